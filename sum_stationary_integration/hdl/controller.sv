@@ -26,6 +26,7 @@ module controller #(
   
   parameter int N = 4,                    // What's the width of the processing units
   parameter int M = 4,                    // This is how much memory is supposed to be stored by the memory buffer (TODO: currently we make it same as N, but will be different)
+  parameter int K_SPLIT = 0,              // 1: send row / col blocks in chunks of M (matrix_length a multiple of M), processors accumulate across them
   parameter int MAX_MATRIX_LENGTH = 4096,  // Assume the max matrix we will do is 4k
   parameter int MULTIPLY_DATA_WIDTH = 2 * DATA_WIDTH, // Data width for multiplication operations
   parameter int ACCUM_DATA_WIDTH = 16, // How many additional bits to reserve for accumulation, can change
@@ -36,14 +37,16 @@ module controller #(
   parameter int NUM_PROCESSORS = ROWS_PROCESSORS * COLS_PROCESSORS, // also how many output memory writers there are
 
   // Calculated parameters for input buffers
-  parameter int INPUT_BUFFER_COUNTER_BITS = $clog2(MAX_MATRIX_LENGTH + 1) // We need to keep track of a count from 0 to MAX_MATRIX_LENGTH
-  parameter int INPUT_BUFFER_MEMORY_INPUT_COUNTER_BITS = $clog2(MAX_MATRIX_LENGTH * N + 1) // For reading from memory, we read at most MAX_MATRIX_LENGTH * N values
+  parameter int INPUT_BUFFER_COUNTER_BITS = $clog2(MAX_MATRIX_LENGTH + 1), // We need to keep track of a count from 0 to MAX_MATRIX_LENGTH
+  parameter int INPUT_BUFFER_MEMORY_INPUT_COUNTER_BITS = $clog2(MAX_MATRIX_LENGTH * N + 1), // For reading from memory, we read at most MAX_MATRIX_LENGTH * N values
   // TODO: this division can be a even smaller value
   parameter int INPUT_BUFFER_REPEATS_COUNTER_BITS = $clog2((MAX_MATRIX_LENGTH / N) + 1), // keep track of how many full data repeats are sent. If we use this for B buffer, the value could become just 1 or 0... (probably keep the bit to a high value in case controller want to fast output A instead of B)
-  parameter int INPUT_BUFFER_INSTRUCTION_COUNTER_BITS = $clog2(MAX_MATRIX_LENGTH*MAX_MATRIX_LENGTH / ROWS_PROCESSORS/COLS_PROCESSORS / N / N + 1), // TODO: bits required to count number of instructions already sent to each input buffer (max_matrix_len^2 / (row_processors*col processors*N^2))
+  // Bits required to count number of instructions already sent to each input buffer (max_matrix_len^2 / (row_processors*col processors*N^2)),
+  // times the chunks of a block with K_SPLIT. 64 bit math, a 4k matrix in small chunks goes past 32 bits
+  parameter int INPUT_BUFFER_INSTRUCTION_COUNTER_BITS = $clog2(64'(MAX_MATRIX_LENGTH)*MAX_MATRIX_LENGTH / ROWS_PROCESSORS/COLS_PROCESSORS / N / N * (K_SPLIT ? MAX_MATRIX_LENGTH / M : 1) + 1),
   // TODO: ^ the above instruction counter bits used division. Not sure if integer division will negatively affect the result. 
 
-  parameter int OUTPUT_BUFFER_INSTRUCTION_COUNTER_BITS = $clog2(MAX_MATRIX_LENGTH*MAX_MATRIX_LENGTH / ROWS_PROCESSORS/COLS_PROCESSORS / N / N + 1), // TODO: bits required to count number of instructions already sent to each input buffer (max_matrix_len^2 / N^2 / ROW_PROCESSORS / COL_PROCESSORS)
+  parameter int OUTPUT_BUFFER_INSTRUCTION_COUNTER_BITS = $clog2(64'(MAX_MATRIX_LENGTH)*MAX_MATRIX_LENGTH / ROWS_PROCESSORS/COLS_PROCESSORS / N / N + 1), // TODO: bits required to count number of instructions already sent to each input buffer (max_matrix_len^2 / N^2 / ROW_PROCESSORS / COL_PROCESSORS)
  
   parameter int MEMORY_ADDRESS_BITS = 64,  // Used to communicate with the memory
   parameter int MEMORY_SIZE = 1024, // size of memory
@@ -67,12 +70,14 @@ module controller #(
   output  logic [MEMORY_ADDRESS_BITS-1:0]               a_input_buffer_address_inputs[ROWS_PROCESSORS-1:0],
   output  logic [INPUT_BUFFER_COUNTER_BITS-1:0]         a_input_buffer_length_inputs[ROWS_PROCESSORS-1:0],
   output  logic [INPUT_BUFFER_REPEATS_COUNTER_BITS-1:0] a_input_buffer_repeats_inputs[ROWS_PROCESSORS-1:0],
+  output  logic                                         a_input_buffer_final_chunk_inputs[ROWS_PROCESSORS-1:0], // K_SPLIT: last chunk of the block (always 1 otherwise)
 
   output  logic                                         b_input_buffer_instruction_valids[COLS_PROCESSORS-1:0],
   input   logic                                         b_input_buffer_instruction_readys[COLS_PROCESSORS-1:0],
   output  logic [MEMORY_ADDRESS_BITS-1:0]               b_input_buffer_address_inputs[COLS_PROCESSORS-1:0],
   output  logic [INPUT_BUFFER_COUNTER_BITS-1:0]         b_input_buffer_length_inputs[COLS_PROCESSORS-1:0],
   output  logic [INPUT_BUFFER_REPEATS_COUNTER_BITS-1:0] b_input_buffer_repeats_inputs[COLS_PROCESSORS-1:0],
+  output  logic                                         b_input_buffer_final_chunk_inputs[COLS_PROCESSORS-1:0], // K_SPLIT: last chunk of the block (always 1 otherwise)
 
   // Instruction to Output Buffer
   output  logic                                         output_buffer_instruction_valids[NUM_PROCESSORS-1:0],
@@ -81,12 +86,15 @@ module controller #(
   output  logic                                         output_buffer_by_row_instructions[NUM_PROCESSORS-1:0],
 
   output  logic                                         output_buffer_completed_readys[NUM_PROCESSORS-1:0],
-  input   logic                                         output_buffer_completed_valids[NUM_PROCESSORS-1:0],
+  input   logic                                         output_buffer_completed_valids[NUM_PROCESSORS-1:0]
 );
   /************************
    * GENERAL INSTRUCTIONS *
    ************************/
-  logic done_register, in_operation_register, a_addr_register, b_addr_register, c_addr_register, matrix_length_register;
+  logic done_register, in_operation_register;
+  logic [MEMORY_ADDRESS_BITS-1:0] a_addr_register, b_addr_register, c_addr_register;
+  logic [MATRIX_LENGTH_BITS-1:0] matrix_length_register;
+  logic all_done; // every output buffer wrote its last tile (see OUTPUT CONFIRMATION)
   always_ff @(posedge clk) begin
     if (reset) begin
       in_operation_register <= '0;
@@ -100,7 +108,7 @@ module controller #(
         c_addr_register <= c_memory_addr;
         matrix_length_register <= matrix_length_input;
         done_register <= '0;
-      end else if (all_done) begin // TODO: define the logic condition for this
+      end else if (in_operation_register && all_done) begin
         // If all output buffer have completed their last output task:
         in_operation_register <= '0;
         done_register <= '1;
@@ -143,6 +151,7 @@ module controller #(
   logic [MEMORY_ADDRESS_BITS-1:0] a_input_buffer_address_registers[ROWS_PROCESSORS-1:0];
   logic [INPUT_BUFFER_COUNTER_BITS-1:0] a_input_buffer_length_registers[ROWS_PROCESSORS-1:0];
   logic [INPUT_BUFFER_REPEATS_COUNTER_BITS-1:0] a_input_buffer_repeats_registers[ROWS_PROCESSORS-1:0];
+  logic a_input_buffer_final_chunk_registers[ROWS_PROCESSORS-1:0]; // Only set with K_SPLIT
 
   // Define state variable registers that remmebers what state the instructions are in
   // (Started/Not Started, on step X)
@@ -158,68 +167,138 @@ module controller #(
       a_input_buffer_address_inputs[a_input_buffer_index] = a_input_buffer_address_registers[a_input_buffer_index];
       a_input_buffer_length_inputs[a_input_buffer_index] = a_input_buffer_length_registers[a_input_buffer_index];
       a_input_buffer_repeats_inputs[a_input_buffer_index] = a_input_buffer_repeats_registers[a_input_buffer_index];
+      a_input_buffer_final_chunk_inputs[a_input_buffer_index] = !K_SPLIT || a_input_buffer_final_chunk_registers[a_input_buffer_index];
     end
   end
 
   // Define a separate counter for input (it keeps track of which repeat we are at)
   logic [INPUT_BUFFER_INSTRUCTION_COUNTER_BITS-1:0] a_input_buffer_repeat_counters[ROWS_PROCESSORS-1:0];
 
-  always_ff @(posedge clk) begin
-    for (int a_input_buffer_index = 0; a_input_buffer_index < ROWS_PROCESSORS; a_input_buffer_index++) begin
-      if (reset) begin
-        a_input_buffer_address_registers[a_input_buffer_index] <= 0;
-        a_input_buffer_length_registers[a_input_buffer_index] <= 0;
-        a_input_buffer_repeats_registers[a_input_buffer_index] <= 0;
-
-        a_input_buffer_instruction_counters[a_input_buffer_index] <= 0;
-        a_input_buffer_repeat_counters[a_input_buffer_index] <= 0;
-        a_input_buffer_started[a_input_buffer_index] <= 0;
-      end else begin
-        if (in_operation_register) begin
-          if (a_input_buffer_instruction_counters[a_input_buffer_index] == 0 && a_input_buffer_started[a_input_buffer_index] == 0) begin
-            // Operating but have not started sending instructions
-            // Mark as started, set data to desired values
-            a_input_buffer_instruction_counters[a_input_buffer_index] <= matrix_length_register / ROWS_PROCESSORS / N; // Value set to Num Instruction
-            a_input_buffer_started[a_input_buffer_index] <= 1;
-            a_input_buffer_repeat_counters[a_input_buffer_index] <= a_input_buffer_repeat_counters[a_input_buffer_index] + 1;
-
-            // TODO: i'm sure some computations here can be done better
-            a_input_buffer_address_registers[a_input_buffer_index] <= a_addr_register + (a_input_buffer_repeat_counters[a_input_buffer_index] * N*matrix_len*ROWS_PROCESSORS) + (a_input_buffer_index * N*matrix_length_register);
-            a_input_buffer_length_registers[a_input_buffer_index] <= matrix_length_register;
-            a_input_buffer_repeats_registers[a_input_buffer_index] <= matrix_length_register / COLS_PROCESSORS / N; // TODO: division? TODO: or this could be user input?
+  generate
+    if (!K_SPLIT) begin : a_full_length_instructions
+      always_ff @(posedge clk) begin
+        for (int a_input_buffer_index = 0; a_input_buffer_index < ROWS_PROCESSORS; a_input_buffer_index++) begin
+          if (reset) begin
+            a_input_buffer_address_registers[a_input_buffer_index] <= 0;
+            a_input_buffer_length_registers[a_input_buffer_index] <= 0;
+            a_input_buffer_repeats_registers[a_input_buffer_index] <= 0;
+
+            a_input_buffer_instruction_counters[a_input_buffer_index] <= 0;
+            a_input_buffer_repeat_counters[a_input_buffer_index] <= 0;
+            a_input_buffer_started[a_input_buffer_index] <= 0;
           end else begin
-            // if ready/valid, decrease counter. 
-            // No need to care for counter here, because if counter is at the "end value", it won't be valid
-            if (a_input_buffer_instruction_valids[a_input_buffer_index] && a_input_buffer_instruction_readys[a_input_buffer_index]) begin
-              if (a_input_buffer_repeat_counters[a_input_buffer_index] == matrix_length_register / ROWS_PROCESSORS / N - 1) begin
-                // Although this won't occur for A inputs
-                a_input_buffer_repeat_counters[a_input_buffer_index] <= 0;
-              end else begin
+            if (in_operation_register) begin
+              if (a_input_buffer_instruction_counters[a_input_buffer_index] == 0 && a_input_buffer_started[a_input_buffer_index] == 0) begin
+                // Operating but have not started sending instructions
+                // Mark as started, set data to desired values
+                a_input_buffer_instruction_counters[a_input_buffer_index] <= matrix_length_register / ROWS_PROCESSORS / N; // Value set to Num Instruction
+                a_input_buffer_started[a_input_buffer_index] <= 1;
                 a_input_buffer_repeat_counters[a_input_buffer_index] <= a_input_buffer_repeat_counters[a_input_buffer_index] + 1;
-              end
+
+                // TODO: i'm sure some computations here can be done better
+                a_input_buffer_address_registers[a_input_buffer_index] <= a_addr_register + (a_input_buffer_repeat_counters[a_input_buffer_index] * N*matrix_length_register*ROWS_PROCESSORS) + (a_input_buffer_index * N*matrix_length_register);
+                a_input_buffer_length_registers[a_input_buffer_index] <= matrix_length_register;
+                a_input_buffer_repeats_registers[a_input_buffer_index] <= matrix_length_register / COLS_PROCESSORS / N; // TODO: division? TODO: or this could be user input?
+              end else begin
+                // if ready/valid, decrease counter. 
+                // No need to care for counter here, because if counter is at the "end value", it won't be valid
+                if (a_input_buffer_instruction_valids[a_input_buffer_index] && a_input_buffer_instruction_readys[a_input_buffer_index]) begin
+                  if (a_input_buffer_repeat_counters[a_input_buffer_index] == matrix_length_register / ROWS_PROCESSORS / N - 1) begin
+                    // Although this won't occur for A inputs
+                    a_input_buffer_repeat_counters[a_input_buffer_index] <= 0;
+                  end else begin
+                    a_input_buffer_repeat_counters[a_input_buffer_index] <= a_input_buffer_repeat_counters[a_input_buffer_index] + 1;
+                  end
               
-              a_input_buffer_instruction_counters[a_input_buffer_index] <= a_input_buffer_instruction_counters[a_input_buffer_index] - 1;
+                  a_input_buffer_instruction_counters[a_input_buffer_index] <= a_input_buffer_instruction_counters[a_input_buffer_index] - 1;
 
-              a_input_buffer_address_registers[a_input_buffer_index] <= a_addr_register + (a_input_buffer_repeat_counters[a_input_buffer_index] * N*matrix_len*ROWS_PROCESSORS) + (a_input_buffer_index * N*matrix_length_register);
-              a_input_buffer_length_registers[a_input_buffer_index] <= matrix_length_register;
-              a_input_buffer_repeats_registers[a_input_buffer_index] <= matrix_length_register / COLS_PROCESSORS / N; // TODO: division? TODO: or this could be user input?
+                  a_input_buffer_address_registers[a_input_buffer_index] <= a_addr_register + (a_input_buffer_repeat_counters[a_input_buffer_index] * N*matrix_length_register*ROWS_PROCESSORS) + (a_input_buffer_index * N*matrix_length_register);
+                  a_input_buffer_length_registers[a_input_buffer_index] <= matrix_length_register;
+                  a_input_buffer_repeats_registers[a_input_buffer_index] <= matrix_length_register / COLS_PROCESSORS / N; // TODO: division? TODO: or this could be user input?
+                end
+              end
+            end else begin
+              // The entire computation is done, at this point counter should be 0 already
+              // We should reset the "started" signal
+              a_input_buffer_started[a_input_buffer_index] <= 0;
+              a_input_buffer_repeat_counters[a_input_buffer_index] <= 0;
+            end
+          end
+        end
+      end
+    end else begin : a_k_split_instructions
+      // K_SPLIT: a row block goes out in matrix_length / M chunks of M columns (N * M words), each sent once
+      // (repeats 1), so the memory buffer only holds one chunk. For every row block of this buffer, for every
+      // col group, the chunks go in order and the last one is flagged final_chunk, the processors keep
+      // accumulating until then. Chunk c of a block starts at word c * M * N (columns go from the right).
+      logic [INPUT_BUFFER_INSTRUCTION_COUNTER_BITS-1:0] a_input_buffer_block_counters[ROWS_PROCESSORS-1:0]; // row block of this buffer
+      logic [INPUT_BUFFER_INSTRUCTION_COUNTER_BITS-1:0] a_input_buffer_group_counters[ROWS_PROCESSORS-1:0]; // col group it is sent for
+      logic [INPUT_BUFFER_INSTRUCTION_COUNTER_BITS-1:0] a_input_buffer_chunk_counters[ROWS_PROCESSORS-1:0]; // chunk of the row block
+
+      always_ff @(posedge clk) begin
+        for (int a_input_buffer_index = 0; a_input_buffer_index < ROWS_PROCESSORS; a_input_buffer_index++) begin
+          if (reset) begin
+            a_input_buffer_address_registers[a_input_buffer_index] <= 0;
+            a_input_buffer_length_registers[a_input_buffer_index] <= 0;
+            a_input_buffer_repeats_registers[a_input_buffer_index] <= 0;
+            a_input_buffer_final_chunk_registers[a_input_buffer_index] <= 0;
+
+            a_input_buffer_instruction_counters[a_input_buffer_index] <= 0;
+            a_input_buffer_block_counters[a_input_buffer_index] <= 0;
+            a_input_buffer_group_counters[a_input_buffer_index] <= 0;
+            a_input_buffer_chunk_counters[a_input_buffer_index] <= 0;
+            a_input_buffer_started[a_input_buffer_index] <= 0;
+          end else begin
+            if (in_operation_register) begin
+              if (a_input_buffer_instruction_counters[a_input_buffer_index] == 0 && a_input_buffer_started[a_input_buffer_index] == 0) begin
+                // Operating but have not started sending instructions: chunk 0 of the first row block
+                a_input_buffer_instruction_counters[a_input_buffer_index] <= (matrix_length_register / ROWS_PROCESSORS / N) * (matrix_length_register / COLS_PROCESSORS / N) * (matrix_length_register / M);
+                a_input_buffer_started[a_input_buffer_index] <= 1;
+                a_input_buffer_block_counters[a_input_buffer_index] <= 0;
+                a_input_buffer_group_counters[a_input_buffer_index] <= 0;
+                a_input_buffer_chunk_counters[a_input_buffer_index] <= 0;
+
+                a_input_buffer_address_registers[a_input_buffer_index] <= a_addr_register + (a_input_buffer_index * N*matrix_length_register);
+                a_input_buffer_length_registers[a_input_buffer_index] <= M;
+                a_input_buffer_repeats_registers[a_input_buffer_index] <= 1;
+                a_input_buffer_final_chunk_registers[a_input_buffer_index] <= matrix_length_register == M;
+              end else if (a_input_buffer_instruction_valids[a_input_buffer_index] && a_input_buffer_instruction_readys[a_input_buffer_index]) begin
+                a_input_buffer_instruction_counters[a_input_buffer_index] <= a_input_buffer_instruction_counters[a_input_buffer_index] - 1;
+                if (a_input_buffer_chunk_counters[a_input_buffer_index] == matrix_length_register / M - 1) begin
+                  // Row block done for this col group: again for the next col group, or the next row block
+                  a_input_buffer_chunk_counters[a_input_buffer_index] <= 0;
+                  if (a_input_buffer_group_counters[a_input_buffer_index] == matrix_length_register / COLS_PROCESSORS / N - 1) begin
+                    a_input_buffer_group_counters[a_input_buffer_index] <= 0;
+                    a_input_buffer_block_counters[a_input_buffer_index] <= a_input_buffer_block_counters[a_input_buffer_index] + 1;
+                    a_input_buffer_address_registers[a_input_buffer_index] <= a_addr_register + ((a_input_buffer_block_counters[a_input_buffer_index] + 1) * N*matrix_length_register*ROWS_PROCESSORS) + (a_input_buffer_index * N*matrix_length_register);
+                  end else begin
+                    a_input_buffer_group_counters[a_input_buffer_index] <= a_input_buffer_group_counters[a_input_buffer_index] + 1;
+                    a_input_buffer_address_registers[a_input_buffer_index] <= a_addr_register + (a_input_buffer_block_counters[a_input_buffer_index] * N*matrix_length_register*ROWS_PROCESSORS) + (a_input_buffer_index * N*matrix_length_register);
+                  end
+                  a_input_buffer_final_chunk_registers[a_input_buffer_index] <= matrix_length_register == M;
+                end else begin
+                  // Next chunk of the same row block
+                  a_input_buffer_chunk_counters[a_input_buffer_index] <= a_input_buffer_chunk_counters[a_input_buffer_index] + 1;
+                  a_input_buffer_address_registers[a_input_buffer_index] <= a_input_buffer_address_registers[a_input_buffer_index] + M*N;
+                  a_input_buffer_final_chunk_registers[a_input_buffer_index] <= a_input_buffer_chunk_counters[a_input_buffer_index] == matrix_length_register / M - 2;
+                end
+              end
+            end else begin
+              // The entire computation is done, we should reset the "started" signal
+              a_input_buffer_started[a_input_buffer_index] <= 0;
             end
           end
-        end else begin
-          // The entire computation is done, at this point counter should be 0 already
-          // We should reset the "started" signal
-          a_input_buffer_started[a_input_buffer_index] <= 0;
-          a_input_buffer_repeat_counters[a_input_buffer_index] <= 0;
         end
       end
     end
-  end
+  endgenerate
 
   // B input:
   // Define registers to store instructions "to be sent"
   logic [MEMORY_ADDRESS_BITS-1:0] b_input_buffer_address_registers[COLS_PROCESSORS-1:0];
   logic [INPUT_BUFFER_COUNTER_BITS-1:0] b_input_buffer_length_registers[COLS_PROCESSORS-1:0];
   logic [INPUT_BUFFER_REPEATS_COUNTER_BITS-1:0] b_input_buffer_repeats_registers[COLS_PROCESSORS-1:0];
+  logic b_input_buffer_final_chunk_registers[COLS_PROCESSORS-1:0]; // Only set with K_SPLIT
 
   // Define state variable registers that remmebers what state the instructions are in
   // (Started/Not Started, on step X)
@@ -235,6 +314,7 @@ module controller #(
       b_input_buffer_address_inputs[b_input_buffer_index] = b_input_buffer_address_registers[b_input_buffer_index];
       b_input_buffer_length_inputs[b_input_buffer_index] = b_input_buffer_length_registers[b_input_buffer_index];
       b_input_buffer_repeats_inputs[b_input_buffer_index] = b_input_buffer_repeats_registers[b_input_buffer_index];
+      b_input_buffer_final_chunk_inputs[b_input_buffer_index] = !K_SPLIT || b_input_buffer_final_chunk_registers[b_input_buffer_index];
     end
   end
 
@@ -242,74 +322,129 @@ module controller #(
   // Define a separate counter for input (it keeps track of which repeat we are at)
   logic [INPUT_BUFFER_INSTRUCTION_COUNTER_BITS-1:0] b_input_buffer_repeat_counters[COLS_PROCESSORS-1:0];
 
-  always_ff @(posedge clk) begin
-    for (int b_input_buffer_index = 0; b_input_buffer_index < COLS_PROCESSORS; b_input_buffer_index++) begin
-      if (reset) begin
-        b_input_buffer_address_registers[b_input_buffer_index] <= 0;
-        b_input_buffer_length_registers[b_input_buffer_index] <= 0;
-        b_input_buffer_repeats_registers[b_input_buffer_index] <= 0;
-
-        b_input_buffer_instruction_counters[b_input_buffer_index] <= 0;
-        b_input_buffer_repeat_counters[b_input_buffer_index] <= 0;
-        b_input_buffer_started[b_input_buffer_index] <= 0;
-      end else begin
-        if (in_operation_register) begin
-          if (b_input_buffer_instruction_counters[b_input_buffer_index] == 0 && b_input_buffer_started[b_input_buffer_index] == 0) begin
-            // Operating but have not started sending instructions
-            // Mark as started, set data to desired values
-            b_input_buffer_instruction_counters[b_input_buffer_index] <= matrix_length_register / COLS_PROCESSORS / N; // Value set to Num Instruction
-            b_input_buffer_started[b_input_buffer_index] <= 1;
-            b_input_buffer_repeat_counters[b_input_buffer_index] <= b_input_buffer_repeat_counters[b_input_buffer_index] + 1;
-
-            // TODO: i'm sure some computations here can be done better
-            b_input_buffer_address_registers[b_input_buffer_index] <= b_addr_register + (b_input_buffer_repeat_counters[b_input_buffer_index] * N*matrix_len*COLS_PROCESSORS) + (b_input_buffer_index * N*matrix_length_register);
-            b_input_buffer_length_registers[b_input_buffer_index] <= matrix_length_register;
-            b_input_buffer_repeats_registers[b_input_buffer_index] <= matrix_length_register / ROWS_PROCESSORS / N; // TODO: division? TODO: or this could be user input?
+  generate
+    if (!K_SPLIT) begin : b_full_length_instructions
+      // A row blocks are repeated once per col group, so B goes the other way around: for every row group of A,
+      // every col block of this buffer once (repeats 1), in order. Col block g of buffer j is block g * COLS_PROCESSORS + j.
+      always_ff @(posedge clk) begin
+        for (int b_input_buffer_index = 0; b_input_buffer_index < COLS_PROCESSORS; b_input_buffer_index++) begin
+          if (reset) begin
+            b_input_buffer_address_registers[b_input_buffer_index] <= 0;
+            b_input_buffer_length_registers[b_input_buffer_index] <= 0;
+            b_input_buffer_repeats_registers[b_input_buffer_index] <= 0;
+
+            b_input_buffer_instruction_counters[b_input_buffer_index] <= 0;
+            b_input_buffer_repeat_counters[b_input_buffer_index] <= 0;
+            b_input_buffer_started[b_input_buffer_index] <= 0;
           end else begin
-            // if ready/valid, decrease counter. 
-            // No need to care for counter here, because if counter is at the "end value", it won't be valid
-            if (b_input_buffer_instruction_valids[b_input_buffer_index] && b_input_buffer_instruction_readys[b_input_buffer_index]) begin
-              if (b_input_buffer_repeat_counters[b_input_buffer_index] == matrix_length_register / COLS_PROCESSORS / N - 1) begin
-                // Although this won't occur for A inputs, it will for b
-                b_input_buffer_repeat_counters[b_input_buffer_index] <= 0;
+            if (in_operation_register) begin
+              if (b_input_buffer_instruction_counters[b_input_buffer_index] == 0 && b_input_buffer_started[b_input_buffer_index] == 0) begin
+                // Operating but have not started sending instructions
+                // Mark as started, set data to desired values
+                b_input_buffer_instruction_counters[b_input_buffer_index] <= (matrix_length_register / ROWS_PROCESSORS / N) * (matrix_length_register / COLS_PROCESSORS / N); // Value set to Num Instruction
+                b_input_buffer_started[b_input_buffer_index] <= 1;
+                b_input_buffer_repeat_counters[b_input_buffer_index] <= 0; // col group of the instruction being sent
+
+                b_input_buffer_address_registers[b_input_buffer_index] <= b_addr_register + (b_input_buffer_index * N*matrix_length_register);
+                b_input_buffer_length_registers[b_input_buffer_index] <= matrix_length_register;
+                b_input_buffer_repeats_registers[b_input_buffer_index] <= 1;
               end else begin
-                b_input_buffer_repeat_counters[b_input_buffer_index] <= b_input_buffer_repeat_counters[b_input_buffer_index] + 1;
-              end
+                // if ready/valid, decrease counter. 
+                // No need to care for counter here, because if counter is at the "end value", it won't be valid
+                if (b_input_buffer_instruction_valids[b_input_buffer_index] && b_input_buffer_instruction_readys[b_input_buffer_index]) begin
+                  if (b_input_buffer_repeat_counters[b_input_buffer_index] == matrix_length_register / COLS_PROCESSORS / N - 1) begin
+                    // Last col group, the next row group of A starts over from the first one
+                    b_input_buffer_repeat_counters[b_input_buffer_index] <= 0;
+                    b_input_buffer_address_registers[b_input_buffer_index] <= b_addr_register + (b_input_buffer_index * N*matrix_length_register);
+                  end else begin
+                    b_input_buffer_repeat_counters[b_input_buffer_index] <= b_input_buffer_repeat_counters[b_input_buffer_index] + 1;
+                    b_input_buffer_address_registers[b_input_buffer_index] <= b_addr_register + ((b_input_buffer_repeat_counters[b_input_buffer_index] + 1) * N*matrix_length_register*COLS_PROCESSORS) + (b_input_buffer_index * N*matrix_length_register);
+                  end
               
-              b_input_buffer_instruction_counters[b_input_buffer_index] <= b_input_buffer_instruction_counters[b_input_buffer_index] - 1;
-
-              b_input_buffer_address_registers[b_input_buffer_index] <= b_addr_register + (b_input_buffer_repeat_counters[b_input_buffer_index] * N*matrix_len*COLS_PROCESSORS) + (b_input_buffer_index * N*matrix_length_register);
-              b_input_buffer_length_registers[b_input_buffer_index] <= matrix_length_register;
-              b_input_buffer_repeats_registers[b_input_buffer_index] <= matrix_length_register / COLS_PROCESSORS / N; // TODO: division? TODO: or this could be user input?
+                  b_input_buffer_instruction_counters[b_input_buffer_index] <= b_input_buffer_instruction_counters[b_input_buffer_index] - 1;
+                end
+              end
+            end else begin
+              // The entire computation is done, at this point counter should be 0 already
+              // We should reset the "started" signal
+              b_input_buffer_started[b_input_buffer_index] <= 0;
+              b_input_buffer_repeat_counters[b_input_buffer_index] <= 0;
+            end
+          end
+        end
+      end
+    end else begin : b_k_split_instructions
+      // K_SPLIT: same chunks of M rows for the col blocks. The processors take A and B tiles in the same order
+      // (row group outer, col group inner), so for every row group, every col block of this buffer goes out
+      // chunk by chunk, the last one flagged final_chunk.
+      logic [INPUT_BUFFER_INSTRUCTION_COUNTER_BITS-1:0] b_input_buffer_block_counters[COLS_PROCESSORS-1:0]; // col block of this buffer
+      logic [INPUT_BUFFER_INSTRUCTION_COUNTER_BITS-1:0] b_input_buffer_chunk_counters[COLS_PROCESSORS-1:0]; // chunk of the col block
+
+      always_ff @(posedge clk) begin
+        for (int b_input_buffer_index = 0; b_input_buffer_index < COLS_PROCESSORS; b_input_buffer_index++) begin
+          if (reset) begin
+            b_input_buffer_address_registers[b_input_buffer_index] <= 0;
+            b_input_buffer_length_registers[b_input_buffer_index] <= 0;
+            b_input_buffer_repeats_registers[b_input_buffer_index] <= 0;
+            b_input_buffer_final_chunk_registers[b_input_buffer_index] <= 0;
+
+            b_input_buffer_instruction_counters[b_input_buffer_index] <= 0;
+            b_input_buffer_block_counters[b_input_buffer_index] <= 0;
+            b_input_buffer_chunk_counters[b_input_buffer_index] <= 0;
+            b_input_buffer_started[b_input_buffer_index] <= 0;
+          end else begin
+            if (in_operation_register) begin
+              if (b_input_buffer_instruction_counters[b_input_buffer_index] == 0 && b_input_buffer_started[b_input_buffer_index] == 0) begin
+                // Operating but have not started sending instructions: chunk 0 of the first col block
+                b_input_buffer_instruction_counters[b_input_buffer_index] <= (matrix_length_register / ROWS_PROCESSORS / N) * (matrix_length_register / COLS_PROCESSORS / N) * (matrix_length_register / M);
+                b_input_buffer_started[b_input_buffer_index] <= 1;
+                b_input_buffer_block_counters[b_input_buffer_index] <= 0;
+                b_input_buffer_chunk_counters[b_input_buffer_index] <= 0;
+
+                b_input_buffer_address_registers[b_input_buffer_index] <= b_addr_register + (b_input_buffer_index * N*matrix_length_register);
+                b_input_buffer_length_registers[b_input_buffer_index] <= M;
+                b_input_buffer_repeats_registers[b_input_buffer_index] <= 1;
+                b_input_buffer_final_chunk_registers[b_input_buffer_index] <= matrix_length_register == M;
+              end else if (b_input_buffer_instruction_valids[b_input_buffer_index] && b_input_buffer_instruction_readys[b_input_buffer_index]) begin
+                b_input_buffer_instruction_counters[b_input_buffer_index] <= b_input_buffer_instruction_counters[b_input_buffer_index] - 1;
+                if (b_input_buffer_chunk_counters[b_input_buffer_index] == matrix_length_register / M - 1) begin
+                  // Col block done: the next one, back to the first after the last (next row group)
+                  b_input_buffer_chunk_counters[b_input_buffer_index] <= 0;
+                  if (b_input_buffer_block_counters[b_input_buffer_index] == matrix_length_register / COLS_PROCESSORS / N - 1) begin
+                    b_input_buffer_block_counters[b_input_buffer_index] <= 0;
+                    b_input_buffer_address_registers[b_input_buffer_index] <= b_addr_register + (b_input_buffer_index * N*matrix_length_register);
+                  end else begin
+                    b_input_buffer_block_counters[b_input_buffer_index] <= b_input_buffer_block_counters[b_input_buffer_index] + 1;
+                    b_input_buffer_address_registers[b_input_buffer_index] <= b_addr_register + ((b_input_buffer_block_counters[b_input_buffer_index] + 1) * N*matrix_length_register*COLS_PROCESSORS) + (b_input_buffer_index * N*matrix_length_register);
+                  end
+                  b_input_buffer_final_chunk_registers[b_input_buffer_index] <= matrix_length_register == M;
+                end else begin
+                  // Next chunk of the same col block
+                  b_input_buffer_chunk_counters[b_input_buffer_index] <= b_input_buffer_chunk_counters[b_input_buffer_index] + 1;
+                  b_input_buffer_address_registers[b_input_buffer_index] <= b_input_buffer_address_registers[b_input_buffer_index] + M*N;
+                  b_input_buffer_final_chunk_registers[b_input_buffer_index] <= b_input_buffer_chunk_counters[b_input_buffer_index] == matrix_length_register / M - 2;
+                end
+              end
+            end else begin
+              // The entire computation is done, we should reset the "started" signal
+              b_input_buffer_started[b_input_buffer_index] <= 0;
             end
           end
-        end else begin
-          // The entire computation is done, at this point counter should be 0 already
-          // We should reset the "started" signal
-          b_input_buffer_started[b_input_buffer_index] <= 0;
-          b_input_buffer_repeat_counters[b_input_buffer_index] <= 0;
         end
       end
     end
-  end
+  endgenerate
 
   /*************************
    * DEFINE OUTPUT_BUFFERS *
    *************************/
+  // Same code structure as the input buffers, one instruction (address of a C block) per tile. A separate FF block
+  // counts the "completed" handshakes (see OUTPUT CONFIRMATION).
+  // Processor (i, j) (output buffer i * COLS_PROCESSORS + j) makes the tiles of row blocks i, i + ROWS_PROCESSORS, ...
+  // times col blocks j, j + COLS_PROCESSORS, ... (col inner), which is exactly its block in every group of C.
 
-  // TODO: output buffer should have same code structure as input buffer. But have a separate FF block that records the "done" signals and count them. 
-
-
-  /* TODO:
-    ready should be "in-progress" - AND count not at max?
-    increment a counter for each tile. 
-
-    if count at max, set "buffer completely done" to true
-
-  */
   // Define registers to store instructions "to be sent"
   logic [MEMORY_ADDRESS_BITS-1:0] output_buffer_address_registers[NUM_PROCESSORS-1:0];
-  logic output_buffer_by_row_registers[NUM_PROCESSORS-1:0];
 
   // Define state variable registers that remmebers what state the instructions are in
   // (Started/Not Started, on step X)
@@ -323,19 +458,17 @@ module controller #(
       // When count reaches 0, it will never be valid again, until "done" flag
       output_buffer_instruction_valids[output_buffer_index] = in_operation_register && output_buffer_instruction_counters[output_buffer_index] != 0;
       output_buffer_address_inputs[output_buffer_index] = output_buffer_address_registers[output_buffer_index];
-      output_buffer_by_row_instructions[output_buffer_index] = output_buffer_by_row_registers[output_buffer_index];
+      output_buffer_by_row_instructions[output_buffer_index] = 1; // C blocks are stored row major
     end
   end
 
-  // Define a separate counter for input (it keeps track of which repeat we are at)
+  // Define a separate counter for output (it keeps track of which group the tile goes to)
   logic [OUTPUT_BUFFER_INSTRUCTION_COUNTER_BITS-1:0] output_buffer_repeat_counters[NUM_PROCESSORS-1:0];
 
   always_ff @(posedge clk) begin
     for (int output_buffer_index = 0; output_buffer_index < NUM_PROCESSORS; output_buffer_index++) begin
       if (reset) begin
         output_buffer_address_registers[output_buffer_index] <= 0;
-        output_buffer_length_registers[output_buffer_index] <= 0;
-        output_buffer_repeats_registers[output_buffer_index] <= 0;
 
         output_buffer_instruction_counters[output_buffer_index] <= 0;
         output_buffer_repeat_counters[output_buffer_index] <= 0;
@@ -345,15 +478,12 @@ module controller #(
           if (output_buffer_instruction_counters[output_buffer_index] == 0 && output_buffer_started[output_buffer_index] == 0) begin
             // Operating but have not started sending instructions
             // Mark as started, set data to desired values
-            output_buffer_instruction_counters[output_buffer_index] <= matrix_length_register*matrix_length_register / ROWS_PROCESSORS / COLS_PROCESSORS / N / N; // Value set to Num Instruction
+            output_buffer_instruction_counters[output_buffer_index] <= (matrix_length_register / ROWS_PROCESSORS / N) * (matrix_length_register / COLS_PROCESSORS / N); // Value set to Num Instruction
             output_buffer_started[output_buffer_index] <= 1;
 
-            output_buffer_repeat_counters[output_buffer_index] <= output_buffer_repeat_counters[output_buffer_index] + 1;
+            output_buffer_repeat_counters[output_buffer_index] <= 1;
 
-            // TODO: i'm sure some computations here can be done better
-            output_buffer_address_registers[output_buffer_index] <= c_addr_register + (output_buffer_repeat_counters[output_buffer_index] * N*N*NUM_PROCESSORS) + (output_buffer_index * N*N);
-            output_buffer_length_registers[output_buffer_index] <= matrix_length_register;
-            output_buffer_repeats_registers[output_buffer_index] <= matrix_length_register / ROWS_PROCESSORS / N; // TODO: division? TODO: or this could be user input?
+            output_buffer_address_registers[output_buffer_index] <= c_addr_register + (output_buffer_index * N*N);
           end else begin
             // if ready/valid, decrease counter. 
             // No need to care for counter here, because if counter is at the "end value", it won't be valid
@@ -363,8 +493,6 @@ module controller #(
               output_buffer_instruction_counters[output_buffer_index] <= output_buffer_instruction_counters[output_buffer_index] - 1;
 
               output_buffer_address_registers[output_buffer_index] <= c_addr_register + (output_buffer_repeat_counters[output_buffer_index] * N*N*NUM_PROCESSORS) + (output_buffer_index * N*N);
-              output_buffer_length_registers[output_buffer_index] <= matrix_length_register;
-              output_buffer_repeats_registers[output_buffer_index] <= matrix_length_register / COLS_PROCESSORS / N; // TODO: division? TODO: or this could be user input?
             end
           end
         end else begin
@@ -380,34 +508,26 @@ module controller #(
   /***********************
    * OUTPUT CONFIRMATION * 
    ***********************/
+  // Count the completed handshakes, an output buffer has ended once all of its tiles are written
+  logic [OUTPUT_BUFFER_INSTRUCTION_COUNTER_BITS-1:0] output_buffer_completed_counters[NUM_PROCESSORS-1:0];
   logic output_buffer_ended[NUM_PROCESSORS-1:0];
   always_ff @(posedge clk) begin
     for (int output_buffer_index = 0; output_buffer_index < NUM_PROCESSORS; output_buffer_index++) begin
-      if (reset) begin
-        output_buffer_ended[output_buffer_index] <= 0;
-      end else if (in_operation_register) begin
-        // This is assuming the output buffer can't finish the task in exactly 1 clock cycle
-        if (output_buffer_repeat_counters[output_buffer_index] == 0 && output_buffer_completed_readys[output_buffer_index] && output_buffer_completed_valids[output_buffer_index]) begin
-          output_buffer_ended[output_buffer_index] <= 1;
-        end
-      end else begin
-        output_buffer_ended[output_buffer_index] <= 0;
+      if (reset || !in_operation_register) begin
+        output_buffer_completed_counters[output_buffer_index] <= 0;
+      end else if (output_buffer_completed_readys[output_buffer_index] && output_buffer_completed_valids[output_buffer_index]) begin
+        output_buffer_completed_counters[output_buffer_index] <= output_buffer_completed_counters[output_buffer_index] + 1;
       end
     end
   end
 
   always_comb begin
+    all_done = 1;
     for (int output_buffer_index = 0; output_buffer_index < NUM_PROCESSORS; output_buffer_index++) begin
+      output_buffer_ended[output_buffer_index] = output_buffer_completed_counters[output_buffer_index] == (matrix_length_register / ROWS_PROCESSORS / N) * (matrix_length_register / COLS_PROCESSORS / N);
       // receive completed when it's not already completed AND in operation. 
       output_buffer_completed_readys[output_buffer_index] = in_operation_register && ~output_buffer_ended[output_buffer_index];
+      all_done = all_done && output_buffer_ended[output_buffer_index];
     end
   end
-
-  logic all_done;
-  assign all_done = &output_buffer_ended;
-  /*
-  
-  ff*/
-
-
-endmodule
\ No newline at end of file
+endmodule
@@ -2,17 +2,26 @@
  *  Reads instruction (memory address, length of input, how many times this input is to be sent to processor(s))
  *  Reads from RAM according to instructions, loads value onto on-chip memory/buffer
  *  Writes the values to processor (with a "last" signal), repeats for num_repeats times
+ *  With K_SPLIT an instruction is one chunk of a row / col block (length <= M), final_chunk goes out with last
+ *  on the last chunk so the processors keep accumulating across the chunks before it
+ *  With BROADCAST a beat goes to every processor at once: each one takes it on its own ready, and the buffer keeps
+ *  track of the processors still missing it, moving on to the next beat once all of them took it
+ *  With PREFETCH there are two banks (ping-pong): the next instruction is taken while the current one is still being
+ *  repeated and is read from memory into the other bank, so it can be sent right after the last repeat
  */
 
 module memory_buffer #(
   parameter int DATA_WIDTH = 8,           // Using 8-bit integers 
   parameter int B_N = 2,                    // What's the width of the processing units
   parameter int B_M = 2,                    // This is how much memory is supposed to be stored by buffer (TODO: currently we make it same as N, but will be different)
+  parameter int K_SPLIT = 0,                // 1: instructions are chunks of at most M vectors, the buffer only holds M * N words
+  parameter int BROADCAST = 0,              // 1: every beat goes to all the processors in parallel instead of one ID at a time
+  parameter int PREFETCH = 0,               // 1: second bank, the next instruction is fetched during the repeats of the current one
   
   parameter int B_NUM_PROCESSORS_TO_BROADCAST = 2, // Assuming 4 processors in the same row / col. (with ID: 0, 1, 2, 3...) (2^2)
   parameter int PROCESSORS_ID_COUNTER_BITS = 4, // Number of bits to record what ID to broadcast to
 
-  parameter int B_MEMORY_ADDRESS_BITS = 6  // Used to communicate with the memory 2^6
+  parameter int B_MEMORY_ADDRESS_BITS = 6,  // Used to communicate with the memory 2^6
   parameter int B_PARALLEL_DATA_STREAMING_SIZE = 2, // Memory can output 4 numbers at same time (2^2) TODO: always divisor of SIZE...
   parameter int B_MAX_MATRIX_LENGTH = 12,  // Assume the max matrix we will do is 4k (2^12)
 
@@ -21,14 +30,15 @@ module memory_buffer #(
 
   parameter int NUM_PROCESSORS_TO_BROADCAST = 1 << B_NUM_PROCESSORS_TO_BROADCAST, // Assuming 4 processors in the same row / col. (with ID: 0, 1, 2, 3...)
   
-  parameter int MEMORY_ADDRESS_BITS = 1 << B_MEMORY_ADDRESS_BITS  // Used to communicate with the memory
+  parameter int MEMORY_ADDRESS_BITS = 1 << B_MEMORY_ADDRESS_BITS,  // Used to communicate with the memory
   parameter int PARALLEL_DATA_STREAMING_SIZE = 1 << B_PARALLEL_DATA_STREAMING_SIZE, // Memory can output 4 numbers at same time TODO: always divisor of SIZE...
   parameter int MAX_MATRIX_LENGTH = 1 << B_MAX_MATRIX_LENGTH,  // Assume the max matrix we will do is 4k
 
 
   parameter int COUNTER_BITS = $clog2(MAX_MATRIX_LENGTH + 1), // We need to keep track of a count from 0 to MAX_MATRIX_LENGTH
   parameter int MEMORY_INPUT_COUNTER_BITS = $clog2(MAX_MATRIX_LENGTH * N + 1), // For reading from memory, we read at most MAX_MATRIX_LENGTH * N values
-  parameter int REPEATS_COUNTER_BITS = $clog2((MAX_MATRIX_LENGTH/N) + 1) // keep track of how many full data repeats are sent. If we use this for B buffer, the value could become just 1 or 0... (probably keep the bit to a high value in case controller want to fast output A instead of B)
+  parameter int REPEATS_COUNTER_BITS = $clog2((MAX_MATRIX_LENGTH/N) + 1), // keep track of how many full data repeats are sent. If we use this for B buffer, the value could become just 1 or 0... (probably keep the bit to a high value in case controller want to fast output A instead of B)
+  parameter int BUFFER_LENGTH = K_SPLIT ? M : MAX_MATRIX_LENGTH // Vectors of N stored, a whole row / col block unless K_SPLIT
 ) (
   input   logic                                   clk,            // Clock signal
   input   logic                                   reset,          // To clear buffer and restore counter
@@ -39,6 +49,7 @@ module memory_buffer #(
   input   logic [MEMORY_ADDRESS_BITS-1:0]         address_input, // The start address of the memory where the data will be. (data will be at addr: address_input, address_input+1, address_input+2...)
   input   logic [COUNTER_BITS-1:0]                length_input, // How big is the input, we will send matrix multiplication of [N x length_input] * [length_input x N]
   input   logic [REPEATS_COUNTER_BITS-1:0]        repeats_input, // How many times the full buffer will be sent to processor before accepting new instructions. (for data reuse)
+  input   logic                                   final_chunk_input, // K_SPLIT: this is the last chunk of the block, the processors finish their tile with it
 
   // Communicating with memory to read data (TODO: assuming memory read have no delay)
   output  logic [MEMORY_ADDRESS_BITS-1:0]         memory_address, // address we are telling the memory we are reading from
@@ -49,74 +60,107 @@ module memory_buffer #(
 
   // Communicating with the processor
   output  logic                                   processor_input_valid, // valid for processor input
+  output  logic                                   processor_input_valids[NUM_PROCESSORS_TO_BROADCAST-1:0], // valid per processor: the one matching the ID, or (BROADCAST) every one still missing the beat
   input   logic                                   processor_input_ready[NUM_PROCESSORS_TO_BROADCAST-1:0], // ready for processor input, each processor has unique ready signal
   output  logic [PROCESSORS_ID_COUNTER_BITS-1:0]  processor_input_id, // ID to write to
   output  logic [DATA_WIDTH-1:0]                  processor_input_data[N-1:0], // the N len vector of row/col to be sent
-  output  logic                                   last // The signal sent alongside the last value in the operation to tell the module to "wrap up" computation
+  output  logic                                   last, // The signal sent alongside the last value in the operation to tell the module to "wrap up" computation
+  output  logic                                   final_chunk // Sent with last: the processor only wraps up when it is also high (always high without K_SPLIT)
 );
   /************************
    * Read from controller *
    ************************/
-  // Define Registers
-  logic [MEMORY_ADDRESS_BITS-1:0] address_register; // remember the memory address after receiving from controller
-  logic [COUNTER_BITS-1:0] length_register; // remember the length of input matrix after receiving from controller
-  logic [REPEATS_COUNTER_BITS-1:0] repeats_counter; // to count how many times the full data is sent (used to set ready signals with controller)
+  localparam int BANKS = PREFETCH ? 2 : 1; // instructions held at once, each with its own part of the buffer
+
+  // Define Registers, one set per bank
+  logic [MEMORY_ADDRESS_BITS-1:0] address_registers[BANKS-1:0]; // remember the memory address after receiving from controller
+  logic [COUNTER_BITS-1:0] length_registers[BANKS-1:0]; // remember the length of input matrix after receiving from controller
+  logic [REPEATS_COUNTER_BITS-1:0] repeats_counters[BANKS-1:0]; // to count how many times the full data is sent, 0 when the bank is free
+  logic final_chunk_registers[BANKS-1:0]; // remember if this chunk finishes the tile (K_SPLIT)
+  // Banks are used in turns, so instructions go out in the order they came in (both stay 0 without PREFETCH)
+  logic load_bank; // bank the next instruction goes into
+  logic stream_bank; // bank being sent to the processors, the oldest instruction
   
   // This is true when the immediate next clock edge we FINISH writing the last value of THIS REPEAT
-  logic writing_last_value_to_processor = last && processor_input_valid && processor_input_ready[NUM_PROCESSORS_TO_BROADCAST-1] && processor_input_id == NUM_PROCESSORS_TO_BROADCAST-1; 
+  logic beat_done; // every processor has the current beat after the next edge (see write to processor)
+  logic writing_last_value_to_processor;
+  assign writing_last_value_to_processor = last && beat_done;
   
   // Always FF Block
   always_ff @(posedge clk) begin : read_from_controller
-    if (reset || (repeats_counter == 1 && writing_last_value_to_processor)) begin
-      /* Reset when:
-       *  we are on last repeat
-       *  we are writing the last value
-       *  It's valid and ready
-       */
-      address_register <= '0;
-      length_register <= '0;
-      repeats_counter <= '0;
+    if (reset) begin
+      for (int bank = 0; bank < BANKS; bank++) begin
+        address_registers[bank] <= '0;
+        length_registers[bank] <= '0;
+        repeats_counters[bank] <= '0;
+        final_chunk_registers[bank] <= '0;
+      end
+      load_bank <= 0;
+      stream_bank <= 0;
     end else begin
       // Load data based on ready valid handshake
       if (instruction_valid && instruction_ready) begin
-        address_register <= address_input;
-        length_register <= length_input;
-        repeats_counter <= repeats_input;
-      end else if (repeats_counter != 0) begin
-        // Decrement repeats counter (decrease right after "last" is asserted)
-        if (writing_last_value_to_processor) begin
-          repeats_counter <= repeats_counter - 1;
+        address_registers[load_bank] <= address_input;
+        length_registers[load_bank] <= length_input;
+        repeats_counters[load_bank] <= repeats_input;
+        final_chunk_registers[load_bank] <= final_chunk_input;
+        load_bank <= PREFETCH ? !load_bank : 1'b0;
+      end
+      // Decrement repeats counter (decrease right after "last" is asserted). Never the bank being loaded, that one is free
+      if (writing_last_value_to_processor) begin
+        repeats_counters[stream_bank] <= repeats_counters[stream_bank] - 1;
+        if (repeats_counters[stream_bank] == 1) begin
+          // Last repeat done, the other bank (if loaded) goes next
+          stream_bank <= PREFETCH ? !stream_bank : 1'b0;
         end
       end
     end 
   end
-  // Receive new instructions when counter reaches 0
-  assign instruction_ready = repeats_counter == 0;
+  // Receive new instructions when the counter of the next bank reaches 0 (with PREFETCH: while the other one repeats)
+  assign instruction_ready = repeats_counters[load_bank] == 0;
+  // Without K_SPLIT every pass is a whole block, so every last finishes a tile
+  assign final_chunk = !K_SPLIT || final_chunk_registers[stream_bank];
 
   /********************
    * Read from memory *
    ********************/
   // Read from memory as long as we are operating. Only read until counter reaches length of values we need to read. 
-  logic [MEMORY_INPUT_COUNTER_BITS-1:0] memory_reading_counter; // to count if we have read enough data from memory (always represent number of values written in buffer)
-  logic [DATA_WIDTH-1:0] memory_buffer_registers[MAX_MATRIX_LEN * N - 1 : 0]; // Flat buffer, we send memory_buffer_registers[N * (i+1) - 1 : N * i]
+  logic [MEMORY_INPUT_COUNTER_BITS-1:0] memory_reading_counters[BANKS-1:0]; // to count if we have read enough data from memory (always represent number of values written in the bank)
+  logic [DATA_WIDTH-1:0] memory_buffer_registers[BANKS-1:0][BUFFER_LENGTH * N - 1 : 0]; // Flat buffer per bank, we send memory_buffer_registers[bank][N * (i+1) - 1 : N * i]
+  logic bank_reading[BANKS-1:0]; // bank holds an instruction not fully read yet
+  logic fetch_bank; // bank being read from memory: the one being sent first, then the next one (PREFETCH)
+
+  always_comb begin : banks_reading
+    for (int bank = 0; bank < BANKS; bank++) begin
+      bank_reading[bank] = repeats_counters[bank] != 0 && memory_reading_counters[bank] < length_registers[bank] * N;
+    end
+  end
+  assign fetch_bank = PREFETCH && !bank_reading[stream_bank] ? !stream_bank : stream_bank;
+
   // We don't need to clear the memory registers on reset, just have to not access it
   always_ff @(posedge clk) begin : read_from_memory
     if (reset) begin
-      memory_reading_counter <= '0;
-    end else if (repeats_counter != 0) begin
+      for (int bank = 0; bank < BANKS; bank++) begin
+        memory_reading_counters[bank] <= '0;
+      end
+    end else begin
       // In operation, check if enough memory has been read. If not, read it.
-      if (memory_reading_counter < length_register * N) begin
-        // TODO: we are really assuming N and M are integer multiples... of PARALLEL_DATA_STREAMING_SIZE
-        if (memory_read_valid && memory_read_ready) begin
-          // read ready and valid
-          memory_reading_counter <= memory_reading_counter + PARALLEL_DATA_STREAMING_SIZE; 
-          memory_buffer_registers[memory_reading_counter+PARALLEL_DATA_STREAMING_SIZE-1 : memory_reading_counter] = memory_data[PARALLEL_DATA_STREAMING_SIZE-1:0];
+      // TODO: we are really assuming N and M are integer multiples... of PARALLEL_DATA_STREAMING_SIZE
+      if (memory_read_valid && memory_read_ready) begin
+        // read ready and valid
+        memory_reading_counters[fetch_bank] <= memory_reading_counters[fetch_bank] + PARALLEL_DATA_STREAMING_SIZE; 
+        for (int i = 0; i < PARALLEL_DATA_STREAMING_SIZE; i++) begin
+          memory_buffer_registers[fetch_bank][memory_reading_counters[fetch_bank] + i] <= memory_data[i];
         end
       end
+      if (repeats_counters[stream_bank] == 1 && writing_last_value_to_processor) begin
+        // Start over for the next instruction of this bank (it was fully read, so it is not the one fetching)
+        memory_reading_counters[stream_bank] <= '0;
+      end
     end
   end
-  assign memory_address = address_register + memory_reading_counter;
-  assign memory_read_ready = repeats_counter != 0 && memory_reading_counter < length_register * N; // Ready to read when we are still operating, and have not fully read data yet
+  assign memory_address = address_registers[fetch_bank] + memory_reading_counters[fetch_bank];
+  assign memory_read_ready = bank_reading[fetch_bank]; // Ready to read when we are still operating, and have not fully read data yet
 
   /**********************
    * Write to processor *
@@ -128,28 +172,47 @@ module memory_buffer #(
 
   // Add writing destination confirmation
   logic [PROCESSORS_ID_COUNTER_BITS-1:0] processor_id_counter;
+  // BROADCAST: processors that still have to take the current beat, all of them again for every new beat
+  logic [NUM_PROCESSORS_TO_BROADCAST-1:0] processor_pending;
+  logic [NUM_PROCESSORS_TO_BROADCAST-1:0] processor_taking; // handshakes on the next edge
+
+  always_comb begin : processor_valids
+    for (int i = 0; i < NUM_PROCESSORS_TO_BROADCAST; i++) begin
+      processor_input_valids[i] = processor_input_valid && (BROADCAST ? processor_pending[i] : processor_id_counter == i);
+      processor_taking[i] = processor_input_valids[i] && processor_input_ready[i];
+    end
+  end
+  // One ID at a time the beat is done when the last ID takes it, broadcast when nobody else is missing it
+  assign beat_done = BROADCAST ? processor_input_valid && (processor_pending & ~processor_taking) == '0
+                               : processor_taking[NUM_PROCESSORS_TO_BROADCAST-1];
 
   always_ff @(posedge clk) begin : write_to_processor
     if (reset) begin
       processor_writing_counter <= 0;
       processor_id_counter <= 0; // Default write to id 0
-    end else if (processor_input_ready[processor_id_counter] && processor_input_valid) begin
-      if (processor_id_counter == NUM_PROCESSORS_TO_BROADCAST-1) begin
-        // This is the last processor to broadcast to
-        processor_id_counter <= 0;
-        // Increase the counter (if at end repeat back)
-        if (last) begin
-          // repeat back
-          processor_writing_counter <= 0;
-        end else begin
-          processor_writing_counter <= processor_writing_counter + 1;
-        end
+      processor_pending <= '1;
+    end else if (beat_done) begin
+      // Every processor has it, next beat (if at end repeat back)
+      processor_id_counter <= 0;
+      processor_pending <= '1;
+      if (last) begin
+        processor_writing_counter <= 0;
       end else begin
-        processor_id_counter <= processor_id_counter + 1;
+        processor_writing_counter <= processor_writing_counter + 1;
       end
+    end else if (BROADCAST) begin
+      // Keep offering the beat to the processors that did not take it yet
+      processor_pending <= processor_pending & ~processor_taking;
+    end else if (processor_taking[processor_id_counter]) begin
+      processor_id_counter <= processor_id_counter + 1;
+    end
+  end
+  assign processor_input_id = processor_id_counter;
+  assign processor_input_valid = repeats_counters[stream_bank] != 0 && memory_reading_counters[stream_bank] >= (processor_writing_counter+1) * N;
+  always_comb begin : processor_data
+    for (int i = 0; i < N; i++) begin
+      processor_input_data[i] = memory_buffer_registers[stream_bank][processor_writing_counter * N + i];
     end
   end
-  assign processor_input_valid = memory_reading_counter >= (processor_writing_counter+1) * N;
-  assign processor_input_data = memory_buffer_registers[(processor_writing_counter+1)*N - 1 : processor_writing_counter*N];
-  assign last = processor_writing_counter == length_register-1; // when counter is len-1, the next number is last.
+  assign last = processor_writing_counter == length_registers[stream_bank]-1; // when counter is len-1, the next number is last.
 endmodule
\ No newline at end of file
@@ -10,14 +10,13 @@ module output_memory_writer #(
   parameter int B_N = 2,                    // What's the width of the processing units
   parameter int N = 1 << B_N,                    // What's the width of the processing units
 
-  parameter int B_MEMORY_ADDRESS_BITS = 6  // Used to communicate with the memory 2^6
+  parameter int B_MEMORY_ADDRESS_BITS = 6,  // Used to communicate with the memory 2^6
   parameter int B_PARALLEL_DATA_STREAMING_SIZE = 2, // Memory can output 4 numbers at same time (2^2) TODO: always divisor of SIZE...
 
-  parameter int MEMORY_ADDRESS_BITS = 1 << B_MEMORY_ADDRESS_BITS  // Used to communicate with the memory
+  parameter int MEMORY_ADDRESS_BITS = 1 << B_MEMORY_ADDRESS_BITS,  // Used to communicate with the memory
   parameter int PARALLEL_DATA_STREAMING_SIZE = 1 << B_PARALLEL_DATA_STREAMING_SIZE, // Memory can output 4 numbers at same time TODO: always divisor of SIZE...
   
-  parameter int COUNTER_BITS = $clog2(N-1 + 1) // We count from 0 to N-1 for cycles written
-  parameter int MEMORY_INPUT_COUNTER_BITS = $clog2(MAX_MATRIX_LENGTH * N + 1) // For reading from memory, we read at most MAX_MATRIX_LENGTH * N values
+  parameter int COUNTER_BITS = $clog2(N + 1) // We count from 0 to N for rows read
 ) (
   input   logic                           clk,            // Clock signal
   input   logic                           reset,          // To clear buffer and restore counter
@@ -37,7 +36,7 @@ module output_memory_writer #(
   output  logic                           write_valid,
   input   logic                           write_ready,
   output  logic [MEMORY_ADDRESS_BITS-1:0] write_address,
-  output  logic [DATA_OUTPUT_DATA_WIDTHWIDTH-1:0]          write_data[PARALLEL_DATA_STREAMING_SIZE-1:0],
+  output  logic [OUTPUT_DATA_WIDTH-1:0]   write_data[PARALLEL_DATA_STREAMING_SIZE-1:0],
 
   // Communicating with the processor
   input   logic                           output_valid,
@@ -50,14 +49,14 @@ module output_memory_writer #(
    ************************/
   // Define Registers
   logic [MEMORY_ADDRESS_BITS-1:0] address_register; // remember the memory address after receiving from controller
-  logic [COUNTER_BITS-1:0] processor_read_counter; // Counts how many times data is read from module (from 0 to N-1)
+  logic [COUNTER_BITS-1:0] processor_read_counter; // Counts how many rows were read from the processor (from 0 to N)
   logic output_by_row_instruction_register;
   logic in_operation_register; // Tell module if we should be reading from processor / writing to memory // TODO is this used?
   logic completed_register; // remember if all operations have been completed
 
   // Always FF Block
   always_ff @(posedge clk) begin : read_from_controller
-    if (reset || (processor_read_counter == N-1 && memory_write_counter == N-PARALLEL_DATA_STREAMING_SIZE && write_valid && write_ready)) begin
+    if (reset || (processor_read_counter == N && memory_write_counter == N-PARALLEL_DATA_STREAMING_SIZE && write_valid && write_ready)) begin
       /* Reset when:
        *  We have finished reading the last value from processor
        *  we are currently ready to write the last bit of value to memory (N-StreamingSize)
@@ -149,11 +148,13 @@ module output_memory_writer #(
 
   assign write_valid = write_valid_register;
 
-  // Write address is base address + offset
-  assign write_address = address_register + memory_write_counter;
+  // Write address is base address + offset, the row in the buffer is the last one read (row-major tile)
+  assign write_address = address_register + (processor_read_counter - 1) * N + memory_write_counter;
 
   // Assign write data lines
-  for (int i = 0; i < PARALLEL_DATA_STREAMING_SIZE; i++) begin
-    write_data[i] = output_writer_buffer[memory_write_counter + i];
+  always_comb begin : write_data_lines
+    for (int i = 0; i < PARALLEL_DATA_STREAMING_SIZE; i++) begin
+      write_data[i] = output_writer_buffer[memory_write_counter + i];
+    end
   end
 endmodule
\ No newline at end of file
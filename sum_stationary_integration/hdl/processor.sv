@@ -7,6 +7,9 @@ module processor #(
   parameter int PROCESSOR_COLS_BITS = 4, // Giving each processor an ID, this is used to respond to input valid
   parameter int ROW_ID = 0,
   parameter int COL_ID = 0,
+  parameter int DOUBLE_BUFFER = 0, // 1: finished results go to a shadow bank so the next tile streams in while the last one drains
+  parameter int INPUT_FIFO_DEPTH = 0, // >0: A and B each go through their own FIFO of this many beats, handshaking on their own ready
+  parameter int K_SPLIT = 0, // 1: a tile comes in several chunks, only a last with final_chunk ends it (accumulators carry on otherwise)
   
   parameter int N = 1 << B_N, // Computing NxN matrix multiplications
   parameter int COUNTER_BITS = $clog2(2 * N + 1) // We count from 2N to 0
@@ -17,44 +20,150 @@ module processor #(
   input   logic                                                   b_input_valid,  // External input to module is correct/valid
   input   logic                                                   output_ready,   // External device is ready to receive output
   output  logic                                                   input_ready,    // Device ready to receive input
+  output  logic                                                   a_input_ready,  // A side ready on its own (input_ready without INPUT_FIFO_DEPTH)
+  output  logic                                                   b_input_ready,  // B side ready on its own (input_ready without INPUT_FIFO_DEPTH)
 
-  input   logic [PROCESSOR_COLS_BITS]                             input_col_id,   // Col destination of the A input
-  input   logic [PROCESSOR_ROWS_BITS]                             input_row_id,   // Row destination of the B input
+  input   logic [PROCESSOR_COLS_BITS-1:0]                         input_col_id,   // Col destination of the A input
+  input   logic [PROCESSOR_ROWS_BITS-1:0]                         input_row_id,   // Row destination of the B input
 
   output  logic                                                   output_valid,   // Output is valid when all data is passed through
   input   logic                                                   output_by_row,  // Indicate if output should be done row wise or col wise
   input   logic                                                   last,           // Signal to indicate this input is the last one (only high with last data)
+  input   logic                                                   final_chunk,    // K_SPLIT: with last, the chunk ending is the last of the tile
   input   logic [DATA_WIDTH-1:0]                                  a_data[N-1:0],  // Column inputs of A (right to left)
   input   logic [DATA_WIDTH-1:0]                                  b_data[N-1:0],  // Row inputs of B (bottom to top)
   output  logic [MULTIPLY_DATA_WIDTH + ACCUM_DATA_WIDTH - 1 : 0]  c_data_streaming[N]    // Streaming data output of C
 );
 
-  // Define result valid signal
-  logic [COUNTER_BITS-1:0] counter;  // Program executes in set number of cycles, count number of cycles
-  assign result_valid = counter == 0;  // Counter won't count down anymore (enable false) when result valid
-  logic enable;
-  logic input_done; // record if the input is over and we just propagating data
-  always_ff @(posedge clk) begin
-    if (reset || (result_valid && !output_valid)) begin
-      // Reset or, we pushing result to output buffers
-      counter <= 2 * N;  // N-1 to pass data through registers, N+1 to compute
-      input_done <= 0;
-    end else if (input_done) begin
-      // Input is done, just decrease count and that's it
-      counter <= counter - 1;
-    end else if (last && input_ready && a_input_valid && (input_col_id == COL_ID) && b_input_valid && (input_row_id == ROW_ID)) begin  
-      // Last input is imposed, we begin countdown. Only count down after we sure data is in
-      counter <= counter - 1;
-      input_done <= 1;
-    end 
-  end
+  logic result_valid;  // Result of a tile ready for the output streaming registers
+  logic enable;        // Shift the delay registers and the systolic array
+  logic array_reset;   // Clear the delay registers and the systolic array
+  logic bank_final;    // DOUBLE_BUFFER: the last unit (N-1, N-1) just put its result in the shadow bank
+
+  // Beats as the array sees them: straight from the ports, or the heads of the input FIFOs
+  logic a_valid;                     // A beat for this processor is there
+  logic b_valid;                     // B beat for this processor is there
+  logic head_last;                   // The A beat is the last of its tile
+  logic [DATA_WIDTH-1:0] a_head[N-1:0];
+  logic [DATA_WIDTH-1:0] b_head[N-1:0];
+  logic array_ready;                 // The array takes the A and B beat this cycle (implies both valid)
+
+  // Last beat of a tile. With K_SPLIT the last of a chunk that is not final is just another beat: the sums keep
+  // accumulating through it, so a tile of X = sum of the chunk lengths is the same as one X long pass.
+  logic tile_last;
+  assign tile_last = K_SPLIT ? (last && final_chunk) : last;
+  generate
+    if (INPUT_FIFO_DEPTH > 0) begin : input_fifos
+      // Each side is written on its own handshake, so A no longer waits for B to be valid (and the other way
+      // around) and last only has to come with A. The array takes a beat when both heads are there, gaps of one
+      // side are absorbed by the FIFO of the other instead of stalling the memory buffer feeding it.
+      logic a_fifo_ready, b_fifo_ready;
+      logic b_head_last;  // B has no last, unused
+      assign a_input_ready = a_fifo_ready && (input_col_id == COL_ID);
+      assign b_input_ready = b_fifo_ready && (input_row_id == ROW_ID);
+      assign input_ready = a_input_ready && b_input_ready;  // Both sides have room, for monitoring only
+      input_fifo #(
+        .DATA_WIDTH(DATA_WIDTH),
+        .N(N),
+        .DEPTH(INPUT_FIFO_DEPTH)
+      ) a_input_fifo (
+        .clk(clk),
+        .reset(reset),
+        .write_valid(a_input_valid && (input_col_id == COL_ID)),
+        .write_ready(a_fifo_ready),
+        .data_i(a_data),
+        .last_i(tile_last),
+        .read_valid(a_valid),
+        .read_ready(array_ready),
+        .data_o(a_head),
+        .last_o(head_last)
+      );
+      input_fifo #(
+        .DATA_WIDTH(DATA_WIDTH),
+        .N(N),
+        .DEPTH(INPUT_FIFO_DEPTH)
+      ) b_input_fifo (
+        .clk(clk),
+        .reset(reset),
+        .write_valid(b_input_valid && (input_row_id == ROW_ID)),
+        .write_ready(b_fifo_ready),
+        .data_i(b_data),
+        .last_i(1'b0),
+        .read_valid(b_valid),
+        .read_ready(array_ready),
+        .data_o(b_head),
+        .last_o(b_head_last)
+      );
+    end else begin : direct_inputs
+      assign a_valid = a_input_valid && (input_col_id == COL_ID);
+      assign b_valid = b_input_valid && (input_row_id == ROW_ID);
+      assign head_last = tile_last;
+      assign a_head = a_data;
+      assign b_head = b_data;
+      assign input_ready = array_ready;
+      assign a_input_ready = array_ready;
+      assign b_input_ready = array_ready;
+    end
+  endgenerate
+
+  generate
+    if (DOUBLE_BUFFER) begin : double_buffered
+      // Every unit moves its finished sum to its shadow register when the last product of the tile reaches it
+      // (a last tag travels through the array with the A data) and starts the next tile from 0, so the array
+      // never stops or resets and the next tile streams in right behind the last one. Bubbles shift zeros in,
+      // which add nothing. Only the last beat of the next tile waits (array_ready low) until the shadow bank
+      // was handed to the output streaming registers, so no unit overwrites a result still to be read.
+      logic bank_valid;    // Every unit holds its result in the shadow bank
+      logic bank_pending;  // A last beat went in and its tile did not reach the output streaming registers yet
+      assign result_valid = bank_valid;
+      assign enable = 1'b1;
+      assign array_reset = reset;
+      assign array_ready = a_valid && b_valid && !(head_last && bank_pending);
+      always_ff @(posedge clk) begin
+        if (reset) begin
+          bank_valid <= 0;
+          bank_pending <= 0;
+        end else begin
+          if (bank_valid && !output_valid) begin
+            // Output streaming registers take the bank this edge
+            bank_valid <= 0;
+            bank_pending <= 0;
+          end else if (bank_final) begin
+            bank_valid <= 1;
+          end
+          if (head_last && array_ready) begin
+            bank_pending <= 1;
+          end
+        end
+      end
+    end else begin : single_buffered
+      // Define result valid signal
+      logic [COUNTER_BITS-1:0] counter;  // Program executes in set number of cycles, count number of cycles
+      assign result_valid = counter == 0;  // Counter won't count down anymore (enable false) when result valid
+      logic input_done; // record if the input is over and we just propagating data
+      always_ff @(posedge clk) begin
+        if (reset || (result_valid && !output_valid)) begin
+          // Reset or, we pushing result to output buffers
+          counter <= 2 * N;  // N-1 to pass data through registers, N+1 to compute
+          input_done <= 0;
+        end else if (input_done) begin
+          // Input is done, just decrease count and that's it
+          counter <= counter - 1;
+        end else if (head_last && array_ready) begin  
+          // Last input is imposed, we begin countdown. Only count down after we sure data is in
+          counter <= counter - 1;
+          input_done <= 1;
+        end 
+      end
 
-  // Define enable signal -- shift data in registers and inside the systolic array
-  assign enable = ((a_input_valid && (input_col_id == COL_ID) && b_input_valid && (input_row_id == ROW_ID) && input_ready) || input_done) && !result_valid;  // Process data when data being input, OR all data is now in registers. Never when output_valid
-  // I know this is a little repetitive, but this extra input_ready makes it clear
+      // Define enable signal -- shift data in registers and inside the systolic array
+      assign enable = (array_ready || input_done) && !result_valid;  // Process data when data being input, OR all data is now in registers. Never when output_valid
 
-  // Define input ready -- we read input when input is not already done
-  assign input_ready = (!input_done) && (a_input_valid && (input_col_id == COL_ID) && b_input_valid && (input_row_id == ROW_ID)); // Adding both input valid to ensure not one device ends input early  
+      // Define input ready -- we read input when input is not already done
+      assign array_ready = (!input_done) && a_valid && b_valid; // Adding both input valid to ensure not one device ends input early  
+      assign array_reset = reset || (result_valid && !output_valid);
+    end
+  endgenerate
 
   // Define input data to the unit matrix
   logic [DATA_WIDTH-1:0] north_inputs [N-1:0];  // North Inputs have N inputs (B's row)
@@ -64,10 +173,10 @@ module processor #(
     .N(N)
   ) west_delay_register (
     .clk(clk),
-    .reset(reset || (result_valid && !output_valid)),
-    .read_input(a_input_valid && (input_col_id == COL_ID) && input_ready),  // Must consider ready as well (data can be valid in between runs)
+    .reset(array_reset),
+    .read_input(array_ready),  // Must consider ready as well (data can be valid in between runs)
     .enable(enable),
-    .data_i(a_data[N-1:0]),
+    .data_i(a_head[N-1:0]),
     .data_o(west_inputs[N-1:0])
   );
   input_delay_register #(
@@ -75,17 +184,36 @@ module processor #(
     .N(N)
   ) north_delay_register(
     .clk(clk),
-    .reset(reset || (result_valid && !output_valid)),
-    .read_input(b_input_valid && (input_row_id == ROW_ID) && input_ready),
+    .reset(array_reset),
+    .read_input(array_ready),
     .enable(enable),
-    .data_i(b_data[N-1:0]),
+    .data_i(b_head[N-1:0]),
     .data_o(north_inputs[N-1:0])
   );
 
+  // Last tags of the A rows, delayed like the data (only used with DOUBLE_BUFFER)
+  logic last_lanes [N-1:0];
+  logic west_lasts [N-1:0];
+  assign last_lanes = '{default: head_last};
+  input_delay_register #(
+    .DATA_WIDTH(1),
+    .N(N)
+  ) last_delay_register (
+    .clk(clk),
+    .reset(array_reset),
+    .read_input(array_ready),
+    .enable(enable),
+    .data_i(last_lanes),
+    .data_o(west_lasts)
+  );
+
   // Define NxN array of processing units
   logic [DATA_WIDTH-1:0] horizontal_interconnect[N:0][N:1]; // The input the i,j th unit will get from west, last is not used
   logic [DATA_WIDTH-1:0] vertical_interconnect[N:1][N:0]; // The input the i,j th unit will get from north, last is not used
   logic [MULTIPLY_DATA_WIDTH + ACCUM_DATA_WIDTH - 1:0] c_data[N-1:0][N-1:0]; // Full computation of C to be buffered
+  logic last_interconnect[N-1:0][N:1]; // Last tag going east with the west inputs
+  logic result_finals[N-1:0][N-1:0];   // Unit just moved a finished result to its shadow register
+  assign bank_final = result_finals[N-1][N-1];  // The wavefront reaches the bottom right unit last
   generate
     genvar i, j;
     for (i = 0; i < N; i++) begin : processing_units_row
@@ -94,16 +222,20 @@ module processor #(
           .DATA_WIDTH(DATA_WIDTH),
           .N(N),
           .MULTIPLY_DATA_WIDTH(MULTIPLY_DATA_WIDTH), 
-          .ACCUM_DATA_WIDTH(ACCUM_DATA_WIDTH) 
+          .ACCUM_DATA_WIDTH(ACCUM_DATA_WIDTH),
+          .DOUBLE_BUFFER(DOUBLE_BUFFER)
         ) u_processing_unit (
           .clk(clk),
           .enable(enable),
-          .reset(reset || (result_valid && !output_valid)),
+          .reset(array_reset),
           .west_i((j == 0) ? west_inputs[i] : horizontal_interconnect[i][j]),
           .north_i((i == 0) ? north_inputs[j] : vertical_interconnect[i][j]),
+          .west_last_i((j == 0) ? west_lasts[i] : last_interconnect[i][j]),
           .south_o(vertical_interconnect[i+1][j]),
           .east_o(horizontal_interconnect[i][j+1]),
-          .result_o(c_data[i][j])
+          .east_last_o(last_interconnect[i][j+1]),
+          .result_o(c_data[i][j]),
+          .result_final_o(result_finals[i][j])
         );
       end
     end
@@ -130,16 +262,20 @@ module processing_unit #(
   parameter int DATA_WIDTH = 8,
   parameter int N = 4,
   parameter int MULTIPLY_DATA_WIDTH = 2 * DATA_WIDTH, 
-  parameter int ACCUM_DATA_WIDTH = 16
+  parameter int ACCUM_DATA_WIDTH = 16,
+  parameter int DOUBLE_BUFFER = 0  // Finished results go to a shadow register, see processor
 ) (
   input                           clk,      // Clock signal
   input                           enable,   // Send data to next, and calculate result to store it
   input                           reset,    // Reset signal
   input        [DATA_WIDTH-1:0]   west_i,   // West input
   input        [DATA_WIDTH-1:0]   north_i,  // North input
+  input                           west_last_i,  // West input is the last of its tile (DOUBLE_BUFFER)
   output       [DATA_WIDTH-1:0]   south_o,  // South output
   output       [DATA_WIDTH-1:0]   east_o,   // East output
-  output logic [MULTIPLY_DATA_WIDTH + ACCUM_DATA_WIDTH-1:0] result_o  // Result output
+  output                          east_last_o,  // Last tag passed on with east_o
+  output logic [MULTIPLY_DATA_WIDTH + ACCUM_DATA_WIDTH-1:0] result_o,  // Result output
+  output logic                    result_final_o  // result_o just took the finished result of a tile (DOUBLE_BUFFER)
 );
   // Output is stored in result_reg, while calculation is in result_calc wire before storing
   logic [MULTIPLY_DATA_WIDTH + ACCUM_DATA_WIDTH-1:0] result_calc;
@@ -154,14 +290,18 @@ module processing_unit #(
   assign result_calc = product_reg + result_reg;
   assign product_calc = north_i * west_i;
 
-  // Output is always result register
-  assign result_o = result_reg;
+  // Output is the result register, or the shadow register holding the last finished tile
+  logic [MULTIPLY_DATA_WIDTH + ACCUM_DATA_WIDTH-1:0] result_shadow;
+  logic product_last;  // product_reg is the last product of its tile
+  assign result_o = DOUBLE_BUFFER ? result_shadow : result_reg;
 
   // Store value and output through other side
   logic [DATA_WIDTH-1:0] north_i_reg;
   logic [DATA_WIDTH-1:0] west_i_reg;
+  logic west_last_reg;
   assign south_o = north_i_reg;
   assign east_o = west_i_reg;
+  assign east_last_o = west_last_reg;
 
   // Store data when enable
   always_ff @(posedge clk) begin
@@ -171,17 +311,31 @@ module processing_unit #(
       result_reg <= '0;
       product_reg <= '0;
       product_calculated <= '0;
+      west_last_reg <= '0;
+      product_last <= '0;
+      result_shadow <= '0;
+      result_final_o <= '0;
     end else begin
       if (enable) begin
         product_reg <= product_calc;
         product_calculated <= '1;
+        product_last <= west_last_i;
         north_i_reg <= north_i;
         west_i_reg <= west_i;
+        west_last_reg <= west_last_i;
       end else begin
         product_calculated <= '0;
       end
+      result_final_o <= '0;
       if (product_calculated) begin
-        result_reg <= result_calc;
+        if (DOUBLE_BUFFER && product_last) begin
+          // Last product of the tile: the finished sum goes to the shadow register, the next tile starts from 0
+          result_shadow <= result_calc;
+          result_reg <= '0;
+          result_final_o <= '1;
+        end else begin
+          result_reg <= result_calc;
+        end
       end
     end
   end
@@ -231,6 +385,58 @@ module input_delay_register #(
   endgenerate
 endmodule
 
+// First in first out buffer of N-wide beats (and their last), in front of an input_delay_register
+module input_fifo #(
+  parameter int DATA_WIDTH = 8,   // Data Width
+  parameter int N = 4,            // Words per beat
+  parameter int DEPTH = 2,        // Beats held, 2 or more to take one beat every cycle
+  parameter int POINTER_BITS = DEPTH > 1 ? $clog2(DEPTH) : 1
+) (
+  input                           clk,            // Clock Signal
+  input                           reset,          // Reset signal
+  input                           write_valid,    // data_i / last_i is a beat to store
+  output logic                    write_ready,    // Room for one more beat
+  input        [DATA_WIDTH-1:0]   data_i[N-1:0],  // Beat written
+  input                           last_i,         // Beat written is the last of its tile
+  output logic                    read_valid,     // data_o / last_o is the oldest beat stored
+  input                           read_ready,     // Remove the oldest beat
+  output logic [DATA_WIDTH-1:0]   data_o[N-1:0],  // Oldest beat
+  output logic                    last_o          // Oldest beat is the last of its tile
+);
+  logic [DATA_WIDTH-1:0] entries [DEPTH-1:0][N-1:0];
+  logic entry_lasts [DEPTH-1:0];
+  logic [POINTER_BITS-1:0] head;  // Oldest beat
+  logic [POINTER_BITS-1:0] tail;  // Where the next beat goes
+  logic [$clog2(DEPTH+1)-1:0] count;
+
+  assign write_ready = count != DEPTH;
+  assign read_valid = count != 0;
+  assign data_o = entries[head];
+  assign last_o = entry_lasts[head];
+
+  logic push, pop;
+  assign push = write_valid && write_ready;
+  assign pop = read_valid && read_ready;
+
+  always_ff @(posedge clk) begin
+    if (reset) begin
+      head <= 0;
+      tail <= 0;
+      count <= 0;
+    end else begin
+      if (push) begin
+        entries[tail] <= data_i;
+        entry_lasts[tail] <= last_i;
+        tail <= (tail == DEPTH - 1) ? 0 : tail + 1;
+      end
+      if (pop) begin
+        head <= (head == DEPTH - 1) ? 0 : head + 1;
+      end
+      count <= count + push - pop;
+    end
+  end
+endmodule
+
 module output_streaming_registers #(
   parameter int N = 4, // Computing NxN matrix multiplications
   parameter int C_DATA_WIDTH = 18
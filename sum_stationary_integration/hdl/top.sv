@@ -18,11 +18,16 @@
  *    These units just simply: read address, read output data, send data to memory, wait for new address. 
  */
 
-module controller #(
+module top #(
   parameter int DATA_WIDTH = 8,           // Using 8-bit integers 
   
   parameter int N = 4,                    // What's the width of the processing units
   parameter int M = 4,                    // This is how much memory is supposed to be stored by the memory buffer (TODO: currently we make it same as N, but will be different)
+  parameter int K_SPLIT = 0,              // 1: memory buffers only hold chunks of M, processors accumulate a tile across them
+  parameter int BROADCAST = 0,            // 1: memory buffers stream every beat to all their processors in parallel
+  parameter int PREFETCH = 0,             // 1: memory buffers fetch their next instruction while repeating the current one
+  parameter int DOUBLE_BUFFER = 0,        // 1: processors drain a tile from a shadow bank while the next one streams in
+  parameter int INPUT_FIFO_DEPTH = 0,     // >0: processors take A and B through their own FIFOs of that many beats
   parameter int MAX_MATRIX_LENGTH = 4096,  // Assume the max matrix we will do is 4k
   parameter int MULTIPLY_DATA_WIDTH = 2 * DATA_WIDTH, // Data width for multiplication operations
   parameter int ACCUM_DATA_WIDTH = 16, // How many additional bits to reserve for accumulation, can change
@@ -37,8 +42,8 @@ module controller #(
   parameter int PROCESSOR_COLS_BITS = $clog2(COLS_PROCESSORS+1), // To use to store counter value for telling which processor row to write to
   
   // Calculated parameters for input buffers
-  parameter int INPUT_BUFFER_COUNTER_BITS = $clog2(MAX_MATRIX_LENGTH + 1) // We need to keep track of a count from 0 to MAX_MATRIX_LENGTH
-  parameter int INPUT_BUFFER_MEMORY_INPUT_COUNTER_BITS = $clog2(MAX_MATRIX_LENGTH * N + 1) // For reading from memory, we read at most MAX_MATRIX_LENGTH * N values
+  parameter int INPUT_BUFFER_COUNTER_BITS = $clog2(MAX_MATRIX_LENGTH + 1), // We need to keep track of a count from 0 to MAX_MATRIX_LENGTH
+  parameter int INPUT_BUFFER_MEMORY_INPUT_COUNTER_BITS = $clog2(MAX_MATRIX_LENGTH * N + 1), // For reading from memory, we read at most MAX_MATRIX_LENGTH * N values
   parameter int INPUT_BUFFER_REPEATS_COUNTER_BITS = $clog2((MAX_MATRIX_LENGTH/N) + 1), // keep track of how many full data repeats are sent. If we use this for B buffer, the value could become just 1 or 0... (probably keep the bit to a high value in case controller want to fast output A instead of B)
 
   parameter int MEMORY_ADDRESS_BITS = 64,  // Used to communicate with the memory
@@ -73,50 +78,40 @@ module controller #(
    * - every cycle looping around... - if read ready, send data with read valid. 
    * OR send chunk data until move on to next. 
    */
-  // TODO, temp using many memory bus for module I/O
-  input   logic [DATA_WIDTH-1:0]          input_memory_a_read_bus[ROWS_PROCESSORS-1:0][PARALLEL_DATA_STREAMING_SIZE-1:0],
-  input   logic [DATA_WIDTH-1:0]          input_memory_b_read_bus[COLS_PROCESSORS-1:0][PARALLEL_DATA_STREAMING_SIZE-1:0],
-  input   logic [MULTIPLY_DATA_WIDTH+ACCUM_DATA_WIDTH-1:0] output_memory_read_bus[NUM_PROCESSORS-1:0][PARALLEL_DATA_STREAMING_SIZE-1:0],
+  // TODO, temp using many memory bus for module I/O (the A / B buffers only read, the output writers only write)
+  // Buses are flat, port i has words i*PARALLEL_DATA_STREAMING_SIZE .. (i+1)*PARALLEL_DATA_STREAMING_SIZE-1 (simulators' VPI can't index 2D ports)
+  input   logic [DATA_WIDTH-1:0]          input_memory_a_read_bus[ROWS_PROCESSORS*PARALLEL_DATA_STREAMING_SIZE-1:0],
+  input   logic [DATA_WIDTH-1:0]          input_memory_b_read_bus[COLS_PROCESSORS*PARALLEL_DATA_STREAMING_SIZE-1:0],
   output  logic [MEMORY_ADDRESS_BITS-1:0]           input_memory_a_read_address[ROWS_PROCESSORS-1:0],
   output  logic [MEMORY_ADDRESS_BITS-1:0]           input_memory_b_read_address[COLS_PROCESSORS-1:0],
-  output  logic [MEMORY_ADDRESS_BITS-1:0]           output_memory_read_address[NUM_PROCESSORS-1:0],
 
   input   logic  input_memory_a_read_valids   [ROWS_PROCESSORS-1:0],
   input   logic  input_memory_b_read_valids   [COLS_PROCESSORS-1:0],
   output  logic  input_memory_a_read_readys   [ROWS_PROCESSORS-1:0],
   output  logic  input_memory_b_read_readys   [COLS_PROCESSORS-1:0],
-  input   logic  output_memory_read_valids    [NUM_PROCESSORS-1:0],
-  output  logic  output_memory_read_readys    [NUM_PROCESSORS-1:0],
 
-  output  logic  input_memory_a_write_valids  [ROWS_PROCESSORS-1:0],
-  output  logic  input_memory_b_write_valids  [COLS_PROCESSORS-1:0],
-  input   logic  input_memory_a_write_readys  [ROWS_PROCESSORS-1:0],
-  input   logic  input_memory_b_write_readys  [COLS_PROCESSORS-1:0],
   output  logic  output_memory_write_valids   [NUM_PROCESSORS-1:0],
   input   logic  output_memory_write_readys   [NUM_PROCESSORS-1:0],
-
-  output  logic [DATA_WIDTH-1:0]          input_memory_a_write_bus[ROWS_PROCESSORS-1:0][PARALLEL_DATA_STREAMING_SIZE-1:0],
-  output  logic [DATA_WIDTH-1:0]          input_memory_b_write_bus[COLS_PROCESSORS-1:0][PARALLEL_DATA_STREAMING_SIZE-1:0],
-  output  logic [MULTIPLY_DATA_WIDTH+ACCUM_DATA_WIDTH-1:0] output_memory_write_bus[NUM_PROCESSORS-1:0][PARALLEL_DATA_STREAMING_SIZE-1:0],
-  output  logic [MEMORY_ADDRESS_BITS-1:0]          input_memory_a_write_address[ROWS_PROCESSORS-1:0],
-  output  logic [MEMORY_ADDRESS_BITS-1:0]          input_memory_b_write_address[COLS_PROCESSORS-1:0],
+  output  logic [MULTIPLY_DATA_WIDTH+ACCUM_DATA_WIDTH-1:0] output_memory_write_bus[NUM_PROCESSORS*PARALLEL_DATA_STREAMING_SIZE-1:0],
   output  logic [MEMORY_ADDRESS_BITS-1:0] output_memory_write_address[NUM_PROCESSORS-1:0]
 );
   /***********************
    * DEFINE INPUT BUFFER *
    ***********************/
-  // Instruction Variables TODO: have to define values to instruction valids and inputs
+  // Instructions from the controller
   logic a_input_buffer_instruction_valids[ROWS_PROCESSORS-1:0];
   logic a_input_buffer_instruction_readys[ROWS_PROCESSORS-1:0];
   logic [MEMORY_ADDRESS_BITS-1:0] a_input_buffer_address_inputs[ROWS_PROCESSORS-1:0];
   logic [INPUT_BUFFER_COUNTER_BITS-1:0] a_input_buffer_length_inputs[ROWS_PROCESSORS-1:0];
   logic [INPUT_BUFFER_REPEATS_COUNTER_BITS-1:0] a_input_buffer_repeats_inputs[ROWS_PROCESSORS-1:0];
+  logic a_input_buffer_final_chunk_inputs[ROWS_PROCESSORS-1:0];
 
   logic b_input_buffer_instruction_valids[COLS_PROCESSORS-1:0];
   logic b_input_buffer_instruction_readys[COLS_PROCESSORS-1:0];
   logic [MEMORY_ADDRESS_BITS-1:0] b_input_buffer_address_inputs[COLS_PROCESSORS-1:0];
   logic [INPUT_BUFFER_COUNTER_BITS-1:0] b_input_buffer_length_inputs[COLS_PROCESSORS-1:0];
   logic [INPUT_BUFFER_REPEATS_COUNTER_BITS-1:0] b_input_buffer_repeats_inputs[COLS_PROCESSORS-1:0];
+  logic b_input_buffer_final_chunk_inputs[COLS_PROCESSORS-1:0];
 
   logic output_buffer_instruction_valids[NUM_PROCESSORS-1:0];
   logic output_buffer_instruction_readys[NUM_PROCESSORS-1:0];
@@ -130,6 +125,7 @@ module controller #(
 
     .N(N),
     .M(M),
+    .K_SPLIT(K_SPLIT),
     
     .MAX_MATRIX_LENGTH(MAX_MATRIX_LENGTH),
 
@@ -160,12 +156,14 @@ module controller #(
     .a_input_buffer_address_inputs(a_input_buffer_address_inputs),
     .a_input_buffer_length_inputs(a_input_buffer_length_inputs),
     .a_input_buffer_repeats_inputs(a_input_buffer_repeats_inputs),
+    .a_input_buffer_final_chunk_inputs(a_input_buffer_final_chunk_inputs),
 
     .b_input_buffer_instruction_valids(b_input_buffer_instruction_valids),
     .b_input_buffer_instruction_readys(b_input_buffer_instruction_readys),
     .b_input_buffer_address_inputs(b_input_buffer_address_inputs),
     .b_input_buffer_length_inputs(b_input_buffer_length_inputs),
     .b_input_buffer_repeats_inputs(b_input_buffer_repeats_inputs),
+    .b_input_buffer_final_chunk_inputs(b_input_buffer_final_chunk_inputs),
 
     .output_buffer_instruction_valids(output_buffer_instruction_valids),
     .output_buffer_instruction_readys(output_buffer_instruction_readys),
@@ -174,15 +172,17 @@ module controller #(
     
     .output_buffer_completed_readys(output_buffer_completed_readys),
     .output_buffer_completed_valids(output_buffer_completed_valids)
-  )
+  );
 
 
   // Communicate with processor
   logic a_input_valid[ROWS_PROCESSORS-1:0];
+  logic a_input_valids[ROWS_PROCESSORS-1:0][COLS_PROCESSORS-1:0]; // per processor valid (ID decoded, or BROADCAST)
   logic a_input_ready[ROWS_PROCESSORS-1:0][COLS_PROCESSORS-1:0]; // Value Assigned with processor
   logic [DATA_WIDTH-1:0] a_input_data[ROWS_PROCESSORS-1:0][N-1:0];
   logic [PROCESSOR_COLS_BITS-1:0] a_input_id[ROWS_PROCESSORS-1:0]; // TODO This can be a parameter...
   logic a_input_last[ROWS_PROCESSORS-1:0];
+  logic a_input_final_chunk[ROWS_PROCESSORS-1:0];
   generate
     genvar a_input_buffer_index;
     for (a_input_buffer_index = 0; a_input_buffer_index < ROWS_PROCESSORS; a_input_buffer_index++) begin : a_input_buffers
@@ -190,6 +190,9 @@ module controller #(
         .DATA_WIDTH(DATA_WIDTH),
         .N(N),
         .M(M),
+        .K_SPLIT(K_SPLIT),
+        .BROADCAST(BROADCAST),
+        .PREFETCH(PREFETCH),
         .MEMORY_ADDRESS_BITS(MEMORY_ADDRESS_BITS),
         .PARALLEL_DATA_STREAMING_SIZE(PARALLEL_DATA_STREAMING_SIZE),
         .MAX_MATRIX_LENGTH(MAX_MATRIX_LENGTH),
@@ -205,36 +208,43 @@ module controller #(
         .instruction_ready(a_input_buffer_instruction_readys[a_input_buffer_index]),
         .address_input(a_input_buffer_address_inputs[a_input_buffer_index]),
         .length_input(a_input_buffer_length_inputs[a_input_buffer_index]),
-        .repeats_input(a_input_repeats_inputs[a_input_buffer_index]),
+        .repeats_input(a_input_buffer_repeats_inputs[a_input_buffer_index]),
+        .final_chunk_input(a_input_buffer_final_chunk_inputs[a_input_buffer_index]),
         
         .memory_address(input_memory_a_read_address[a_input_buffer_index]),
-        .memory_data(input_memory_a_read_bus[a_input_buffer_index]),
+        .memory_data(input_memory_a_read_bus[(a_input_buffer_index+1)*PARALLEL_DATA_STREAMING_SIZE-1:a_input_buffer_index*PARALLEL_DATA_STREAMING_SIZE]),
         .memory_read_valid(input_memory_a_read_valids[a_input_buffer_index]),
         .memory_read_ready(input_memory_a_read_readys[a_input_buffer_index]),
 
         .processor_input_valid(a_input_valid[a_input_buffer_index]),
+        .processor_input_valids(a_input_valids[a_input_buffer_index]),
         .processor_input_ready(a_input_ready[a_input_buffer_index]),
-        .processor_input_id(a_input_id),
+        .processor_input_id(a_input_id[a_input_buffer_index]),
         .processor_input_data(a_input_data[a_input_buffer_index]),
-        .last(a_input_last[a_input_buffer_index])
-      )
+        .last(a_input_last[a_input_buffer_index]),
+        .final_chunk(a_input_final_chunk[a_input_buffer_index])
+      );
     end
   endgenerate
 
   logic b_input_valid[COLS_PROCESSORS-1:0];
+  logic b_input_valids[COLS_PROCESSORS-1:0][ROWS_PROCESSORS-1:0]; // per processor valid (ID decoded, or BROADCAST)
   logic b_input_ready[COLS_PROCESSORS-1:0][ROWS_PROCESSORS-1:0]; // Value Assigned with processor
   logic [DATA_WIDTH-1:0] b_input_data[COLS_PROCESSORS-1:0][N-1:0];
-  logic [PROCESSOR_COLS_BITS-1:0] b_input_id[COLS_PROCESSORS-1:0]; // TODO This can be a parameter...
-  logic b_input_last[COLS_PROCESSORS-1:0];
+  logic [PROCESSOR_ROWS_BITS-1:0] b_input_id[COLS_PROCESSORS-1:0]; // TODO This can be a parameter...
   generate
     genvar b_input_buffer_index;
     for (b_input_buffer_index = 0; b_input_buffer_index < COLS_PROCESSORS; b_input_buffer_index++) begin : b_input_buffers
+      // last / final_chunk of the B buffers are not used, the processors take them with A
       memory_buffer #(
-        .DATb_WIDTH(DATA_WIDTH),
+        .DATA_WIDTH(DATA_WIDTH),
         .N(N),
         .M(M),
+        .K_SPLIT(K_SPLIT),
+        .BROADCAST(BROADCAST),
+        .PREFETCH(PREFETCH),
         .MEMORY_ADDRESS_BITS(MEMORY_ADDRESS_BITS),
-        .PARALLEL_DATb_STREAMING_SIZE(PARALLEL_DATA_STREAMING_SIZE),
+        .PARALLEL_DATA_STREAMING_SIZE(PARALLEL_DATA_STREAMING_SIZE),
         .MAX_MATRIX_LENGTH(MAX_MATRIX_LENGTH),
 
         .NUM_PROCESSORS_TO_BROADCAST(ROWS_PROCESSORS),
@@ -248,94 +258,70 @@ module controller #(
         .instruction_ready(b_input_buffer_instruction_readys[b_input_buffer_index]),
         .address_input(b_input_buffer_address_inputs[b_input_buffer_index]),
         .length_input(b_input_buffer_length_inputs[b_input_buffer_index]),
-        .repeats_input(b_input_repeats_inputs[b_input_buffer_index]),
+        .repeats_input(b_input_buffer_repeats_inputs[b_input_buffer_index]),
+        .final_chunk_input(b_input_buffer_final_chunk_inputs[b_input_buffer_index]),
         
         .memory_address(input_memory_b_read_address[b_input_buffer_index]),
-        .memory_data(input_memory_b_read_bus[b_input_buffer_index]),
+        .memory_data(input_memory_b_read_bus[(b_input_buffer_index+1)*PARALLEL_DATA_STREAMING_SIZE-1:b_input_buffer_index*PARALLEL_DATA_STREAMING_SIZE]),
         .memory_read_valid(input_memory_b_read_valids[b_input_buffer_index]),
         .memory_read_ready(input_memory_b_read_readys[b_input_buffer_index]),
 
         .processor_input_valid(b_input_valid[b_input_buffer_index]),
+        .processor_input_valids(b_input_valids[b_input_buffer_index]),
         .processor_input_ready(b_input_ready[b_input_buffer_index]),
-        .processor_input_id(b_input_id),
+        .processor_input_id(b_input_id[b_input_buffer_index]),
         .processor_input_data(b_input_data[b_input_buffer_index]),
-        .last(b_input_last[b_input_buffer_index])
-      )
-    end
-  endgenerate
-
-  /*****************
-   * OUTPUT BUFFER *
-   *****************/
-  // TODO
-  logic b_input_valid[COLS_PROCESSORS-1:0];
-  logic b_input_ready[COLS_PROCESSORS-1:0][ROWS_PROCESSORS-1:0]; // Value Assigned with processor
-  logic [DATA_WIDTH-1:0] b_input_data[COLS_PROCESSORS-1:0][N-1:0];
-  logic [PROCESSOR_COLS_BITS-1:0] b_input_id[COLS_PROCESSORS-1:0]; // TODO This can be a parameter...
-  logic b_input_last[COLS_PROCESSORS-1:0];
-  generate
-    genvar b_input_buffer_index;
-    for (b_input_buffer_index = 0; b_input_buffer_index < COLS_PROCESSORS; b_input_buffer_index++) begin : b_input_buffers
-      memory_buffer #(
-        .DATb_WIDTH(DATA_WIDTH),
-        .N(N),
-        .M(M),
-        .MEMORY_ADDRESS_BITS(MEMORY_ADDRESS_BITS),
-        .PARALLEL_DATb_STREAMING_SIZE(PARALLEL_DATA_STREAMING_SIZE),
-        .MAX_MATRIX_LENGTH(MAX_MATRIX_LENGTH),
-
-        .NUM_PROCESSORS_TO_BROADCAST(ROWS_PROCESSORS),
-        .PROCESSORS_ID_COUNTER_BITS(PROCESSOR_ROWS_BITS)
-        // Ignoring "calculated" parameters
-      ) u_b_memory_buffer (
-        .clk(clk),
-        .reset(reset),
-
-        .instruction_valid(b_input_buffer_instruction_valids[b_input_buffer_index]),
-        .instruction_ready(b_input_buffer_instruction_readys[b_input_buffer_index]),
-        .address_input(b_input_buffer_address_inputs[b_input_buffer_index]),
-        .length_input(b_input_buffer_length_inputs[b_input_buffer_index]),
-        .repeats_input(b_input_repeats_inputs[b_input_buffer_index]),
-        
-        .memory_address(input_memory_b_read_address[b_input_buffer_index]),
-        .memory_data(input_memory_b_read_bus[b_input_buffer_index]),
-
-        .processor_input_valid(b_input_valid[b_input_buffer_index]),
-        .processor_input_ready(b_input_ready[b_input_buffer_index]),
-        .processor_input_id(b_input_id),
-        .processor_input_data(b_input_data[b_input_buffer_index]),
-        .last(b_input_last[b_input_buffer_index])
-      )
+        .last(),
+        .final_chunk()
+      );
     end
   endgenerate
 
   /*********************
    * DEFINE PROCESSORS *
    *********************/
+  // Processor (i, j) <-> output writer i * COLS_PROCESSORS + j
+  logic processor_output_ready_signals[ROWS_PROCESSORS-1:0][COLS_PROCESSORS-1:0];
+  logic processor_output_valid_signals[ROWS_PROCESSORS-1:0][COLS_PROCESSORS-1:0];
+  logic processor_output_by_row[ROWS_PROCESSORS-1:0][COLS_PROCESSORS-1:0];
+  logic [MULTIPLY_DATA_WIDTH+ACCUM_DATA_WIDTH-1:0] processor_output_streaming_data[ROWS_PROCESSORS-1:0][COLS_PROCESSORS-1:0][N-1:0];
+
   generate
     genvar processor_i, processor_j;
     for (processor_i = 0; processor_i < ROWS_PROCESSORS; processor_i++) begin : processor_rows
       for (processor_j = 0; processor_j < COLS_PROCESSORS; processor_j++) begin : processor_cols
+        // The buffers already decode their IDs into per processor valids (BROADCAST has no single ID), so every
+        // processor keeps the default ROW_ID / COL_ID and its ID inputs match them
         processor #(
           .DATA_WIDTH(DATA_WIDTH),
           .N(N),
           .MULTIPLY_DATA_WIDTH(MULTIPLY_DATA_WIDTH),
-          .ACCUM_DATA_WIDTH(ACCUM_DATA_WIDTH)
+          .ACCUM_DATA_WIDTH(ACCUM_DATA_WIDTH),
+          .PROCESSOR_ROWS_BITS(PROCESSOR_ROWS_BITS),
+          .PROCESSOR_COLS_BITS(PROCESSOR_COLS_BITS),
+          .DOUBLE_BUFFER(DOUBLE_BUFFER),
+          .INPUT_FIFO_DEPTH(INPUT_FIFO_DEPTH),
+          .K_SPLIT(K_SPLIT)
         ) u_processor (
           .clk(clk),
           .reset(reset),
 
-          .a_input_valid(a_input_valid[processor_i]),
-          .b_input_valid(b_input_valid[processor_j]),
+          .a_input_valid(a_input_valids[processor_i][processor_j]),
+          .b_input_valid(b_input_valids[processor_j][processor_i]),
           .output_ready(processor_output_ready_signals[processor_i][processor_j]),
-          .input_ready(processor_input_ready_signals[processor_i][processor_j]),
+          .input_ready(),
+          .a_input_ready(a_input_ready[processor_i][processor_j]),
+          .b_input_ready(b_input_ready[processor_j][processor_i]),
+          .input_col_id('0),
+          .input_row_id('0),
           .output_valid(processor_output_valid_signals[processor_i][processor_j]),
           .output_by_row(processor_output_by_row[processor_i][processor_j]),
           .last(a_input_last[processor_i]), // Assuming only a will need the last signal
+          .final_chunk(a_input_final_chunk[processor_i]),
           .a_data(a_input_data[processor_i]),
           .b_data(b_input_data[processor_j]),
           .c_data_streaming(processor_output_streaming_data[processor_i][processor_j])
-        )
+        );
       end
     end
   endgenerate
@@ -343,24 +329,12 @@ module controller #(
   /*************************
    * DEFINE OUTPUT_BUFFERS *
    *************************/
-  // TODO: define a grid of output buffer per processor.
-  
-
-  /* TODO:
-    ready should be "in-progress" - AND count not at max?
-    increment a counter for each tile. 
-
-    if count at max, set "buffer completely done" to true
-
-  */
-
-
-  logic processor_output_by_row[ROWS_PROCESSORS-1:0][COLS_PROCESSORS-1:0];
-
+  // One output memory writer per processor, it asks the controller for the address of every tile
   generate
     genvar output_buffer_i, output_buffer_j;
     for (output_buffer_i = 0; output_buffer_i < ROWS_PROCESSORS; output_buffer_i++) begin : output_buffer_rows
       for (output_buffer_j = 0; output_buffer_j < COLS_PROCESSORS; output_buffer_j++) begin : output_buffer_cols
+        localparam int OUTPUT_BUFFER_INDEX = output_buffer_i * COLS_PROCESSORS + output_buffer_j;
         output_memory_writer #(
           .OUTPUT_DATA_WIDTH(MULTIPLY_DATA_WIDTH + ACCUM_DATA_WIDTH),
           .N(N),
@@ -370,25 +344,25 @@ module controller #(
           .clk(clk),
           .reset(reset),
 
-          .instruction_valid(output_buffer_instruction_valids[output_buffer_i][output_buffer_j]),
-          .instruction_ready(output_buffer_instruction_readys[output_buffer_i][output_buffer_j]),
-          .address_input(output_buffer_address_inputs[output_buffer_i][output_buffer_j]),
-          .output_by_row_instruction(output_buffer_by_row_instructions[output_buffer_i][output_buffer_j]),
+          .instruction_valid(output_buffer_instruction_valids[OUTPUT_BUFFER_INDEX]),
+          .instruction_ready(output_buffer_instruction_readys[OUTPUT_BUFFER_INDEX]),
+          .address_input(output_buffer_address_inputs[OUTPUT_BUFFER_INDEX]),
+          .output_by_row_instruction(output_buffer_by_row_instructions[OUTPUT_BUFFER_INDEX]),
 
-          .completed_ready(output_buffer_completed_readys[output_buffer_i][output_buffer_j]),
-          .completed_valid(output_buffer_completed_valids[output_buffer_i][output_buffer_j]),
+          .completed_ready(output_buffer_completed_readys[OUTPUT_BUFFER_INDEX]),
+          .completed_valid(output_buffer_completed_valids[OUTPUT_BUFFER_INDEX]),
 
-          .write_valid(output_memory_write_valids[output_buffer_i * ROWS_PROCESSORS + output_buffer_j]),
-          .write_ready(output_memory_write_readys[output_buffer_i * ROWS_PROCESSORS + output_buffer_j]),
-          .write_address(output_memory_write_address[output_buffer_i * ROWS_PROCESSORS + output_buffer_j]),
-          .write_data(output_memory_write_bus[output_buffer_i * ROWS_PROCESSORS + output_buffer_j]),
+          .write_valid(output_memory_write_valids[OUTPUT_BUFFER_INDEX]),
+          .write_ready(output_memory_write_readys[OUTPUT_BUFFER_INDEX]),
+          .write_address(output_memory_write_address[OUTPUT_BUFFER_INDEX]),
+          .write_data(output_memory_write_bus[(OUTPUT_BUFFER_INDEX+1)*PARALLEL_DATA_STREAMING_SIZE-1:OUTPUT_BUFFER_INDEX*PARALLEL_DATA_STREAMING_SIZE]),
 
           .output_ready(processor_output_ready_signals[output_buffer_i][output_buffer_j]),
           .output_valid(processor_output_valid_signals[output_buffer_i][output_buffer_j]),
           .output_by_row(processor_output_by_row[output_buffer_i][output_buffer_j]),
           .c_data_streaming(processor_output_streaming_data[output_buffer_i][output_buffer_j])
-        )
+        );
       end
     end
   endgenerate
-endmodule
\ No newline at end of file
+endmodule
@@ -1,146 +1,347 @@
 # This file is public domain, it can be freely copied without restrictions.
 # SPDX-License-Identifier: CC0-1.0
 
+import json
 import math
 import os
-import sys
-from pathlib import Path
-from random import getrandbits, randint
-from typing import Any, Dict, List, Tuple
+from collections import deque
+from random import getrandbits, random
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 import cocotb
-from cocotb.binary import BinaryValue
 from cocotb.clock import Clock
-from cocotb.handle import SimHandleBase
-from cocotb.queue import Queue
-from cocotb.runner import get_runner
-from cocotb.triggers import RisingEdge, First
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge
 
-from memory_simulator import MemoryReadController, MemoryWriteController
-
-from latency_insensitive_io import LIReader, LIWriter
+from verification.instrumentation import MemoryBufferMonitor
+from verification.memory_model import ArrayMemory
+from verification.memory_simulator import MemoryReadController, StreamingReader
+from verification.memory_timing import MemoryTiming
+from verification.performance_model import simulate_memory_buffer
+from verification.signals import is_high, write_array
 
 # Read parameters from sim parameters
 NUM_SAMPLES = int(os.environ.get("NUM_SAMPLES", 5))
+# Other read ports sharing the memory with the buffer (the rest of the grid's buffers), always reading, so
+# MEMORY_ARBITER decides how much of it the buffer gets. The buffer is port 0
+MEMORY_CONTENDERS = int(os.environ.get("MEMORY_CONTENDERS", 0))
+# Beats per read request of burst_test (MEMORY_BURST if set above 1), the other tests use MEMORY_BURST as is
+BURST_BEATS = max(int(os.environ.get("MEMORY_BURST", 1)), 1)
+BURST_BEATS = BURST_BEATS if BURST_BEATS > 1 else 4
+CLOCK_PERIOD_NS = 10
+# If set, the cycles and beats per cycle of every scenario are written to this JSON file (read by verification/sweep.py)
+METRICS_FILE = os.environ.get("METRICS_FILE")
+SCENARIO_METRICS: List[Dict[str, Any]] = []
+# MemoryBufferMonitor reports of prefetch_test
+PREFETCH_REPORTS: List[Dict[str, Any]] = []
+# Cycles and MemoryReadController.burst_stats() of burst_test, single beat reads first
+BURST_REPORTS: List[Dict[str, Any]] = []
 if cocotb.simulator.is_running():
     DATA_WIDTH = int(cocotb.top.DATA_WIDTH)
-    N = int(cocotb.top.N)      
-    MULTIPLY_DATA_WIDTH = int(cocotb.top.MULTIPLY_DATA_WIDTH)
-    ACCUM_DATA_WIDTH = int(cocotb.top.ACCUM_DATA_WIDTH)
-
-
-# Tester:
-#   init = define itself, add the writer/reader.
-#   start() starts
-#   end() ends
-
-# In the test:
-"""
-start clock
-define tester
-
-assert reset value
-
-start tester()
-
-do sequence of tests:
-    await rising edge
-    assert signals
-    await rising edge...
-    assert signals
-
-"""
+    N = int(cocotb.top.N)
+    M = int(cocotb.top.M)
+    NUM_PROCESSORS = int(cocotb.top.NUM_PROCESSORS_TO_BROADCAST)
+    PARALLEL_DATA_STREAMING_SIZE = int(cocotb.top.PARALLEL_DATA_STREAMING_SIZE)
+    MAX_MATRIX_LENGTH = int(cocotb.top.MAX_MATRIX_LENGTH)
+    BROADCAST = bool(int(cocotb.top.BROADCAST))
+    K_SPLIT = bool(int(cocotb.top.K_SPLIT))
+    # Vectors one instruction can hold: a whole block, or a chunk of at most M with K_SPLIT
+    BUFFER_LENGTH = M if K_SPLIT else MAX_MATRIX_LENGTH
+    PREFETCH = bool(int(cocotb.top.PREFETCH))
 
 """
-Test Procedure:
-Set memory to specific value (or we can make a big memory and use different memory address)
-use LI writer to write addresses and lengths
-just wait for risingEdge "Done" then read from memory table and compare. 
+Test procedure:
+    fill an ArrayMemory with random words, a MemoryReadController answers the buffer's reads (ideal memory unless
+    MEMORY_TIMING says otherwise)
+    give the buffer instructions (address, length, repeats[, final_chunk]), back to back if the test queues several
+    every processor port takes beats on its own ready, each one has to see the length vectors from address
+    in order (last on the last one, with final_chunk on the last chunk of a block under K_SPLIT), repeats times
 """
 
 
-class MatrixMultiplierTester:
+class MemoryBufferTester:
     """
-    Reusable checker of a matrix_multiplier instance
+    Fake memory behind the buffer (MemoryReadController, MEMORY_TIMING / MEMORY_BURST apply) and NUM_PROCESSORS
+    processor ports in front of it, checking what each port takes
 
-    Args
-        matrix_multiplier_entity: handle to an instance of matrix_multiplier
+    ready: called for every processor port every cycle, True raises its ready (always ready by default)
+    burst_beats: beats per read request of the controller, MEMORY_BURST if None
     """
 
-    def __init__(self, matrix_multiplier_entity: SimHandleBase):
-        self.dut = matrix_multiplier_entity
-
-        self.a_input_writer = LIWriter(
-            dut=self.dut,
-            clk=self.dut.clk, 
-            signals=self.dut.a_data, 
-            valid=self.dut.a_input_valid, 
-            ready=self.dut.input_ready, 
-            last=self.dut.last,
-            sends_last=True,
-            input_length=N
-        )
-
-        self.b_input_writer = LIWriter(
-            dut=self.dut,
-            clk=self.dut.clk, 
-            signals=self.dut.b_data, 
-            valid=self.dut.b_input_valid, 
-            ready=self.dut.input_ready, 
-            last=None,
-            sends_last=False,
-            input_length=N
-        )
-
-        self.output_reader = LIReader(
-            dut=self.dut,
-            clk=self.dut.clk, 
-            signals=dict(c_data_streaming=self.dut.c_data_streaming),  # the c_data_streaming= tells name of the dict value
-            valid=self.dut.output_valid, 
-            ready=self.dut.output_ready
-        )
+    def __init__(self, dut, memory: ArrayMemory, burst_beats: Optional[int] = None):
+        self.dut = dut
+        self.memory = memory
+        self.contenders = [StreamingReader(dut.clk, PARALLEL_DATA_STREAMING_SIZE, len(memory),
+                                           address=(port + 1) * len(memory) // (MEMORY_CONTENDERS + 1))
+                           for port in range(MEMORY_CONTENDERS)]
+        # The buffer has a single read port, the controller wants per port arrays
+        ports = [(dut.memory_read_ready, dut.memory_read_valid, dut.memory_address, dut.memory_data)]
+        ports += [(port.read_ready, port.read_valid, port.read_address, port.read_data) for port in self.contenders]
+        read_readys, read_valids, read_addresses, read_datas = (list(signals) for signals in zip(*ports))
+        self.reader = MemoryReadController(dut, dut.clk, read_readys, read_valids, read_addresses, read_datas,
+                                           num_ports=len(ports), parallel_num_ports=PARALLEL_DATA_STREAMING_SIZE,
+                                           memory=memory, burst_beats=burst_beats)
+        self.ready: Callable[[], bool] = lambda: True
+        self.cycle = 0
+        # Beats (data, last, final_chunk) still expected by every processor port
+        self.expected: List[Deque[Tuple[List[int], bool, bool]]] = [deque() for _ in range(NUM_PROCESSORS)]
+        self.beats_taken = 0
+        self.last_beat_cycle: Optional[int] = None
+        self._coros = []
 
     def start(self) -> None:
-        """Starts monitors, model, and checker coroutine"""
-        # if self._checker is not None:
-        #     raise RuntimeError("Monitor already started")
-        self.a_input_writer.start()
-        self.b_input_writer.start()
-        self.output_reader.start()
-        # self._checker = cocotb.start_soon(self._check())
+        self.reader.start()
+        for contender in self.contenders:
+            contender.start()
+        self._coros = [cocotb.start_soon(self._processors())]
 
     def stop(self) -> None:
-        """Stops everything"""
-        # if self._checker is None:
-        #     raise RuntimeError("Monitor never started")
-        self.a_input_writer.stop()
-        self.b_input_writer.stop()
-        self.output_reader.stop()
-        # self._checker.kill()
-        # self._checker = None
-
-
-@cocotb.test(
-    expect_error=IndexError
-    if cocotb.simulator.is_running() and cocotb.SIM_NAME.lower().startswith("ghdl")
-    else ()
-)
-async def multiply_test(dut):
-    """Test multiplication of many matrices."""
-
-    cocotb.start_soon(Clock(dut.clk, 10, units="ns").start())
-    tester = MatrixMultiplierTester(dut)
+        self.reader.stop()
+        for contender in self.contenders:
+            contender.stop()
+        for coro in self._coros:
+            coro.kill()
+        self._coros = []
+
+    @property
+    def ideal_memory(self) -> bool:
+        """The performance model's memory matches the fake one only without MEMORY_TIMING, and all to the buffer"""
+        return type(self.reader.timing) is MemoryTiming and not self.contenders
+
+    async def _processors(self) -> None:
+        """Drive every ready on its own, check the beats taken (per processor valid and ready) against expected"""
+        dut = self.dut
+        while True:
+            await RisingEdge(dut.clk)
+            self.cycle += 1
+            await FallingEdge(dut.clk)
+            write_array(dut.processor_input_ready, [int(self.ready()) for _ in range(NUM_PROCESSORS)])
+            await ReadOnly()
+            for processor in range(NUM_PROCESSORS):
+                if not (is_high(dut.processor_input_valids[processor]) and is_high(dut.processor_input_ready[processor])):
+                    continue
+                data = [dut.processor_input_data[i].value.integer for i in range(N)]
+                last = is_high(dut.last)
+                assert self.expected[processor], f"Processor {processor} took a beat nobody sent"
+                expected_data, expected_last, expected_final = self.expected[processor].popleft()
+                assert data == expected_data and last == expected_last, \
+                    f"Processor {processor} took {data} (last={last}), expected {expected_data} (last={expected_last})"
+                # final_chunk only means something with last
+                if last:
+                    final = is_high(dut.final_chunk)
+                    assert final == expected_final, \
+                        f"Processor {processor} took last with final_chunk={final}, expected {expected_final}"
+                self.beats_taken += 1
+                # Taken on the next edge
+                self.last_beat_cycle = self.cycle + 1
+
+    def done(self) -> bool:
+        return not any(self.expected)
+
+    async def run_instruction(self, address: int, length: int, repeats: int) -> int:
+        """Send one instruction and wait until every processor took every beat, returns the cycles it took"""
+        return await self.run_instructions([(address, length, repeats)])
+
+    async def run_instructions(self, instructions: List[Tuple[int, ...]]) -> int:
+        """
+        Send (address, length, repeats[, final_chunk]) instructions as fast as the buffer takes them, then wait
+        until every processor took every beat. Returns the cycles from the first instruction handshake to the last
+        beat.
+        """
+        start = None
+        for instruction in instructions:
+            taken = await self.send_instruction(*instruction)
+            start = taken if start is None else start
+        await FallingEdge(self.dut.clk)
+        self.dut.instruction_valid.value = 0
+        while not self.done():
+            await RisingEdge(self.dut.clk)
+        return self.last_beat_cycle - start
+
+    async def send_instruction(self, address: int, length: int, repeats: int, final_chunk: bool = True) -> int:
+        """Hand one instruction over (valid stays high for the next one), returns the cycle of its handshake"""
+        dut = self.dut
+        words = self.memory.read(address, length * N).tolist()
+        # Without K_SPLIT the buffer drives final_chunk high whatever the instruction says
+        final = final_chunk or not K_SPLIT
+        beats = [(words[k * N:(k + 1) * N], k == length - 1, final) for k in range(length)]
+        for expected in self.expected:
+            expected.extend(beats * repeats)
+        await FallingEdge(dut.clk)
+        dut.address_input.value = address
+        dut.length_input.value = length
+        dut.repeats_input.value = repeats
+        dut.final_chunk_input.value = int(final_chunk)
+        dut.instruction_valid.value = 1
+        while True:
+            await ReadOnly()
+            if is_high(dut.instruction_ready):
+                break
+            await FallingEdge(dut.clk)
+        # Taken on the next edge
+        return self.cycle + 1
+
+
+@cocotb.test()
+async def broadcast_test(dut):
+    """
+    Always ready processors: every beat of the block reaches every processor repeats times. Cycles against the model,
+    one ID at a time a beat costs NUM_PROCESSORS_TO_BROADCAST cycles, with BROADCAST=1 one cycle for all of them
+    """
+    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD_NS, units="ns").start())
+    tester = await start_tester(dut)
+    dut._log.info(f"Test memory buffer for:\n\tN={N}\n\tNUM_PROCESSORS_TO_BROADCAST={NUM_PROCESSORS}\n\t"
+                  f"PARALLEL_DATA_STREAMING_SIZE={PARALLEL_DATA_STREAMING_SIZE}\n\tBROADCAST={int(BROADCAST)}\n\t"
+                  f"PREFETCH={int(PREFETCH)}\n\tK_SPLIT={int(K_SPLIT)}")
+
+    for length, repeats in ((N, 1), (min(4 * N, BUFFER_LENGTH), 3), (BUFFER_LENGTH, 2)):
+        address = (length * N * repeats) % (len(tester.memory) - length * N)
+        beats_before = tester.beats_taken
+        cycles = await tester.run_instruction(address, length, repeats)
+        beats = tester.beats_taken - beats_before
+        predicted = simulate_memory_buffer(N, length, repeats, NUM_PROCESSORS, PARALLEL_DATA_STREAMING_SIZE, BROADCAST)
+        dut._log.info(f"{length}-length block, {repeats} repeats: {cycles} cycles, predicted {predicted}, "
+                      f"{beats / cycles:.2f} beats per cycle to {NUM_PROCESSORS} processors")
+        SCENARIO_METRICS.append(dict(length=length, repeats=repeats, cycles=cycles, predicted=predicted, beats=beats))
+        if tester.ideal_memory:
+            assert abs(cycles - predicted) <= max(2, 0.05 * predicted)
+
+    tester.stop()
+    write_metrics()
+
+
+@cocotb.test()
+async def random_ready_test(dut):
+    """
+    Processors ready at random, each on its own: no beat lost or taken twice, in order, every repeat. Instructions
+    are queued back to back, with PREFETCH the next one is fetched while the processors still take the current one.
+    With K_SPLIT every block goes out in chunks of at most M vectors, final_chunk with the last one
+    """
+    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD_NS, units="ns").start())
+    tester = await start_tester(dut)
+    tester.ready = lambda: random() < 0.6
 
+    instructions = []
+    for sample in range(NUM_SAMPLES):
+        block = N * (sample % 4 + 1)
+        for offset in range(0, block, BUFFER_LENGTH):
+            length = min(BUFFER_LENGTH, block - offset)
+            instructions.append(((sample + offset) * N, length, sample % 3 + 1, offset + length == block))
+    await tester.run_instructions(instructions)
+
+    tester.stop()
+
+
+@cocotb.test()
+async def prefetch_test(dut):
+    """
+    Row block like instructions (several repeats) back to back: without PREFETCH the memory sits idle during the
+    repeats and the processors starve while the next block is read, with it the next block is read into the
+    other bank meanwhile. Checks the memory idle cycles against what each setting allows, compare builds with
+    verification/sweep.py --bench memory_buffer --param PREFETCH=0,1 --memory-timing latency=8
+    """
+    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD_NS, units="ns").start())
+    tester = await start_tester(dut)
+    monitor = MemoryBufferMonitor(dut, dut.clk)
+    monitor.start()
+
+    length, repeats = min(4 * N, BUFFER_LENGTH), 2
+    instructions = [((index * length * N) % (len(tester.memory) - length * N), length, repeats)
+                    for index in range(max(NUM_SAMPLES, 4))]
+    cycles = await tester.run_instructions(instructions)
+    report = monitor.report()
+    memory = dict(tester.reader.timing.stats.as_dict(), ports=tester.reader.arbiter.report())
+    dut._log.info(f"{len(instructions)} instructions, PREFETCH={int(PREFETCH)}: {cycles} cycles, "
+                  f"memory idle {report['stalls']['memory_idle']} cycles, "
+                  f"processors starved {report['stalls']['starved']} cycles\n{report}\nMemory: {memory}")
+    PREFETCH_REPORTS.append(dict(report, prefetch=PREFETCH, memory=memory))
+
+    stalls = report["stalls"]
+    assert report["instructions"] == len(instructions)
+    pass_cycles = length * (1 if BROADCAST else NUM_PROCESSORS)
+    stream_cycles = len(instructions) * repeats * pass_cycles
+    # A single bank cannot read during the repeats after its first pass
+    single_bank_idle = len(instructions) * (repeats - 1) * pass_cycles
+    busy = report["reads"] + stalls["memory_wait"]
+    slack = 4 * len(instructions)
+    dut._log.info(f"Memory busy {busy} cycles, the processors take {stream_cycles}, a single bank idles at least "
+                  f"{single_bank_idle}")
+    if PREFETCH:
+        # The memory only waits while both banks are full, i.e. where it is faster than the processors, and for
+        # the repeats of the last instruction (nothing left to read). Behind a slow memory (busy >= stream_cycles)
+        # that is about the tail only, well below single_bank_idle
+        tail = (repeats - 1) * pass_cycles
+        assert stalls["memory_idle"] <= max(stream_cycles - busy, 0) + tail + slack
+    else:
+        assert stalls["memory_idle"] >= single_bank_idle - slack
+    if tester.ideal_memory:
+        # The model's memory is pipelined, only comparable to an ideal one (one read at a time, see
+        # memory_buffer.sv). The model does not wait for the first read of an instruction, a couple of cycles each
+        predicted = simulate_memory_buffer(N, length, repeats, NUM_PROCESSORS, PARALLEL_DATA_STREAMING_SIZE, BROADCAST,
+                                           PREFETCH, len(instructions))
+        dut._log.info(f"Predicted {predicted} cycles")
+        assert abs(cycles - predicted) <= max(2 * len(instructions), 0.05 * predicted)
+
+    monitor.stop()
+    tester.stop()
+    write_metrics()
+
+
+@cocotb.test()
+async def burst_test(dut):
+    """
+    The same instructions with single beat reads and with BURST_BEATS beat bursts: the buffer has no length port,
+    so the controller guesses the bursts and drops what is left of one at the end of a block. Reports
+    burst_stats(), the read handshakes the bursts save, and what they save in cycles behind MEMORY_TIMING
+    """
+    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD_NS, units="ns").start())
+    # Blocks of a beat more than a multiple of 4, ending in the middle of a burst, with gaps between them, so what
+    # is left of that burst is dropped
+    length = min(4 * N + PARALLEL_DATA_STREAMING_SIZE // math.gcd(N, PARALLEL_DATA_STREAMING_SIZE), BUFFER_LENGTH)
+    stride = length * N + 3 * PARALLEL_DATA_STREAMING_SIZE
+    for burst_beats in (1, BURST_BEATS):
+        tester = await start_tester(dut, burst_beats=burst_beats)
+        instructions = [((index * stride) % (len(tester.memory) - length * N), length, 1)
+                        for index in range(max(NUM_SAMPLES, 4))]
+        cycles = await tester.run_instructions(instructions)
+        stats = tester.reader.burst_stats()
+        dut._log.info(f"{burst_beats} beat reads: {cycles} cycles, {stats}")
+        BURST_REPORTS.append(dict(stats, burst_beats=burst_beats, cycles=cycles))
+        tester.stop()
+
+    single, burst = BURST_REPORTS[-2:]
+    blocks = len(instructions)
+    if not MEMORY_CONTENDERS:
+        # Every block is read whole in both cases (the contenders read as much as they get)
+        assert burst["beats_served"] == single["beats_served"]
+    # A BURST_BEATS-th of the requests, plus the one cut short at the end of every block
+    assert burst["requests"] <= burst["beats_served"] / BURST_BEATS + 2 * blocks
+    # Latency (if any) is paid once per burst instead of once per beat
+    assert burst["cycles"] <= single["cycles"] + 2 * blocks
+    write_metrics()
+
+
+async def start_tester(dut, burst_beats: Optional[int] = None) -> MemoryBufferTester:
+    """Random memory content, idle inputs, reset for 3 cycles, then the memory / processor drivers"""
+    memory = ArrayMemory(min(1 << int(dut.MEMORY_ADDRESS_BITS), 4 * MAX_MATRIX_LENGTH * N), DATA_WIDTH)
+    memory.write(0, [getrandbits(DATA_WIDTH) for _ in range(len(memory))])
+    await reset_dut(dut)
+    tester = MemoryBufferTester(dut, memory, burst_beats)
+    tester.start()
+    return tester
+
+
+async def reset_dut(dut):
+    """Idle inputs, then hold reset for 3 cycles"""
     dut._log.info("Initialize and reset model")
 
-    # Initial values
-    dut.a_input_valid.value = 0
-    dut.b_input_valid.value = 0
-    dut.output_ready.value = 0
-    dut.output_by_row.value = 1  # outputs row 0 first
-    dut.last.value = 0
-    dut.a_data.value = create_row(N, lambda x: 0)
-    dut.b_data.value = create_row(N, lambda x: 0)
+    dut.instruction_valid.value = 0
+    dut.address_input.value = 0
+    dut.length_input.value = 0
+    dut.repeats_input.value = 0
+    dut.final_chunk_input.value = 0
+    dut.memory_read_valid.value = 0
+    write_array(dut.memory_data, [0] * PARALLEL_DATA_STREAMING_SIZE)
+    write_array(dut.processor_input_ready, [0] * NUM_PROCESSORS)
 
     # Reset DUT
     dut.reset.value = 1
@@ -148,283 +349,21 @@ async def multiply_test(dut):
         await RisingEdge(dut.clk)
     dut.reset.value = 0
 
-    # start tester after reset so we know it's in a good state
-    tester.start()
-    dut._log.info(f"Test multiplication operations for:\n\tDATA_WIDTH={DATA_WIDTH}\n\tN={N}\n\tMULTIPLY_DATA_WIDTH={MULTIPLY_DATA_WIDTH}\n\tACCUM_DATA_WIDTH={ACCUM_DATA_WIDTH}")
-
-    # ready to listen:
-    tester.output_reader.set_status(True)
-
-    # Do multiplication operations
-    dut._log.info("Test multiplication for:\n\tN-length input\n\tSteady In/Out\n\tN/A")
-    await test_matrix_write(tester, dut, num_samples=NUM_SAMPLES, outer_dimension=N, inner_dimension=N, 
-                      input_steady=True, output_steady=True, 
-                      input_not_steady_long_time=True, output_not_steady_long_time=True,
-                      output_by_row=True)
-    
-    dut._log.info("Test multiplication for:\n\tN-length input\n\tUnsteady In/Out\n\tShort Unsteady")
-    await test_matrix_write(tester, dut, num_samples=NUM_SAMPLES, outer_dimension=N, inner_dimension=N, 
-                      input_steady=False, output_steady=False, 
-                      input_not_steady_long_time=False, output_not_steady_long_time=False,
-                      output_by_row=True)
-    
-    dut._log.info("Test multiplication for:\n\tN-length input\n\tUnsteady In/Out\n\tLong Unsteady")
-    await test_matrix_write(tester, dut, num_samples=NUM_SAMPLES, outer_dimension=N, inner_dimension=N, 
-                      input_steady=False, output_steady=False, 
-                      input_not_steady_long_time=True, output_not_steady_long_time=True,
-                      output_by_row=True)
-    
-    dut._log.info("Test multiplication for:\n\t2N-length input\n\tSteady In/Out\n\tN/A")
-    await test_matrix_write(tester, dut, num_samples=NUM_SAMPLES, outer_dimension=N, inner_dimension=2*N, 
-                      input_steady=True, output_steady=True, 
-                      input_not_steady_long_time=True, output_not_steady_long_time=True,
-                      output_by_row=True)
-    
-    dut._log.info("Test multiplication for:\n\t2N-length input\n\tUnsteady In/Out\n\tShort Unsteady")
-    await test_matrix_write(tester, dut, num_samples=NUM_SAMPLES, outer_dimension=N, inner_dimension=2*N, 
-                      input_steady=False, output_steady=False, 
-                      input_not_steady_long_time=False, output_not_steady_long_time=False,
-                      output_by_row=True)
-    
-    dut._log.info("Test multiplication for:\n\t2N-length input\n\tUnsteady In/Out\n\tLong Unsteady")
-    await test_matrix_write(tester, dut, num_samples=NUM_SAMPLES, outer_dimension=N, inner_dimension=2*N, 
-                      input_steady=False, output_steady=False, 
-                      input_not_steady_long_time=True, output_not_steady_long_time=True,
-                      output_by_row=True)
-    
-    # Here we limit test some edge case of max input (11111111...)
-    dut._log.info("Test max input multiplication for:\n\tN-length input\n\tSteady In/Out\n\tN/A")
-    await test_matrix_write(tester, dut, num_samples=NUM_SAMPLES, outer_dimension=N, inner_dimension=N, 
-                      input_steady=True, output_steady=True, 
-                      input_not_steady_long_time=True, output_not_steady_long_time=True,
-                      output_by_row=True, matrix_gen_func=lambda x:2**DATA_WIDTH-1)
-    
-    dut._log.info("Test max input multiplication for:\n\tN-length input\n\tUnsteady In/Out\n\tShort Unsteady")
-    await test_matrix_write(tester, dut, num_samples=NUM_SAMPLES, outer_dimension=N, inner_dimension=N, 
-                      input_steady=False, output_steady=False, 
-                      input_not_steady_long_time=False, output_not_steady_long_time=False,
-                      output_by_row=True, matrix_gen_func=lambda x:2**DATA_WIDTH-1)
-    
-    dut._log.info("Test max input multiplication for:\n\tN-length input\n\tUnsteady In/Out\n\tLong Unsteady")
-    await test_matrix_write(tester, dut, num_samples=NUM_SAMPLES, outer_dimension=N, inner_dimension=N, 
-                      input_steady=False, output_steady=False, 
-                      input_not_steady_long_time=True, output_not_steady_long_time=True,
-                      output_by_row=True, matrix_gen_func=lambda x:2**DATA_WIDTH-1)
-    
-    dut._log.info("Test max input multiplication for:\n\t2N-length input\n\tSteady In/Out\n\tN/A")
-    await test_matrix_write(tester, dut, num_samples=NUM_SAMPLES, outer_dimension=N, inner_dimension=2*N, 
-                      input_steady=True, output_steady=True, 
-                      input_not_steady_long_time=True, output_not_steady_long_time=True,
-                      output_by_row=True, matrix_gen_func=lambda x:2**DATA_WIDTH-1)
-    
-    dut._log.info("Test max input multiplication for:\n\t2N-length input\n\tUnsteady In/Out\n\tShort Unsteady")
-    await test_matrix_write(tester, dut, num_samples=NUM_SAMPLES, outer_dimension=N, inner_dimension=2*N, 
-                      input_steady=False, output_steady=False, 
-                      input_not_steady_long_time=False, output_not_steady_long_time=False,
-                      output_by_row=True, matrix_gen_func=lambda x:2**DATA_WIDTH-1)
-    
-    dut._log.info("Test max input multiplication for:\n\t2N-length input\n\tUnsteady In/Out\n\tLong Unsteady")
-    await test_matrix_write(tester, dut, num_samples=NUM_SAMPLES, outer_dimension=N, inner_dimension=2*N, 
-                      input_steady=False, output_steady=False, 
-                      input_not_steady_long_time=True, output_not_steady_long_time=True,
-                      output_by_row=True, matrix_gen_func=lambda x:2**DATA_WIDTH-1)
-
-
-def matrix_multiplication(a_matrix: List[List[int]], b_matrix: List[List[int]]) -> List[List[int]]:
-        """Transaction-level model of the matrix multipler as instantiated"""
-        # TODO not fixed
-        outer_dimension = len(a_matrix)
-        inner_dimension = len(a_matrix[0])
-        return [
-            [
-                BinaryValue(
-                    sum(
-                        [
-                            a_matrix[i][n]
-                            * b_matrix[n][j]
-                            for n in range(inner_dimension)
-                        ]
-                    ),
-                    n_bits=MULTIPLY_DATA_WIDTH+ACCUM_DATA_WIDTH,
-                    bigEndian=False,
-                )
-                for j in range(outer_dimension)
-            ]
-                for i in range(outer_dimension)
-        ]
-    
-
-
-async def test_matrix_write(tester, dut, num_samples: int, outer_dimension: int, inner_dimension: int, 
-                      input_steady: bool, output_steady: bool, 
-                      input_not_steady_long_time: bool, output_not_steady_long_time: bool,
-                      output_by_row: bool = True, matrix_gen_func=getrandbits):
+
+def write_metrics():
     """
-    repeat num_samples time, do outer_dimension x inner_dimension * inner_dimension * outer_dimension matrix
-    N = outer_dimension here
-
-    Test: output always ready to listen, input all streamlined
-    Test: Sprinkle random not_valid for input
-    Test: Output ready have random pauses
-    Test: input will be not valid for a long period of time
-    Test: output will be not_ready for a long period of time
+    Dump the cycles and beats per cycle of every scenario (and their totals), and the memory idle cycles and mean
+    arbitration wait of the buffer's reads in prefetch_test, and the burst stats of burst_test to METRICS_FILE
     """
-    dut.output_by_row.value = output_by_row  # Output based on row or col
-    expected_outputs = []
-    # Generate matrix A and B based on input
-    for i, (A, B) in enumerate(zip(gen_matrices(outer_dimension, inner_dimension, num_samples=num_samples, func=matrix_gen_func), gen_matrices(inner_dimension, outer_dimension, num_samples=num_samples, func=matrix_gen_func))):
-        # dut._log.info(f"operation {i}")
-        matrix_product_temp = matrix_multiplication(A, B)
-        if not output_by_row:
-            matrix_product_temp_transposed = [[matrix_product_temp[i][j] for i in outer_dimension] for j in outer_dimension]
-        expected_outputs.append(matrix_product_temp if output_by_row else matrix_product_temp_transposed)
-        # dut._log.info(f"Input: {A}, {B}")
-        # Fit all data to the input writer first (all num_samples)
-        # add random gaps if input won't be all valid
-        # A matrix input gen
-        for col_index in range(inner_dimension-1, 0, -1):
-            # get col in reverse order
-            col = list(reversed([a_row[col_index] for a_row in A]))  # Reversed because my module take [N-1:0]
-            tester.a_input_writer.set_status((col, True, False))
-            if not input_steady and not input_not_steady_long_time:
-                # add random pauses here and there lasting 1-3 cycles
-                for _ in range(randint(0, 1)):
-                    tester.a_input_writer.set_status((create_row(outer_dimension), False, False))
-            elif not input_steady and input_not_steady_long_time:
-                # adding random pauses that are at least as long as an entire input cycle
-                for _ in range(randint(0, inner_dimension)):
-                    tester.a_input_writer.set_status((create_row(outer_dimension), False, False))
-        tester.a_input_writer.set_status((list(reversed([a_row[0] for a_row in A])), True, True))
-        if not input_steady and not input_not_steady_long_time:
-            # add random pauses here and there lasting 1-3 cycles
-            for _ in range(randint(0, 1)):
-                tester.a_input_writer.set_status((create_row(outer_dimension), False, False))
-        elif not input_steady and input_not_steady_long_time:
-            # adding random pauses that are at least as long as an entire input cycle
-            for _ in range(randint(0, inner_dimension)):
-                tester.a_input_writer.set_status((create_row(outer_dimension), False, False))
-        
-        # B matrix input gen
-        for row in list(reversed(B))[:-1]:
-            tester.b_input_writer.set_status((list(reversed(row)), True, False))
-            if not input_steady and not input_not_steady_long_time:
-                # add random pauses here and there lasting 1-3 cycles
-                for _ in range(randint(0, 1)):
-                    tester.b_input_writer.set_status((create_row(outer_dimension), False, False))
-            elif not input_steady and input_not_steady_long_time:
-                # adding random pauses that are at least as long as an entire input cycle
-                for _ in range(randint(0, inner_dimension)):
-                    tester.b_input_writer.set_status((create_row(outer_dimension), False, False))
-        tester.b_input_writer.set_status((list(reversed(B[0])), True, True))
-        if not input_steady and not input_not_steady_long_time:
-            # add random pauses here and there lasting 1-3 cycles
-            for _ in range(randint(0, 1)):
-                tester.b_input_writer.set_status((create_row(outer_dimension), False, False))
-        elif not input_steady and input_not_steady_long_time:
-            # adding random pauses that are at least as long as an entire input cycle
-            for _ in range(randint(0, inner_dimension)):
-                tester.b_input_writer.set_status((create_row(outer_dimension), False, False))
-
-    all_output_collected = False
-    C = [[]]
-    num_collected = 0
-    long_output_pause_counter = 0
-    output_reader_status = True
-
-    # This variable was used to "timeout" when debugging
-    cycle_count = 0
-
-    while not all_output_collected:
-        # dut._log.info(f"a value: {dut.a_data.value}")
-        # dut._log.info(f"a valid: {dut.a_input_valid.value}")
-        # dut._log.info(f"b value: {dut.b_data.value}")
-        # dut._log.info(f"b valid: {dut.b_input_valid.value}")
-        # dut._log.info(f"input_ready: {dut.input_ready.value}")
-        # dut._log.info(f"output_collected?: {all_output_collected}, NumCollected: {num_collected}, NumSamples: {num_samples}")
-        
-        # dut._log.info(f"C?: {C}")
-        if output_steady: 
-            tester.output_reader.set_status(True)
-        elif not output_not_steady_long_time:
-            if randint(0, 1) > 0:
-                tester.output_reader.set_status(True)
-            else:
-                tester.output_reader.set_status(False)
-        else:
-            long_output_pause_counter += 1
-            if long_output_pause_counter % inner_dimension == 0:
-                tester.output_reader.set_status(output_reader_status)
-                output_reader_status = not output_reader_status
-
-        await RisingEdge(dut.clk)
-        # dut._log.info("--------")
-
-        # dut._log.info(f"A inputs: {[val.integer for val in dut.a_data.value]}")
-        # dut._log.info(f"a_input_valid: {dut.a_input_valid.value}")
-        # dut._log.info(f"B inputs: {[val.integer for val in dut.b_data.value]}")
-        # dut._log.info(f"b_input_valid: {dut.b_input_valid.value}")
-        # dut._log.info(f"input_ready: {dut.input_ready.value}")
-
-        # dut._log.info(f"outputs: {[val.integer for val in dut.c_data_streaming.value]}")
-        # dut._log.info(f"output_valid: {dut.output_valid.value}")
-        # dut._log.info(f"output_ready: {dut.output_ready.value}")
-        
-        # processing_units_row = getattr(dut, f'processing_units_row[0]')
-        # processing_units_col = getattr(processing_units_row, f'processing_units_col[0]')
-        # u_processing_unit_instance = getattr(processing_units_col, 'u_processing_unit')
-        # dut._log.info(f"north_reg: {u_processing_unit_instance.north_i_reg.value.integer}, west reg: {u_processing_unit_instance.west_i_reg.value.integer}, result: {u_processing_unit_instance.result_reg.value.integer}")
-        
-
-        # dut._log.info(f"input ready : {dut.input_ready.value}")
-
-        # # This was used to "timeout" when debugging
-        # cycle_count += 1
-        # if cycle_count > 60:
-        #     raise Exception("done")
-
-        # dut._log.info(tester.output_reader.values.empty())
-        if not tester.output_reader.values.empty():
-            C[-1].append((await tester.output_reader.values.get())["c_data_streaming"])
-            # dut._log.info(f"C: {C}")
-        # dut._log.info(f"num_collected {num_collected}")
-        if len(C[-1]) >= outer_dimension:
-            num_collected += 1
-            # Run the comparison test here:
-            dut._log.info(f"Successful Number: {num_collected}")
-            try:
-                assert expected_outputs[num_collected-1] == C[-1]
-            except Exception as e:
-                dut._log.info("Expected")
-                dut._log.info([[val.integer for val in row] for row in expected_outputs[num_collected-1]])
-                dut._log.info("Actual")
-                dut._log.info([[val.integer for val in row] for row in C[-1]])
-                raise e
-            C.append([])
-        if num_collected >= num_samples:
-            # dut._log.info(f"Should have been set around here---------------")
-            all_output_collected = True
-            continue
-        # dut._log.info(f"all_output_collected: {all_output_collected}")
-    
-    # # Run comparison code
-    # count = 1
-    # for (expected_output, actual_result) in zip(expected_outputs, C):
-    #     # dut._log.info("Expected")
-    #     # dut._log.info([[val.integer for val in row] for row in expected_output])
-    #     # dut._log.info("Actual")
-    #     # dut._log.info([[val.integer for val in row] for row in actual_result])
-    #     dut._log.info(f"Successful Number: {count}")
-    #     count += 1
-    #     assert expected_output == actual_result
-
-
-def create_matrix(func, rows, cols):
-    return [[func(DATA_WIDTH) for col in range(cols)] for row in range(rows)]
-
-def create_row(length, func=getrandbits):
-    return [func(DATA_WIDTH) for _ in range(length)]
-
-def gen_matrices(rows, cols, num_samples=NUM_SAMPLES, func=getrandbits):
-    """Generate random matrix data for matrices of set dimensions"""
-    for _ in range(num_samples):
-        yield create_matrix(func, rows, cols)
\ No newline at end of file
+    if not METRICS_FILE:
+        return
+    cycles = sum(metrics["cycles"] for metrics in SCENARIO_METRICS)
+    beats = sum(metrics["beats"] for metrics in SCENARIO_METRICS)
+    memory_idle = sum(report["stalls"]["memory_idle"] for report in PREFETCH_REPORTS) if PREFETCH_REPORTS else None
+    read_wait = PREFETCH_REPORTS[-1]["memory"]["ports"][0]["wait_mean"] if PREFETCH_REPORTS else None
+    beats_per_request = BURST_REPORTS[-1]["beats_per_request"] if BURST_REPORTS else None
+    with open(METRICS_FILE, "w") as metrics_file:
+        json.dump(dict(cycles=cycles, beats=beats, beats_per_cycle=beats / cycles if cycles else None,
+                       memory_idle=memory_idle, read_wait=read_wait,
+                       beats_per_request=beats_per_request, scenarios=SCENARIO_METRICS, prefetch=PREFETCH_REPORTS,
+                       bursts=BURST_REPORTS), metrics_file, indent=2)
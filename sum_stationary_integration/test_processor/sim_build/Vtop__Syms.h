@@ -0,0 +1,117 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table internal header
+//
+// Internal details; most calling programs do not need this header,
+// unless using verilator public meta comments.
+
+#ifndef VERILATED_VTOP__SYMS_H_
+#define VERILATED_VTOP__SYMS_H_  // guard
+
+#include "verilated.h"
+
+// INCLUDE MODEL CLASS
+
+#include "Vtop.h"
+
+// INCLUDE MODULE CLASSES
+#include "Vtop___024root.h"
+
+// DPI TYPES for DPI Export callbacks (Internal use)
+
+// SYMS CLASS (contains all model state)
+class alignas(VL_CACHE_LINE_BYTES) Vtop__Syms final : public VerilatedSyms {
+  public:
+    // INTERNAL STATE
+    Vtop* const __Vm_modelp;
+    VlDeleter __Vm_deleter;
+    bool __Vm_didInit = false;
+
+    // MODULE INSTANCE STATE
+    Vtop___024root                 TOP;
+
+    // SCOPE NAMES
+    VerilatedScope* __Vscopep_TOP;
+    VerilatedScope* __Vscopep_processor;
+    VerilatedScope* __Vscopep_processor__last_delay_register;
+    VerilatedScope* __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET__;
+    VerilatedScope* __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1;
+    VerilatedScope* __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2;
+    VerilatedScope* __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET__;
+    VerilatedScope* __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1;
+    VerilatedScope* __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2;
+    VerilatedScope* __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET__;
+    VerilatedScope* __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1;
+    VerilatedScope* __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2;
+    VerilatedScope* __Vscopep_processor__north_delay_register;
+    VerilatedScope* __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET__;
+    VerilatedScope* __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1;
+    VerilatedScope* __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2;
+    VerilatedScope* __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET__;
+    VerilatedScope* __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1;
+    VerilatedScope* __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2;
+    VerilatedScope* __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET__;
+    VerilatedScope* __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1;
+    VerilatedScope* __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__0__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__1__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__2__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__3__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET__;
+    VerilatedScope* __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit;
+    VerilatedScope* __Vscopep_processor__single_buffered;
+    VerilatedScope* __Vscopep_processor__u_output_streaming_registers;
+    VerilatedScope* __Vscopep_processor__u_output_streaming_registers__unnamedblk1;
+    VerilatedScope* __Vscopep_processor__u_output_streaming_registers__unnamedblk2;
+    VerilatedScope* __Vscopep_processor__west_delay_register;
+    VerilatedScope* __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET__;
+    VerilatedScope* __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1;
+    VerilatedScope* __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2;
+    VerilatedScope* __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET__;
+    VerilatedScope* __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1;
+    VerilatedScope* __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2;
+    VerilatedScope* __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET__;
+    VerilatedScope* __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1;
+    VerilatedScope* __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2;
+
+    // SCOPE HIERARCHY
+    VerilatedHierarchy __Vhier;
+
+    // CONSTRUCTORS
+    Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp);
+    ~Vtop__Syms();
+
+    // METHODS
+    const char* name() const { return TOP.vlNamep; }
+};
+
+#endif  // guard
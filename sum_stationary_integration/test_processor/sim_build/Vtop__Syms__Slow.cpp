@@ -0,0 +1,876 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table implementation internals
+
+#include "Vtop__pch.h"
+
+Vtop__Syms::Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp)
+    : VerilatedSyms{contextp}
+    // Setup internal state of the Syms class
+    , __Vm_modelp{modelp}
+    // Setup top module instance
+    , TOP{this, namep}
+{
+    // Check resources
+    Verilated::stackCheck(684);
+    // Setup sub module instances
+    // Configure time unit / time precision
+    _vm_contextp__->timeunit(-9);
+    _vm_contextp__->timeprecision(-12);
+    // Setup each module's pointers to their submodules
+    // Setup each module's pointer back to symbol table (for public functions)
+    TOP.__Vconfigure(true);
+    // Setup scopes
+    __Vscopep_TOP = new VerilatedScope{this, "TOP", "TOP", "<null>", 0, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor = new VerilatedScope{this, "processor", "processor", "processor", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__last_delay_register = new VerilatedScope{this, "processor.last_delay_register", "last_delay_register", "input_delay_register", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET__ = new VerilatedScope{this, "processor.last_delay_register.shift_reg_gen[1]", "shift_reg_gen[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1 = new VerilatedScope{this, "processor.last_delay_register.shift_reg_gen[1].unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2 = new VerilatedScope{this, "processor.last_delay_register.shift_reg_gen[1].unnamedblk2", "unnamedblk2", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET__ = new VerilatedScope{this, "processor.last_delay_register.shift_reg_gen[2]", "shift_reg_gen[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1 = new VerilatedScope{this, "processor.last_delay_register.shift_reg_gen[2].unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2 = new VerilatedScope{this, "processor.last_delay_register.shift_reg_gen[2].unnamedblk2", "unnamedblk2", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET__ = new VerilatedScope{this, "processor.last_delay_register.shift_reg_gen[3]", "shift_reg_gen[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1 = new VerilatedScope{this, "processor.last_delay_register.shift_reg_gen[3].unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2 = new VerilatedScope{this, "processor.last_delay_register.shift_reg_gen[3].unnamedblk2", "unnamedblk2", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__north_delay_register = new VerilatedScope{this, "processor.north_delay_register", "north_delay_register", "input_delay_register", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET__ = new VerilatedScope{this, "processor.north_delay_register.shift_reg_gen[1]", "shift_reg_gen[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1 = new VerilatedScope{this, "processor.north_delay_register.shift_reg_gen[1].unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2 = new VerilatedScope{this, "processor.north_delay_register.shift_reg_gen[1].unnamedblk2", "unnamedblk2", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET__ = new VerilatedScope{this, "processor.north_delay_register.shift_reg_gen[2]", "shift_reg_gen[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1 = new VerilatedScope{this, "processor.north_delay_register.shift_reg_gen[2].unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2 = new VerilatedScope{this, "processor.north_delay_register.shift_reg_gen[2].unnamedblk2", "unnamedblk2", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET__ = new VerilatedScope{this, "processor.north_delay_register.shift_reg_gen[3]", "shift_reg_gen[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1 = new VerilatedScope{this, "processor.north_delay_register.shift_reg_gen[3].unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2 = new VerilatedScope{this, "processor.north_delay_register.shift_reg_gen[3].unnamedblk2", "unnamedblk2", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__0__KET__ = new VerilatedScope{this, "processor.processing_units_row[0]", "processing_units_row[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET__ = new VerilatedScope{this, "processor.processing_units_row[0].processing_units_col[0]", "processing_units_col[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[0].processing_units_col[0].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET__ = new VerilatedScope{this, "processor.processing_units_row[0].processing_units_col[1]", "processing_units_col[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[0].processing_units_col[1].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET__ = new VerilatedScope{this, "processor.processing_units_row[0].processing_units_col[2]", "processing_units_col[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[0].processing_units_col[2].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET__ = new VerilatedScope{this, "processor.processing_units_row[0].processing_units_col[3]", "processing_units_col[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[0].processing_units_col[3].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__1__KET__ = new VerilatedScope{this, "processor.processing_units_row[1]", "processing_units_row[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET__ = new VerilatedScope{this, "processor.processing_units_row[1].processing_units_col[0]", "processing_units_col[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[1].processing_units_col[0].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET__ = new VerilatedScope{this, "processor.processing_units_row[1].processing_units_col[1]", "processing_units_col[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[1].processing_units_col[1].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET__ = new VerilatedScope{this, "processor.processing_units_row[1].processing_units_col[2]", "processing_units_col[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[1].processing_units_col[2].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET__ = new VerilatedScope{this, "processor.processing_units_row[1].processing_units_col[3]", "processing_units_col[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[1].processing_units_col[3].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__2__KET__ = new VerilatedScope{this, "processor.processing_units_row[2]", "processing_units_row[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET__ = new VerilatedScope{this, "processor.processing_units_row[2].processing_units_col[0]", "processing_units_col[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[2].processing_units_col[0].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET__ = new VerilatedScope{this, "processor.processing_units_row[2].processing_units_col[1]", "processing_units_col[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[2].processing_units_col[1].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET__ = new VerilatedScope{this, "processor.processing_units_row[2].processing_units_col[2]", "processing_units_col[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[2].processing_units_col[2].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET__ = new VerilatedScope{this, "processor.processing_units_row[2].processing_units_col[3]", "processing_units_col[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[2].processing_units_col[3].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__3__KET__ = new VerilatedScope{this, "processor.processing_units_row[3]", "processing_units_row[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET__ = new VerilatedScope{this, "processor.processing_units_row[3].processing_units_col[0]", "processing_units_col[0]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[3].processing_units_col[0].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET__ = new VerilatedScope{this, "processor.processing_units_row[3].processing_units_col[1]", "processing_units_col[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[3].processing_units_col[1].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET__ = new VerilatedScope{this, "processor.processing_units_row[3].processing_units_col[2]", "processing_units_col[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[3].processing_units_col[2].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET__ = new VerilatedScope{this, "processor.processing_units_row[3].processing_units_col[3]", "processing_units_col[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit = new VerilatedScope{this, "processor.processing_units_row[3].processing_units_col[3].u_processing_unit", "u_processing_unit", "processing_unit", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__single_buffered = new VerilatedScope{this, "processor.single_buffered", "single_buffered", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__u_output_streaming_registers = new VerilatedScope{this, "processor.u_output_streaming_registers", "u_output_streaming_registers", "output_streaming_registers", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__u_output_streaming_registers__unnamedblk1 = new VerilatedScope{this, "processor.u_output_streaming_registers.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__u_output_streaming_registers__unnamedblk2 = new VerilatedScope{this, "processor.u_output_streaming_registers.unnamedblk2", "unnamedblk2", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__west_delay_register = new VerilatedScope{this, "processor.west_delay_register", "west_delay_register", "input_delay_register", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET__ = new VerilatedScope{this, "processor.west_delay_register.shift_reg_gen[1]", "shift_reg_gen[1]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1 = new VerilatedScope{this, "processor.west_delay_register.shift_reg_gen[1].unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2 = new VerilatedScope{this, "processor.west_delay_register.shift_reg_gen[1].unnamedblk2", "unnamedblk2", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET__ = new VerilatedScope{this, "processor.west_delay_register.shift_reg_gen[2]", "shift_reg_gen[2]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1 = new VerilatedScope{this, "processor.west_delay_register.shift_reg_gen[2].unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2 = new VerilatedScope{this, "processor.west_delay_register.shift_reg_gen[2].unnamedblk2", "unnamedblk2", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET__ = new VerilatedScope{this, "processor.west_delay_register.shift_reg_gen[3]", "shift_reg_gen[3]", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1 = new VerilatedScope{this, "processor.west_delay_register.shift_reg_gen[3].unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2 = new VerilatedScope{this, "processor.west_delay_register.shift_reg_gen[3].unnamedblk2", "unnamedblk2", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    // Set up scope hierarchy
+    __Vhier.add(0, __Vscopep_processor);
+    __Vhier.add(__Vscopep_processor, __Vscopep_processor__last_delay_register);
+    __Vhier.add(__Vscopep_processor, __Vscopep_processor__north_delay_register);
+    __Vhier.add(__Vscopep_processor, __Vscopep_processor__processing_units_row__BRA__0__KET__);
+    __Vhier.add(__Vscopep_processor, __Vscopep_processor__processing_units_row__BRA__1__KET__);
+    __Vhier.add(__Vscopep_processor, __Vscopep_processor__processing_units_row__BRA__2__KET__);
+    __Vhier.add(__Vscopep_processor, __Vscopep_processor__processing_units_row__BRA__3__KET__);
+    __Vhier.add(__Vscopep_processor, __Vscopep_processor__single_buffered);
+    __Vhier.add(__Vscopep_processor, __Vscopep_processor__u_output_streaming_registers);
+    __Vhier.add(__Vscopep_processor, __Vscopep_processor__west_delay_register);
+    __Vhier.add(__Vscopep_processor__last_delay_register, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET__);
+    __Vhier.add(__Vscopep_processor__last_delay_register, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET__);
+    __Vhier.add(__Vscopep_processor__last_delay_register, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET__);
+    __Vhier.add(__Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1);
+    __Vhier.add(__Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2);
+    __Vhier.add(__Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1);
+    __Vhier.add(__Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2);
+    __Vhier.add(__Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1);
+    __Vhier.add(__Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2);
+    __Vhier.add(__Vscopep_processor__north_delay_register, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET__);
+    __Vhier.add(__Vscopep_processor__north_delay_register, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET__);
+    __Vhier.add(__Vscopep_processor__north_delay_register, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET__);
+    __Vhier.add(__Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1);
+    __Vhier.add(__Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2);
+    __Vhier.add(__Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1);
+    __Vhier.add(__Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2);
+    __Vhier.add(__Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1);
+    __Vhier.add(__Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET__);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit);
+    __Vhier.add(__Vscopep_processor__u_output_streaming_registers, __Vscopep_processor__u_output_streaming_registers__unnamedblk1);
+    __Vhier.add(__Vscopep_processor__u_output_streaming_registers, __Vscopep_processor__u_output_streaming_registers__unnamedblk2);
+    __Vhier.add(__Vscopep_processor__west_delay_register, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET__);
+    __Vhier.add(__Vscopep_processor__west_delay_register, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET__);
+    __Vhier.add(__Vscopep_processor__west_delay_register, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET__);
+    __Vhier.add(__Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1);
+    __Vhier.add(__Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2);
+    __Vhier.add(__Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1);
+    __Vhier.add(__Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2);
+    __Vhier.add(__Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1);
+    __Vhier.add(__Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2);
+    // Setup export functions - final: 0
+    // Setup export functions - final: 1
+    // Setup public variables
+    __Vscopep_TOP->varInsert("a_data", &(TOP.a_data), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 1, 1 ,3,0 ,7,0);
+    __Vscopep_TOP->varInsert("a_input_ready", &(TOP.a_input_ready), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_TOP->varInsert("a_input_valid", &(TOP.a_input_valid), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("b_data", &(TOP.b_data), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 1, 1 ,3,0 ,7,0);
+    __Vscopep_TOP->varInsert("b_input_ready", &(TOP.b_input_ready), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_TOP->varInsert("b_input_valid", &(TOP.b_input_valid), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("c_data_streaming", &(TOP.c_data_streaming), false, VLVT_UINT32, VLVD_OUT|VLVF_PUB_RW, 1, 1 ,0,3 ,18,0);
+    __Vscopep_TOP->varInsert("clk", &(TOP.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("final_chunk", &(TOP.final_chunk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("input_col_id", &(TOP.input_col_id), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_TOP->varInsert("input_ready", &(TOP.input_ready), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_TOP->varInsert("input_row_id", &(TOP.input_row_id), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_TOP->varInsert("last", &(TOP.last), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("output_by_row", &(TOP.output_by_row), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("output_ready", &(TOP.output_ready), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("output_valid", &(TOP.output_valid), false, VLVT_UINT8, VLVD_OUT|VLVF_PUB_RW, 0, 0);
+    __Vscopep_TOP->varInsert("reset", &(TOP.reset), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor->varInsert("B_N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__B_N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor->varInsert("COL_ID", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__COL_ID))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor->varInsert("COUNTER_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__COUNTER_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor->varInsert("INPUT_FIFO_DEPTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__INPUT_FIFO_DEPTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor->varInsert("K_SPLIT", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__K_SPLIT))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor->varInsert("PROCESSOR_COLS_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__PROCESSOR_COLS_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor->varInsert("PROCESSOR_ROWS_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__PROCESSOR_ROWS_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor->varInsert("ROW_ID", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__ROW_ID))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor->varInsert("a_data", &(TOP.processor__DOT__a_data), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,3,0 ,7,0);
+    __Vscopep_processor->varInsert("a_head", &(TOP.processor__DOT__a_head), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 1, 1 ,3,0 ,7,0);
+    __Vscopep_processor->varInsert("a_input_ready", &(TOP.processor__DOT__a_input_ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor->varInsert("a_input_valid", &(TOP.processor__DOT__a_input_valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor->varInsert("a_valid", &(TOP.processor__DOT__a_valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor->varInsert("array_ready", &(TOP.processor__DOT__array_ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor->varInsert("array_reset", &(TOP.processor__DOT__array_reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor->varInsert("b_data", &(TOP.processor__DOT__b_data), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,3,0 ,7,0);
+    __Vscopep_processor->varInsert("b_head", &(TOP.processor__DOT__b_head), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 1, 1 ,3,0 ,7,0);
+    __Vscopep_processor->varInsert("b_input_ready", &(TOP.processor__DOT__b_input_ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor->varInsert("b_input_valid", &(TOP.processor__DOT__b_input_valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor->varInsert("b_valid", &(TOP.processor__DOT__b_valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor->varInsert("bank_final", &(TOP.processor__DOT__bank_final), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor->varInsert("c_data", &(TOP.processor__DOT__c_data), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 2, 1 ,3,0 ,3,0 ,18,0);
+    __Vscopep_processor->varInsert("c_data_streaming", &(TOP.processor__DOT__c_data_streaming), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,0,3 ,18,0);
+    __Vscopep_processor->varInsert("clk", &(TOP.processor__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor->varInsert("enable", &(TOP.processor__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor->varInsert("final_chunk", &(TOP.processor__DOT__final_chunk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor->varInsert("head_last", &(TOP.processor__DOT__head_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor->varInsert("horizontal_interconnect", &(TOP.processor__DOT__horizontal_interconnect), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 2, 1 ,4,0 ,4,1 ,7,0);
+    __Vscopep_processor->varInsert("input_col_id", &(TOP.processor__DOT__input_col_id), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_processor->varInsert("input_ready", &(TOP.processor__DOT__input_ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor->varInsert("input_row_id", &(TOP.processor__DOT__input_row_id), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_processor->varInsert("last", &(TOP.processor__DOT__last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor->varInsert("last_interconnect", &(TOP.processor__DOT__last_interconnect), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 2, 0 ,3,0 ,4,1);
+    __Vscopep_processor->varInsert("last_lanes", &(TOP.processor__DOT__last_lanes), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 1, 0 ,3,0);
+    __Vscopep_processor->varInsert("north_inputs", &(TOP.processor__DOT__north_inputs), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,3,0 ,7,0);
+    __Vscopep_processor->varInsert("output_by_row", &(TOP.processor__DOT__output_by_row), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor->varInsert("output_ready", &(TOP.processor__DOT__output_ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor->varInsert("output_valid", &(TOP.processor__DOT__output_valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor->varInsert("reset", &(TOP.processor__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor->varInsert("result_finals", &(TOP.processor__DOT__result_finals), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 2, 0 ,3,0 ,3,0);
+    __Vscopep_processor->varInsert("result_valid", &(TOP.processor__DOT__result_valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor->varInsert("tile_last", &(TOP.processor__DOT__tile_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor->varInsert("vertical_interconnect", &(TOP.processor__DOT__vertical_interconnect), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 2, 1 ,4,1 ,4,0 ,7,0);
+    __Vscopep_processor->varInsert("west_inputs", &(TOP.processor__DOT__west_inputs), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,3,0 ,7,0);
+    __Vscopep_processor->varInsert("west_lasts", &(TOP.processor__DOT__west_lasts), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 0 ,3,0);
+    __Vscopep_processor__last_delay_register->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__last_delay_register__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__last_delay_register->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__last_delay_register__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__last_delay_register->varInsert("clk", &(TOP.processor__DOT__last_delay_register__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__last_delay_register->varInsert("data_i", &(TOP.processor__DOT__last_delay_register__DOT__data_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,3,0 ,0,0);
+    __Vscopep_processor__last_delay_register->varInsert("data_o", &(TOP.processor__DOT__last_delay_register__DOT__data_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 1, 1 ,3,0 ,0,0);
+    __Vscopep_processor__last_delay_register->varInsert("enable", &(TOP.processor__DOT__last_delay_register__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__last_delay_register->varInsert("read_input", &(TOP.processor__DOT__last_delay_register__DOT__read_input), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__last_delay_register->varInsert("reset", &(TOP.processor__DOT__last_delay_register__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__last_delay_register->varInsert("shift_reg", &(TOP.processor__DOT__last_delay_register__DOT__shift_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 2, 1 ,3,1 ,2,0 ,0,0);
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET__->varInsert("shift_reg_i", &(TOP.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,0,0 ,0,0);
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1->varInsert("j", &(TOP.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2->varInsert("j", &(TOP.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET__->varInsert("shift_reg_i", &(TOP.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,1,0 ,0,0);
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1->varInsert("j", &(TOP.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2->varInsert("j", &(TOP.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET__->varInsert("shift_reg_i", &(TOP.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,2,0 ,0,0);
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1->varInsert("j", &(TOP.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2->varInsert("j", &(TOP.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__north_delay_register->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__north_delay_register__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__north_delay_register->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__north_delay_register__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__north_delay_register->varInsert("clk", &(TOP.processor__DOT__north_delay_register__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__north_delay_register->varInsert("data_i", &(TOP.processor__DOT__north_delay_register__DOT__data_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,3,0 ,7,0);
+    __Vscopep_processor__north_delay_register->varInsert("data_o", &(TOP.processor__DOT__north_delay_register__DOT__data_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 1, 1 ,3,0 ,7,0);
+    __Vscopep_processor__north_delay_register->varInsert("enable", &(TOP.processor__DOT__north_delay_register__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__north_delay_register->varInsert("read_input", &(TOP.processor__DOT__north_delay_register__DOT__read_input), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__north_delay_register->varInsert("reset", &(TOP.processor__DOT__north_delay_register__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__north_delay_register->varInsert("shift_reg", &(TOP.processor__DOT__north_delay_register__DOT__shift_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 2, 1 ,3,1 ,2,0 ,7,0);
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET__->varInsert("shift_reg_i", &(TOP.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,0,0 ,7,0);
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1->varInsert("j", &(TOP.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2->varInsert("j", &(TOP.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET__->varInsert("shift_reg_i", &(TOP.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,1,0 ,7,0);
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1->varInsert("j", &(TOP.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2->varInsert("j", &(TOP.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET__->varInsert("shift_reg_i", &(TOP.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,2,0 ,7,0);
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1->varInsert("j", &(TOP.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2->varInsert("j", &(TOP.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("ACCUM_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("DOUBLE_BUFFER", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("MULTIPLY_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("clk", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("east_last_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("east_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("enable", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("north_i", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("north_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_calc", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_calculated", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_last", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("product_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("reset", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_calc", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_final_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("result_shadow", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,18,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("south_o", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_i", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_i_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_last_i", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit->varInsert("west_last_reg", &(TOP.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__single_buffered->varInsert("counter", &(TOP.processor__DOT__single_buffered__DOT__counter), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_processor__single_buffered->varInsert("input_done", &(TOP.processor__DOT__single_buffered__DOT__input_done), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("C_DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__u_output_streaming_registers__DOT__C_DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__u_output_streaming_registers__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("c_data", &(TOP.processor__DOT__u_output_streaming_registers__DOT__c_data), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 2, 1 ,3,0 ,3,0 ,18,0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("clk", &(TOP.processor__DOT__u_output_streaming_registers__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("counter", &(TOP.processor__DOT__u_output_streaming_registers__DOT__counter), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,2,0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("output_by_row", &(TOP.processor__DOT__u_output_streaming_registers__DOT__output_by_row), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("output_by_row_register", &(TOP.processor__DOT__u_output_streaming_registers__DOT__output_by_row_register), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("output_by_row_wire", &(TOP.processor__DOT__u_output_streaming_registers__DOT__output_by_row_wire), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("output_data", &(TOP.processor__DOT__u_output_streaming_registers__DOT__output_data), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,0,3 ,18,0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("output_ready", &(TOP.processor__DOT__u_output_streaming_registers__DOT__output_ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("output_registers", &(TOP.processor__DOT__u_output_streaming_registers__DOT__output_registers), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 2, 1 ,0,3 ,0,3 ,18,0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("output_valid", &(TOP.processor__DOT__u_output_streaming_registers__DOT__output_valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("reset", &(TOP.processor__DOT__u_output_streaming_registers__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__u_output_streaming_registers->varInsert("result_valid", &(TOP.processor__DOT__u_output_streaming_registers__DOT__result_valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__u_output_streaming_registers__unnamedblk1->varInsert("j", &(TOP.processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__u_output_streaming_registers__unnamedblk2->varInsert("i", &(TOP.processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__west_delay_register->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__west_delay_register__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__west_delay_register->varInsert("N", const_cast<void*>(static_cast<const void*>(&(TOP.processor__DOT__west_delay_register__DOT__N))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__west_delay_register->varInsert("clk", &(TOP.processor__DOT__west_delay_register__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__west_delay_register->varInsert("data_i", &(TOP.processor__DOT__west_delay_register__DOT__data_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,3,0 ,7,0);
+    __Vscopep_processor__west_delay_register->varInsert("data_o", &(TOP.processor__DOT__west_delay_register__DOT__data_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 1, 1 ,3,0 ,7,0);
+    __Vscopep_processor__west_delay_register->varInsert("enable", &(TOP.processor__DOT__west_delay_register__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__west_delay_register->varInsert("read_input", &(TOP.processor__DOT__west_delay_register__DOT__read_input), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__west_delay_register->varInsert("reset", &(TOP.processor__DOT__west_delay_register__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_processor__west_delay_register->varInsert("shift_reg", &(TOP.processor__DOT__west_delay_register__DOT__shift_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 2, 1 ,3,1 ,2,0 ,7,0);
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET__->varInsert("shift_reg_i", &(TOP.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,0,0 ,7,0);
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1->varInsert("j", &(TOP.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2->varInsert("j", &(TOP.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET__->varInsert("shift_reg_i", &(TOP.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,1,0 ,7,0);
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1->varInsert("j", &(TOP.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2->varInsert("j", &(TOP.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET__->varInsert("shift_reg_i", &(TOP.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,2,0 ,7,0);
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1->varInsert("j", &(TOP.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2->varInsert("j", &(TOP.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 1 ,31,0);
+}
+
+Vtop__Syms::~Vtop__Syms() {
+    // Tear down scope hierarchy
+    __Vhier.remove(0, __Vscopep_processor);
+    __Vhier.remove(__Vscopep_processor, __Vscopep_processor__last_delay_register);
+    __Vhier.remove(__Vscopep_processor, __Vscopep_processor__north_delay_register);
+    __Vhier.remove(__Vscopep_processor, __Vscopep_processor__processing_units_row__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_processor, __Vscopep_processor__processing_units_row__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_processor, __Vscopep_processor__processing_units_row__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_processor, __Vscopep_processor__processing_units_row__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_processor, __Vscopep_processor__single_buffered);
+    __Vhier.remove(__Vscopep_processor, __Vscopep_processor__u_output_streaming_registers);
+    __Vhier.remove(__Vscopep_processor, __Vscopep_processor__west_delay_register);
+    __Vhier.remove(__Vscopep_processor__last_delay_register, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_processor__last_delay_register, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_processor__last_delay_register, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1);
+    __Vhier.remove(__Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2);
+    __Vhier.remove(__Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1);
+    __Vhier.remove(__Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2);
+    __Vhier.remove(__Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1);
+    __Vhier.remove(__Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2);
+    __Vhier.remove(__Vscopep_processor__north_delay_register, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_processor__north_delay_register, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_processor__north_delay_register, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1);
+    __Vhier.remove(__Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2);
+    __Vhier.remove(__Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1);
+    __Vhier.remove(__Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2);
+    __Vhier.remove(__Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1);
+    __Vhier.remove(__Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit);
+    __Vhier.remove(__Vscopep_processor__u_output_streaming_registers, __Vscopep_processor__u_output_streaming_registers__unnamedblk1);
+    __Vhier.remove(__Vscopep_processor__u_output_streaming_registers, __Vscopep_processor__u_output_streaming_registers__unnamedblk2);
+    __Vhier.remove(__Vscopep_processor__west_delay_register, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_processor__west_delay_register, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_processor__west_delay_register, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET__);
+    __Vhier.remove(__Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1);
+    __Vhier.remove(__Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2);
+    __Vhier.remove(__Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1);
+    __Vhier.remove(__Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2);
+    __Vhier.remove(__Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1);
+    __Vhier.remove(__Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2);
+    // Clear keys from hierarchy map after values have been removed
+    __Vhier.clear();
+    // Tear down scopes
+    VL_DO_CLEAR(delete __Vscopep_TOP, __Vscopep_TOP = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor, __Vscopep_processor = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__last_delay_register, __Vscopep_processor__last_delay_register = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2, __Vscopep_processor__last_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__north_delay_register, __Vscopep_processor__north_delay_register = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2, __Vscopep_processor__north_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__0__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__1__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__2__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__0__KET____processing_units_col__BRA__3__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__0__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__1__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__2__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__1__KET____processing_units_col__BRA__3__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__0__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__1__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__2__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__2__KET____processing_units_col__BRA__3__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__0__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__1__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__2__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET__, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit, __Vscopep_processor__processing_units_row__BRA__3__KET____processing_units_col__BRA__3__KET____u_processing_unit = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__single_buffered, __Vscopep_processor__single_buffered = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__u_output_streaming_registers, __Vscopep_processor__u_output_streaming_registers = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__u_output_streaming_registers__unnamedblk1, __Vscopep_processor__u_output_streaming_registers__unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__u_output_streaming_registers__unnamedblk2, __Vscopep_processor__u_output_streaming_registers__unnamedblk2 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__west_delay_register, __Vscopep_processor__west_delay_register = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__1__KET____unnamedblk2 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__2__KET____unnamedblk2 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET__, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk1 = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2, __Vscopep_processor__west_delay_register__shift_reg_gen__BRA__3__KET____unnamedblk2 = nullptr);
+    // Tear down sub module instances
+}
@@ -0,0 +1,660 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP___024ROOT_H_
+#define VERILATED_VTOP___024ROOT_H_  // guard
+
+#include "verilated.h"
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop___024root final {
+  public:
+
+    // DESIGN SPECIFIC STATE
+    // Anonymous structures to workaround compiler member-count bugs
+    struct {
+        VL_IN8(clk,0,0);
+        VL_IN8(reset,0,0);
+        VL_IN8(a_input_valid,0,0);
+        VL_IN8(b_input_valid,0,0);
+        VL_IN8(output_ready,0,0);
+        VL_OUT8(input_ready,0,0);
+        VL_OUT8(a_input_ready,0,0);
+        VL_OUT8(b_input_ready,0,0);
+        VL_IN8(input_col_id,3,0);
+        VL_IN8(input_row_id,3,0);
+        VL_OUT8(output_valid,0,0);
+        VL_IN8(output_by_row,0,0);
+        VL_IN8(last,0,0);
+        VL_IN8(final_chunk,0,0);
+        CData/*0:0*/ processor__DOT__clk;
+        CData/*0:0*/ processor__DOT__reset;
+        CData/*0:0*/ processor__DOT__a_input_valid;
+        CData/*0:0*/ processor__DOT__b_input_valid;
+        CData/*0:0*/ processor__DOT__output_ready;
+        CData/*0:0*/ processor__DOT__input_ready;
+        CData/*0:0*/ processor__DOT__a_input_ready;
+        CData/*0:0*/ processor__DOT__b_input_ready;
+        CData/*3:0*/ processor__DOT__input_col_id;
+        CData/*3:0*/ processor__DOT__input_row_id;
+        CData/*0:0*/ processor__DOT__output_valid;
+        CData/*0:0*/ processor__DOT__output_by_row;
+        CData/*0:0*/ processor__DOT__last;
+        CData/*0:0*/ processor__DOT__final_chunk;
+        CData/*0:0*/ processor__DOT__result_valid;
+        CData/*0:0*/ processor__DOT__enable;
+        CData/*0:0*/ processor__DOT__array_reset;
+        CData/*0:0*/ processor__DOT__bank_final;
+        CData/*0:0*/ processor__DOT__a_valid;
+        CData/*0:0*/ processor__DOT__b_valid;
+        CData/*0:0*/ processor__DOT__head_last;
+        CData/*0:0*/ processor__DOT__array_ready;
+        CData/*0:0*/ processor__DOT__tile_last;
+        CData/*3:0*/ processor__DOT__single_buffered__DOT__counter;
+        CData/*0:0*/ processor__DOT__single_buffered__DOT__input_done;
+        CData/*7:0*/ processor__DOT__west_delay_register__DOT____Vlvbound_ha910025d__0;
+        CData/*7:0*/ processor__DOT__west_delay_register__DOT____Vlvbound_hffe52cae__0;
+        CData/*7:0*/ processor__DOT__west_delay_register__DOT____Vlvbound_h556b5c52__0;
+        CData/*7:0*/ processor__DOT__west_delay_register__DOT____Vlvbound_h9629e2bb__0;
+        CData/*0:0*/ processor__DOT__west_delay_register__DOT__clk;
+        CData/*0:0*/ processor__DOT__west_delay_register__DOT__reset;
+        CData/*0:0*/ processor__DOT__west_delay_register__DOT__read_input;
+        CData/*0:0*/ processor__DOT__west_delay_register__DOT__enable;
+        CData/*7:0*/ processor__DOT__north_delay_register__DOT____Vlvbound_ha910025d__0;
+        CData/*7:0*/ processor__DOT__north_delay_register__DOT____Vlvbound_hffe52cae__0;
+        CData/*7:0*/ processor__DOT__north_delay_register__DOT____Vlvbound_h556b5c52__0;
+        CData/*7:0*/ processor__DOT__north_delay_register__DOT____Vlvbound_h9629e2bb__0;
+        CData/*0:0*/ processor__DOT__north_delay_register__DOT__clk;
+        CData/*0:0*/ processor__DOT__north_delay_register__DOT__reset;
+        CData/*0:0*/ processor__DOT__north_delay_register__DOT__read_input;
+        CData/*0:0*/ processor__DOT__north_delay_register__DOT__enable;
+        CData/*0:0*/ processor__DOT__last_delay_register__DOT____Vlvbound_hbadac7db__0;
+        CData/*0:0*/ processor__DOT__last_delay_register__DOT____Vlvbound_h8f55f58c__0;
+        CData/*0:0*/ processor__DOT__last_delay_register__DOT____Vlvbound_h20b024af__0;
+        CData/*0:0*/ processor__DOT__last_delay_register__DOT____Vlvbound_hfb724d0c__0;
+        CData/*0:0*/ processor__DOT__last_delay_register__DOT__clk;
+        CData/*0:0*/ processor__DOT__last_delay_register__DOT__reset;
+        CData/*0:0*/ processor__DOT__last_delay_register__DOT__read_input;
+        CData/*0:0*/ processor__DOT__last_delay_register__DOT__enable;
+        CData/*0:0*/ processor__DOT__u_output_streaming_registers__DOT__clk;
+    };
+    struct {
+        CData/*0:0*/ processor__DOT__u_output_streaming_registers__DOT__reset;
+        CData/*0:0*/ processor__DOT__u_output_streaming_registers__DOT__result_valid;
+        CData/*0:0*/ processor__DOT__u_output_streaming_registers__DOT__output_by_row;
+        CData/*0:0*/ processor__DOT__u_output_streaming_registers__DOT__output_ready;
+        CData/*0:0*/ processor__DOT__u_output_streaming_registers__DOT__output_valid;
+        CData/*2:0*/ processor__DOT__u_output_streaming_registers__DOT__counter;
+        CData/*0:0*/ processor__DOT__u_output_streaming_registers__DOT__output_by_row_register;
+        CData/*0:0*/ processor__DOT__u_output_streaming_registers__DOT__output_by_row_wire;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated;
+    };
+    struct {
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    };
+    struct {
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i;
+    };
+    struct {
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        CData/*7:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        CData/*0:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        CData/*0:0*/ __VstlFirstIteration;
+        CData/*0:0*/ __VstlPhaseResult;
+        CData/*0:0*/ __VicoFirstIteration;
+        CData/*0:0*/ __VicoPhaseResult;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__west_delay_register__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__north_delay_register__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__last_delay_register__DOT__clk__0;
+    };
+    struct {
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__u_output_streaming_registers__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0;
+        CData/*0:0*/ __VactPhaseResult;
+        CData/*0:0*/ __VnbaPhaseResult;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc;
+        SData/*15:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg;
+        IData/*31:0*/ processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j;
+        IData/*31:0*/ processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j;
+        IData/*31:0*/ processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j;
+        IData/*31:0*/ processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j;
+        IData/*31:0*/ processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j;
+        IData/*31:0*/ processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j;
+        IData/*31:0*/ processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j;
+        IData/*31:0*/ processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j;
+        IData/*31:0*/ processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j;
+        IData/*31:0*/ processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j;
+        IData/*31:0*/ processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j;
+        IData/*31:0*/ processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j;
+        IData/*31:0*/ processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j;
+    };
+    struct {
+        IData/*31:0*/ processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j;
+        IData/*31:0*/ processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j;
+        IData/*31:0*/ processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j;
+        IData/*31:0*/ processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j;
+        IData/*31:0*/ processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j;
+        IData/*31:0*/ processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j;
+        IData/*31:0*/ processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+    };
+    struct {
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+        IData/*18:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow;
+        IData/*31:0*/ __VactIterCount;
+        VlUnpacked<CData/*7:0*/, 4> a_data;
+        VlUnpacked<CData/*7:0*/, 4> b_data;
+        VlUnpacked<IData/*18:0*/, 4> c_data_streaming;
+        VlUnpacked<CData/*7:0*/, 4> processor__DOT__a_data;
+        VlUnpacked<CData/*7:0*/, 4> processor__DOT__b_data;
+        VlUnpacked<IData/*18:0*/, 4> processor__DOT__c_data_streaming;
+        VlUnpacked<CData/*7:0*/, 4> processor__DOT__a_head;
+        VlUnpacked<CData/*7:0*/, 4> processor__DOT__b_head;
+        VlUnpacked<CData/*7:0*/, 4> processor__DOT__north_inputs;
+        VlUnpacked<CData/*7:0*/, 4> processor__DOT__west_inputs;
+        VlUnpacked<CData/*0:0*/, 4> processor__DOT__last_lanes;
+        VlUnpacked<CData/*0:0*/, 4> processor__DOT__west_lasts;
+        VlUnpacked<CData/*0:0*/, 4> processor__DOT____Vcellinp__last_delay_register__data_i;
+        VlUnpacked<VlUnpacked<CData/*7:0*/, 4>, 5> processor__DOT__horizontal_interconnect;
+        VlUnpacked<VlUnpacked<CData/*7:0*/, 5>, 4> processor__DOT__vertical_interconnect;
+        VlUnpacked<VlUnpacked<IData/*18:0*/, 4>, 4> processor__DOT__c_data;
+        VlUnpacked<VlUnpacked<CData/*0:0*/, 4>, 4> processor__DOT__last_interconnect;
+        VlUnpacked<VlUnpacked<CData/*0:0*/, 4>, 4> processor__DOT__result_finals;
+        VlUnpacked<CData/*7:0*/, 4> processor__DOT__west_delay_register__DOT__data_i;
+        VlUnpacked<CData/*7:0*/, 4> processor__DOT__west_delay_register__DOT__data_o;
+        VlUnpacked<VlUnpacked<CData/*7:0*/, 3>, 3> processor__DOT__west_delay_register__DOT__shift_reg;
+        VlUnpacked<CData/*7:0*/, 1> processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i;
+        VlUnpacked<CData/*7:0*/, 2> processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i;
+        VlUnpacked<CData/*7:0*/, 3> processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i;
+        VlUnpacked<CData/*7:0*/, 4> processor__DOT__north_delay_register__DOT__data_i;
+        VlUnpacked<CData/*7:0*/, 4> processor__DOT__north_delay_register__DOT__data_o;
+        VlUnpacked<VlUnpacked<CData/*7:0*/, 3>, 3> processor__DOT__north_delay_register__DOT__shift_reg;
+        VlUnpacked<CData/*7:0*/, 1> processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i;
+        VlUnpacked<CData/*7:0*/, 2> processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i;
+        VlUnpacked<CData/*7:0*/, 3> processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i;
+        VlUnpacked<CData/*0:0*/, 4> processor__DOT__last_delay_register__DOT__data_i;
+        VlUnpacked<CData/*0:0*/, 4> processor__DOT__last_delay_register__DOT__data_o;
+        VlUnpacked<VlUnpacked<CData/*0:0*/, 3>, 3> processor__DOT__last_delay_register__DOT__shift_reg;
+        VlUnpacked<CData/*0:0*/, 1> processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i;
+        VlUnpacked<CData/*0:0*/, 2> processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i;
+        VlUnpacked<CData/*0:0*/, 3> processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i;
+        VlUnpacked<VlUnpacked<IData/*18:0*/, 4>, 4> processor__DOT__u_output_streaming_registers__DOT__c_data;
+        VlUnpacked<IData/*18:0*/, 4> processor__DOT__u_output_streaming_registers__DOT__output_data;
+        VlUnpacked<VlUnpacked<IData/*18:0*/, 4>, 4> processor__DOT__u_output_streaming_registers__DOT__output_registers;
+        VlUnpacked<QData/*63:0*/, 1> __VstlTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VicoTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VactTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VnbaTriggered;
+    };
+    VlNBACommitQueue<VlUnpacked<CData/*7:0*/, 1>, false, CData/*7:0*/, 1> __VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i;
+    VlNBACommitQueue<VlUnpacked<CData/*7:0*/, 2>, false, CData/*7:0*/, 1> __VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i;
+    VlNBACommitQueue<VlUnpacked<CData/*7:0*/, 3>, false, CData/*7:0*/, 1> __VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i;
+    VlNBACommitQueue<VlUnpacked<CData/*7:0*/, 1>, false, CData/*7:0*/, 1> __VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i;
+    VlNBACommitQueue<VlUnpacked<CData/*7:0*/, 2>, false, CData/*7:0*/, 1> __VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i;
+    VlNBACommitQueue<VlUnpacked<CData/*7:0*/, 3>, false, CData/*7:0*/, 1> __VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i;
+    VlNBACommitQueue<VlUnpacked<CData/*0:0*/, 1>, false, CData/*0:0*/, 1> __VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i;
+    VlNBACommitQueue<VlUnpacked<CData/*0:0*/, 2>, false, CData/*0:0*/, 1> __VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i;
+    VlNBACommitQueue<VlUnpacked<CData/*0:0*/, 3>, false, CData/*0:0*/, 1> __VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i;
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr IData/*31:0*/ processor__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__B_N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__PROCESSOR_ROWS_BITS = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__PROCESSOR_COLS_BITS = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__ROW_ID = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__COL_ID = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__INPUT_FIFO_DEPTH = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__K_SPLIT = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__COUNTER_BITS = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__west_delay_register__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__west_delay_register__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__north_delay_register__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__north_delay_register__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__last_delay_register__DOT__DATA_WIDTH = 1U;
+    static constexpr IData/*31:0*/ processor__DOT__last_delay_register__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__u_output_streaming_registers__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__u_output_streaming_registers__DOT__C_DATA_WIDTH = 0x00000013U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DATA_WIDTH = 8U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__N = 4U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH = 3U;
+    static constexpr IData/*31:0*/ processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER = 0U;
+
+    // CONSTRUCTORS
+    Vtop___024root(Vtop__Syms* symsp, const char* namep);
+    ~Vtop___024root();
+    VL_UNCOPYABLE(Vtop___024root);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
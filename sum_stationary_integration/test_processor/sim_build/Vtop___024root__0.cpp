@@ -0,0 +1,4510 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop___024root___eval_triggers_vec__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VicoTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VicoTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VicoFirstIteration)));
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__ico\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ico_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.processor__DOT__final_chunk = vlSelfRef.final_chunk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg[0U][0U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg[1U][1U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg[1U][0U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg[2U][2U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[2U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg[2U][1U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg[2U][0U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg[0U][0U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg[1U][1U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg[1U][0U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg[2U][2U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[2U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg[2U][1U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg[2U][0U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg[0U][0U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg[1U][1U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg[1U][0U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg[2U][2U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[2U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg[2U][1U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg[2U][0U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__output_ready = vlSelfRef.output_ready;
+    vlSelfRef.processor__DOT__result_finals[0U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[0U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[0U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[0U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[1U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[1U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[1U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[1U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[2U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[2U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[2U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[2U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[3U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[3U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[3U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__result_finals[3U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[1U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[2U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[3U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__output_by_row = vlSelfRef.output_by_row;
+    vlSelfRef.processor__DOT__west_delay_register__DOT__data_o[1U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__data_o[2U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__data_o[3U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[2U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__data_o[1U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__data_o[2U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__data_o[3U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[2U];
+    vlSelfRef.processor__DOT__last = vlSelfRef.last;
+    vlSelfRef.processor__DOT__a_data = vlSelfRef.a_data;
+    vlSelfRef.processor__DOT__b_data = vlSelfRef.b_data;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__clk = vlSelfRef.clk;
+    vlSelfRef.processor__DOT__reset = vlSelfRef.reset;
+    vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_valid 
+        = (0U != (IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__counter));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__result_valid = (0U == (IData)(vlSelfRef.processor__DOT__single_buffered__DOT__counter));
+    vlSelfRef.processor__DOT__a_input_valid = vlSelfRef.a_input_valid;
+    vlSelfRef.processor__DOT__b_input_valid = vlSelfRef.b_input_valid;
+    vlSelfRef.processor__DOT__input_col_id = vlSelfRef.input_col_id;
+    vlSelfRef.processor__DOT__input_row_id = vlSelfRef.input_row_id;
+    vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_ready 
+        = vlSelfRef.processor__DOT__output_ready;
+    vlSelfRef.processor__DOT__bank_final = vlSelfRef.processor__DOT__result_finals[3U][3U];
+    vlSelfRef.processor__DOT__c_data[0U][0U] = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[0U][1U] = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[0U][2U] = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[0U][3U] = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[1U][0U] = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[1U][1U] = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[1U][2U] = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[1U][3U] = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[2U][0U] = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[2U][1U] = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[2U][2U] = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[2U][3U] = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[3U][0U] = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[3U][1U] = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[3U][2U] = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__c_data[3U][3U] = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_by_row 
+        = vlSelfRef.processor__DOT__output_by_row;
+    vlSelfRef.processor__DOT__tile_last = vlSelfRef.processor__DOT__last;
+    vlSelfRef.processor__DOT__a_head = vlSelfRef.processor__DOT__a_data;
+    vlSelfRef.processor__DOT__b_head = vlSelfRef.processor__DOT__b_data;
+    vlSelfRef.processor__DOT__last_interconnect[0U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[0U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[0U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[0U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[1U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[1U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[1U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[1U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[2U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[2U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[2U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[2U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[3U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[3U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[3U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__last_interconnect[3U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__west_delay_register__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__north_delay_register__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__last_delay_register__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__reset 
+        = vlSelfRef.processor__DOT__reset;
+    vlSelfRef.processor__DOT__output_valid = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_valid;
+    vlSelfRef.processor__DOT__horizontal_interconnect[0U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[0U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[0U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[0U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[0U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[0U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[0U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[0U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[1U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[1U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[1U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[1U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[1U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[1U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[1U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[1U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[2U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[2U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[2U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[2U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[2U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[2U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[2U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[2U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[3U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[3U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[3U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[3U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[3U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[3U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[3U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[3U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__result_valid 
+        = vlSelfRef.processor__DOT__result_valid;
+    vlSelfRef.processor__DOT__a_valid = ((IData)(vlSelfRef.processor__DOT__a_input_valid) 
+                                         & (0U == (IData)(vlSelfRef.processor__DOT__input_col_id)));
+    vlSelfRef.processor__DOT__b_valid = ((IData)(vlSelfRef.processor__DOT__b_input_valid) 
+                                         & (0U == (IData)(vlSelfRef.processor__DOT__input_row_id)));
+    vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data 
+        = vlSelfRef.processor__DOT__c_data;
+    vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_by_row_wire 
+        = ((4U == (IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__counter))
+            ? (IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_by_row)
+            : (IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_by_row_register));
+    vlSelfRef.processor__DOT__head_last = vlSelfRef.processor__DOT__tile_last;
+    vlSelfRef.processor__DOT__west_delay_register__DOT__data_i 
+        = vlSelfRef.processor__DOT__a_head;
+    vlSelfRef.processor__DOT__north_delay_register__DOT__data_i 
+        = vlSelfRef.processor__DOT__b_head;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[0U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[0U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[0U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[1U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[1U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[1U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[2U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[2U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[2U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[3U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[3U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[3U][2U];
+    vlSelfRef.output_valid = vlSelfRef.processor__DOT__output_valid;
+    vlSelfRef.processor__DOT__array_reset = ((IData)(vlSelfRef.processor__DOT__reset) 
+                                             | ((~ (IData)(vlSelfRef.processor__DOT__output_valid)) 
+                                                & (IData)(vlSelfRef.processor__DOT__result_valid)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[0U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[0U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[0U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[1U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[1U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[1U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[2U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[2U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[2U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[3U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[3U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[3U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[0U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[1U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[2U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[0U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[0U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[0U][3U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[1U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[1U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[1U][3U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[2U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[2U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[2U][3U];
+    vlSelfRef.processor__DOT__array_ready = ((~ (IData)(vlSelfRef.processor__DOT__single_buffered__DOT__input_done)) 
+                                             & ((IData)(vlSelfRef.processor__DOT__a_valid) 
+                                                & (IData)(vlSelfRef.processor__DOT__b_valid)));
+    if (vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_by_row_wire) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j = 0U;
+        while (VL_GTS_III(32, 4U, vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j)) {
+            vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_data[(3U 
+                                                                                & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j)] 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U]
+                [(3U & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j)];
+            vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j 
+                = ((IData)(1U) + vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j);
+        }
+    } else {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i = 0U;
+        while (VL_GTS_III(32, 4U, vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i)) {
+            vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_data[(3U 
+                                                                                & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i)] 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers
+                [(3U & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i)][0U];
+            vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i 
+                = ((IData)(1U) + vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i);
+        }
+    }
+    vlSelfRef.processor__DOT__last_lanes[3U] = vlSelfRef.processor__DOT__head_last;
+    vlSelfRef.processor__DOT__last_lanes[2U] = vlSelfRef.processor__DOT__head_last;
+    vlSelfRef.processor__DOT__last_lanes[1U] = vlSelfRef.processor__DOT__head_last;
+    vlSelfRef.processor__DOT__last_lanes[0U] = vlSelfRef.processor__DOT__head_last;
+    vlSelfRef.processor__DOT__west_delay_register__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__north_delay_register__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__last_delay_register__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__input_ready = vlSelfRef.processor__DOT__array_ready;
+    vlSelfRef.processor__DOT__a_input_ready = vlSelfRef.processor__DOT__array_ready;
+    vlSelfRef.processor__DOT__b_input_ready = vlSelfRef.processor__DOT__array_ready;
+    vlSelfRef.processor__DOT__last_delay_register__DOT__read_input 
+        = vlSelfRef.processor__DOT__array_ready;
+    vlSelfRef.processor__DOT__west_delay_register__DOT__read_input 
+        = vlSelfRef.processor__DOT__array_ready;
+    vlSelfRef.processor__DOT__north_delay_register__DOT__read_input 
+        = vlSelfRef.processor__DOT__array_ready;
+    vlSelfRef.processor__DOT__enable = ((~ (IData)(vlSelfRef.processor__DOT__result_valid)) 
+                                        & ((IData)(vlSelfRef.processor__DOT__array_ready) 
+                                           | (IData)(vlSelfRef.processor__DOT__single_buffered__DOT__input_done)));
+    vlSelfRef.processor__DOT__c_data_streaming = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_data;
+    vlSelfRef.processor__DOT____Vcellinp__last_delay_register__data_i[3U] 
+        = vlSelfRef.processor__DOT__last_lanes[3U];
+    vlSelfRef.processor__DOT____Vcellinp__last_delay_register__data_i[2U] 
+        = vlSelfRef.processor__DOT__last_lanes[2U];
+    vlSelfRef.processor__DOT____Vcellinp__last_delay_register__data_i[1U] 
+        = vlSelfRef.processor__DOT__last_lanes[1U];
+    vlSelfRef.processor__DOT____Vcellinp__last_delay_register__data_i[0U] 
+        = vlSelfRef.processor__DOT__last_lanes[0U];
+    vlSelfRef.input_ready = vlSelfRef.processor__DOT__input_ready;
+    vlSelfRef.a_input_ready = vlSelfRef.processor__DOT__a_input_ready;
+    vlSelfRef.b_input_ready = vlSelfRef.processor__DOT__b_input_ready;
+    vlSelfRef.processor__DOT__west_delay_register__DOT__data_o[0U] 
+        = (vlSelfRef.processor__DOT__west_delay_register__DOT__data_i[0U] 
+           & (- (IData)((IData)(vlSelfRef.processor__DOT__west_delay_register__DOT__read_input))));
+    vlSelfRef.processor__DOT__north_delay_register__DOT__data_o[0U] 
+        = (vlSelfRef.processor__DOT__north_delay_register__DOT__data_i[0U] 
+           & (- (IData)((IData)(vlSelfRef.processor__DOT__north_delay_register__DOT__read_input))));
+    vlSelfRef.processor__DOT__west_delay_register__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__north_delay_register__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__last_delay_register__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.c_data_streaming = vlSelfRef.processor__DOT__c_data_streaming;
+    vlSelfRef.processor__DOT__last_delay_register__DOT__data_i 
+        = vlSelfRef.processor__DOT____Vcellinp__last_delay_register__data_i;
+    vlSelfRef.processor__DOT__west_inputs = vlSelfRef.processor__DOT__west_delay_register__DOT__data_o;
+    vlSelfRef.processor__DOT__north_inputs = vlSelfRef.processor__DOT__north_delay_register__DOT__data_o;
+    vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[0U] 
+        = ((IData)(vlSelfRef.processor__DOT__last_delay_register__DOT__read_input) 
+           & vlSelfRef.processor__DOT__last_delay_register__DOT__data_i[0U]);
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__west_inputs[0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__west_inputs[1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__west_inputs[2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__west_inputs[3U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__north_inputs[0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__north_inputs[1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__north_inputs[2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__north_inputs[3U];
+    vlSelfRef.processor__DOT__west_lasts[3U] = vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[3U];
+    vlSelfRef.processor__DOT__west_lasts[2U] = vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[2U];
+    vlSelfRef.processor__DOT__west_lasts[1U] = vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[1U];
+    vlSelfRef.processor__DOT__west_lasts[0U] = vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__west_lasts[0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__west_lasts[1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__west_lasts[2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__west_lasts[3U];
+}
+
+void Vtop___024root___eval_ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VicoTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+    }
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VicoExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__ico(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+    }
+#endif
+    __VicoExecute = Vtop___024root___trigger_anySet__ico(vlSelfRef.__VicoTriggered);
+    if (__VicoExecute) {
+        Vtop___024root___eval_ico(vlSelf);
+    }
+    return (__VicoExecute);
+}
+
+void Vtop___024root___eval_triggers_vec__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VactTriggered[0U] = (QData)((IData)(
+                                                    (((((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk) 
+                                                        & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0))) 
+                                                       << 0x00000014U) 
+                                                      | ((((((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk) 
+                                                             & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0))) 
+                                                            << 3U) 
+                                                           | (((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk) 
+                                                               & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0))) 
+                                                              << 2U)) 
+                                                          | ((((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk) 
+                                                               & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0))) 
+                                                              << 1U) 
+                                                             | ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0))))) 
+                                                         << 0x00000010U)) 
+                                                     | ((((((((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk) 
+                                                              & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0))) 
+                                                             << 3U) 
+                                                            | (((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0))) 
+                                                               << 2U)) 
+                                                           | ((((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0))) 
+                                                               << 1U) 
+                                                              | ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk) 
+                                                                 & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0))))) 
+                                                          << 0x0000000cU) 
+                                                         | ((((((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0))) 
+                                                               << 3U) 
+                                                              | (((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0))) 
+                                                                 << 2U)) 
+                                                             | ((((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0))) 
+                                                                 << 1U) 
+                                                                | ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0))))) 
+                                                            << 8U)) 
+                                                        | (((((((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0))) 
+                                                               << 3U) 
+                                                              | (((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0))) 
+                                                                 << 2U)) 
+                                                             | ((((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk) 
+                                                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0))) 
+                                                                 << 1U) 
+                                                                | ((IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__u_output_streaming_registers__DOT__clk__0))))) 
+                                                            << 4U) 
+                                                           | (((((IData)(vlSelfRef.processor__DOT__last_delay_register__DOT__clk) 
+                                                                 & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__last_delay_register__DOT__clk__0))) 
+                                                                << 3U) 
+                                                               | (((IData)(vlSelfRef.processor__DOT__north_delay_register__DOT__clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__north_delay_register__DOT__clk__0))) 
+                                                                  << 2U)) 
+                                                              | ((((IData)(vlSelfRef.processor__DOT__west_delay_register__DOT__clk) 
+                                                                   & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__west_delay_register__DOT__clk__0))) 
+                                                                  << 1U) 
+                                                                 | ((IData)(vlSelfRef.processor__DOT__clk) 
+                                                                    & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__clk__0))))))))));
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__clk__0 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__west_delay_register__DOT__clk__0 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__north_delay_register__DOT__clk__0 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__last_delay_register__DOT__clk__0 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__u_output_streaming_registers__DOT__clk__0 
+        = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk;
+}
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___nba_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*2:0*/ __Vdly__processor__DOT__u_output_streaming_registers__DOT__counter;
+    __Vdly__processor__DOT__u_output_streaming_registers__DOT__counter = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v0;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v0 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v1;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v1 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v1;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v1 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v2;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v2 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v2;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v2 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v3;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v3 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v4;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v4 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v4;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v4 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v5;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v5 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v5;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v5 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v6;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v6 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v7;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v7 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v7;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v7 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v8;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v8 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v8;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v8 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v9;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v9 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v10;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v10 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v10;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v10 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v11;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v11 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v11;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v11 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v12;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v12 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v13;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v13 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v13;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v13 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v14;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v14 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v14;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v14 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v15;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v15 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v16;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v16 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v16;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v16 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v17;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v17 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v17;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v17 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v18;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v18 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v19;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v19 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v19;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v19 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v20;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v20 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v20;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v20 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v21;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v21 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v22;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v22 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v22;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v22 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v23;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v23 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v23;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v23 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v24;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v24 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v25;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v25 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v25;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v25 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v26;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v26 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v26;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v26 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v27;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v27 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v28;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v28 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v28;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v28 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v29;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v29 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v29;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v29 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v30;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v30 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v31;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v31 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v31;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v31 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v32;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v32 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v32;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v32 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v33;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v33 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v34;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v34 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v34;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v34 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v35;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v35 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v35;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v35 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v36;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v36 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v37;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v37 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v37;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v37 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v38;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v38 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v38;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v38 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v39;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v39 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v40;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v40 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v40;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v40 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v41;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v41 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v41;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v41 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v42;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v42 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v43;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v43 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v43;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v43 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v44;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v44 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v44;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v44 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v45;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v45 = 0;
+    IData/*18:0*/ __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v46;
+    __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v46 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v46;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v46 = 0;
+    CData/*0:0*/ __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v47;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v47 = 0;
+    // Body
+    __Vdly__processor__DOT__u_output_streaming_registers__DOT__counter 
+        = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__counter;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v45 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v46 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v47 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v0 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v1 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v2 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v3 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v4 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v5 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v6 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v7 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v8 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v9 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v10 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v11 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v12 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v13 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v14 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v15 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v16 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v17 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v18 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v19 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v20 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v21 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v22 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v23 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v24 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v25 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v26 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v27 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v28 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v29 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v30 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v31 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v32 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v33 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v34 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v35 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v36 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v37 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v38 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v39 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v40 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v41 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v42 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v43 = 0U;
+    __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v44 = 0U;
+    if (vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__reset) {
+        __Vdly__processor__DOT__u_output_streaming_registers__DOT__counter = 0U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v45 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v0 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v3 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v6 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v9 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v12 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v15 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v18 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v21 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v24 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v27 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v30 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v33 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v36 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v39 = 1U;
+        __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v42 = 1U;
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_by_row_register = 0U;
+    } else {
+        if (((IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__result_valid) 
+             & (~ (IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_valid)))) {
+            __Vdly__processor__DOT__u_output_streaming_registers__DOT__counter = 4U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v46 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[3U][3U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v46 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v1 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[0U][0U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v1 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v4 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[0U][1U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v4 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v7 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[0U][2U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v7 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v10 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[0U][3U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v10 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v13 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[1U][0U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v13 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v16 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[1U][1U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v16 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v19 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[1U][2U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v19 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v22 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[1U][3U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v22 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v25 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[2U][0U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v25 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v28 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[2U][1U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v28 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v31 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[2U][2U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v31 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v34 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[2U][3U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v34 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v37 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[3U][0U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v37 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v40 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[3U][1U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v40 = 1U;
+            __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v43 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data[3U][2U];
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v43 = 1U;
+        } else if (((IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_valid) 
+                    & (IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_ready))) {
+            __Vdly__processor__DOT__u_output_streaming_registers__DOT__counter 
+                = (7U & ((IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__counter) 
+                         - (IData)(1U)));
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v47 = 1U;
+            if (vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_by_row_wire) {
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v2 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][0U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v5 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][1U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v8 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][2U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v11 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][3U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v14 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][0U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v17 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][1U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v20 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][2U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v23 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][3U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v26 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][0U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v29 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][1U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v32 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][2U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v35 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][3U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v38 = 0U;
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v41 = 0U;
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v44 = 0U;
+            } else {
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v2 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][1U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v5 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][2U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v8 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][3U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v11 = 0U;
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v14 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][1U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v17 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][2U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v20 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][3U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v23 = 0U;
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v26 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][1U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v29 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][2U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v32 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][3U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v35 = 0U;
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v38 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][1U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v41 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][2U]);
+                __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v44 
+                    = (0x0007ffffU & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][3U]);
+            }
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v2 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v5 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v8 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v11 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v14 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v17 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v20 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v23 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v26 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v29 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v32 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v35 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v38 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v41 = 1U;
+            __VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v44 = 1U;
+        }
+        if ((((IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_valid) 
+              & (IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_ready)) 
+             & (4U == (IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__counter)))) {
+            vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_by_row_register 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_by_row;
+        }
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v0) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][0U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v1) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][0U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v1;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v2) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][0U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v2;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v3) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][1U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v4) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][1U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v4;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v5) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][1U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v5;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v6) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][2U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v7) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][2U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v7;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v8) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][2U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v8;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v9) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][3U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v10) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][3U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v10;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v11) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U][3U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v11;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v12) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][0U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v13) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][0U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v13;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v14) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][0U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v14;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v15) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][1U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v16) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][1U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v16;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v17) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][1U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v17;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v18) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][2U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v19) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][2U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v19;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v20) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][2U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v20;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v21) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][3U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v22) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][3U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v22;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v23) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[1U][3U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v23;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v24) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][0U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v25) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][0U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v25;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v26) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][0U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v26;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v27) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][1U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v28) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][1U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v28;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v29) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][1U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v29;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v30) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][2U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v31) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][2U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v31;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v32) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][2U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v32;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v33) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][3U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v34) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][3U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v34;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v35) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[2U][3U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v35;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v36) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][0U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v37) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][0U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v37;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v38) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][0U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v38;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v39) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][1U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v40) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][1U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v40;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v41) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][1U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v41;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v42) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][2U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v43) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][2U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v43;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v44) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][2U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v44;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v45) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][3U] = 0U;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v46) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][3U] 
+            = __VdlyVal__processor__DOT__u_output_streaming_registers__DOT__output_registers__v46;
+    }
+    if (__VdlySet__processor__DOT__u_output_streaming_registers__DOT__output_registers__v47) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[3U][3U] = 0U;
+    }
+    vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__counter 
+        = __Vdly__processor__DOT__u_output_streaming_registers__DOT__counter;
+    vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_by_row_wire 
+        = ((4U == (IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__counter))
+            ? (IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_by_row)
+            : (IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_by_row_register));
+    vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_valid 
+        = (0U != (IData)(vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__counter));
+    if (vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_by_row_wire) {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j = 0U;
+        while (VL_GTS_III(32, 4U, vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j)) {
+            vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_data[(3U 
+                                                                                & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j)] 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers[0U]
+                [(3U & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j)];
+            vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j 
+                = ((IData)(1U) + vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j);
+        }
+    } else {
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i = 0U;
+        while (VL_GTS_III(32, 4U, vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i)) {
+            vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_data[(3U 
+                                                                                & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i)] 
+                = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_registers
+                [(3U & vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i)][0U];
+            vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i 
+                = ((IData)(1U) + vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i);
+        }
+    }
+    vlSelfRef.processor__DOT__c_data_streaming = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_data;
+    vlSelfRef.c_data_streaming = vlSelfRef.processor__DOT__c_data_streaming;
+}
+
+void Vtop___024root___nba_sequent__TOP__1(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*3:0*/ __Vdly__processor__DOT__single_buffered__DOT__counter;
+    __Vdly__processor__DOT__single_buffered__DOT__counter = 0;
+    CData/*0:0*/ __Vdly__processor__DOT__single_buffered__DOT__input_done;
+    __Vdly__processor__DOT__single_buffered__DOT__input_done = 0;
+    // Body
+    __Vdly__processor__DOT__single_buffered__DOT__counter 
+        = vlSelfRef.processor__DOT__single_buffered__DOT__counter;
+    __Vdly__processor__DOT__single_buffered__DOT__input_done 
+        = vlSelfRef.processor__DOT__single_buffered__DOT__input_done;
+    if (((IData)(vlSelfRef.processor__DOT__reset) | 
+         ((IData)(vlSelfRef.processor__DOT__result_valid) 
+          & (~ (IData)(vlSelfRef.processor__DOT__output_valid))))) {
+        __Vdly__processor__DOT__single_buffered__DOT__counter = 8U;
+        __Vdly__processor__DOT__single_buffered__DOT__input_done = 0U;
+    } else if (vlSelfRef.processor__DOT__single_buffered__DOT__input_done) {
+        __Vdly__processor__DOT__single_buffered__DOT__counter 
+            = (0x0000000fU & ((IData)(vlSelfRef.processor__DOT__single_buffered__DOT__counter) 
+                              - (IData)(1U)));
+    } else if (((IData)(vlSelfRef.processor__DOT__head_last) 
+                & (IData)(vlSelfRef.processor__DOT__array_ready))) {
+        __Vdly__processor__DOT__single_buffered__DOT__counter 
+            = (0x0000000fU & ((IData)(vlSelfRef.processor__DOT__single_buffered__DOT__counter) 
+                              - (IData)(1U)));
+        __Vdly__processor__DOT__single_buffered__DOT__input_done = 1U;
+    }
+    vlSelfRef.processor__DOT__single_buffered__DOT__counter 
+        = __Vdly__processor__DOT__single_buffered__DOT__counter;
+    vlSelfRef.processor__DOT__single_buffered__DOT__input_done 
+        = __Vdly__processor__DOT__single_buffered__DOT__input_done;
+    vlSelfRef.processor__DOT__result_valid = (0U == (IData)(vlSelfRef.processor__DOT__single_buffered__DOT__counter));
+    vlSelfRef.processor__DOT__array_ready = ((~ (IData)(vlSelfRef.processor__DOT__single_buffered__DOT__input_done)) 
+                                             & ((IData)(vlSelfRef.processor__DOT__a_valid) 
+                                                & (IData)(vlSelfRef.processor__DOT__b_valid)));
+    vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__result_valid 
+        = vlSelfRef.processor__DOT__result_valid;
+    vlSelfRef.processor__DOT__input_ready = vlSelfRef.processor__DOT__array_ready;
+    vlSelfRef.processor__DOT__a_input_ready = vlSelfRef.processor__DOT__array_ready;
+    vlSelfRef.processor__DOT__b_input_ready = vlSelfRef.processor__DOT__array_ready;
+    vlSelfRef.processor__DOT__enable = ((~ (IData)(vlSelfRef.processor__DOT__result_valid)) 
+                                        & ((IData)(vlSelfRef.processor__DOT__array_ready) 
+                                           | (IData)(vlSelfRef.processor__DOT__single_buffered__DOT__input_done)));
+    vlSelfRef.input_ready = vlSelfRef.processor__DOT__input_ready;
+    vlSelfRef.a_input_ready = vlSelfRef.processor__DOT__a_input_ready;
+    vlSelfRef.b_input_ready = vlSelfRef.processor__DOT__b_input_ready;
+}
+
+void Vtop___024root___nba_sequent__TOP__2(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__2\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[0U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[0U][0U] = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[0U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[0U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[0U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__3(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__3\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[0U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[0U][1U] = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[0U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[0U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[0U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__4(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__4\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[0U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[0U][2U] = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[0U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[0U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[0U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__5(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__5\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[0U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[0U][3U] = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[0U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[0U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[0U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__6(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__6\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[1U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[1U][0U] = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[1U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[1U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[1U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__7(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__7\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[1U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[1U][1U] = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[1U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[1U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[1U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__8(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__8\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[1U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[1U][2U] = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[1U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[1U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[1U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__9(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__9\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[1U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[1U][3U] = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[1U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[1U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[1U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__10(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__10\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[2U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[2U][0U] = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[2U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[2U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[2U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__11(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__11\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[2U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[2U][1U] = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[2U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[2U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[2U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__12(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__12\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[2U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[2U][2U] = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[2U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[2U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[2U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__13(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__13\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[2U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[2U][3U] = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[2U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[2U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[2U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__14(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__14\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[3U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[3U][0U] = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[3U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[3U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[3U][0U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__15(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__15\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[3U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[3U][1U] = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[3U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[3U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[3U][1U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__16(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__16\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[3U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[3U][2U] = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[3U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[3U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[3U][2U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__17(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__17\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+    } else {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i;
+        }
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc;
+        }
+    }
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+    vlSelfRef.processor__DOT__result_finals[3U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc 
+        = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                          + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated 
+        = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset))) 
+           && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+    vlSelfRef.processor__DOT__c_data[3U][3U] = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+    vlSelfRef.processor__DOT__last_interconnect[3U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+    vlSelfRef.processor__DOT__vertical_interconnect[3U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+    vlSelfRef.processor__DOT__horizontal_interconnect[3U][3U] 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+}
+
+void Vtop___024root___nba_sequent__TOP__18(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__18\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0;
+    __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*0:0*/ __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0;
+    __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*0:0*/ __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1;
+    __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*0:0*/ __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1;
+    __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*0:0*/ __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v2;
+    __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v2 = 0;
+    CData/*0:0*/ __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v0;
+    __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*0:0*/ __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1;
+    __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*0:0*/ __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1;
+    __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*0:0*/ __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v2;
+    __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v2 = 0;
+    CData/*0:0*/ __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0;
+    __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*1:0*/ __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0;
+    __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*0:0*/ __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1;
+    __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*1:0*/ __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1;
+    __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*0:0*/ __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v2;
+    __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v2 = 0;
+    // Body
+    if (vlSelfRef.processor__DOT__last_delay_register__DOT__reset) {
+        vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j = 0U;
+        while (VL_GTS_III(32, 2U, vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j)) {
+            __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v0 
+                = (1U & vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j);
+            vlSelfRef.__VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i.enqueue(0U, (IData)(__VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v0));
+            vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j 
+                = ((IData)(1U) + vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j);
+        }
+    } else if (vlSelfRef.processor__DOT__last_delay_register__DOT__enable) {
+        vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j = 1U;
+        while (VL_LTS_III(32, 0U, vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j)) {
+            __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1 
+                = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i
+                [(1U & (vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j 
+                        - (IData)(1U)))];
+            __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1 
+                = (1U & vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j);
+            vlSelfRef.__VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1, (IData)(__VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1));
+            vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j 
+                = (vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j 
+                   - (IData)(1U));
+        }
+        __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v2 
+            = ((IData)(vlSelfRef.processor__DOT__last_delay_register__DOT__read_input) 
+               & vlSelfRef.processor__DOT__last_delay_register__DOT__data_i[2U]);
+        vlSelfRef.__VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v2, 0U);
+    }
+    if (vlSelfRef.processor__DOT__last_delay_register__DOT__reset) {
+        vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j = 0U;
+        while (VL_GTS_III(32, 1U, vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j)) {
+            vlSelfRef.processor__DOT__last_delay_register__DOT____Vlvbound_hfb724d0c__0 = 0U;
+            if (VL_LIKELY(((0U >= (1U & vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j))))) {
+                __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0 
+                    = vlSelfRef.processor__DOT__last_delay_register__DOT____Vlvbound_hfb724d0c__0;
+                __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0 
+                    = (1U & vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j);
+                vlSelfRef.__VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0, (IData)(__VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0));
+            }
+            vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j 
+                = ((IData)(1U) + vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j);
+        }
+    } else if (vlSelfRef.processor__DOT__last_delay_register__DOT__enable) {
+        vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j = 0U;
+        while (VL_LTS_III(32, 0U, vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j)) {
+            vlSelfRef.processor__DOT__last_delay_register__DOT____Vlvbound_h20b024af__0 
+                = ((0U >= (1U & (vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j 
+                                 - (IData)(1U)))) && vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i
+                   [(1U & (vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j 
+                           - (IData)(1U)))]);
+            if (VL_LIKELY(((0U >= (1U & vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j))))) {
+                __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1 
+                    = vlSelfRef.processor__DOT__last_delay_register__DOT____Vlvbound_h20b024af__0;
+                __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1 
+                    = (1U & vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j);
+                vlSelfRef.__VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1, (IData)(__VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1));
+            }
+            vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j 
+                = (vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j 
+                   - (IData)(1U));
+        }
+        __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v2 
+            = ((IData)(vlSelfRef.processor__DOT__last_delay_register__DOT__read_input) 
+               & vlSelfRef.processor__DOT__last_delay_register__DOT__data_i[1U]);
+        vlSelfRef.__VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v2, 0U);
+    }
+    if (vlSelfRef.processor__DOT__last_delay_register__DOT__reset) {
+        vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j = 0U;
+        while (VL_GTS_III(32, 3U, vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j)) {
+            vlSelfRef.processor__DOT__last_delay_register__DOT____Vlvbound_h8f55f58c__0 = 0U;
+            if (VL_LIKELY(((2U >= (3U & vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j))))) {
+                __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0 
+                    = vlSelfRef.processor__DOT__last_delay_register__DOT____Vlvbound_h8f55f58c__0;
+                __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0 
+                    = (3U & vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j);
+                vlSelfRef.__VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0, (IData)(__VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0));
+            }
+            vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j 
+                = ((IData)(1U) + vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j);
+        }
+    } else if (vlSelfRef.processor__DOT__last_delay_register__DOT__enable) {
+        vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j = 2U;
+        while (VL_LTS_III(32, 0U, vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j)) {
+            vlSelfRef.processor__DOT__last_delay_register__DOT____Vlvbound_hbadac7db__0 
+                = ((2U >= (3U & (vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j 
+                                 - (IData)(1U)))) && vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i
+                   [(3U & (vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j 
+                           - (IData)(1U)))]);
+            if (VL_LIKELY(((2U >= (3U & vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j))))) {
+                __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1 
+                    = vlSelfRef.processor__DOT__last_delay_register__DOT____Vlvbound_hbadac7db__0;
+                __VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1 
+                    = (3U & vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j);
+                vlSelfRef.__VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1, (IData)(__VdlyDim0__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1));
+            }
+            vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j 
+                = (vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j 
+                   - (IData)(1U));
+        }
+        __VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v2 
+            = ((IData)(vlSelfRef.processor__DOT__last_delay_register__DOT__read_input) 
+               & vlSelfRef.processor__DOT__last_delay_register__DOT__data_i[3U]);
+        vlSelfRef.__VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v2, 0U);
+    }
+    vlSelfRef.__VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i.commit(vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i);
+    vlSelfRef.__VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i.commit(vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i);
+    vlSelfRef.__VdlyCommitQueueprocessor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i.commit(vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i);
+    vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg[1U][1U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg[1U][0U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[2U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg[0U][0U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[1U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg[2U][2U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[2U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg[2U][1U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg[2U][0U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[3U] 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[2U];
+}
+
+void Vtop___024root___nba_sequent__TOP__19(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__19\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*7:0*/ __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0;
+    __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*0:0*/ __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0;
+    __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1;
+    __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*0:0*/ __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1;
+    __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v2;
+    __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v2 = 0;
+    CData/*0:0*/ __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v0;
+    __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1;
+    __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*0:0*/ __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1;
+    __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v2;
+    __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v2 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0;
+    __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*1:0*/ __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0;
+    __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1;
+    __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*1:0*/ __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1;
+    __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v2;
+    __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v2 = 0;
+    // Body
+    if (vlSelfRef.processor__DOT__west_delay_register__DOT__reset) {
+        vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j = 0U;
+        while (VL_GTS_III(32, 2U, vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j)) {
+            __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v0 
+                = (1U & vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j);
+            vlSelfRef.__VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i.enqueue(0U, (IData)(__VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v0));
+            vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j 
+                = ((IData)(1U) + vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j);
+        }
+    } else if (vlSelfRef.processor__DOT__west_delay_register__DOT__enable) {
+        vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j = 1U;
+        while (VL_LTS_III(32, 0U, vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j)) {
+            __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1 
+                = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i
+                [(1U & (vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j 
+                        - (IData)(1U)))];
+            __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1 
+                = (1U & vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j);
+            vlSelfRef.__VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1, (IData)(__VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1));
+            vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j 
+                = (vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j 
+                   - (IData)(1U));
+        }
+        __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v2 
+            = ((IData)(vlSelfRef.processor__DOT__west_delay_register__DOT__read_input)
+                ? vlSelfRef.processor__DOT__west_delay_register__DOT__data_i[2U]
+                : 0U);
+        vlSelfRef.__VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v2, 0U);
+    }
+    if (vlSelfRef.processor__DOT__west_delay_register__DOT__reset) {
+        vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j = 0U;
+        while (VL_GTS_III(32, 1U, vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j)) {
+            vlSelfRef.processor__DOT__west_delay_register__DOT____Vlvbound_h9629e2bb__0 = 0U;
+            if (VL_LIKELY(((0U >= (1U & vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j))))) {
+                __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0 
+                    = vlSelfRef.processor__DOT__west_delay_register__DOT____Vlvbound_h9629e2bb__0;
+                __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0 
+                    = (1U & vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j);
+                vlSelfRef.__VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0, (IData)(__VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0));
+            }
+            vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j 
+                = ((IData)(1U) + vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j);
+        }
+    } else if (vlSelfRef.processor__DOT__west_delay_register__DOT__enable) {
+        vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j = 0U;
+        while (VL_LTS_III(32, 0U, vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j)) {
+            vlSelfRef.processor__DOT__west_delay_register__DOT____Vlvbound_h556b5c52__0 
+                = ((0U >= (1U & (vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j 
+                                 - (IData)(1U)))) ? vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i
+                   [(1U & (vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j 
+                           - (IData)(1U)))] : 0U);
+            if (VL_LIKELY(((0U >= (1U & vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j))))) {
+                __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1 
+                    = vlSelfRef.processor__DOT__west_delay_register__DOT____Vlvbound_h556b5c52__0;
+                __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1 
+                    = (1U & vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j);
+                vlSelfRef.__VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1, (IData)(__VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1));
+            }
+            vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j 
+                = (vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j 
+                   - (IData)(1U));
+        }
+        __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v2 
+            = ((IData)(vlSelfRef.processor__DOT__west_delay_register__DOT__read_input)
+                ? vlSelfRef.processor__DOT__west_delay_register__DOT__data_i[1U]
+                : 0U);
+        vlSelfRef.__VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v2, 0U);
+    }
+    if (vlSelfRef.processor__DOT__west_delay_register__DOT__reset) {
+        vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j = 0U;
+        while (VL_GTS_III(32, 3U, vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j)) {
+            vlSelfRef.processor__DOT__west_delay_register__DOT____Vlvbound_hffe52cae__0 = 0U;
+            if (VL_LIKELY(((2U >= (3U & vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j))))) {
+                __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0 
+                    = vlSelfRef.processor__DOT__west_delay_register__DOT____Vlvbound_hffe52cae__0;
+                __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0 
+                    = (3U & vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j);
+                vlSelfRef.__VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0, (IData)(__VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0));
+            }
+            vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j 
+                = ((IData)(1U) + vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j);
+        }
+    } else if (vlSelfRef.processor__DOT__west_delay_register__DOT__enable) {
+        vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j = 2U;
+        while (VL_LTS_III(32, 0U, vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j)) {
+            vlSelfRef.processor__DOT__west_delay_register__DOT____Vlvbound_ha910025d__0 
+                = ((2U >= (3U & (vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j 
+                                 - (IData)(1U)))) ? vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i
+                   [(3U & (vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j 
+                           - (IData)(1U)))] : 0U);
+            if (VL_LIKELY(((2U >= (3U & vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j))))) {
+                __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1 
+                    = vlSelfRef.processor__DOT__west_delay_register__DOT____Vlvbound_ha910025d__0;
+                __VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1 
+                    = (3U & vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j);
+                vlSelfRef.__VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1, (IData)(__VdlyDim0__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1));
+            }
+            vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j 
+                = (vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j 
+                   - (IData)(1U));
+        }
+        __VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v2 
+            = ((IData)(vlSelfRef.processor__DOT__west_delay_register__DOT__read_input)
+                ? vlSelfRef.processor__DOT__west_delay_register__DOT__data_i[3U]
+                : 0U);
+        vlSelfRef.__VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v2, 0U);
+    }
+    vlSelfRef.__VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i.commit(vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i);
+    vlSelfRef.__VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i.commit(vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i);
+    vlSelfRef.__VdlyCommitQueueprocessor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i.commit(vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i);
+    vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg[1U][1U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg[1U][0U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__data_o[2U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg[0U][0U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__data_o[1U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg[2U][2U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[2U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg[2U][1U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg[2U][0U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__west_delay_register__DOT__data_o[3U] 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[2U];
+}
+
+void Vtop___024root___nba_sequent__TOP__20(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__20\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*7:0*/ __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0;
+    __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*0:0*/ __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0;
+    __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1;
+    __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*0:0*/ __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1;
+    __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v2;
+    __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v2 = 0;
+    CData/*0:0*/ __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v0;
+    __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1;
+    __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*0:0*/ __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1;
+    __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v2;
+    __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v2 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0;
+    __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*1:0*/ __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0;
+    __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1;
+    __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*1:0*/ __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1;
+    __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1 = 0;
+    CData/*7:0*/ __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v2;
+    __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v2 = 0;
+    // Body
+    if (vlSelfRef.processor__DOT__north_delay_register__DOT__reset) {
+        vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j = 0U;
+        while (VL_GTS_III(32, 2U, vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j)) {
+            __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v0 
+                = (1U & vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j);
+            vlSelfRef.__VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i.enqueue(0U, (IData)(__VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v0));
+            vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j 
+                = ((IData)(1U) + vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j);
+        }
+    } else if (vlSelfRef.processor__DOT__north_delay_register__DOT__enable) {
+        vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j = 1U;
+        while (VL_LTS_III(32, 0U, vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j)) {
+            __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1 
+                = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i
+                [(1U & (vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j 
+                        - (IData)(1U)))];
+            __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1 
+                = (1U & vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j);
+            vlSelfRef.__VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1, (IData)(__VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v1));
+            vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j 
+                = (vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j 
+                   - (IData)(1U));
+        }
+        __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v2 
+            = ((IData)(vlSelfRef.processor__DOT__north_delay_register__DOT__read_input)
+                ? vlSelfRef.processor__DOT__north_delay_register__DOT__data_i[2U]
+                : 0U);
+        vlSelfRef.__VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i__v2, 0U);
+    }
+    if (vlSelfRef.processor__DOT__north_delay_register__DOT__reset) {
+        vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j = 0U;
+        while (VL_GTS_III(32, 1U, vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j)) {
+            vlSelfRef.processor__DOT__north_delay_register__DOT____Vlvbound_h9629e2bb__0 = 0U;
+            if (VL_LIKELY(((0U >= (1U & vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j))))) {
+                __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0 
+                    = vlSelfRef.processor__DOT__north_delay_register__DOT____Vlvbound_h9629e2bb__0;
+                __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0 
+                    = (1U & vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j);
+                vlSelfRef.__VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0, (IData)(__VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v0));
+            }
+            vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j 
+                = ((IData)(1U) + vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j);
+        }
+    } else if (vlSelfRef.processor__DOT__north_delay_register__DOT__enable) {
+        vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j = 0U;
+        while (VL_LTS_III(32, 0U, vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j)) {
+            vlSelfRef.processor__DOT__north_delay_register__DOT____Vlvbound_h556b5c52__0 
+                = ((0U >= (1U & (vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j 
+                                 - (IData)(1U)))) ? vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i
+                   [(1U & (vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j 
+                           - (IData)(1U)))] : 0U);
+            if (VL_LIKELY(((0U >= (1U & vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j))))) {
+                __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1 
+                    = vlSelfRef.processor__DOT__north_delay_register__DOT____Vlvbound_h556b5c52__0;
+                __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1 
+                    = (1U & vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j);
+                vlSelfRef.__VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1, (IData)(__VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v1));
+            }
+            vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j 
+                = (vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j 
+                   - (IData)(1U));
+        }
+        __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v2 
+            = ((IData)(vlSelfRef.processor__DOT__north_delay_register__DOT__read_input)
+                ? vlSelfRef.processor__DOT__north_delay_register__DOT__data_i[1U]
+                : 0U);
+        vlSelfRef.__VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i__v2, 0U);
+    }
+    if (vlSelfRef.processor__DOT__north_delay_register__DOT__reset) {
+        vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j = 0U;
+        while (VL_GTS_III(32, 3U, vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j)) {
+            vlSelfRef.processor__DOT__north_delay_register__DOT____Vlvbound_hffe52cae__0 = 0U;
+            if (VL_LIKELY(((2U >= (3U & vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j))))) {
+                __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0 
+                    = vlSelfRef.processor__DOT__north_delay_register__DOT____Vlvbound_hffe52cae__0;
+                __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0 
+                    = (3U & vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j);
+                vlSelfRef.__VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0, (IData)(__VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v0));
+            }
+            vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j 
+                = ((IData)(1U) + vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j);
+        }
+    } else if (vlSelfRef.processor__DOT__north_delay_register__DOT__enable) {
+        vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j = 2U;
+        while (VL_LTS_III(32, 0U, vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j)) {
+            vlSelfRef.processor__DOT__north_delay_register__DOT____Vlvbound_ha910025d__0 
+                = ((2U >= (3U & (vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j 
+                                 - (IData)(1U)))) ? vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i
+                   [(3U & (vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j 
+                           - (IData)(1U)))] : 0U);
+            if (VL_LIKELY(((2U >= (3U & vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j))))) {
+                __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1 
+                    = vlSelfRef.processor__DOT__north_delay_register__DOT____Vlvbound_ha910025d__0;
+                __VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1 
+                    = (3U & vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j);
+                vlSelfRef.__VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1, (IData)(__VdlyDim0__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v1));
+            }
+            vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j 
+                = (vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j 
+                   - (IData)(1U));
+        }
+        __VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v2 
+            = ((IData)(vlSelfRef.processor__DOT__north_delay_register__DOT__read_input)
+                ? vlSelfRef.processor__DOT__north_delay_register__DOT__data_i[3U]
+                : 0U);
+        vlSelfRef.__VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i.enqueue(__VdlyVal__processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i__v2, 0U);
+    }
+    vlSelfRef.__VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i.commit(vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i);
+    vlSelfRef.__VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i.commit(vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i);
+    vlSelfRef.__VdlyCommitQueueprocessor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i.commit(vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i);
+    vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg[1U][1U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg[1U][0U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__data_o[2U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg[0U][0U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__data_o[1U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg[2U][2U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[2U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg[2U][1U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[1U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg[2U][0U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[0U];
+    vlSelfRef.processor__DOT__north_delay_register__DOT__data_o[3U] 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[2U];
+}
+
+void Vtop___024root___nba_sequent__TOP__21(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__21\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.processor__DOT__output_valid = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_valid;
+    vlSelfRef.output_valid = vlSelfRef.processor__DOT__output_valid;
+}
+
+void Vtop___024root___nba_sequent__TOP__22(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__22\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__last_delay_register__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__last_delay_register__DOT__read_input 
+        = vlSelfRef.processor__DOT__array_ready;
+    vlSelfRef.processor__DOT__west_delay_register__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__west_delay_register__DOT__read_input 
+        = vlSelfRef.processor__DOT__array_ready;
+    vlSelfRef.processor__DOT__north_delay_register__DOT__enable 
+        = vlSelfRef.processor__DOT__enable;
+    vlSelfRef.processor__DOT__north_delay_register__DOT__read_input 
+        = vlSelfRef.processor__DOT__array_ready;
+    vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[0U] 
+        = ((IData)(vlSelfRef.processor__DOT__last_delay_register__DOT__read_input) 
+           & vlSelfRef.processor__DOT__last_delay_register__DOT__data_i[0U]);
+    vlSelfRef.processor__DOT__west_delay_register__DOT__data_o[0U] 
+        = (vlSelfRef.processor__DOT__west_delay_register__DOT__data_i[0U] 
+           & (- (IData)((IData)(vlSelfRef.processor__DOT__west_delay_register__DOT__read_input))));
+    vlSelfRef.processor__DOT__north_delay_register__DOT__data_o[0U] 
+        = (vlSelfRef.processor__DOT__north_delay_register__DOT__data_i[0U] 
+           & (- (IData)((IData)(vlSelfRef.processor__DOT__north_delay_register__DOT__read_input))));
+}
+
+void Vtop___024root___nba_comb__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.processor__DOT__bank_final = vlSelfRef.processor__DOT__result_finals[3U][3U];
+    vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__c_data 
+        = vlSelfRef.processor__DOT__c_data;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[0U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[0U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[0U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[1U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[1U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[1U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[2U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[2U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[2U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[3U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[3U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__last_interconnect[3U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[0U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[1U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[2U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[0U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[0U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[0U][3U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[1U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[1U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[1U][3U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[2U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[2U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__vertical_interconnect[2U][3U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[0U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[0U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[0U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[1U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[1U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[1U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[2U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[2U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[2U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[3U][0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[3U][1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__horizontal_interconnect[3U][2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i)));
+}
+
+void Vtop___024root___nba_comb__TOP__1(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.processor__DOT__array_reset = ((IData)(vlSelfRef.processor__DOT__reset) 
+                                             | ((~ (IData)(vlSelfRef.processor__DOT__output_valid)) 
+                                                & (IData)(vlSelfRef.processor__DOT__result_valid)));
+    vlSelfRef.processor__DOT__west_delay_register__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__north_delay_register__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__last_delay_register__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset 
+        = vlSelfRef.processor__DOT__array_reset;
+}
+
+void Vtop___024root___nba_comb__TOP__2(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__2\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.processor__DOT__west_lasts[3U] = vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[3U];
+    vlSelfRef.processor__DOT__west_lasts[2U] = vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[2U];
+    vlSelfRef.processor__DOT__west_lasts[1U] = vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[1U];
+    vlSelfRef.processor__DOT__west_lasts[0U] = vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__west_lasts[0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__west_lasts[1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__west_lasts[2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i 
+        = vlSelfRef.processor__DOT__west_lasts[3U];
+}
+
+void Vtop___024root___nba_comb__TOP__3(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__3\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.processor__DOT__west_inputs = vlSelfRef.processor__DOT__west_delay_register__DOT__data_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__west_inputs[0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__west_inputs[1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__west_inputs[2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i 
+        = vlSelfRef.processor__DOT__west_inputs[3U];
+}
+
+void Vtop___024root___nba_comb__TOP__4(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__4\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.processor__DOT__north_inputs = vlSelfRef.processor__DOT__north_delay_register__DOT__data_o;
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__north_inputs[0U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__north_inputs[1U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__north_inputs[2U];
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i 
+        = vlSelfRef.processor__DOT__north_inputs[3U];
+}
+
+void Vtop___024root___nba_comb__TOP__5(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__5\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i)));
+}
+
+void Vtop___024root___nba_comb__TOP__6(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__6\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i)));
+}
+
+void Vtop___024root___nba_comb__TOP__7(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__7\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i)));
+    vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc 
+        = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i) 
+                          * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i)));
+}
+
+void Vtop___024root___eval_nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*3:0*/ __Vinline__nba_sequent__TOP__1___Vdly__processor__DOT__single_buffered__DOT__counter;
+    __Vinline__nba_sequent__TOP__1___Vdly__processor__DOT__single_buffered__DOT__counter = 0;
+    CData/*0:0*/ __Vinline__nba_sequent__TOP__1___Vdly__processor__DOT__single_buffered__DOT__input_done;
+    __Vinline__nba_sequent__TOP__1___Vdly__processor__DOT__single_buffered__DOT__input_done = 0;
+    // Body
+    if ((0x0000000000000010ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_sequent__TOP__0(vlSelf);
+    }
+    if ((1ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        __Vinline__nba_sequent__TOP__1___Vdly__processor__DOT__single_buffered__DOT__counter 
+            = vlSelfRef.processor__DOT__single_buffered__DOT__counter;
+        __Vinline__nba_sequent__TOP__1___Vdly__processor__DOT__single_buffered__DOT__input_done 
+            = vlSelfRef.processor__DOT__single_buffered__DOT__input_done;
+        if (((IData)(vlSelfRef.processor__DOT__reset) 
+             | ((IData)(vlSelfRef.processor__DOT__result_valid) 
+                & (~ (IData)(vlSelfRef.processor__DOT__output_valid))))) {
+            __Vinline__nba_sequent__TOP__1___Vdly__processor__DOT__single_buffered__DOT__counter = 8U;
+            __Vinline__nba_sequent__TOP__1___Vdly__processor__DOT__single_buffered__DOT__input_done = 0U;
+        } else if (vlSelfRef.processor__DOT__single_buffered__DOT__input_done) {
+            __Vinline__nba_sequent__TOP__1___Vdly__processor__DOT__single_buffered__DOT__counter 
+                = (0x0000000fU & ((IData)(vlSelfRef.processor__DOT__single_buffered__DOT__counter) 
+                                  - (IData)(1U)));
+        } else if (((IData)(vlSelfRef.processor__DOT__head_last) 
+                    & (IData)(vlSelfRef.processor__DOT__array_ready))) {
+            __Vinline__nba_sequent__TOP__1___Vdly__processor__DOT__single_buffered__DOT__counter 
+                = (0x0000000fU & ((IData)(vlSelfRef.processor__DOT__single_buffered__DOT__counter) 
+                                  - (IData)(1U)));
+            __Vinline__nba_sequent__TOP__1___Vdly__processor__DOT__single_buffered__DOT__input_done = 1U;
+        }
+        vlSelfRef.processor__DOT__single_buffered__DOT__counter 
+            = __Vinline__nba_sequent__TOP__1___Vdly__processor__DOT__single_buffered__DOT__counter;
+        vlSelfRef.processor__DOT__single_buffered__DOT__input_done 
+            = __Vinline__nba_sequent__TOP__1___Vdly__processor__DOT__single_buffered__DOT__input_done;
+        vlSelfRef.processor__DOT__result_valid = (0U 
+                                                  == (IData)(vlSelfRef.processor__DOT__single_buffered__DOT__counter));
+        vlSelfRef.processor__DOT__array_ready = ((~ (IData)(vlSelfRef.processor__DOT__single_buffered__DOT__input_done)) 
+                                                 & ((IData)(vlSelfRef.processor__DOT__a_valid) 
+                                                    & (IData)(vlSelfRef.processor__DOT__b_valid)));
+        vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__result_valid 
+            = vlSelfRef.processor__DOT__result_valid;
+        vlSelfRef.processor__DOT__input_ready = vlSelfRef.processor__DOT__array_ready;
+        vlSelfRef.processor__DOT__a_input_ready = vlSelfRef.processor__DOT__array_ready;
+        vlSelfRef.processor__DOT__b_input_ready = vlSelfRef.processor__DOT__array_ready;
+        vlSelfRef.processor__DOT__enable = ((~ (IData)(vlSelfRef.processor__DOT__result_valid)) 
+                                            & ((IData)(vlSelfRef.processor__DOT__array_ready) 
+                                               | (IData)(vlSelfRef.processor__DOT__single_buffered__DOT__input_done)));
+        vlSelfRef.input_ready = vlSelfRef.processor__DOT__input_ready;
+        vlSelfRef.a_input_ready = vlSelfRef.processor__DOT__a_input_ready;
+        vlSelfRef.b_input_ready = vlSelfRef.processor__DOT__b_input_ready;
+    }
+    if ((0x0000000000000020ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[0U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[0U][0U] = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[0U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[0U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[0U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000000040ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[0U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[0U][1U] = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[0U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[0U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[0U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000000080ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[0U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[0U][2U] = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[0U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[0U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[0U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000000100ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[0U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[0U][3U] = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[0U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[0U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[0U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000000200ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[1U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[1U][0U] = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[1U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[1U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[1U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000000400ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[1U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[1U][1U] = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[1U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[1U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[1U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000000800ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[1U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[1U][2U] = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[1U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[1U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[1U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000001000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[1U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[1U][3U] = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[1U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[1U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[1U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000002000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[2U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[2U][0U] = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[2U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[2U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[2U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000004000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[2U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[2U][1U] = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[2U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[2U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[2U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000008000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[2U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[2U][2U] = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[2U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[2U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[2U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000010000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[2U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[2U][3U] = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[2U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[2U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[2U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000020000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[3U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[3U][0U] = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[3U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[3U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[3U][0U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000040000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[3U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[3U][1U] = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[3U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[3U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[3U][1U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000080000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[3U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[3U][2U] = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[3U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[3U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[3U][2U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((0x0000000000100000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset) {
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg = 0U;
+            vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg = 0U;
+        } else {
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i;
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i;
+            }
+            if (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated) {
+                vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                    = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc;
+            }
+        }
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o = 0U;
+        vlSelfRef.processor__DOT__result_finals[3U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc 
+            = (0x0007ffffU & (vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg 
+                              + (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated 
+            = ((1U & (~ (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset))) 
+               && (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg;
+        vlSelfRef.processor__DOT__c_data[3U][3U] = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o;
+        vlSelfRef.processor__DOT__last_interconnect[3U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o;
+        vlSelfRef.processor__DOT__vertical_interconnect[3U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o;
+        vlSelfRef.processor__DOT__horizontal_interconnect[3U][3U] 
+            = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o;
+    }
+    if ((8ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_sequent__TOP__18(vlSelf);
+    }
+    if ((2ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_sequent__TOP__19(vlSelf);
+    }
+    if ((4ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_sequent__TOP__20(vlSelf);
+    }
+    if ((0x0000000000000010ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.processor__DOT__output_valid = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__output_valid;
+        vlSelfRef.output_valid = vlSelfRef.processor__DOT__output_valid;
+    }
+    if ((1ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__last_delay_register__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__last_delay_register__DOT__read_input 
+            = vlSelfRef.processor__DOT__array_ready;
+        vlSelfRef.processor__DOT__west_delay_register__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__west_delay_register__DOT__read_input 
+            = vlSelfRef.processor__DOT__array_ready;
+        vlSelfRef.processor__DOT__north_delay_register__DOT__enable 
+            = vlSelfRef.processor__DOT__enable;
+        vlSelfRef.processor__DOT__north_delay_register__DOT__read_input 
+            = vlSelfRef.processor__DOT__array_ready;
+        vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[0U] 
+            = ((IData)(vlSelfRef.processor__DOT__last_delay_register__DOT__read_input) 
+               & vlSelfRef.processor__DOT__last_delay_register__DOT__data_i[0U]);
+        vlSelfRef.processor__DOT__west_delay_register__DOT__data_o[0U] 
+            = (vlSelfRef.processor__DOT__west_delay_register__DOT__data_i[0U] 
+               & (- (IData)((IData)(vlSelfRef.processor__DOT__west_delay_register__DOT__read_input))));
+        vlSelfRef.processor__DOT__north_delay_register__DOT__data_o[0U] 
+            = (vlSelfRef.processor__DOT__north_delay_register__DOT__data_i[0U] 
+               & (- (IData)((IData)(vlSelfRef.processor__DOT__north_delay_register__DOT__read_input))));
+    }
+    if ((0x00000000001fffe0ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_comb__TOP__0(vlSelf);
+    }
+    if ((0x0000000000000011ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.processor__DOT__array_reset = ((IData)(vlSelfRef.processor__DOT__reset) 
+                                                 | ((~ (IData)(vlSelfRef.processor__DOT__output_valid)) 
+                                                    & (IData)(vlSelfRef.processor__DOT__result_valid)));
+        vlSelfRef.processor__DOT__west_delay_register__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__north_delay_register__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__last_delay_register__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset 
+            = vlSelfRef.processor__DOT__array_reset;
+    }
+    if ((9ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.processor__DOT__west_lasts[3U] = vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[3U];
+        vlSelfRef.processor__DOT__west_lasts[2U] = vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[2U];
+        vlSelfRef.processor__DOT__west_lasts[1U] = vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[1U];
+        vlSelfRef.processor__DOT__west_lasts[0U] = vlSelfRef.processor__DOT__last_delay_register__DOT__data_o[0U];
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i 
+            = vlSelfRef.processor__DOT__west_lasts[0U];
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i 
+            = vlSelfRef.processor__DOT__west_lasts[1U];
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i 
+            = vlSelfRef.processor__DOT__west_lasts[2U];
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i 
+            = vlSelfRef.processor__DOT__west_lasts[3U];
+    }
+    if ((3ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.processor__DOT__west_inputs = vlSelfRef.processor__DOT__west_delay_register__DOT__data_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i 
+            = vlSelfRef.processor__DOT__west_inputs[0U];
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i 
+            = vlSelfRef.processor__DOT__west_inputs[1U];
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i 
+            = vlSelfRef.processor__DOT__west_inputs[2U];
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i 
+            = vlSelfRef.processor__DOT__west_inputs[3U];
+    }
+    if ((5ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.processor__DOT__north_inputs = vlSelfRef.processor__DOT__north_delay_register__DOT__data_o;
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i 
+            = vlSelfRef.processor__DOT__north_inputs[0U];
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i 
+            = vlSelfRef.processor__DOT__north_inputs[1U];
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i 
+            = vlSelfRef.processor__DOT__north_inputs[2U];
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i 
+            = vlSelfRef.processor__DOT__north_inputs[3U];
+    }
+    if ((0x00000000001fffe3ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc 
+            = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i) 
+                              * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc 
+            = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i) 
+                              * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc 
+            = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i) 
+                              * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i)));
+    }
+    if ((7ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc 
+            = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i) 
+                              * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i)));
+    }
+    if ((0x00000000001fffe5ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc 
+            = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i) 
+                              * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc 
+            = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i) 
+                              * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i)));
+        vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc 
+            = (0x0000ffffU & ((IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i) 
+                              * (IData)(vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i)));
+    }
+}
+
+void Vtop___024root___trigger_orInto__act_vec_vec(VlUnpacked<QData/*63:0*/, 1> &out, const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_orInto__act_vec_vec\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = (out[n] | in[n]);
+        n = ((IData)(1U) + n);
+    } while ((0U >= n));
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    Vtop___024root___eval_triggers_vec__act(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__act(vlSelfRef.__VactTriggered, "act"s);
+    }
+#endif
+    Vtop___024root___trigger_orInto__act_vec_vec(vlSelfRef.__VnbaTriggered, vlSelfRef.__VactTriggered);
+    return (0U);
+}
+
+void Vtop___024root___trigger_clear__act(VlUnpacked<QData/*63:0*/, 1> &out) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_clear__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = 0ULL;
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+}
+
+bool Vtop___024root___eval_phase__nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VnbaExecute;
+    // Body
+    __VnbaExecute = Vtop___024root___trigger_anySet__act(vlSelfRef.__VnbaTriggered);
+    if (__VnbaExecute) {
+        Vtop___024root___eval_nba(vlSelf);
+        Vtop___024root___trigger_clear__act(vlSelfRef.__VnbaTriggered);
+    }
+    return (__VnbaExecute);
+}
+
+void Vtop___024root___eval(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VicoIterCount;
+    IData/*31:0*/ __VnbaIterCount;
+    // Body
+    __VicoIterCount = 0U;
+    vlSelfRef.__VicoFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VicoIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+#endif
+            VL_FATAL_MT("/root/package/sum_stationary_integration/test_processor/../hdl/processor.sv", 1, "", "DIDNOTCONVERGE: Input combinational region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VicoIterCount = ((IData)(1U) + __VicoIterCount);
+        vlSelfRef.__VicoPhaseResult = Vtop___024root___eval_phase__ico(vlSelf);
+        vlSelfRef.__VicoFirstIteration = 0U;
+    } while (vlSelfRef.__VicoPhaseResult);
+    __VnbaIterCount = 0U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VnbaIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__act(vlSelfRef.__VnbaTriggered, "nba"s);
+#endif
+            VL_FATAL_MT("/root/package/sum_stationary_integration/test_processor/../hdl/processor.sv", 1, "", "DIDNOTCONVERGE: NBA region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VnbaIterCount = ((IData)(1U) + __VnbaIterCount);
+        vlSelfRef.__VactIterCount = 0U;
+        do {
+            if (VL_UNLIKELY(((0x00002710U < vlSelfRef.__VactIterCount)))) {
+#ifdef VL_DEBUG
+                Vtop___024root___dump_triggers__act(vlSelfRef.__VactTriggered, "act"s);
+#endif
+                VL_FATAL_MT("/root/package/sum_stationary_integration/test_processor/../hdl/processor.sv", 1, "", "DIDNOTCONVERGE: Active region did not converge after '--converge-limit' of 10000 tries");
+            }
+            vlSelfRef.__VactIterCount = ((IData)(1U) 
+                                         + vlSelfRef.__VactIterCount);
+            vlSelfRef.__VactPhaseResult = Vtop___024root___eval_phase__act(vlSelf);
+        } while (vlSelfRef.__VactPhaseResult);
+        vlSelfRef.__VnbaPhaseResult = Vtop___024root___eval_phase__nba(vlSelf);
+    } while (vlSelfRef.__VnbaPhaseResult);
+}
+
+#ifdef VL_DEBUG
+void Vtop___024root___eval_debug_assertions(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_debug_assertions\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (VL_UNLIKELY(((vlSelfRef.clk & 0xfeU)))) {
+        Verilated::overWidthError("clk");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.reset & 0xfeU)))) {
+        Verilated::overWidthError("reset");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.a_input_valid & 0xfeU)))) {
+        Verilated::overWidthError("a_input_valid");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.b_input_valid & 0xfeU)))) {
+        Verilated::overWidthError("b_input_valid");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.output_ready & 0xfeU)))) {
+        Verilated::overWidthError("output_ready");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.input_col_id & 0xf0U)))) {
+        Verilated::overWidthError("input_col_id");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.input_row_id & 0xf0U)))) {
+        Verilated::overWidthError("input_row_id");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.output_by_row & 0xfeU)))) {
+        Verilated::overWidthError("output_by_row");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.last & 0xfeU)))) {
+        Verilated::overWidthError("last");
+    }
+    if (VL_UNLIKELY(((vlSelfRef.final_chunk & 0xfeU)))) {
+        Verilated::overWidthError("final_chunk");
+    }
+}
+#endif  // VL_DEBUG
@@ -0,0 +1,861 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop___024root___eval_static(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__clk__0 
+        = vlSelfRef.processor__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__west_delay_register__DOT__clk__0 
+        = vlSelfRef.processor__DOT__west_delay_register__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__north_delay_register__DOT__clk__0 
+        = vlSelfRef.processor__DOT__north_delay_register__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__last_delay_register__DOT__clk__0 
+        = vlSelfRef.processor__DOT__last_delay_register__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__u_output_streaming_registers__DOT__clk__0 
+        = vlSelfRef.processor__DOT__u_output_streaming_registers__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0 
+        = vlSelfRef.processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk;
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_final(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_final\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_settle(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_settle\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VstlIterCount;
+    // Body
+    __VstlIterCount = 0U;
+    vlSelfRef.__VstlFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VstlIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+#endif
+            VL_FATAL_MT("/root/package/sum_stationary_integration/test_processor/../hdl/processor.sv", 1, "", "DIDNOTCONVERGE: Settle region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VstlIterCount = ((IData)(1U) + __VstlIterCount);
+        vlSelfRef.__VstlPhaseResult = Vtop___024root___eval_phase__stl(vlSelf);
+        vlSelfRef.__VstlFirstIteration = 0U;
+    } while (vlSelfRef.__VstlPhaseResult);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_triggers_vec__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VstlTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VstlTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VstlFirstIteration)));
+}
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__stl\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__stl(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'stl' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__stl\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VstlTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+    }
+}
+
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VstlExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__stl(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+    }
+#endif
+    __VstlExecute = Vtop___024root___trigger_anySet__stl(vlSelfRef.__VstlTriggered);
+    if (__VstlExecute) {
+        Vtop___024root___eval_stl(vlSelf);
+    }
+    return (__VstlExecute);
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__ico\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__ico(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'ico' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__act\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__act(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: @(posedge processor.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 1U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 1 is active: @(posedge processor.west_delay_register.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 2U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 2 is active: @(posedge processor.north_delay_register.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 3U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 3 is active: @(posedge processor.last_delay_register.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 4U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 4 is active: @(posedge processor.u_output_streaming_registers.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 5U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 5 is active: @(posedge processor.processing_units_row[0].processing_units_col[0].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 6U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 6 is active: @(posedge processor.processing_units_row[0].processing_units_col[1].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 7U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 7 is active: @(posedge processor.processing_units_row[0].processing_units_col[2].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 8U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 8 is active: @(posedge processor.processing_units_row[0].processing_units_col[3].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 9U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 9 is active: @(posedge processor.processing_units_row[1].processing_units_col[0].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000aU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 10 is active: @(posedge processor.processing_units_row[1].processing_units_col[1].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000bU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 11 is active: @(posedge processor.processing_units_row[1].processing_units_col[2].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000cU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 12 is active: @(posedge processor.processing_units_row[1].processing_units_col[3].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000dU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 13 is active: @(posedge processor.processing_units_row[2].processing_units_col[0].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000eU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 14 is active: @(posedge processor.processing_units_row[2].processing_units_col[1].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000fU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 15 is active: @(posedge processor.processing_units_row[2].processing_units_col[2].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000010U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 16 is active: @(posedge processor.processing_units_row[2].processing_units_col[3].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000011U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 17 is active: @(posedge processor.processing_units_row[3].processing_units_col[0].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000012U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 18 is active: @(posedge processor.processing_units_row[3].processing_units_col[1].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000013U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 19 is active: @(posedge processor.processing_units_row[3].processing_units_col[2].u_processing_unit.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x00000014U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 20 is active: @(posedge processor.processing_units_row[3].processing_units_col[3].u_processing_unit.clk)\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16707436170211756652ull);
+    vlSelf->reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9928399931838511862ull);
+    vlSelf->a_input_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7157637118708581973ull);
+    vlSelf->b_input_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16861223974637990601ull);
+    vlSelf->output_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15744654871367209719ull);
+    vlSelf->input_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5031374033172706937ull);
+    vlSelf->a_input_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3368592568602343292ull);
+    vlSelf->b_input_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3564984172529981193ull);
+    vlSelf->input_col_id = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 149863649541890936ull);
+    vlSelf->input_row_id = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 16230267342865455321ull);
+    vlSelf->output_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14078276386344907199ull);
+    vlSelf->output_by_row = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13255363841028203741ull);
+    vlSelf->last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2304216914404789790ull);
+    vlSelf->final_chunk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11246864333680020032ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->a_data[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13897448395925857588ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->b_data[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17962703699480683040ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->c_data_streaming[__Vi0] = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11804741157134696477ull);
+    }
+    vlSelf->processor__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12329724676771354909ull);
+    vlSelf->processor__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9585088872023954565ull);
+    vlSelf->processor__DOT__a_input_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4906602192102105673ull);
+    vlSelf->processor__DOT__b_input_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10246961942364254048ull);
+    vlSelf->processor__DOT__output_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14061820904688254083ull);
+    vlSelf->processor__DOT__input_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12213157354027487747ull);
+    vlSelf->processor__DOT__a_input_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4138117007391472273ull);
+    vlSelf->processor__DOT__b_input_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6943222202378603064ull);
+    vlSelf->processor__DOT__input_col_id = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 9970994491472008982ull);
+    vlSelf->processor__DOT__input_row_id = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 3390111722332624526ull);
+    vlSelf->processor__DOT__output_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5256542193465080673ull);
+    vlSelf->processor__DOT__output_by_row = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10090721607912393269ull);
+    vlSelf->processor__DOT__last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17352095047058824223ull);
+    vlSelf->processor__DOT__final_chunk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2652375347251356188ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__a_data[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11674743977825597877ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__b_data[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16158655464641537271ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__c_data_streaming[__Vi0] = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1426632644513495603ull);
+    }
+    vlSelf->processor__DOT__result_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17019340509704563641ull);
+    vlSelf->processor__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16701187525097748790ull);
+    vlSelf->processor__DOT__array_reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16228786798765751944ull);
+    vlSelf->processor__DOT__bank_final = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10866581729906120230ull);
+    vlSelf->processor__DOT__a_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7175575925495754181ull);
+    vlSelf->processor__DOT__b_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2140619512079206120ull);
+    vlSelf->processor__DOT__head_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15064847251517823976ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__a_head[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4010352969693390147ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__b_head[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2651514390878188253ull);
+    }
+    vlSelf->processor__DOT__array_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16182092589049265904ull);
+    vlSelf->processor__DOT__tile_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4667172049826642010ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__north_inputs[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2268884314287657138ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__west_inputs[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12450444521613545278ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__last_lanes[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11634460939472506483ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__west_lasts[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9522130715055265483ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT____Vcellinp__last_delay_register__data_i[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 5; ++__Vi0) {
+        for (int __Vi1 = 0; __Vi1 < 4; ++__Vi1) {
+            vlSelf->processor__DOT__horizontal_interconnect[__Vi0][__Vi1] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2512121045028902524ull);
+        }
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        for (int __Vi1 = 0; __Vi1 < 5; ++__Vi1) {
+            vlSelf->processor__DOT__vertical_interconnect[__Vi0][__Vi1] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 872946985329002538ull);
+        }
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        for (int __Vi1 = 0; __Vi1 < 4; ++__Vi1) {
+            vlSelf->processor__DOT__c_data[__Vi0][__Vi1] = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10753191074603325640ull);
+        }
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        for (int __Vi1 = 0; __Vi1 < 4; ++__Vi1) {
+            vlSelf->processor__DOT__last_interconnect[__Vi0][__Vi1] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13397293419857039207ull);
+        }
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        for (int __Vi1 = 0; __Vi1 < 4; ++__Vi1) {
+            vlSelf->processor__DOT__result_finals[__Vi0][__Vi1] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5232753743273311936ull);
+        }
+    }
+    vlSelf->processor__DOT__single_buffered__DOT__counter = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 4028581141324858843ull);
+    vlSelf->processor__DOT__single_buffered__DOT__input_done = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3054503031747299619ull);
+    vlSelf->processor__DOT__west_delay_register__DOT____Vlvbound_ha910025d__0 = 0;
+    vlSelf->processor__DOT__west_delay_register__DOT____Vlvbound_hffe52cae__0 = 0;
+    vlSelf->processor__DOT__west_delay_register__DOT____Vlvbound_h556b5c52__0 = 0;
+    vlSelf->processor__DOT__west_delay_register__DOT____Vlvbound_h9629e2bb__0 = 0;
+    vlSelf->processor__DOT__west_delay_register__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11491836063714178214ull);
+    vlSelf->processor__DOT__west_delay_register__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4038074769385162767ull);
+    vlSelf->processor__DOT__west_delay_register__DOT__read_input = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10497138444597776413ull);
+    vlSelf->processor__DOT__west_delay_register__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2827746054042688890ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__west_delay_register__DOT__data_i[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6169153903418951531ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__west_delay_register__DOT__data_o[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9203266143062442333ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 3; ++__Vi0) {
+        for (int __Vi1 = 0; __Vi1 < 3; ++__Vi1) {
+            vlSelf->processor__DOT__west_delay_register__DOT__shift_reg[__Vi0][__Vi1] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6624377634948328958ull);
+        }
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10978802631376534134ull);
+    }
+    vlSelf->processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j = 0;
+    vlSelf->processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j = 0;
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8340787822889229419ull);
+    }
+    vlSelf->processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j = 0;
+    vlSelf->processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j = 0;
+    for (int __Vi0 = 0; __Vi0 < 3; ++__Vi0) {
+        vlSelf->processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15083178895769121907ull);
+    }
+    vlSelf->processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j = 0;
+    vlSelf->processor__DOT__west_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j = 0;
+    vlSelf->processor__DOT__north_delay_register__DOT____Vlvbound_ha910025d__0 = 0;
+    vlSelf->processor__DOT__north_delay_register__DOT____Vlvbound_hffe52cae__0 = 0;
+    vlSelf->processor__DOT__north_delay_register__DOT____Vlvbound_h556b5c52__0 = 0;
+    vlSelf->processor__DOT__north_delay_register__DOT____Vlvbound_h9629e2bb__0 = 0;
+    vlSelf->processor__DOT__north_delay_register__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8942622492780402388ull);
+    vlSelf->processor__DOT__north_delay_register__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9199777239501087326ull);
+    vlSelf->processor__DOT__north_delay_register__DOT__read_input = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6132600294294770331ull);
+    vlSelf->processor__DOT__north_delay_register__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 410711117592219066ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__north_delay_register__DOT__data_i[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10810354583108231733ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__north_delay_register__DOT__data_o[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2844816132544876452ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 3; ++__Vi0) {
+        for (int __Vi1 = 0; __Vi1 < 3; ++__Vi1) {
+            vlSelf->processor__DOT__north_delay_register__DOT__shift_reg[__Vi0][__Vi1] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 518876197157353154ull);
+        }
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12729318800277364938ull);
+    }
+    vlSelf->processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j = 0;
+    vlSelf->processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j = 0;
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7190768848888461910ull);
+    }
+    vlSelf->processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j = 0;
+    vlSelf->processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j = 0;
+    for (int __Vi0 = 0; __Vi0 < 3; ++__Vi0) {
+        vlSelf->processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7243632661304948557ull);
+    }
+    vlSelf->processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j = 0;
+    vlSelf->processor__DOT__north_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j = 0;
+    vlSelf->processor__DOT__last_delay_register__DOT____Vlvbound_hbadac7db__0 = 0;
+    vlSelf->processor__DOT__last_delay_register__DOT____Vlvbound_h8f55f58c__0 = 0;
+    vlSelf->processor__DOT__last_delay_register__DOT____Vlvbound_h20b024af__0 = 0;
+    vlSelf->processor__DOT__last_delay_register__DOT____Vlvbound_hfb724d0c__0 = 0;
+    vlSelf->processor__DOT__last_delay_register__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6986891216344970051ull);
+    vlSelf->processor__DOT__last_delay_register__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17676175544005273540ull);
+    vlSelf->processor__DOT__last_delay_register__DOT__read_input = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10376005286830620372ull);
+    vlSelf->processor__DOT__last_delay_register__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16438855821052461775ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__last_delay_register__DOT__data_i[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13087206898706882608ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__last_delay_register__DOT__data_o[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11061900602413902606ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 3; ++__Vi0) {
+        for (int __Vi1 = 0; __Vi1 < 3; ++__Vi1) {
+            vlSelf->processor__DOT__last_delay_register__DOT__shift_reg[__Vi0][__Vi1] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4806491059133726176ull);
+        }
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__shift_reg_i[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3836049226092016591ull);
+    }
+    vlSelf->processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk1__DOT__j = 0;
+    vlSelf->processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__1__KET____DOT__unnamedblk2__DOT__j = 0;
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__shift_reg_i[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1794603487351843015ull);
+    }
+    vlSelf->processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk1__DOT__j = 0;
+    vlSelf->processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__2__KET____DOT__unnamedblk2__DOT__j = 0;
+    for (int __Vi0 = 0; __Vi0 < 3; ++__Vi0) {
+        vlSelf->processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__shift_reg_i[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9932994136910159596ull);
+    }
+    vlSelf->processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk1__DOT__j = 0;
+    vlSelf->processor__DOT__last_delay_register__DOT__shift_reg_gen__BRA__3__KET____DOT__unnamedblk2__DOT__j = 0;
+    vlSelf->processor__DOT__u_output_streaming_registers__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4780018788293395654ull);
+    vlSelf->processor__DOT__u_output_streaming_registers__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1509791361837260733ull);
+    vlSelf->processor__DOT__u_output_streaming_registers__DOT__result_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4406919904853713711ull);
+    vlSelf->processor__DOT__u_output_streaming_registers__DOT__output_by_row = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6457187448738213263ull);
+    vlSelf->processor__DOT__u_output_streaming_registers__DOT__output_ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1094181642155501095ull);
+    vlSelf->processor__DOT__u_output_streaming_registers__DOT__output_valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17691495835275689422ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        for (int __Vi1 = 0; __Vi1 < 4; ++__Vi1) {
+            vlSelf->processor__DOT__u_output_streaming_registers__DOT__c_data[__Vi0][__Vi1] = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5070747580055991247ull);
+        }
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->processor__DOT__u_output_streaming_registers__DOT__output_data[__Vi0] = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1514687642916993538ull);
+    }
+    vlSelf->processor__DOT__u_output_streaming_registers__DOT__counter = VL_SCOPED_RAND_RESET_I(3, __VscopeHash, 16862212271374934940ull);
+    vlSelf->processor__DOT__u_output_streaming_registers__DOT__output_by_row_register = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12508925717340856938ull);
+    vlSelf->processor__DOT__u_output_streaming_registers__DOT__output_by_row_wire = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7839925402842048060ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        for (int __Vi1 = 0; __Vi1 < 4; ++__Vi1) {
+            vlSelf->processor__DOT__u_output_streaming_registers__DOT__output_registers[__Vi0][__Vi1] = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5799001401597226771ull);
+        }
+    }
+    vlSelf->processor__DOT__u_output_streaming_registers__DOT__unnamedblk1__DOT__j = 0;
+    vlSelf->processor__DOT__u_output_streaming_registers__DOT__unnamedblk2__DOT__i = 0;
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4297076229772225581ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8650552932469290200ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1750168474264172835ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10388859381188522312ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9924673451942139082ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1385043045387791656ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13229523759362428781ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17523569250908650639ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12533114168783654076ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4201760054545646523ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9978804932063663686ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 7522036075994496024ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9058118485113725816ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 9306623341784533924ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 2159656772232751381ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8127910628947457958ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2366333920314192752ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6320204074530973965ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15482473301729348917ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10595954004317902126ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1546603495847640289ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12523145168304325136ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7038160587952374916ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7788612548209295776ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2835590071975256332ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7651330417984245082ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2122288650089563715ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5654950645759971832ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4978424477022558ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 18112325385681460325ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10442549129650901523ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11644390866753125738ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14193921079664697875ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1267085378741720672ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 15215616457899296814ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 7184671503917701158ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11190738217631344060ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2524227270987886306ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9338843756558537643ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5884326082013934971ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7111423673092093889ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7256925238703485068ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 653892945699676355ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4812254961351605791ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7248009290244016243ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 200447372354607741ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14610903856329405944ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11327765412928009263ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1536715960674244664ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6628775057837821827ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14079947284988259406ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1602641848951987484ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8206616190564665681ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15534670976717433786ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13345551800185276017ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 10842341348060037522ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 14360916462053506808ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3742122656130244656ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1957966049555851396ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6855452874646807876ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9001182471908851167ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 396685825006088690ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1991332622315923245ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10962074510506905180ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9118988854240439594ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 430958643110726235ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1412921054316638489ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15358238606189348435ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9880304396781842161ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12437212186632400392ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7378370553786248772ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17608200647687338118ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9476522604599646706ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5943017633549313088ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2127279183272571320ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14044239349307086052ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 7914089402495597105ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 11803803931544853012ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16000952107230130070ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 8011441991203331400ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6092851546966315167ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4037362673380167982ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4266450309978578938ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2776506248365492807ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3622962969466406301ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17850164619283604908ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2997140877018131742ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10649781202652335407ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5159364114883475921ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7571436433465207757ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5878227814371799775ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10359832096886348231ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5744562259040943706ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15136601339619491901ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5919589156846873241ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 15222227485016932336ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13744968909490958104ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 14199914405939091785ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 17113925791440046846ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2998193310801818533ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2353811793348765110ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9259447180186068943ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10942812910482574363ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9332814239769552213ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7745605125435807205ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10686421978622409655ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16939036960709129071ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13945913121717790656ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15016365923118315260ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8555443301435417592ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16129777807428235201ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9157396492966324652ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12204552775698986520ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15674153683753879493ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5599856477174265985ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10177850581711981780ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6153505054557976304ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10496605522237827492ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 10107513508888446509ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 8364772199595014330ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15817489515504893232ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1545173678500701690ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17048512653911168357ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12232680720710809429ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6337797104046779552ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2183001425547211359ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 66488602256023369ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 18273403930871427694ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16303179456556838143ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7054577975600427356ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8870960601804517826ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9475104895774501449ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4378350429796677474ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17196901559200287339ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9901441722543353916ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13180206578921739379ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11088292213959185347ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 5415628094722414517ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 1187383796819020174ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 6414779648136686789ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 18250917602920334885ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12424674206846865627ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11704937392242217818ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3023189115091640758ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17183729040181992206ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1215858970998686723ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10714718970217615151ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10633599324673069054ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5671763028889201764ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2559612785194514673ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4163266034067868099ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 18109865119517575073ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17499446610235743483ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16823659272312448520ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10318113964906816590ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7868152489215249987ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4138618533460315480ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10629899360977991854ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12999683383922098921ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 8589991981193166122ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 1701162527024848788ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 16228036521666033489ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3764532012666032281ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4129676228588327427ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7464744794212633942ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10730269586575621321ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12216968478737667879ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14457660986266661923ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8691217382686915583ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14977467074596175712ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16877253967926431284ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12812113781044037179ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12191399943797987450ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15787853834568525846ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2037854417394396729ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3809803810212704068ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11777428218837500448ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 8058452182051822635ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2756624961485634766ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12001769648704028301ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14250650516875560270ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 16806158714979824770ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 10461259734911747498ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16725767680247631953ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16138922332816816520ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11457071902710981561ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12560989736140774804ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7405378478100518754ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10921667505167796242ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 18296046827379592404ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6835893358180974456ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11763707267425041977ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7062705980018169999ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7750355280474187687ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15176129956805909067ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8102328293944021615ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4742051882391645571ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4507123259550837117ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9010881921487675399ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4359376596735253748ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 8772218694130924800ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 17484141635111009645ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 6194339055378666841ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 872829616249413257ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4030965799692247209ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12525118698035080891ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4589622515583019332ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10573829351223814240ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4513347150570409108ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7391258076685427932ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7441426752830270303ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17152065346364476310ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6468261613550809ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15777481302559593074ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 10978416257754864182ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6927107388084793367ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16967714982636769483ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1458158101465819134ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11100564819671052276ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 14069772898871022115ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5066888141179551688ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11473568489129632395ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2168013288179447075ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 6088370076029187319ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 13602452492885778283ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5873264201084504908ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4650457667653201048ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6541928913862076454ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 450900856742219830ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11107465294165987197ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1547525850223932651ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17532633483711072419ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17847468724199107113ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9113584821654643217ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8319815553575248470ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 8933821632864947762ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13119454095519048758ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4978894957179228181ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2087885743410265398ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12983448479964298651ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10132113157748142614ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11348421419990666976ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9135306744701543396ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6255390413018558857ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 14222557969790625635ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 7992620603853274245ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12542360390563407677ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4393372747382912977ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15270634762242880879ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9352312320520107556ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15345114732145016059ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11311327449987033374ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10625303490941459906ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5215176966861323085ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7781822234381534406ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 3023518916734979774ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4545202985718607366ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5761580510245224135ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7139250206583831179ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15084561894631592524ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5364081685288303731ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13234283791982571376ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6058936390908977753ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6336912029407804604ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 3201966977624847566ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 17845178307427487632ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 5482129884814900169ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2007190395591887519ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 2453955825380959334ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1456696308071703099ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9496173367557557577ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11437808101769873393ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7412472821254366641ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 18167646921756517786ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5239267813385456875ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 636491204208468855ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16152307211808899558ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9014239338607954299ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16073720537040513252ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16418618974690249842ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16340934648589814659ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17988400924383359789ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 16000763185835250240ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4989632804745473419ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9054814565283696442ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11340577025480964520ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 18184032520016602072ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 18379892765012111373ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17386459105000623666ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11313063701329388612ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2097127443821523190ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2314975328839876398ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 16100792241208972743ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8820893729481713658ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6804812768495781208ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14418898403150793384ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16538234166859055480ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2460529231690962263ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5087657483195448631ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2113702912726200525ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14019930798452765472ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14897267269134685386ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11185689264508228364ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 9800902046191653541ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10771343397835932016ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11436902311682329888ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 6007318052772854135ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 14685929197136717349ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 11771290405227355696ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14714661068065506909ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 11611118599269210444ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7930257164327960405ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7342836445691750070ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 12152309467203531217ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7972770487959146523ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16838728542125015398ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4278509519984101072ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3886244529485568763ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2879396612228073930ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13558595394687287979ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16196113150887068688ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__south_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 2339763319599681564ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5605030960049396720ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__east_last_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1073786827356180841ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_o = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 10757441731906006416ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_final_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17665923655773050800ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_calc = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 13661241222786234054ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_reg = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 12542266643768076023ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calc = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 17613525307830178429ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_reg = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 17116701598446801393ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_calculated = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13847903972356092369ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__result_shadow = VL_SCOPED_RAND_RESET_I(19, __VscopeHash, 4646214781591715286ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__product_last = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15441712301837113824ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__north_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7976267637840908225ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_i_reg = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17666294743663390359ull);
+    vlSelf->processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__west_last_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 870893914081735704ull);
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VstlTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VicoTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VactTriggered[__Vi0] = 0;
+    }
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__west_delay_register__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__north_delay_register__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__last_delay_register__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__u_output_streaming_registers__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__clk__0 = 0;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VnbaTriggered[__Vi0] = 0;
+    }
+}
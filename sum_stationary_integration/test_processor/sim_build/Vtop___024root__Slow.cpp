@@ -0,0 +1,127 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+// Parameter definitions for Vtop___024root
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__B_N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__PROCESSOR_ROWS_BITS;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__PROCESSOR_COLS_BITS;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__ROW_ID;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__COL_ID;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__INPUT_FIFO_DEPTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__K_SPLIT;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__COUNTER_BITS;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__west_delay_register__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__west_delay_register__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__north_delay_register__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__north_delay_register__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__last_delay_register__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__last_delay_register__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__u_output_streaming_registers__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__u_output_streaming_registers__DOT__C_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__0__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__1__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__2__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__0__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__1__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__2__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__N;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__MULTIPLY_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__ACCUM_DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop___024root::processor__DOT__processing_units_row__BRA__3__KET____DOT__processing_units_col__BRA__3__KET____DOT__u_processing_unit__DOT__DOUBLE_BUFFER;
+
+
+void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf);
+
+Vtop___024root::Vtop___024root(Vtop__Syms* symsp, const char* namep)
+ {
+    vlSymsp = symsp;
+    vlNamep = strdup(namep);
+    // Reset structure values
+    Vtop___024root___ctor_var_reset(this);
+}
+
+void Vtop___024root::__Vconfigure(bool first) {
+    (void)first;  // Prevent unused variable warning
+}
+
+Vtop___024root::~Vtop___024root() {
+    VL_DO_DANGLING(std::free(const_cast<char*>(vlNamep)), vlNamep);
+}
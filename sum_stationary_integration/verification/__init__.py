@@ -0,0 +1,21 @@
+"""
+Shared verification code for the sum_stationary_integration testbenches.
+
+The cocotb Makefiles add `sum_stationary_integration/` to PYTHONPATH, so benches import
+modules directly, e.g. `from verification.reference_model import matrix_multiplication`.
+
+    latency_insensitive_io  LIReader / LIWriter / InstructionWriter valid-ready drivers
+    layouts                 pack / unpack the A row block, B col block and C group memory layouts, CView over C
+    memory_model            ArrayMemory, flat NumPy memory with slice reads / writes and matrix load / dump
+    backdoor                load / dump simple_memory.sv through the simulator handles, no cycles spent
+    memory_simulator        MemoryReadController / MemoryWriteController for the top.sv memory ports
+    memory_timing           ideal and DRAM-like read timing of the fake memory (MEMORY_TIMING)
+    arbiters                round robin / fixed priority / weighted fair port arbiters (MEMORY_ARBITER)
+    tester                  MatrixMultiplierTester, writers + reader + scoreboard of one processor
+    instrumentation         ProcessorMonitor, per tile latency / interval / utilization / stall causes (INSTRUMENTATION_FILE)
+    stimulus                matrix generators (create_row, gen_matrices, generate_tiles) and StreamingStimulus
+    scoreboard              streaming output checker
+    signals                 simulator independent signal access
+    dataset_cache           on-disk (A, B, expected) datasets keyed by seed / shape / widths (STIMULUS_CACHE)
+    reference_model / performance_model / sweep / build_cache
+"""
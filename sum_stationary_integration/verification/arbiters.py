@@ -0,0 +1,189 @@
+"""
+Arbiters picking which port the fake memory serves in a cycle.
+
+    RoundRobinArbiter       work conserving round robin, idle ports are skipped
+    FixedPriorityArbiter    always the first asking port of a priority order (e.g. A buffers before B buffers)
+    WeightedFairArbiter     weighted fair queuing, a port with weight 2 gets twice the grants of a port with
+                            weight 1 when both keep asking
+
+Every cycle the controller calls observe() with the ports asking, pick() to get the winner and granted() once
+it served it (a timing model may still refuse the read, the port then keeps waiting). arbitrate() does all three.
+Each arbiter counts per port how long requests waited for their grant:
+
+    arbiter = arbiter_from_spec("wfq:4,1,1,1", num_ports=4)
+    ...
+    for port, stats in enumerate(arbiter.report()): print(port, stats)
+
+Benches pick one with the MEMORY_ARBITER environment variable (or `sweep.py --memory-arbiter`), see
+arbiter_from_spec().
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+
+@dataclass
+class PortStats:
+    """Grants of one port and the cycles its requests waited for them"""
+    grants: int = 0
+    total_wait: int = 0
+    max_wait: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(grants=self.grants, wait_mean=self.total_wait / self.grants if self.grants else None,
+                    wait_max=self.max_wait)
+
+
+class Arbiter:
+    """Base class, subclasses implement pick() and may update their state in _on_grant()"""
+
+    def __init__(self, num_ports: int):
+        if num_ports < 1:
+            raise ValueError("An arbiter needs at least one port")
+        self.num_ports = num_ports
+        self.stats = [PortStats() for _ in range(num_ports)]
+        self._waiting_since: List[Optional[int]] = [None] * num_ports
+
+    def observe(self, cycle: int, requests: Sequence[bool]) -> None:
+        """Ports asking this cycle, starts the wait clock of new requests"""
+        for port, request in enumerate(requests):
+            if not request:
+                self._waiting_since[port] = None
+            elif self._waiting_since[port] is None:
+                self._waiting_since[port] = cycle
+
+    def pick(self, requests: Sequence[bool]) -> Optional[int]:
+        """Winner among the asking ports, None if nobody asks. Does not change any state"""
+        raise NotImplementedError
+
+    def granted(self, port: int, cycle: int) -> None:
+        """port was served in cycle"""
+        since = self._waiting_since[port]
+        wait = 0 if since is None else cycle - since
+        stats = self.stats[port]
+        stats.grants += 1
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+        self._waiting_since[port] = None
+        self._on_grant(port)
+
+    def arbitrate(self, cycle: int, requests: Sequence[bool]) -> Optional[int]:
+        """observe(), pick() and granted() in one go"""
+        self.observe(cycle, requests)
+        port = self.pick(requests)
+        if port is not None:
+            self.granted(port, cycle)
+        return port
+
+    def report(self) -> List[Dict[str, Any]]:
+        return [stats.as_dict() for stats in self.stats]
+
+    def _on_grant(self, port: int) -> None:
+        pass
+
+
+class RoundRobinArbiter(Arbiter):
+    """First asking port after the last one granted"""
+
+    def __init__(self, num_ports: int):
+        super().__init__(num_ports)
+        self._next = 0
+
+    def pick(self, requests: Sequence[bool]) -> Optional[int]:
+        for offset in range(self.num_ports):
+            port = (self._next + offset) % self.num_ports
+            if requests[port]:
+                return port
+        return None
+
+    def _on_grant(self, port: int) -> None:
+        self._next = (port + 1) % self.num_ports
+
+
+class FixedPriorityArbiter(Arbiter):
+    """
+    First asking port in order
+
+    Args
+        order: ports from highest to lowest priority, port 0 first by default. Ports left out come last.
+    """
+
+    def __init__(self, num_ports: int, order: Optional[Sequence[int]] = None):
+        super().__init__(num_ports)
+        order = list(order or [])
+        if any(port < 0 or port >= num_ports for port in order) or len(set(order)) != len(order):
+            raise ValueError(f"Bad priority order {order} for {num_ports} ports")
+        self._order = order + [port for port in range(num_ports) if port not in order]
+
+    def pick(self, requests: Sequence[bool]) -> Optional[int]:
+        for port in self._order:
+            if requests[port]:
+                return port
+        return None
+
+
+class WeightedFairArbiter(Arbiter):
+    """
+    Weighted fair queuing: a request gets a finish tag 1 / weight after the later of the current virtual time
+    and the tag of the port's previous request, the asking port with the smallest tag wins. A port that was idle
+    restarts from the current virtual time, so it cannot save up grants.
+
+    Args
+        weights: positive weight of every port, all 1 by default (then it behaves like round robin)
+    """
+
+    def __init__(self, num_ports: int, weights: Optional[Sequence[float]] = None):
+        super().__init__(num_ports)
+        weights = list(weights) if weights is not None else [1] * num_ports
+        if len(weights) != num_ports or any(weight <= 0 for weight in weights):
+            raise ValueError(f"Need {num_ports} positive weights, got {weights}")
+        self._weights = weights
+        self._virtual_time = 0.0
+        self._last_finish = [0.0] * num_ports
+        # Finish tag of the request waiting on every port
+        self._tags: List[Optional[float]] = [None] * num_ports
+
+    def observe(self, cycle: int, requests: Sequence[bool]) -> None:
+        super().observe(cycle, requests)
+        for port, request in enumerate(requests):
+            if not request:
+                self._tags[port] = None
+            elif self._tags[port] is None:
+                self._tags[port] = self._new_tag(port)
+
+    def pick(self, requests: Sequence[bool]) -> Optional[int]:
+        asking = [port for port in range(self.num_ports) if requests[port]]
+        if not asking:
+            return None
+        # Ties go to the lowest port
+        return min(asking, key=lambda port: (self._tag(port), port))
+
+    def _new_tag(self, port: int) -> float:
+        return max(self._virtual_time, self._last_finish[port]) + 1 / self._weights[port]
+
+    def _tag(self, port: int) -> float:
+        tag = self._tags[port]
+        return self._new_tag(port) if tag is None else tag
+
+    def _on_grant(self, port: int) -> None:
+        finish = self._tag(port)
+        self._last_finish[port] = finish
+        # Virtual time follows the start tag of what is served
+        self._virtual_time = max(self._virtual_time, finish - 1 / self._weights[port])
+        self._tags[port] = None
+
+
+def arbiter_from_spec(spec: Optional[str], num_ports: int) -> Arbiter:
+    """
+    "" / "round_robin", "priority" or "priority:2,0,1" (order), "wfq" or "wfq:4,1,1,1" (weights)
+    """
+    spec = (spec or "").strip()
+    name, _, arguments = spec.partition(":")
+    values = [float(value) for value in arguments.split(",")] if arguments else None
+    if name in ("", "round_robin"):
+        return RoundRobinArbiter(num_ports)
+    if name == "priority":
+        return FixedPriorityArbiter(num_ports, [int(value) for value in values] if values else None)
+    if name == "wfq":
+        return WeightedFairArbiter(num_ports, values)
+    raise ValueError(f"Unknown arbiter {spec!r}, expected round_robin, priority[:order] or wfq[:weights]")
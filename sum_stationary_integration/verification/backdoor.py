@@ -0,0 +1,109 @@
+"""
+Backdoor access to the memories: load A / B and read C back without spending simulation cycles on it.
+
+simple_memory.sv only takes PARALLEL_DATA_STREAMING_SIZE words per cycle through write_valid / write_ready, so
+loading a 4096 x 4096 matrix through the port would take millions of cycles before the multiply even starts.
+SimpleMemoryBackdoor writes its memory_data array directly through the simulator handles instead, at time 0 or
+between tests, no clock needed:
+
+    backdoor = SimpleMemoryBackdoor(dut.memory_a)                 # the simple_memory instance
+    backdoor.load(a_address, pack_a(a, N))                        # layouts.py
+    ...
+    c = backdoor.dump(c_address, c_words(n, n, N, ROWS_PROCESSORS, COLS_PROCESSORS))
+
+The Python memory controllers have no HDL memory behind them, their backdoor is the ArrayMemory itself
+(MemoryReadController.preload() / dump(), or share one ArrayMemory between controllers).
+
+Writes use setimmediatevalue(), so they are visible right away and can be done before the clock starts. As
+for any write they are not allowed in a ReadOnly phase.
+"""
+
+from typing import Optional, Sequence, Union
+
+import numpy as np
+from cocotb.handle import SimHandleBase
+
+from verification.memory_model import ArrayMemory, word_dtype
+
+
+def preload_array(handle: SimHandleBase, address: int, words: Union[Sequence[int], np.ndarray],
+                  previous: Optional[np.ndarray] = None) -> int:
+    """
+    Write words into the unpacked array handle from element address (wrapping around like the memory)
+
+    previous: what the array holds now (same length as words), only the words that differ are written. Every
+    write is a simulator call, so e.g. loading into a zeroed memory with previous=zeros skips the zeros.
+
+    Returns how many elements were written.
+    """
+    words = np.asarray(words).reshape(-1)
+    size = len(handle)
+    indices = np.arange(words.size)
+    if previous is not None:
+        indices = np.flatnonzero(np.asarray(previous).reshape(-1) != words)
+    for index in indices.tolist():
+        handle[(address + index) % size].setimmediatevalue(int(words[index]))
+    return len(indices)
+
+
+def dump_array(handle: SimHandleBase, address: int, count: int, word_width: int, unresolved: int = 0) -> np.ndarray:
+    """count elements of the unpacked array handle from element address, x / z words read as unresolved"""
+    size = len(handle)
+    words = np.empty(count, dtype=word_dtype(word_width))
+    for index in range(count):
+        value = handle[(address + index) % size].value
+        words[index] = value.integer if value.is_resolvable else unresolved
+    return words
+
+
+class SimpleMemoryBackdoor:
+    """
+    Backdoor of one simple_memory instance, keeps a shadow ArrayMemory of what was written through it
+
+    Args
+        instance: handle of the simple_memory instance (its memory_data array is used)
+        word_width: DATA_WIDTH of the instance, read from it if None
+        shadow: starting content of memory_data, the initial values of simple_memory.sv (1..16 then 0) if None.
+            Writes that do not change a word are skipped, so only pass a shadow known to match the memory.
+    """
+
+    def __init__(self, instance: SimHandleBase, word_width: Optional[int] = None, shadow: Optional[ArrayMemory] = None):
+        self._memory_data = instance.memory_data
+        self.size = len(self._memory_data)
+        self.word_width = word_width if word_width is not None else int(instance.DATA_WIDTH.value)
+        if shadow is None:
+            shadow = ArrayMemory(self.size, self.word_width)
+            shadow.write(0, range(1, min(17, self.size + 1)))
+        self.shadow = shadow
+
+    def load(self, address: int, words: Union[Sequence[int], np.ndarray], force: bool = False) -> int:
+        """
+        Write words from address, returns how many words were written
+
+        Only the words differing from the shadow are written, unless force. If the design wrote into the range
+        since the last dump() / sync(), force (or sync() first).
+        """
+        count = len(np.asarray(words).reshape(-1))
+        previous = None if force else self.shadow.read(address, count)
+        self.shadow.write(address, words)
+        return preload_array(self._memory_data, address, self.shadow.read(address, count), previous=previous)
+
+    def load_matrix(self, address: int, matrix: Union[Sequence[Sequence[int]], np.ndarray], force: bool = False) -> int:
+        """Matrix flattened in row major order from address (pack it with layouts.py first for A / B)"""
+        return self.load(address, np.asarray(matrix).reshape(-1), force=force)
+
+    def load_memory(self, memory: ArrayMemory, address: int = 0, count: Optional[int] = None, force: bool = False) -> int:
+        """Copy count words (all of them if None) of an ArrayMemory into the same addresses"""
+        count = len(memory) - address if count is None else count
+        return self.load(address, memory.read(address, count), force=force)
+
+    def dump(self, address: int, count: int) -> np.ndarray:
+        """count words from address as the simulator sees them (e.g. C written through the write port)"""
+        words = dump_array(self._memory_data, address, count, self.word_width)
+        # Keep the shadow in sync with what the design wrote
+        self.shadow.write(address, words)
+        return words
+
+    def sync(self) -> None:
+        """Re-read the whole memory into the shadow, after the design wrote where dump() did not look"""
+        self.dump(0, self.size)
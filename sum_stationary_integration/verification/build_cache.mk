@@ -0,0 +1,29 @@
+# Optional build cache for the bench Makefiles, include it after Makefile.sim.
+# With BUILD_CACHE=<dir>, SIM_BUILD becomes a link to the verification/build_cache.py entry of the sources,
+# simulator, toplevel and compile arguments (so the HDL parameters). A miss builds into it and marks it built,
+# make clean && make (or another NUM_SAMPLES) links the same build again instead of compiling.
+
+ifdef BUILD_CACHE
+
+ifeq ($(SIM),verilator)
+		BUILD_CACHE_TARGET := $(SIM_BUILD)/Vtop
+else ifeq ($(SIM),icarus)
+		BUILD_CACHE_TARGET := $(SIM_BUILD)/sim.vvp
+else
+$(error BUILD_CACHE only works with SIM=verilator or SIM=icarus)
+endif
+
+BUILD_CACHE_COMMAND := PYTHONPATH=$(PWD)/.. $(shell cocotb-config --python-bin) -m verification.build_cache $(BUILD_CACHE) --simulator $(SIM) --toplevel $(TOPLEVEL) --args='$(COMPILE_ARGS) $(EXTRA_ARGS)' $(VERILOG_SOURCES)
+
+# Prints nothing unless it could not link
+BUILD_CACHE_ERROR := $(shell $(BUILD_CACHE_COMMAND) --link $(SIM_BUILD) 2>&1)
+ifneq ($(BUILD_CACHE_ERROR),)
+$(error $(BUILD_CACHE_ERROR))
+endif
+
+$(SIM_BUILD)/cache_entry.json: $(BUILD_CACHE_TARGET)
+	$(BUILD_CACHE_COMMAND) --commit
+
+$(COCOTB_RESULTS_FILE): $(SIM_BUILD)/cache_entry.json
+
+endif
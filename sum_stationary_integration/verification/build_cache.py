@@ -0,0 +1,257 @@
+"""
+Content-addressed cache of compiled simulator builds.
+
+A build only depends on the HDL sources, the simulator (and cocotb version it links against), the toplevel
+and the HDL parameters, so the key is a hash of exactly those. Changing NUM_SAMPLES or the Python stimulus
+keeps the key and reuses the existing build, no elaboration. Entries are directories under the cache root,
+the least recently used ones are deleted once there are more than max_entries.
+
+    cache = BuildCache(Path("build_cache"), max_entries=16)
+    description = cache.describe("verilator", "processor", [HDL_DIR / "processor.sv"], dict(N=4, DATA_WIDTH=8))
+    with cache.entry(description) as entry:
+        if not entry.hit:
+            runner.build(..., build_dir=entry.path)
+            entry.commit()
+        runner.test(..., build_dir=entry.path)
+
+An entry is locked (flock) exclusively while it is looked up and built, so parallel sweep workers asking for the
+same key wait for the first one instead of compiling twice. commit() (or a hit) turns that into a shared lock for
+as long as the entry is used, so points sharing a build run side by side, and eviction never deletes an entry that
+is in use. Evicted entries take their lock file with them.
+
+verification/sweep.py goes through entry(). The bench Makefiles use it with BUILD_CACHE=<dir> (see
+build_cache.mk): sim_build becomes a link to the entry of the sources, simulator, toplevel and compile arguments
+(so the parameters), make builds into it on a miss and marks it built, and make clean && make links the same
+build again instead of compiling. Those only lock while looking the entry up, one make per key at a time.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Union
+
+import cocotb
+
+# Written once the build succeeded, its mtime is the last time the entry was used
+ENTRY_FILE = "cache_entry.json"
+
+
+class CacheEntry:
+    """One build directory of the cache, see BuildCache.entry()"""
+
+    def __init__(self, path: Path, key: str, description: Dict[str, Any], lock_file: Optional[IO] = None):
+        self.path = path
+        self.key = key
+        self._description = description
+        self._lock_file = lock_file
+
+    @property
+    def hit(self) -> bool:
+        """True if this directory already holds a successful build"""
+        return (self.path / ENTRY_FILE).exists()
+
+    def commit(self) -> None:
+        """Mark the build as complete so later runs reuse it, other workers can use it from now on"""
+        (self.path / ENTRY_FILE).write_text(json.dumps(self._description, indent=2))
+        if self._lock_file is not None:
+            fcntl.flock(self._lock_file, fcntl.LOCK_SH)
+
+    def touch(self) -> None:
+        os.utime(self.path / ENTRY_FILE)
+
+
+class BuildCache:
+    """
+    LRU cache of build directories keyed on hash(simulator, toplevel, HDL sources, parameters, build args)
+
+    Args
+        root: directory holding every entry (created if needed)
+        max_entries: keep at most this many builds, least recently used go first
+    """
+
+    def __init__(self, root: Union[str, Path], max_entries: int = 16):
+        if max_entries < 1:
+            raise ValueError("max_entries should be at least 1")
+        self.root = Path(root).resolve()
+        self.max_entries = max_entries
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def describe(simulator: str, hdl_toplevel: str, sources: Sequence[Union[str, Path]],
+                 parameters: Dict[str, Any], build_args: Sequence[str] = ()) -> Dict[str, Any]:
+        """Everything the build depends on, source files by content hash"""
+        return dict(
+            simulator=simulator,
+            cocotb=cocotb.__version__,
+            hdl_toplevel=hdl_toplevel,
+            sources={Path(source).name: hashlib.sha256(Path(source).read_bytes()).hexdigest() for source in sources},
+            parameters={name: str(value) for name, value in sorted(parameters.items())},
+            build_args=list(build_args),
+        )
+
+    @staticmethod
+    def key(description: Dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()[:16]
+
+    @contextmanager
+    def entry(self, description: Dict[str, Any]) -> Iterator[CacheEntry]:
+        """
+        Lock and yield the entry for a describe() result. If entry.hit is False, build into entry.path and
+        call entry.commit(), the lock is exclusive until then and shared afterwards (and on a hit). A build that
+        raises before commit() is thrown away.
+        """
+        key = self.key(description)
+        path = self.root / key
+        with self._lock(key, shared=True) as lock_file:
+            hit = (path / ENTRY_FILE).exists()
+            if hit:
+                entry = CacheEntry(path, key, description)
+                entry.touch()
+                yield entry
+        if not hit:
+            # Only one worker builds, the others wait here and find it built
+            with self._lock(key) as lock_file:
+                entry = CacheEntry(path, key, description, lock_file)
+                if entry.hit:
+                    fcntl.flock(lock_file, fcntl.LOCK_SH)
+                    entry.touch()
+                else:
+                    # Leftovers of a failed or interrupted build
+                    shutil.rmtree(path, ignore_errors=True)
+                    path.mkdir(parents=True)
+                try:
+                    yield entry
+                except BaseException:
+                    if not entry.hit:
+                        shutil.rmtree(path, ignore_errors=True)
+                    raise
+        self.evict()
+
+    def link(self, description: Dict[str, Any], build_dir: Union[str, Path]) -> CacheEntry:
+        """
+        Point build_dir (a symlink, replaced if there is one) at the entry for a describe() result, for builds
+        driven by make: it builds into the entry on a miss and calls commit() once done. A hit gets one new
+        mtime over all its files, so make takes it as newer than the sources (the key says they match) instead
+        of rebuilding it.
+        """
+        self.evict()
+        key = self.key(description)
+        build_dir = Path(build_dir)
+        if build_dir.exists() and not build_dir.is_symlink():
+            raise FileExistsError(f"{build_dir} holds a build of its own, remove it (make clean) to use the cache")
+        with self._lock(key):
+            entry = CacheEntry(self.root / key, key, description)
+            entry.path.mkdir(exist_ok=True)
+            if entry.hit:
+                now = time.time()
+                for path in [entry.path, *entry.path.rglob("*")]:
+                    os.utime(path, (now, now), follow_symlinks=False)
+        # Nothing locks it from now on, and a key without an entry yet would look like a failed build to evict()
+        Path(f"{entry.path}.lock").unlink(missing_ok=True)
+        if build_dir.is_symlink():
+            build_dir.unlink()
+        build_dir.symlink_to(entry.path, target_is_directory=True)
+        return entry
+
+    def entries(self) -> List[Path]:
+        """Complete entries, least recently used first"""
+        complete = [path for path in self.root.iterdir() if (path / ENTRY_FILE).exists()]
+        return sorted(complete, key=lambda path: (path / ENTRY_FILE).stat().st_mtime)
+
+    def evict(self) -> None:
+        """
+        Delete least recently used entries until at most max_entries are left, skipping entries in use, and the
+        lock files of keys without an entry (builds that failed)
+        """
+        entries = self.entries()
+        stale = [path.with_suffix("") for path in self.root.glob("*.lock") if not (path.with_suffix("") / ENTRY_FILE).exists()]
+        for path in entries[:max(len(entries) - self.max_entries, 0)] + stale:
+            with self._lock(path.name, blocking=False) as lock_file:
+                if lock_file is not None:
+                    self._remove(path)
+
+    def clear(self) -> None:
+        for path in self.entries():
+            with self._lock(path.name):
+                self._remove(path)
+
+    def _remove(self, path: Path) -> None:
+        """Delete an entry and its lock file, with its lock held"""
+        shutil.rmtree(path, ignore_errors=True)
+        # Whoever waits on this lock file sees it is gone and opens a new one (see _lock)
+        Path(f"{path}.lock").unlink(missing_ok=True)
+
+    @contextmanager
+    def _lock(self, key: str, blocking: bool = True, shared: bool = False) -> Iterator[Optional[IO]]:
+        """Lock on one key across processes, yields the locked file, or None if not blocking and already held"""
+        while True:
+            lock_file = open(self.root / f"{key}.lock", "a")
+            try:
+                fcntl.flock(lock_file, (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                lock_file.close()
+                yield None
+                return
+            if self._current(key, lock_file):
+                break
+            # Evicted while we waited, lock the new file instead
+            lock_file.close()
+        try:
+            yield lock_file
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+    def _current(self, key: str, lock_file: IO) -> bool:
+        """True if lock_file is still the lock file of key (not unlinked by an eviction)"""
+        try:
+            return os.stat(self.root / f"{key}.lock").st_ino == os.fstat(lock_file.fileno()).st_ino
+        except FileNotFoundError:
+            return False
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or clear the simulator build cache, or link a bench "
+                                                 "Makefile's build directory to it (see build_cache.mk)")
+    parser.add_argument("root", type=Path, help="cache directory, e.g. sweep_build/cache")
+    parser.add_argument("--clear", action="store_true", help="delete every cached build")
+    parser.add_argument("--link", type=Path, metavar="BUILD_DIR", help="link BUILD_DIR to the entry of the build below")
+    parser.add_argument("--commit", action="store_true", help="mark the entry of the build below as built")
+    parser.add_argument("--simulator", help="build: simulator")
+    parser.add_argument("--toplevel", help="build: HDL toplevel")
+    parser.add_argument("--args", default="", help="build: compile arguments, HDL parameters included")
+    parser.add_argument("sources", nargs="*", type=Path, help="build: HDL sources")
+    args = parser.parse_intermixed_args()
+
+    cache = BuildCache(args.root)
+    if args.clear:
+        cache.clear()
+        return
+    if args.link or args.commit:
+        description = cache.describe(args.simulator, args.toplevel, args.sources, {}, args.args.split())
+        if args.link:
+            try:
+                cache.link(description, args.link)
+            except FileExistsError as error:
+                parser.exit(1, f"{error}\n")
+        if args.commit:
+            CacheEntry(cache.root / cache.key(description), cache.key(description), description).commit()
+        return
+    for path in reversed(cache.entries()):
+        description = json.loads((path / ENTRY_FILE).read_text())
+        last_used = time.strftime("%Y-%m-%d %H:%M", time.localtime((path / ENTRY_FILE).stat().st_mtime))
+        parameters = " ".join(f"{name}={value}" for name, value in description.get("parameters", {}).items())
+        # Makefile builds have their parameters in the compile arguments
+        parameters = parameters or " ".join(description.get("build_args", []))
+        print(f"{path.name}  {last_used}  {description.get('simulator')}  {description.get('hdl_toplevel')}  {parameters}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+On-disk cache of generated stimulus: A, B and the expected results of a scenario.
+
+With RANDOM_SEED fixed in the Makefiles every regression draws the same matrices and recomputes the same
+products. A Dataset is instead drawn from its own seed with NumPy (no getrandbits per element) and stored as
+raw .npy files, keyed by everything it depends on: seed, shape, widths and truncation policy. Later runs, and
+every worker of a sweep, memory map the files instead of generating anything:
+
+    cache = DatasetCache(Path("stimulus_cache"))
+    dataset = cache.get(REFERENCE_ENGINE, seed=1234, num_samples=3000, outer_dimension=N, inner_dimension=N)
+    tiles = dataset.tiles()          # what generate_tiles() yields, read lazily from the mapped files
+
+Entries live in a BuildCache (same locking and least recently used eviction as the simulator builds), so two
+processes asking for the same dataset generate it once. Benches use it when STIMULUS_CACHE names a directory,
+see MatrixMultiplierTester.
+"""
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Union
+
+import numpy as np
+
+from verification.build_cache import BuildCache
+from verification.reference_model import FixedPointEngine, output_dtype
+from verification.stimulus import Tile
+
+# Bump when the generation below changes, so old entries are not reused
+DATASET_VERSION = 1
+ARRAYS = ("a", "b", "expected")
+
+
+@dataclass
+class Dataset:
+    """num_samples tiles: a (num_samples, outer, inner), b (num_samples, inner, outer), expected (num_samples, outer, outer)"""
+    a: np.ndarray
+    b: np.ndarray
+    expected: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.a)
+
+    def tiles(self, transpose: bool = False) -> Iterator[Tile]:
+        """Tiles one by one like generate_tiles(), transpose gives the expected results column by column"""
+        for a, b, expected in zip(self.a, self.b, self.expected):
+            yield Tile(a, b, expected.T if transpose else expected)
+
+
+def random_words(rng: np.random.Generator, shape: tuple, data_width: int) -> np.ndarray:
+    """Uniform data_width bit words, Python ints (object array) past 64 bits"""
+    if data_width <= 64:
+        return rng.integers(0, (1 << data_width) - 1, size=shape, dtype=np.uint64, endpoint=True)
+    # Wide words: seed a Python generator from the NumPy one so the result still only depends on the seed
+    wide = random.Random(int(rng.integers(0, 1 << 63)))
+    return np.array([wide.getrandbits(data_width) for _ in range(int(np.prod(shape)))], dtype=object).reshape(shape)
+
+
+def generate_dataset(engine: FixedPointEngine, seed: int, num_samples: int, outer_dimension: int,
+                     inner_dimension: int) -> Dataset:
+    """Draw num_samples tiles from seed and compute their expected results with engine"""
+    rng = np.random.default_rng(seed)
+    a = random_words(rng, (num_samples, outer_dimension, inner_dimension), engine.data_width)
+    b = random_words(rng, (num_samples, inner_dimension, outer_dimension), engine.data_width)
+    return Dataset(a, b, engine.multiply(a, b))
+
+
+def describe(engine: FixedPointEngine, seed: int, num_samples: int, outer_dimension: int, inner_dimension: int) -> Dict[str, Any]:
+    """Everything a dataset depends on, the cache key"""
+    return dict(
+        version=DATASET_VERSION,
+        seed=seed,
+        num_samples=num_samples,
+        outer_dimension=outer_dimension,
+        inner_dimension=inner_dimension,
+        data_width=engine.data_width,
+        multiply_data_width=engine.multiply_data_width,
+        accum_data_width=engine.accum_data_width,
+        policy=engine.policy.value,
+    )
+
+
+class DatasetCache:
+    """
+    Generated datasets stored under root
+
+    Args
+        root: cache directory (created if needed)
+        max_entries: datasets kept, least recently used go first
+    """
+
+    def __init__(self, root: Union[str, Path], max_entries: int = 64):
+        self._cache = BuildCache(root, max_entries=max_entries)
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def root(self) -> Path:
+        return self._cache.root
+
+    def get(self, engine: FixedPointEngine, seed: int, num_samples: int, outer_dimension: int,
+            inner_dimension: int) -> Dataset:
+        """The dataset of these parameters, generated and stored on the first call, memory mapped afterwards"""
+        if output_dtype(engine.data_width, engine.multiply_data_width, engine.accum_data_width, inner_dimension) == object:
+            # Python int results cannot be stored raw, nothing to map
+            self.misses += 1
+            return generate_dataset(engine, seed, num_samples, outer_dimension, inner_dimension)
+        description = describe(engine, seed, num_samples, outer_dimension, inner_dimension)
+        with self._cache.entry(description) as entry:
+            if entry.hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+                dataset = generate_dataset(engine, seed, num_samples, outer_dimension, inner_dimension)
+                for name in ARRAYS:
+                    np.save(entry.path / f"{name}.npy", getattr(dataset, name))
+                entry.commit()
+            return Dataset(*(np.load(entry.path / f"{name}.npy", mmap_mode="r") for name in ARRAYS))
@@ -0,0 +1,344 @@
+"""
+Cycle by cycle throughput / latency instrumentation of a processor (processor.sv) instance.
+
+ProcessorMonitor watches the ready / valid interfaces once per cycle (in ReadOnly, like the drivers) and records
+for every tile:
+    start       cycle of its first input handshake (a_input_valid and a_input_ready, A carries last)
+    last_input  cycle of the handshake with last (and final_chunk, which the bench drives with every last unless
+                chunking for K_SPLIT)
+    end         cycle of its last output row handshake (output_valid and output_ready)
+    latency     end - start, the same count as Scoreboard.latency
+    interval    start - start of the previous tile (initiation interval)
+
+and over the whole window, why no input was taken in a cycle:
+    input_idle          neither A nor B valid
+    a_starved           only B valid, waiting on A
+    b_starved           only A valid, waiting on B
+    busy                both valid, input_ready low while the array drains its last tile
+    result_held         both valid, input_ready low while the previous result still sits in the output registers
+    output_backpressure output_valid high but output_ready low (counted separately, input can still go on)
+    a_backpressure      a_input_valid high but a_input_ready low, cycles the A writer (memory buffer) is held up
+    b_backpressure      same for B (both counted separately too)
+
+Without input FIFOs (INPUT_FIFO_DEPTH) a_input_ready is input_ready, so A is only taken with B. With them each side
+is taken on its own, the first four causes then tell why A was not taken (b_starved: the A FIFO is full waiting
+on B).
+
+input_skew_max is the most A beats taken ahead of B (or B ahead of A) at any point. Without input FIFOs both are
+taken together (0), with them it is how far one side ran ahead while the other paused, at most INPUT_FIFO_DEPTH.
+
+Utilization is MACs done over the MACs an N x N array could do in the window, i.e. N^2 per cycle. The window
+counts both its ends (first input handshake to last output row, inclusive), like MemoryBufferMonitor's.
+
+    monitor = ProcessorMonitor(dut, dut.clk)
+    monitor.start()
+    ...
+    monitor.write("processor_metrics.json")   # or .csv, one row per tile
+    monitor.reset()                           # between scenarios
+
+It wakes up on every cycle, so it is off unless asked for (MatrixMultiplierTester(instrument=True), set by
+processor_tb.py when INSTRUMENTATION_FILE is given).
+
+MemoryBufferMonitor does the same for a memory_buffer.sv instance: memory reads and beats handed to the processors
+from the first instruction to the last beat, and per cycle how the memory port and the processor side were idle:
+    memory_idle     memory_read_ready low, nothing left to read (the buffer waits for its repeats to end)
+    memory_wait     memory_read_ready high but the memory not valid yet (latency)
+    starved         processor_input_valid low, the next beat is not read yet
+    held            processor_input_valid high but no processor took the beat
+
+Its bench (and MemoryReadController) drive the inputs on the falling edge, so it samples after that one: inputs
+and outputs are then both what the next rising edge takes.
+"""
+
+import csv
+import json
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import cocotb
+from cocotb.handle import SimHandleBase
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge
+
+from verification.signals import is_high
+
+STALL_CAUSES = ("input_idle", "a_starved", "b_starved", "busy", "result_held", "output_backpressure",
+                "a_backpressure", "b_backpressure")
+MEMORY_BUFFER_CAUSES = ("memory_idle", "memory_wait", "starved", "held")
+
+
+@dataclass
+class TileRecord:
+    """One tile through the processor, cycles counted from the monitor start"""
+    index: int
+    start: int
+    inner_dimension: int = 0
+    last_input: Optional[int] = None
+    end: Optional[int] = None
+    rows_out: int = 0
+    interval: Optional[int] = None
+
+    @property
+    def latency(self) -> Optional[int]:
+        return None if self.end is None else self.end - self.start
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(asdict(self), latency=self.latency)
+
+
+class ProcessorMonitor:
+    """
+    Watches one processor instance
+
+    Args
+        dut: the processor handle (a_input_valid, b_input_valid, a_input_ready, b_input_ready, last, final_chunk,
+            output_valid, output_ready, a_data)
+        clk: its clock
+    """
+
+    def __init__(self, dut: SimHandleBase, clk: SimHandleBase):
+        self._dut = dut
+        self._clk = clk
+        self.n = len(dut.a_data)
+        self._coro = None
+        self.cycle = 0
+        self.reset()
+
+    def start(self) -> None:
+        """Start monitor"""
+        if self._coro is not None:
+            raise RuntimeError("Monitor already started")
+        self._coro = cocotb.start_soon(self._run())  # Start a coroutine
+
+    def stop(self) -> None:
+        """Stop monitor"""
+        if self._coro is None:
+            raise RuntimeError("Monitor never started")
+        self._coro.kill()
+        self._coro = None
+
+    def reset(self) -> None:
+        """Forget the tiles and counters so far (the cycle count goes on), e.g. between scenarios"""
+        self.tiles: List[TileRecord] = []
+        self.stalls: Dict[str, int] = {cause: 0 for cause in STALL_CAUSES}
+        self.input_beats = 0
+        self.output_rows = 0
+        self._skew = 0  # A beats taken minus B beats taken
+        self.input_skew_max = 0
+        self.first_cycle: Optional[int] = None
+        self.last_cycle: Optional[int] = None
+        # Tile being fed, and tiles fed but not fully out yet (oldest first)
+        self._feeding: Optional[TileRecord] = None
+        self._draining: List[TileRecord] = []
+        # Stalls while no tile is in the processor, they only count once another tile comes
+        self._gap: Dict[str, int] = {cause: 0 for cause in STALL_CAUSES}
+
+    async def _run(self) -> None:
+        dut = self._dut
+        while True:
+            await RisingEdge(self._clk)
+            self.cycle += 1
+            await ReadOnly()
+            a_valid = is_high(dut.a_input_valid)
+            b_valid = is_high(dut.b_input_valid)
+            output_valid = is_high(dut.output_valid)
+            a_ready = is_high(dut.a_input_ready)
+            if a_valid and a_ready:
+                self._input(is_high(dut.last) and is_high(dut.final_chunk))
+            elif self.first_cycle is not None:
+                self._stall(a_valid, b_valid, output_valid)
+            b_taken = b_valid and is_high(dut.b_input_ready)
+            self._skew += (a_valid and a_ready) - b_taken
+            self.input_skew_max = max(self.input_skew_max, abs(self._skew))
+            if self.first_cycle is not None:
+                if a_valid and not a_ready:
+                    self.stalls["a_backpressure"] += 1
+                if b_valid and not b_taken:
+                    self.stalls["b_backpressure"] += 1
+            if output_valid:
+                if is_high(dut.output_ready):
+                    self._output()
+                else:
+                    self.stalls["output_backpressure"] += 1
+
+    def _input(self, last: bool) -> None:
+        if self._feeding is None:
+            previous = self.tiles[-1].start if self.tiles else None
+            self._feeding = TileRecord(index=len(self.tiles), start=self.cycle,
+                                       interval=None if previous is None else self.cycle - previous)
+            self.tiles.append(self._feeding)
+            if self.first_cycle is None:
+                self.first_cycle = self.cycle
+            for cause, count in self._gap.items():
+                self.stalls[cause] += count
+                self._gap[cause] = 0
+        self._feeding.inner_dimension += 1
+        self.input_beats += 1
+        if last:
+            self._feeding.last_input = self.cycle
+            self._draining.append(self._feeding)
+            self._feeding = None
+
+    def _stall(self, a_valid: bool, b_valid: bool, output_valid: bool) -> None:
+        if not a_valid and not b_valid:
+            cause = "input_idle"
+        elif not a_valid:
+            cause = "a_starved"
+        elif not b_valid:
+            cause = "b_starved"
+        else:
+            cause = "result_held" if output_valid else "busy"
+        # Nothing after the last tile of the window counts
+        counters = self.stalls if self._feeding is not None or self._draining else self._gap
+        counters[cause] += 1
+
+    def _output(self) -> None:
+        self.output_rows += 1
+        if not self._draining:
+            return
+        tile = self._draining[0]
+        tile.rows_out += 1
+        if tile.rows_out == self.n:
+            tile.end = self.cycle
+            self.last_cycle = self.cycle
+            self._draining.pop(0)
+
+    def report(self) -> Dict[str, Any]:
+        """Summary over the tiles done since the last reset(), cycles from the first input to the last output inclusive"""
+        done = [tile for tile in self.tiles if tile.end is not None]
+        latencies = [tile.latency for tile in done]
+        intervals = [tile.interval for tile in self.tiles if tile.interval is not None]
+        cycles = self.last_cycle - self.first_cycle + 1 if done else 0
+        macs = sum(self.n * self.n * tile.inner_dimension for tile in done)
+        return dict(
+            n=self.n,
+            tiles=len(done),
+            cycles=cycles,
+            macs=macs,
+            macs_per_cycle=macs / cycles if cycles else None,
+            utilization=macs / (cycles * self.n * self.n) if cycles else None,
+            latency_min=min(latencies, default=None),
+            latency_mean=sum(latencies) / len(latencies) if latencies else None,
+            latency_max=max(latencies, default=None),
+            interval_min=min(intervals, default=None),
+            interval_mean=sum(intervals) / len(intervals) if intervals else None,
+            input_beats=self.input_beats,
+            input_skew_max=self.input_skew_max,
+            output_rows=self.output_rows,
+            stalls=dict(self.stalls),
+        )
+
+    def write(self, path: Union[str, Path]) -> None:
+        """report() and every tile as JSON, or only the tiles as CSV if path ends in .csv"""
+        write_metrics(path, self.report(), [tile.as_dict() for tile in self.tiles])
+
+
+def write_metrics(path: Union[str, Path], summary: Dict[str, Any], tiles: List[Dict[str, Any]]) -> None:
+    """JSON with the summary and the tile list, or a CSV of the tiles (one row each) if path ends in .csv"""
+    path = Path(path)
+    if path.suffix == ".csv":
+        columns = [field.name for field in fields(TileRecord)] + ["latency"]
+        columns += [key for key in (tiles[0] if tiles else {}) if key not in columns]
+        with open(path, "w", newline="") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(tiles)
+        return
+    with open(path, "w") as json_file:
+        json.dump(dict(summary, tile_records=tiles), json_file, indent=2)
+
+
+class MemoryBufferMonitor:
+    """
+    Watches one memory_buffer instance
+
+    Args
+        dut: the memory_buffer handle (instruction_valid, instruction_ready, memory_read_valid, memory_read_ready,
+            processor_input_valid, processor_input_valids, processor_input_ready)
+        clk: its clock
+    """
+
+    def __init__(self, dut: SimHandleBase, clk: SimHandleBase):
+        self._dut = dut
+        self._clk = clk
+        self.num_processors = len(dut.processor_input_ready)
+        self._coro = None
+        self.cycle = 0
+        self.reset()
+
+    def start(self) -> None:
+        """Start monitor"""
+        if self._coro is not None:
+            raise RuntimeError("Monitor already started")
+        self._coro = cocotb.start_soon(self._run())  # Start a coroutine
+
+    def stop(self) -> None:
+        """Stop monitor"""
+        if self._coro is None:
+            raise RuntimeError("Monitor never started")
+        self._coro.kill()
+        self._coro = None
+
+    def reset(self) -> None:
+        """Forget the counters so far (the cycle count goes on), e.g. between scenarios"""
+        self.instructions = 0
+        self.reads = 0
+        self.beats = 0
+        self.stalls: Dict[str, int] = {cause: 0 for cause in MEMORY_BUFFER_CAUSES}
+        self.first_cycle: Optional[int] = None
+        self.last_cycle: Optional[int] = None
+        # Idle cycles since the last beat, they only count once another beat comes
+        self._gap: Dict[str, int] = {cause: 0 for cause in MEMORY_BUFFER_CAUSES}
+
+    async def _run(self) -> None:
+        while True:
+            # Sample first, mid cycle, then move on to the next one: right after a rising edge the inputs would
+            # still be the ones it just took, paired with the outputs that followed (e.g. an instruction handshake
+            # missed as instruction_ready drops), and waiting for an edge first misses a handshake already up
+            await FallingEdge(self._clk)
+            await ReadOnly()
+            self._sample()
+            await RisingEdge(self._clk)
+            self.cycle += 1
+
+    def _sample(self) -> None:
+        dut = self._dut
+        if is_high(dut.instruction_valid) and is_high(dut.instruction_ready):
+            self.instructions += 1
+            if self.first_cycle is None:
+                self.first_cycle = self.cycle
+        if self.first_cycle is None:
+            return
+        if is_high(dut.memory_read_ready):
+            if is_high(dut.memory_read_valid):
+                self.reads += 1
+            else:
+                self._gap["memory_wait"] += 1
+        else:
+            self._gap["memory_idle"] += 1
+        beats = sum(is_high(dut.processor_input_valids[i]) and is_high(dut.processor_input_ready[i])
+                    for i in range(self.num_processors))
+        if not is_high(dut.processor_input_valid):
+            self._gap["starved"] += 1
+        elif not beats:
+            self._gap["held"] += 1
+        if beats:
+            self.beats += beats
+            self.last_cycle = self.cycle
+            for cause, count in self._gap.items():
+                self.stalls[cause] += count
+                self._gap[cause] = 0
+
+    def report(self) -> Dict[str, Any]:
+        """Summary since the last reset(), cycles from the first instruction to the last beat inclusive"""
+        cycles = self.last_cycle - self.first_cycle + 1 if self.last_cycle is not None else 0
+        return dict(
+            num_processors=self.num_processors,
+            instructions=self.instructions,
+            cycles=cycles,
+            reads=self.reads,
+            beats=self.beats,
+            beats_per_cycle=self.beats / cycles if cycles else None,
+            memory_utilization=self.reads / cycles if cycles else None,
+            stalls=dict(self.stalls),
+        )
@@ -0,0 +1,252 @@
+"""
+Latency insensitive (valid / ready) drivers shared by every bench.
+
+    LIReader          takes transactions off a valid/ready output (c_data_streaming, memory buffer outputs, ...)
+    LIWriter          drives beats of an unpacked array (a_data / b_data) with valid and optionally last
+    InstructionWriter drives the address / length / repeats instructions of the memory buffers
+
+All of them are event driven: the handshake is sampled once the cycle settled (ReadOnly) and while nothing can
+be transferred they sleep on the valid / ready signals instead of waking up on every clock edge, see the
+signals module for why ReadOnly.
+"""
+
+from random import randint
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import cocotb
+from cocotb.handle import SimHandleBase
+from cocotb.queue import Queue
+from cocotb.triggers import Edge, First, ReadOnly, RisingEdge
+
+from verification.signals import is_high, sample, wait_cycles, write_array
+
+
+# Data reader - that asserts ready when instructed to start read data, not ready when stop. Checks for valid signals before reading.
+#   reader(ready=True/False) - and it logs whatever value it read
+class LIReader:
+    """
+    Read transactions from the DUT
+
+    How to use:
+        1. Initialize the class with:
+            - dut: the DUT handle (not really used)
+            - clk: the clock handle
+            - signals: a dict of signal handles that will be read from, e.g. dict(c_data_streaming=dut.c_data_streaming).
+                In the memory buffer case, the signals would be: processor_id, processor_input_data, last.
+            - valid: the handle to the valid signal
+            - ready: the handle to the ready signal
+                Note that one LI Reader is meant to serve as one processor unit. So to test broadcasting, we need multiple LI Readers.
+        2. Call start() to start the monitor
+        3. Either read from self.values, or add_callback() to get every transaction as it is taken
+    """
+
+    def __init__(self, dut: SimHandleBase, clk: SimHandleBase, signals: Dict[str, SimHandleBase], valid: SimHandleBase, ready: SimHandleBase):
+        self.values = Queue[Dict[str, Any]]()  # {'signal_name': value}
+        self._dut = dut
+        self._clk = clk
+        self._signals = signals
+        self._valid = valid
+        self._ready = ready
+        self._callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        self._coro = None
+
+    def start(self) -> None:
+        """Start monitor"""
+        if self._coro is not None:
+            raise RuntimeError("Monitor already started")
+        self._coro = cocotb.start_soon(self._run())  # Start a coroutine
+
+    def stop(self) -> None:
+        """Stop monitor"""
+        if self._coro is None:
+            raise RuntimeError("Monitor never started")
+        self._coro.kill()
+        self._coro = None
+
+    def add_callback(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Call callback(transaction) for every value read instead of queuing it in self.values"""
+        self._callbacks.append(callback)
+
+    def set_status(self, ready: bool):
+        """Set so that the next rising edge we read or not"""
+        self._ready.value = 1 if ready else 0
+
+    async def _run(self) -> None:
+        """
+        Once the signals settled (ReadOnly), check if valid AND ready. If so, the next rising edge takes the value,
+        so we read it now.
+        Sampling in ReadOnly instead of right after the edge gives the same result on event driven simulators
+        (pre-edge values) and Verilator (which shows post-edge values after RisingEdge).
+
+        Event driven: while nothing is transferred we sleep until valid or ready changes instead of waking up on
+        every clock. After a transfer we stay in burst mode and look at the very next cycle, back to back beats
+        then cost one edge (+ ReadOnly) each.
+        """
+        while True:
+            await ReadOnly()
+            if not (is_high(self._valid) and is_high(self._ready)):
+                # Idle: sleep until one side changes, then look at the settled values again
+                await First(Edge(self._valid), Edge(self._ready))
+                continue
+            # Both valid and ready are true going into the rising clock edge
+            transaction = self._sample()
+            if self._callbacks:
+                for callback in self._callbacks:
+                    callback(transaction)
+            else:
+                self.values.put_nowait(transaction)
+            await RisingEdge(self._clk)
+
+    def _sample(self) -> Dict[str, Any]:
+        """
+        Samples the data signals and builds a transaction object
+
+        Return value is what is stored in queue. Meant to be overriden by the user.
+        """
+        return {name: sample(handle) for name, handle in self._signals.items()}
+
+
+# Data writer - asserts valid when prepared,
+#   writer(valid=True/False, value)
+class LIWriter:
+    """
+    Write beats to the DUT
+
+    Beats are tuples with valid at index 1, for this class ([data...], valid, last) or ([data...], valid, last, final_chunk):
+        - valid beats are held until ready, the next edge takes them
+        - not valid beats keep valid low for 1-3 cycles (random)
+        - if the queue is empty, 0s are driven with valid low
+
+    Args
+        signals: unpacked array the data goes to, element i of the beat data to signals[i]
+        last / sends_last: the last signal, only driven if sends_last
+        final_chunk: driven along with last if given, from the 4th element of the beat, or as last for 3 element beats
+        input_length: number of elements of signals, for the idle value
+        queue_depth: > 0 bounds self.values, producers should then await self.values.put() (backpressure)
+        clock_period_ns: period of a clock started at time 0, lets not valid gaps sleep on a single Timer
+    """
+
+    def __init__(self, dut: SimHandleBase, clk: SimHandleBase, signals: SimHandleBase, valid: SimHandleBase, ready: SimHandleBase,
+                 last: Optional[SimHandleBase] = None, sends_last: bool = False, input_length: int = 0, queue_depth: int = 0,
+                 clock_period_ns: Optional[int] = None, final_chunk: Optional[SimHandleBase] = None):
+        self.values = Queue[Tuple](maxsize=queue_depth)
+        self._dut = dut
+        self._clk = clk
+        self._signals = signals
+        self._valid = valid
+        self._ready = ready
+        self._last = last
+        self._sends_last = sends_last
+        self._final_chunk = final_chunk
+        self._input_length = input_length
+        self._clock_period_ns = clock_period_ns
+        self._callbacks: List[Callable[[Tuple], None]] = []
+        self._coro = None
+
+    def start(self) -> None:
+        """Start monitor"""
+        if self._coro is not None:
+            raise RuntimeError("Monitor already started")
+        self._coro = cocotb.start_soon(self._run())  # Start a coroutine
+
+    def stop(self) -> None:
+        """Stop monitor"""
+        if self._coro is None:
+            raise RuntimeError("Monitor never started")
+        self._coro.kill()
+        self._coro = None
+
+    def add_callback(self, callback: Callable[[Tuple], None]) -> None:
+        """Call callback(beat) for every beat the DUT accepted"""
+        self._callbacks.append(callback)
+
+    def set_status(self, beat: Tuple):
+        """Queue one beat without waiting, see the class docstring for its shape"""
+        self.values.put_nowait(beat)
+
+    async def _run(self) -> None:
+        """
+        Goal: iterate thru values, and write. If true, do proper wait. If False, wait a random number of cycles.
+
+        Burst mode: queued valid beats go out back to back, the next one is driven right after the edge that took
+        the previous one. Waiting never polls the clock:
+            - not ready: sleep until ready changes
+            - not valid entries: consecutive ones are merged into a single wait (see wait_cycles)
+            - empty queue: drive not valid and sleep until something is queued
+        """
+        pending = None
+        while True:
+            if pending is not None:
+                beat, pending = pending, None
+            elif self.values.empty():
+                self._drive_idle()
+                beat = await self.values.get()
+            else:
+                beat = self.values.get_nowait()
+            self._drive(beat)
+
+            if beat[1]:
+                # We are writing
+                # Once the cycle settled (ReadOnly), check if ready. If ready, the next edge takes the data and we switch value
+                # if not ready, sleep until ready changes and check again
+                while True:
+                    await ReadOnly()
+                    if is_high(self._ready):
+                        break
+                    await Edge(self._ready)
+                for callback in self._callbacks:
+                    callback(beat)
+                await RisingEdge(self._clk)
+            else:
+                # We are not writing
+                # Generate random value (1-3 probably) for this entry and every not valid entry right behind it
+                cycles = randint(1, 3)
+                while pending is None and not self.values.empty():
+                    next_beat = self.values.get_nowait()
+                    if next_beat[1]:
+                        pending = next_beat
+                    else:
+                        cycles += randint(1, 3)
+                await wait_cycles(self._clk, cycles, self._clock_period_ns)
+
+    def _drive(self, beat: Tuple) -> None:
+        """Set signals to our values."""
+        input_value, do_input, is_last = beat[:3]
+        write_array(self._signals, input_value)
+        self._valid.value = do_input
+        # If this writer does send the "last" signal, then we set the last signal.
+        if self._sends_last:
+            self._last.value = is_last
+            if self._final_chunk is not None:
+                self._final_chunk.value = beat[3] if len(beat) > 3 else is_last
+
+    def _drive_idle(self) -> None:
+        self._drive(([0] * self._input_length, False, False))
+
+
+class InstructionWriter(LIWriter):
+    """
+    LIWriter for the memory buffer instructions, beats are ([address, length, repeats], valid)
+
+    Args
+        address_input_signal / length_input_signal / repeats_input_signal: where the three fields of a beat go
+    """
+
+    def __init__(self, dut: SimHandleBase, clk: SimHandleBase, address_input_signal: SimHandleBase, length_input_signal: SimHandleBase,
+                 repeats_input_signal: SimHandleBase, valid: SimHandleBase, ready: SimHandleBase, queue_depth: int = 0,
+                 clock_period_ns: Optional[int] = None):
+        super().__init__(dut, clk, signals=None, valid=valid, ready=ready, queue_depth=queue_depth, clock_period_ns=clock_period_ns)
+        self._address_input_signal = address_input_signal
+        self._length_input_signal = length_input_signal
+        self._repeats_input_signal = repeats_input_signal
+
+    def _drive(self, beat: Tuple) -> None:
+        instruction, do_input = beat
+        address, length, repeats = instruction
+        self._address_input_signal.value = address
+        self._length_input_signal.value = length
+        self._repeats_input_signal.value = repeats
+        self._valid.value = do_input
+
+    def _drive_idle(self) -> None:
+        self._drive(([0, 0, 0], False))
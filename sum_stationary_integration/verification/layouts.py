@@ -0,0 +1,216 @@
+"""
+Memory layouts of the A, B and C matrices (see "Input/Output Specifications" in hdl/README.md).
+
+    A  row blocks of N rows, top to bottom. Each block column major, starting from its rightmost column
+    B  col blocks of N cols, left to right. Each block row major, starting from its bottom row
+    C  groups of ROWS_PROCESSORS x COLS_PROCESSORS blocks of N x N, groups / blocks / elements all row major
+
+Every packer / unpacker is a fixed number of NumPy reshape / transpose / flip calls, no Python loop over
+elements, so staging a 4096 x 4096 run costs a few array copies:
+
+    memory.write(a_address, pack_a(a, N))
+    memory.write(b_address, pack_b(b, N))
+    ...
+    c = unpack_c(memory.read(c_address, c_words(n, n, N, ROWS_PROCESSORS, COLS_PROCESSORS)), N,
+                 ROWS_PROCESSORS, COLS_PROCESSORS, shape=(n, n))
+
+unpack_c() copies every element into row major order. For big results CView looks at the C words in place
+instead (np.lib.stride_tricks, no copy): blocks are views, comparisons go block by block against the expected
+matrix, and only what is indexed gets gathered:
+
+    c = CView(memory.region(c_address, c_words(n, n, N, ROWS_PROCESSORS, COLS_PROCESSORS)), N,
+              ROWS_PROCESSORS, COLS_PROCESSORS, shape=(n, n))
+    c.block(3, 5)            # N x N view
+    c[100:110, 7]            # gathers 10 words
+    c.mismatches(expected)   # [(row, col), ...] without building a dense C
+
+Matrices that are not a multiple of the block sizes are padded with zeros (zero rows of A / cols of B only give
+zero results, which unpack_c crops away with shape). Words wider than 64 bits (object arrays) work the same.
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+Matrix = Union[Sequence[Sequence[int]], np.ndarray]
+
+
+def _padded(matrix: Matrix, row_multiple: int, col_multiple: int) -> np.ndarray:
+    """matrix as a 2D array, zero padded at the bottom / right up to the given multiples"""
+    matrix = np.asarray(matrix)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2D matrix, got shape {matrix.shape}")
+    rows, cols = matrix.shape
+    pad_rows = -rows % row_multiple
+    pad_cols = -cols % col_multiple
+    if pad_rows or pad_cols:
+        matrix = np.pad(matrix, ((0, pad_rows), (0, pad_cols)))
+    return matrix
+
+
+def pack_a(a: Matrix, n: int) -> np.ndarray:
+    """
+    Flat memory image of A (rows x inner): row blocks of n rows, each one column by column from the right
+
+    Rows are padded to a multiple of n. Word k of block i is a[i*n + k % n][inner - 1 - k // n].
+    """
+    a = _padded(a, n, 1)
+    rows, inner = a.shape
+    # (block, row in block, col) -> (block, col from the right, row in block)
+    return a.reshape(rows // n, n, inner)[:, :, ::-1].transpose(0, 2, 1).reshape(-1)
+
+
+def unpack_a(words: np.ndarray, n: int, inner: int, rows: Optional[int] = None) -> np.ndarray:
+    """A back from pack_a() words, rows crops the padding (all the rows of the image if None)"""
+    words = np.asarray(words).reshape(-1)
+    blocks = words.size // (n * inner)
+    a = words[:blocks * n * inner].reshape(blocks, inner, n)[:, ::-1, :].transpose(0, 2, 1).reshape(blocks * n, inner)
+    return a if rows is None else a[:rows]
+
+
+def pack_b(b: Matrix, n: int) -> np.ndarray:
+    """
+    Flat memory image of B (inner x cols): col blocks of n cols, each one row by row from the bottom
+
+    Cols are padded to a multiple of n. Word k of block j is b[inner - 1 - k // n][j*n + k % n].
+    """
+    b = _padded(b, 1, n)
+    inner, cols = b.shape
+    # (row, block, col in block) -> (block, row from the bottom, col in block)
+    return b.reshape(inner, cols // n, n).transpose(1, 0, 2)[:, ::-1, :].reshape(-1)
+
+
+def unpack_b(words: np.ndarray, n: int, inner: int, cols: Optional[int] = None) -> np.ndarray:
+    """B back from pack_b() words, cols crops the padding (all the cols of the image if None)"""
+    words = np.asarray(words).reshape(-1)
+    blocks = words.size // (n * inner)
+    b = words[:blocks * n * inner].reshape(blocks, inner, n)[:, ::-1, :].transpose(1, 0, 2).reshape(inner, blocks * n)
+    return b if cols is None else b[:, :cols]
+
+
+def c_shape(rows: int, cols: int, n: int, rows_processors: int, cols_processors: int) -> Tuple[int, int]:
+    """Shape of C once padded to whole groups"""
+    group_rows = n * rows_processors
+    group_cols = n * cols_processors
+    return -(-rows // group_rows) * group_rows, -(-cols // group_cols) * group_cols
+
+
+def c_words(rows: int, cols: int, n: int, rows_processors: int, cols_processors: int) -> int:
+    """Words the design writes for a rows x cols C, what to allocate at c_memory_addr"""
+    padded_rows, padded_cols = c_shape(rows, cols, n, rows_processors, cols_processors)
+    return padded_rows * padded_cols
+
+
+def pack_c(c: Matrix, n: int, rows_processors: int, cols_processors: int) -> np.ndarray:
+    """Flat memory image of C in groups of rows_processors x cols_processors blocks of n x n, padded to whole groups"""
+    c = _padded(c, n * rows_processors, n * cols_processors)
+    rows, cols = c.shape
+    # (group row, block row, row in block, group col, block col, col in block)
+    blocked = c.reshape(rows // (n * rows_processors), rows_processors, n, cols // (n * cols_processors), cols_processors, n)
+    return blocked.transpose(0, 3, 1, 4, 2, 5).reshape(-1)
+
+
+def unpack_c(words: np.ndarray, n: int, rows_processors: int, cols_processors: int,
+             shape: Tuple[int, int]) -> np.ndarray:
+    """
+    Dense C from the words the design wrote (c_words() of them from c_memory_addr)
+
+    shape is the unpadded (rows, cols) of C, the padding is cropped away.
+    """
+    rows, cols = shape
+    padded_rows, padded_cols = c_shape(rows, cols, n, rows_processors, cols_processors)
+    words = np.asarray(words).reshape(-1)
+    if words.size < padded_rows * padded_cols:
+        raise ValueError(f"C of {shape} needs {padded_rows * padded_cols} words, got {words.size}")
+    blocked = words[:padded_rows * padded_cols].reshape(padded_rows // (n * rows_processors), padded_cols // (n * cols_processors),
+                                                        rows_processors, cols_processors, n, n)
+    return blocked.transpose(0, 2, 4, 1, 3, 5).reshape(padded_rows, padded_cols)[:rows, :cols]
+
+
+class CView:
+    """
+    C (rows x cols) seen through the group layout without copying it
+
+    Args
+        words: the flat C words (c_words() of them), e.g. ArrayMemory.region() or a memmap, never copied
+        shape: unpadded (rows, cols) of C, indexing past it raises IndexError
+    """
+
+    def __init__(self, words: np.ndarray, n: int, rows_processors: int, cols_processors: int, shape: Tuple[int, int]):
+        self.n = n
+        self.rows_processors = rows_processors
+        self.cols_processors = cols_processors
+        self.shape = tuple(shape)
+        padded_rows, padded_cols = c_shape(*self.shape, n, rows_processors, cols_processors)
+        if words.ndim != 1 or words.size < padded_rows * padded_cols:
+            raise ValueError(f"C of {self.shape} needs {padded_rows * padded_cols} flat words, got {words.shape}")
+        self._groups = (padded_rows // (n * rows_processors), padded_cols // (n * cols_processors))
+        # (group row, block row, row in block, group col, block col, col in block), same axes as the dense matrix
+        item = words.strides[0]
+        block = n * n * item
+        strides = (self._groups[1] * rows_processors * cols_processors * block, cols_processors * block, n * item,
+                   rows_processors * cols_processors * block, block, item)
+        self.blocked = as_strided(words, shape=(self._groups[0], rows_processors, n, self._groups[1], cols_processors, n),
+                                  strides=strides, writeable=False)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.blocked.dtype
+
+    def block(self, block_row: int, block_col: int) -> np.ndarray:
+        """N x N view of the block computed for rows block_row*N.. and cols block_col*N.."""
+        group_row, row = divmod(block_row, self.rows_processors)
+        group_col, col = divmod(block_col, self.cols_processors)
+        return self.blocked[group_row, row, :, group_col, col, :]
+
+    def _split(self, indices: np.ndarray, processors: int) -> Tuple[np.ndarray, ...]:
+        """Dense row (or col) indices to (group, block, index in block)"""
+        group, rest = np.divmod(indices, self.n * processors)
+        block, index = np.divmod(rest, self.n)
+        return group, block, index
+
+    def __getitem__(self, key: Any) -> Any:
+        """Dense indexing (ints and slices), only the selected words are gathered"""
+        row_key, col_key = key if isinstance(key, tuple) else (key, slice(None))
+        rows = np.arange(self.shape[0])[row_key]
+        cols = np.arange(self.shape[1])[col_key]
+        group_row, block_row, row = self._split(np.asarray(rows), self.rows_processors)
+        group_col, block_col, col = self._split(np.asarray(cols), self.cols_processors)
+        # Outer product of the row and col selections
+        expand = (Ellipsis, None) if np.ndim(cols) else (Ellipsis,)
+        selected = self.blocked[group_row[expand], block_row[expand], row[expand], group_col, block_col, col]
+        return selected.item() if selected.ndim == 0 else selected
+
+    def __array__(self, dtype: Optional[np.dtype] = None) -> np.ndarray:
+        """Dense copy (what unpack_c() gives), for when C is small"""
+        rows, cols = self.shape
+        dense = self.blocked.reshape(self._groups[0] * self.rows_processors * self.n, -1)[:rows, :cols]
+        return dense if dtype is None else dense.astype(dtype)
+
+    def _expected_blocked(self, expected: Matrix) -> np.ndarray:
+        """expected padded to whole groups and reshaped like self.blocked, a view when no padding is needed"""
+        expected = _padded(expected, self.n * self.rows_processors, self.n * self.cols_processors)
+        if expected.shape[0] < self.shape[0] or expected.shape[1] < self.shape[1]:
+            raise ValueError(f"Expected matrix of {expected.shape} is smaller than C {self.shape}")
+        return expected.reshape(self.blocked.shape)
+
+    def mismatches(self, expected: Matrix, limit: Optional[int] = None) -> List[Tuple[int, int]]:
+        """(row, col) of the words differing from expected, group row by group row so no dense C is built"""
+        expected = self._expected_blocked(expected)
+        found: List[Tuple[int, int]] = []
+        group_rows = self.n * self.rows_processors
+        group_cols = self.n * self.cols_processors
+        for group_row in range(self._groups[0]):
+            differing = np.argwhere(self.blocked[group_row] != expected[group_row])
+            for block_row, row, group_col, block_col, col in differing:
+                row_index = group_row * group_rows + block_row * self.n + row
+                col_index = group_col * group_cols + block_col * self.n + col
+                if row_index < self.shape[0] and col_index < self.shape[1]:
+                    found.append((int(row_index), int(col_index)))
+                    if limit is not None and len(found) >= limit:
+                        return found
+        return found
+
+    def equals(self, expected: Matrix) -> bool:
+        return not self.mismatches(expected, limit=1)
@@ -0,0 +1,153 @@
+"""
+Flat array-backed memory for the memory simulator.
+
+Words live in one NumPy array indexed by address, so a PARALLEL_DATA_STREAMING_SIZE read or write is a single
+slice and a whole matrix is loaded or dumped with one copy instead of a Python loop over dict keys:
+
+    memory = ArrayMemory(2**MEMORY_ADDRESS_BITS, word_width=DATA_WIDTH)
+    memory.load_matrix(a_address, a_matrix)                     # row major, see layouts in hdl/README.md
+    words = memory.read(address, PARALLEL_DATA_STREAMING_SIZE)
+    c = memory.dump_region(c_address, (rows, cols))
+
+Addresses wrap around at size like a real address bus.
+
+For big matrices (top_tb toward MAX_MATRIX_LENGTH=4096) the words can live in a file instead, mapped with
+np.memmap. Matrices are written once and later runs, or every process of a sweep, map the same file: the OS
+shares the pages between processes and only loads what is touched.
+
+    memory = ArrayMemory.memmap("matrices.mem", size, DATA_WIDTH, mode="w+")   # create
+    memory.load_matrix(a_address, a_matrix)
+    memory.flush()
+    memory = ArrayMemory.memmap("matrices.mem", size, DATA_WIDTH)              # reuse, copy on write
+"""
+
+from pathlib import Path
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+def word_dtype(word_width: int) -> np.dtype:
+    """Smallest unsigned dtype holding word_width bits, object (Python ints) past 64 bits"""
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if word_width <= np.iinfo(dtype).bits:
+            return np.dtype(dtype)
+    return np.dtype(object)
+
+
+class ArrayMemory:
+    """
+    size words of word_width bits, all 0 at first
+
+    Args
+        size: number of addressable words
+        word_width: bits per word, values are masked to it on write
+        words: backing array of size words of word_dtype(word_width), a new zeroed one if None (see memmap())
+    """
+
+    def __init__(self, size: int, word_width: int, words: Optional[np.ndarray] = None):
+        if size < 1:
+            raise ValueError("Memory size should be at least 1")
+        self.size = size
+        self.word_width = word_width
+        self._mask = (1 << word_width) - 1
+        if words is None:
+            words = np.zeros(size, dtype=word_dtype(word_width))
+        elif words.shape != (size,) or words.dtype != word_dtype(word_width):
+            raise ValueError(f"Backing array should be {size} words of {word_dtype(word_width)}, got {words.shape} of {words.dtype}")
+        self.words = words
+
+    @classmethod
+    def memmap(cls, path: Union[str, Path], size: int, word_width: int, mode: str = "c") -> "ArrayMemory":
+        """
+        Memory backed by the file at path (np.memmap)
+
+        mode is the np.memmap one:
+            "w+" creates (or truncates) the file, all 0
+            "r+" maps an existing file, writes go to the file
+            "c"  maps an existing file copy on write: writes (e.g. C results) stay private to this process and
+                 the file is shared untouched, what parallel runs want
+            "r"  maps an existing file read only, writes raise
+        """
+        dtype = word_dtype(word_width)
+        if dtype == object:
+            raise ValueError(f"Memory mapped words are at most 64 bits, got {word_width}")
+        path = Path(path)
+        if mode != "w+" and path.stat().st_size != size * dtype.itemsize:
+            raise ValueError(f"{path} holds {path.stat().st_size} bytes, expected {size} words of {dtype}")
+        return cls(size, word_width, words=np.memmap(path, dtype=dtype, mode=mode, shape=(size,)))
+
+    def flush(self) -> None:
+        """Write changes of a memory mapped memory back to its file (nothing to do otherwise)"""
+        if isinstance(self.words, np.memmap):
+            self.words.flush()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, address: int) -> int:
+        return int(self.words[address % self.size])
+
+    def __setitem__(self, address: int, value: int) -> None:
+        self.words[address % self.size] = value & self._mask
+
+    def _spans(self, address: int, count: int) -> Tuple[slice, ...]:
+        """Slices of self.words covering count words from address, two if it wraps around"""
+        if count > self.size:
+            raise ValueError(f"{count} words do not fit in a memory of {self.size}")
+        start = address % self.size
+        end = start + count
+        if end <= self.size:
+            return (slice(start, end),)
+        return slice(start, self.size), slice(0, end - self.size)
+
+    def read(self, address: int, count: int) -> np.ndarray:
+        """count words from address (a copy)"""
+        spans = self._spans(address, count)
+        if len(spans) == 1:
+            return self.words[spans[0]].copy()
+        return np.concatenate([self.words[span] for span in spans])
+
+    def region(self, address: int, count: int) -> np.ndarray:
+        """count words from address without copying (a view, e.g. for layouts.CView), cannot wrap around"""
+        spans = self._spans(address, count)
+        if len(spans) != 1:
+            raise ValueError(f"Region of {count} words at {address} wraps around, use read()")
+        return self.words[spans[0]]
+
+    def write(self, address: int, words: Union[Sequence[int], np.ndarray]) -> None:
+        """Write words at address, address + 1, ..."""
+        words = self._masked(words)
+        offset = 0
+        for span in self._spans(address, len(words)):
+            length = span.stop - span.start
+            self.words[span] = words[offset:offset + length]
+            offset += length
+
+    def read_burst(self, address: int, beats: int, beat_words: int) -> np.ndarray:
+        """beats consecutive beats of beat_words words from address in one slice, row i is beat i"""
+        return self.read(address, beats * beat_words).reshape(beats, beat_words)
+
+    def load_matrix(self, address: int, matrix: Union[Sequence[Sequence[int]], np.ndarray]) -> None:
+        """Store a matrix (any shape) flattened in row major order from address"""
+        self.write(address, np.asarray(matrix).reshape(-1))
+
+    def dump_region(self, address: int, shape: Union[int, Tuple[int, ...]]) -> np.ndarray:
+        """Words from address, reshaped to shape (a count gives a flat array)"""
+        shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        return self.read(address, int(np.prod(shape))).reshape(shape)
+
+    def fill(self, value: int = 0) -> None:
+        self.words[:] = value & self._mask
+
+    def _masked(self, words: Union[Sequence[int], np.ndarray]) -> np.ndarray:
+        """words as a flat array of the memory dtype, masked to word_width"""
+        words = np.asarray(words).reshape(-1)
+        if self.words.dtype == object or words.dtype == object:
+            # Words wider than 64 bits, Python ints
+            masked = np.array([int(word) & self._mask for word in words], dtype=object)
+            return masked if self.words.dtype == object else masked.astype(self.words.dtype)
+        if words.dtype.kind not in "uib":
+            raise TypeError(f"Memory words should be integers, got {words.dtype}")
+        # Through uint64, negative values keep their two's complement bits like a Python & would
+        return (words.astype(np.uint64, copy=False) & np.uint64(self._mask)).astype(self.words.dtype, copy=False)
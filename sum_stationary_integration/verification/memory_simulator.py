@@ -0,0 +1,366 @@
+"""
+Python models of the memories around top.sv, serving its read / write ports round robin.
+
+    memory = ArrayMemory(2**MEMORY_ADDRESS_BITS, word_width=DATA_WIDTH)
+    memory.load_matrix(a_address, a_matrix)
+    reader = MemoryReadController(dut, dut.clk, dut.input_memory_a_read_readys, dut.input_memory_a_read_valids,
+                                  dut.input_memory_a_read_address, dut.input_memory_a_read_bus,
+                                  num_ports=ROWS_PROCESSORS, parallel_num_ports=PARALLEL_DATA_STREAMING_SIZE,
+                                  memory=memory)
+
+A read or write at address i moves words i, i+1, ..., i+parallel_num_ports-1 (one slice of the ArrayMemory),
+like simple_memory.sv. Read and write controllers given the same memory share it. preload() / dump() load A / B
+and read C back directly, without going through the ports.
+
+Reads go through a timing model (memory_timing.py), ideal unless MEMORY_TIMING says otherwise. Which port is
+served when several ask is up to an arbiter (arbiters.py), work conserving round robin unless MEMORY_ARBITER
+says otherwise. Both controllers keep per port wait statistics in arbiter.report().
+
+Reads can be bursts: one request (address + number of beats) streams beats from address, address +
+parallel_num_ports, ... on consecutive cycles, paying latency and arbitration once. memory_buffer.sv has no
+length port, it reads consecutive addresses one handshake at a time, so by default the controller guesses a burst
+of MEMORY_BURST beats and keeps serving while the port asks for the next address, dropping what is left of the
+burst when it asks for something else. A DUT with a length port passes it as read_lengths instead.
+burst_stats() counts requests, beats served and beats dropped.
+
+A controller can serve ports with no HDL behind them next to the DUT's: StreamingReader is one, reading
+consecutive addresses as fast as it is served, e.g. the other buffers of the grid competing with the single
+memory_buffer of its bench (MEMORY_CONTENDERS), so the arbiter has something to arbitrate.
+"""
+
+import os
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+import cocotb
+import numpy as np
+from cocotb.binary import BinaryValue
+from cocotb.handle import SimHandleBase
+from cocotb.triggers import FallingEdge, ReadOnly, RisingEdge
+
+from verification.arbiters import Arbiter, arbiter_from_spec
+from verification.memory_model import ArrayMemory
+from verification.memory_timing import MemoryTiming, timing_from_spec
+from verification.signals import is_high, read_array, write_array
+
+
+class MemoryReadController:
+    """
+    Takes one read request per cycle, from the port the arbiter picks among the ports asking, and answers each
+    one when the timing model says its data is ready
+
+    A port asks by raising ready with an address (memory_read_ready / memory_address of memory_buffer.sv). Its
+    data and valid are driven once ready, and held until the DUT takes them (valid and ready at an edge). The next
+    beat of the burst follows if the port then asks for the next address, otherwise the rest of the burst is
+    dropped and the port asks again. With the ideal timing the data comes in the same cycle as the request.
+
+    Args
+        read_readys / read_valids / read_addresses: per port arrays, ready is the request of the DUT (a list of
+            the signals for a DUT with separate ports, e.g. [dut.memory_read_ready] for memory_buffer.sv)
+        read_datas: per port arrays of parallel_num_ports words ([num_ports][parallel_num_ports])
+        memory: ArrayMemory the words come from
+        timing: MemoryTiming of the reads, from the MEMORY_TIMING environment variable if None
+        arbiter: Arbiter over the ports, from the MEMORY_ARBITER environment variable if None
+        burst_beats: beats of every request, from the MEMORY_BURST environment variable (default 1) if None
+        read_lengths: per port burst length in beats driven by the DUT, used instead of burst_beats if given
+    """
+
+    def __init__(self, dut: SimHandleBase, clk: SimHandleBase,
+                 read_readys: SimHandleBase, read_valids: SimHandleBase, read_addresses: SimHandleBase, read_datas: SimHandleBase,
+                 num_ports: int, parallel_num_ports: int, memory: ArrayMemory, timing: Optional[MemoryTiming] = None,
+                 arbiter: Optional[Arbiter] = None, burst_beats: Optional[int] = None,
+                 read_lengths: Optional[SimHandleBase] = None):
+        self._dut = dut
+        self._clk = clk
+
+        self._read_readys = read_readys
+        self._read_valids = read_valids
+        self._read_addresses = read_addresses
+        self._read_datas = read_datas
+
+        self._num_ports = num_ports
+        self._parallel_num_ports = parallel_num_ports
+
+        self._memory = memory
+        self.timing = timing if timing is not None else timing_from_spec(os.environ.get("MEMORY_TIMING"))
+        self.arbiter = arbiter if arbiter is not None else arbiter_from_spec(os.environ.get("MEMORY_ARBITER"), num_ports)
+        self._burst_beats = burst_beats if burst_beats is not None else int(os.environ.get("MEMORY_BURST", 1))
+        if self._burst_beats < 1:
+            raise ValueError("A burst has at least 1 beat")
+        self._read_lengths = read_lengths
+        # (address, cycle it is ready, words) of the beats left in the burst of every port, first one is next
+        self._bursts: List[Deque[Tuple[int, int, List[int]]]] = [deque() for _ in range(num_ports)]
+        self._presenting = [False] * num_ports
+        self._cycle = 0
+        self._beats_served = 0
+        self._beats_dropped = 0
+
+        self._coro = None
+
+    def start(self) -> None:
+        """Start monitor"""
+        if self._coro is not None:
+            raise RuntimeError("Monitor already started")
+        self._coro = cocotb.start_soon(self._run())  # Start a coroutine
+
+    def stop(self) -> None:
+        """Stop monitor"""
+        if self._coro is None:
+            raise RuntimeError("Monitor never started")
+        self._coro.kill()
+        self._coro = None
+
+    def set_memory(self, memory: Dict[int, int]):
+        """Set the memory to the array / list that will be passed in
+
+        Shape: {0: 12, 1: 1231241241, ...}
+        """
+        for address, value in memory.items():
+            self._memory[address] = value
+
+    def alter_memory(self, address: int, value: int):
+        self._memory[address] = value
+
+    def get_memory(self) -> ArrayMemory:
+        return self._memory
+
+    def preload(self, address: int, words: Union[Sequence[int], np.ndarray]) -> None:
+        """Backdoor write of words from address, no cycles spent (see backdoor.py)"""
+        self._memory.write(address, words)
+
+    def dump(self, address: int, count: int) -> np.ndarray:
+        """Backdoor read of count words from address"""
+        return self._memory.read(address, count)
+
+    def burst_stats(self) -> Dict[str, Any]:
+        """Handshakes saved by bursts: requests issued against beats served (and beats fetched for nothing)"""
+        requests = self.timing.stats.requests
+        return dict(requests=requests, beats_served=self._beats_served, beats_dropped=self._beats_dropped,
+                    beats_per_request=self._beats_served / requests if requests else None)
+
+    def _drop_burst(self, port: int) -> None:
+        self._beats_dropped += len(self._bursts[port])
+        self._bursts[port].clear()
+        self._presenting[port] = False
+        self.timing.complete()
+
+    def _issue(self, port: int, address: int) -> bool:
+        """Ask the timing model for a burst from address for port, False if refused"""
+        beats = self._burst_beats
+        if self._read_lengths is not None:
+            beats = max(self._read_lengths[port].value.integer, 1)
+        ready_cycles = self.timing.request_burst(self._cycle, address, self._parallel_num_ports, beats)
+        if ready_cycles is None:
+            return False
+        # The whole burst comes out of memory in one slice
+        words = self._memory.read_burst(address, beats, self._parallel_num_ports).tolist()
+        self._bursts[port].extend(
+            ((address + beat * self._parallel_num_ports) % len(self._memory), ready_cycles[beat], words[beat])
+            for beat in range(beats))
+        return True
+
+    async def _run(self) -> None:
+        """
+        Every cycle:
+            - after the rising edge, move on in the bursts whose beat was taken by that edge
+            - once settled (ReadOnly), drop bursts whose port asks for another address than their next beat, and
+              issue the burst of the port the arbiter picks among the ports asking with no burst
+            - at the falling edge, drive data and valid of the next beats that are ready
+            - once settled again, see which of them the next edge takes (valid and ready)
+        We assume the user when reading at index "i", it reads i, i+1, i+2, i+3... to i+Parallel_num_ports-1
+        """
+        taken: List[int] = []
+        while True:
+            await RisingEdge(self._clk)
+            self._cycle += 1
+            for port in taken:
+                self._bursts[port].popleft()
+                self._presenting[port] = False
+                self._beats_served += 1
+                if not self._bursts[port]:
+                    self.timing.complete()
+
+            await ReadOnly()
+            requests = [False] * self._num_ports
+            addresses: List[Optional[int]] = [None] * self._num_ports
+            for port in range(self._num_ports):
+                if not is_high(self._read_readys[port]):
+                    continue
+                addresses[port] = self._read_addresses[port].value.integer
+                burst = self._bursts[port]
+                if burst and burst[0][0] != addresses[port]:
+                    # Not the address the burst guessed
+                    self._drop_burst(port)
+                requests[port] = not burst
+            self.arbiter.observe(self._cycle, requests)
+            # One request per cycle (single command bus), one refused by the timing model asks again next cycle
+            port = self.arbiter.pick(requests)
+            if port is not None and self._issue(port, addresses[port]):
+                self.arbiter.granted(port, self._cycle)
+
+            await FallingEdge(self._clk)
+            for port in range(self._num_ports):
+                burst = self._bursts[port]
+                if burst and not self._presenting[port] and burst[0][1] <= self._cycle:
+                    write_array(self._read_datas[port], burst[0][2])
+                    self._presenting[port] = True
+                self._read_valids[port].value = int(self._presenting[port])
+
+            await ReadOnly()
+            taken = [port for port in range(self._num_ports) if self._presenting[port] and is_high(self._read_readys[port])]
+
+
+class MemoryWriteController:
+    """
+    Takes one write per cycle: write ready is raised on the port the arbiter picks among the ports with a valid
+    write
+
+    Args
+        write_readys / write_valids / write_addresses: per port arrays
+        write_datas: per port arrays of parallel_num_ports words ([num_ports][parallel_num_ports])
+        memory: ArrayMemory the words go to
+        arbiter: Arbiter over the ports, from the MEMORY_ARBITER environment variable if None
+    """
+
+    def __init__(self, dut: SimHandleBase, clk: SimHandleBase,
+                 write_readys: SimHandleBase, write_valids: SimHandleBase, write_addresses: SimHandleBase, write_datas: SimHandleBase,
+                 num_ports: int, parallel_num_ports: int, memory: ArrayMemory, arbiter: Optional[Arbiter] = None):
+        self._dut = dut
+        self._clk = clk
+
+        self._write_readys = write_readys
+        self._write_valids = write_valids
+        self._write_addresses = write_addresses
+        self._write_datas = write_datas
+
+        self._num_ports = num_ports
+        self._parallel_num_ports = parallel_num_ports
+
+        self._memory = memory
+        self.arbiter = arbiter if arbiter is not None else arbiter_from_spec(os.environ.get("MEMORY_ARBITER"), num_ports)
+        self._cycle = 0
+
+        self._coro = None
+
+    def start(self) -> None:
+        """Start monitor"""
+        if self._coro is not None:
+            raise RuntimeError("Monitor already started")
+        self._coro = cocotb.start_soon(self._run())  # Start a coroutine
+
+    def stop(self) -> None:
+        """Stop monitor"""
+        if self._coro is None:
+            raise RuntimeError("Monitor never started")
+        self._coro.kill()
+        self._coro = None
+
+    def set_memory(self, memory: Dict[int, int]):
+        """Set the memory to the array / list that will be passed in
+
+        Shape: {0: 12, 1: 1231241241, ...}
+        """
+        for address, value in memory.items():
+            self._memory[address] = value
+
+    def alter_memory(self, address: int, value: int):
+        self._memory[address] = value
+
+    def get_memory(self) -> ArrayMemory:
+        return self._memory
+
+    def preload(self, address: int, words: Union[Sequence[int], np.ndarray]) -> None:
+        """Backdoor write of words from address, no cycles spent (see backdoor.py)"""
+        self._memory.write(address, words)
+
+    def dump(self, address: int, count: int) -> np.ndarray:
+        """Backdoor read of count words from address"""
+        return self._memory.read(address, count)
+
+    async def _run(self) -> None:
+        """
+        Every cycle:
+            - once settled (ReadOnly), the arbiter picks one of the ports with write valid
+            - at the falling edge, raise write ready on that port only
+            - once settled again, if it is still valid the next edge takes the write
+        """
+        granted: Optional[Tuple[int, List[int]]] = None
+        while True:
+            await RisingEdge(self._clk)
+            self._cycle += 1
+            if granted is not None:
+                self._memory.write(*granted)
+                granted = None
+
+            await ReadOnly()
+            port = self.arbiter.arbitrate(self._cycle, [is_high(self._write_valids[i]) for i in range(self._num_ports)])
+
+            await FallingEdge(self._clk)
+            for i in range(self._num_ports):
+                self._write_readys[i].value = 1 if i == port else 0
+
+            await ReadOnly()
+            if port is not None and is_high(self._write_valids[port]):
+                address = self._write_addresses[port].value.integer
+                granted = (address, [value.integer for value in read_array(self._write_datas[port])])
+
+
+class SignalStub:
+    """Stands in for a signal handle on the Python side: .value reads back as a BinaryValue, writes take effect at once"""
+
+    def __init__(self, value: int = 0):
+        self.value = value
+
+    @property
+    def value(self) -> BinaryValue:
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._value = BinaryValue(int(value))
+
+
+class StreamingReader:
+    """
+    Read port driven from Python, for a MemoryReadController to serve next to the DUT's ports: always asking,
+    for address, address + parallel_num_ports, ... (wrapping at memory_size), one read after the other like
+    memory_buffer.sv
+
+    Pass read_ready / read_valid / read_address / read_data along with the DUT's ports to the controller.
+    """
+
+    def __init__(self, clk: SimHandleBase, parallel_num_ports: int, memory_size: int, address: int = 0):
+        self._clk = clk
+        self._parallel_num_ports = parallel_num_ports
+        self._memory_size = memory_size
+        self.read_ready = SignalStub(1)
+        self.read_valid = SignalStub(0)
+        self.read_address = SignalStub(address % memory_size)
+        self.read_data = [SignalStub(0) for _ in range(parallel_num_ports)]
+        self.reads = 0
+
+        self._coro = None
+
+    def start(self) -> None:
+        """Start monitor"""
+        if self._coro is not None:
+            raise RuntimeError("Monitor already started")
+        self._coro = cocotb.start_soon(self._run())  # Start a coroutine
+
+    def stop(self) -> None:
+        """Stop monitor"""
+        if self._coro is None:
+            raise RuntimeError("Monitor never started")
+        self._coro.kill()
+        self._coro = None
+
+    async def _run(self) -> None:
+        """The controller drives valid at the falling edge, a read taken by the next rising edge moves the address on"""
+        while True:
+            await FallingEdge(self._clk)
+            await ReadOnly()
+            taken = is_high(self.read_valid)
+            await RisingEdge(self._clk)
+            if taken:
+                self.reads += 1
+                self.read_address.value = (self.read_address.value.integer + self._parallel_num_ports) % self._memory_size
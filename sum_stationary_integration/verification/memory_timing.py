@@ -0,0 +1,168 @@
+"""
+Timing models for the fake memory behind MemoryReadController.
+
+The controller asks the model when the data of every read it takes will be ready:
+
+    MemoryTiming()   ideal memory, data in the same cycle as the request, no limit (what the HDL assumes,
+                     "assuming memory read have no delay" in memory_buffer.sv)
+    DramTiming(...)  fixed or random latency, cap on outstanding reads, banks that stay busy after an access
+                     (bank conflicts) and a bytes per cycle cap on the data bus
+
+A burst (request_burst) pays the latency, the bank access and the outstanding slot once for all its beats.
+
+Benches pick the model with the MEMORY_TIMING environment variable (Makefile or `sweep.py --memory-timing`),
+parsed by timing_from_spec():
+
+    MEMORY_TIMING="latency=40,jitter=8,outstanding=8,banks=8,bank_busy=4,bytes_per_cycle=16,word_bytes=1"
+"""
+
+import math
+import random
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class TimingStats:
+    """What a timing model saw over a run"""
+    requests: int = 0
+    beats: int = 0                # more than requests with bursts
+    total_latency: int = 0
+    max_latency: int = 0
+    outstanding_stalls: int = 0   # cycles a request was refused because too many reads were in flight
+    bank_conflicts: int = 0       # requests that waited for their bank
+    bank_wait_cycles: int = 0
+    bus_wait_cycles: int = 0      # cycles data waited for the bandwidth cap
+
+    def as_dict(self) -> Dict[str, Any]:
+        mean = self.total_latency / self.requests if self.requests else None
+        return dict(requests=self.requests, beats=self.beats, latency_mean=mean, latency_max=self.max_latency,
+                    outstanding_stalls=self.outstanding_stalls, bank_conflicts=self.bank_conflicts,
+                    bank_wait_cycles=self.bank_wait_cycles, bus_wait_cycles=self.bus_wait_cycles)
+
+
+class MemoryTiming:
+    """Ideal memory: every read is taken right away and its data is there in the same cycle"""
+
+    def __init__(self):
+        self.stats = TimingStats()
+        self.outstanding = 0
+
+    def request(self, cycle: int, address: int, words: int) -> Optional[int]:
+        """
+        Issue a read of words words at address in cycle
+
+        Returns the cycle the data is driven on the bus (cycle itself for no latency), or None if the memory
+        cannot take the read this cycle and it should be asked again later.
+        """
+        ready_cycles = self.request_burst(cycle, address, words, 1)
+        return None if ready_cycles is None else ready_cycles[0]
+
+    def request_burst(self, cycle: int, address: int, beat_words: int, beats: int) -> Optional[List[int]]:
+        """
+        Issue a burst of beats reads of beat_words words from address in cycle: one request, the latency is paid
+        once and the beats follow on consecutive cycles (as the bandwidth allows)
+
+        Returns the cycle every beat is ready, or None like request(). The burst holds one outstanding slot.
+        """
+        ready_cycles = self._schedule(cycle, address, beat_words, beats)
+        if ready_cycles is None:
+            return None
+        self.outstanding += 1
+        latency = ready_cycles[0] - cycle
+        self.stats.requests += 1
+        self.stats.beats += beats
+        self.stats.total_latency += latency
+        self.stats.max_latency = max(self.stats.max_latency, latency)
+        return ready_cycles
+
+    def complete(self) -> None:
+        """The data of one read (or burst) was taken by the DUT or dropped, its slot is free again"""
+        self.outstanding -= 1
+
+    def _schedule(self, cycle: int, address: int, beat_words: int, beats: int) -> Optional[List[int]]:
+        return [cycle + beat for beat in range(beats)]
+
+
+@dataclass
+class DramConfig:
+    """
+    Args
+        latency: cycles from request to data
+        jitter: random extra latency, uniform in 0..jitter
+        outstanding: reads in flight at most (issued and not taken yet), 0 for no limit
+        banks: number of banks, consecutive interleave words go to the same bank
+        interleave: words per bank before moving on to the next one
+        bank_busy: cycles a bank cannot start another access after starting one, 0 for no conflicts
+        bytes_per_cycle: data bus bandwidth, 0 for no limit
+        word_bytes: bytes of one word, for the bandwidth cap
+        seed: seed of the jitter
+    """
+    latency: int = 0
+    jitter: int = 0
+    outstanding: int = 0
+    banks: int = 1
+    interleave: int = 4
+    bank_busy: int = 0
+    bytes_per_cycle: int = 0
+    word_bytes: int = 1
+    seed: Optional[int] = None
+
+
+class DramTiming(MemoryTiming):
+    """DRAM-like memory, see DramConfig for the knobs"""
+
+    def __init__(self, config: DramConfig):
+        super().__init__()
+        if config.banks < 1 or config.interleave < 1:
+            raise ValueError("banks and interleave should be at least 1")
+        self.config = config
+        self._random = random.Random(config.seed)
+        self._bank_free: List[int] = [0] * config.banks
+        self._bus_free = 0
+
+    def _schedule(self, cycle: int, address: int, beat_words: int, beats: int) -> Optional[List[int]]:
+        config = self.config
+        if config.outstanding and self.outstanding >= config.outstanding:
+            self.stats.outstanding_stalls += 1
+            return None
+
+        # The access starts once its bank is done with the previous one
+        bank = (address // config.interleave) % config.banks
+        start = max(cycle, self._bank_free[bank])
+        if start > cycle:
+            self.stats.bank_conflicts += 1
+            self.stats.bank_wait_cycles += start - cycle
+        if config.bank_busy:
+            self._bank_free[bank] = start + config.bank_busy
+
+        first_cycle = start + config.latency + (self._random.randint(0, config.jitter) if config.jitter else 0)
+        if not config.bytes_per_cycle:
+            # One beat per cycle, what the bus to the DUT moves anyway
+            return [first_cycle + beat for beat in range(beats)]
+        # The data bus moves bytes_per_cycle, transfers go out one after the other
+        beat_bytes = beat_words * config.word_bytes
+        bus_start = max(first_cycle, self._bus_free)
+        self.stats.bus_wait_cycles += bus_start - first_cycle
+        ready_cycles = [bus_start + math.ceil((beat + 1) * beat_bytes / config.bytes_per_cycle) - 1 for beat in range(beats)]
+        self._bus_free = ready_cycles[-1] + 1
+        return ready_cycles
+
+
+def timing_from_spec(spec: Optional[str]) -> MemoryTiming:
+    """
+    "" / "ideal" gives MemoryTiming(), otherwise comma separated DramConfig fields:
+    "latency=40,jitter=8,outstanding=8"
+    """
+    spec = (spec or "").strip()
+    if spec in ("", "ideal"):
+        return MemoryTiming()
+    names = {config_field.name for config_field in fields(DramConfig)}
+    values = {}
+    for item in spec.split(","):
+        name, _, value = item.partition("=")
+        name = name.strip()
+        if name not in names or not value:
+            raise ValueError(f"Bad memory timing {item!r}, expected NAME=value with NAME in {', '.join(sorted(names))}")
+        values[name] = int(value, 0)
+    return DramTiming(DramConfig(**values))
@@ -0,0 +1,781 @@
+"""
+Transaction-level, cycle-approximate model of the top.sv grid.
+
+Every module of the design is a python generator process that exchanges transactions over ready/valid
+Channels, scheduled by a small discrete-event Simulator. A transaction is a whole instruction, pass or
+tile instead of a single beat, so a 1024 x 1024 multiply takes seconds to model instead of hours of RTL
+simulation.
+
+Timing (in cycles) follows the RTL:
+    controller                  2 cycles after the handshake, hands out one instruction per unit per cycle.
+                                A row blocks stay in their memory_buffer and are repeated once per B col
+                                block, B col blocks are sent once per A row block. done is up 2 cycles
+                                after the last writer completes
+    memory_buffer               fetches length * N words at the memory read bandwidth (from the cycle after the
+                                handshake, streaming from the first beat), then streams one pass
+                                of length beats to each of its processors, one beat per cycle, one ID at a
+                                time (all of them at once with broadcast, BROADCAST=1). The next instruction is
+                                only accepted after the last repeat, or (prefetch, PREFETCH=1) right away into a
+                                second bank, read from memory while the first one is still being repeated
+    processor                   takes a pass from both its A and B buffer, needs 2N cycles after the last
+                                beat to drain the systolic array, then hands the result to
+                                output_streaming_registers (only once those are empty)
+    output_streaming_registers  streams N rows, one per handshake with the output_memory_writer
+    output_memory_writer        takes one row at a time and writes it with N / PARALLEL_DATA_STREAMING_SIZE
+                                memory beats before it is ready for the next row
+    memory                      one shared read and one shared write port (like memory_simulator.py)
+
+With chunk_length (K_SPLIT) the memory buffers get one instruction per chunk of chunk_length vectors, sent once,
+and the processors run through the chunks of a tile like one long pass, only draining after the final one.
+
+Usage:
+    report = simulate_top(GridConfig(n=4, rows_processors=4, cols_processors=4,
+                                     parallel_data_streaming_size=4, matrix_length=1024))
+    print(report.summary())
+"""
+
+import heapq
+import itertools
+import math
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Generator, List, Optional, Tuple
+
+
+class Event:
+    """Something a process can wait on (by yielding it), triggered once with a value"""
+
+    def __init__(self, sim: "Simulator"):
+        self.sim = sim
+        self.value = None
+        self.triggered = False
+        self.callbacks: Optional[List[Callable[["Event"], None]]] = []  # None once the event has fired
+
+    def succeed(self, value=None) -> "Event":
+        """Trigger the event, waiting processes resume in the current cycle"""
+        if self.triggered:
+            raise RuntimeError("Event already triggered")
+        self.triggered = True
+        self.value = value
+        self.sim._schedule(self, self.sim.now)
+        return self
+
+    def _fire(self) -> None:
+        callbacks, self.callbacks = self.callbacks, None
+        for callback in callbacks:
+            callback(self)
+
+
+class Process(Event):
+    """Runs a generator that yields Events, resuming it with their values. Triggers when the generator returns."""
+
+    def __init__(self, sim: "Simulator", generator: Generator):
+        super().__init__(sim)
+        self._generator = generator
+        start = Event(sim)
+        start.callbacks.append(self._resume)
+        start.succeed()
+
+    def _resume(self, event: Event) -> None:
+        value = event.value
+        while True:
+            try:
+                target = self._generator.send(value)
+            except StopIteration as stop:
+                self.succeed(stop.value)
+                return
+            if target.callbacks is None:
+                # Already fired, carry on straight away
+                value = target.value
+                continue
+            target.callbacks.append(self._resume)
+            return
+
+
+class Simulator:
+    """Discrete-event kernel, time is counted in clock cycles"""
+
+    def __init__(self):
+        self.now = 0
+        self._queue: List[Tuple[int, int, Event]] = []
+        self._sequence = itertools.count()
+
+    def _schedule(self, event: Event, time: int) -> None:
+        heapq.heappush(self._queue, (time, next(self._sequence), event))
+
+    def process(self, generator: Generator) -> Process:
+        """Start a process"""
+        return Process(self, generator)
+
+    def timeout(self, cycles: int) -> Event:
+        """Event that fires cycles from now"""
+        event = Event(self)
+        event.triggered = True
+        self._schedule(event, self.now + cycles)
+        return event
+
+    def run(self, until: Optional[int] = None) -> None:
+        """Run until nothing is left to do (or until the given cycle)"""
+        while self._queue:
+            time, _, event = self._queue[0]
+            if until is not None and time > until:
+                self.now = until
+                return
+            heapq.heappop(self._queue)
+            self.now = time
+            event._fire()
+
+
+class Channel:
+    """
+    Ready/valid link between two components
+
+    put() triggers once the receiver has taken the item (the cycle ready && valid), get() triggers with the item.
+    depth > 0 adds a FIFO so the sender can run ahead of the receiver by depth items (0 = plain handshake).
+    """
+
+    def __init__(self, sim: Simulator, depth: int = 0):
+        self.sim = sim
+        self.depth = depth
+        self._items: Deque = deque()
+        self._putters: Deque[Tuple[object, Event]] = deque()
+        self._getters: Deque[Event] = deque()
+
+    def put(self, item) -> Event:
+        event = Event(self.sim)
+        if self._getters:
+            self._getters.popleft().succeed(item)
+            event.succeed()
+        elif len(self._items) < self.depth:
+            self._items.append(item)
+            event.succeed()
+        else:
+            self._putters.append((item, event))
+        return event
+
+    def get(self) -> Event:
+        event = Event(self.sim)
+        if self._items:
+            event.succeed(self._items.popleft())
+            if self._putters:
+                item, put_event = self._putters.popleft()
+                self._items.append(item)
+                put_event.succeed()
+        elif self._putters:
+            item, put_event = self._putters.popleft()
+            put_event.succeed()
+            event.succeed(item)
+        else:
+            self._getters.append(event)
+        return event
+
+
+class Component:
+    """Base of the modelled modules, keeps a per-reason count of cycles spent stalled"""
+
+    def __init__(self, sim: Simulator, name: str):
+        self.sim = sim
+        self.name = name
+        self.busy = 0  # cycles spent moving data
+        self.stalls: Dict[str, int] = defaultdict(int)
+
+    def _wait(self, event: Event, reason: str):
+        """Wait for event, charging the cycles spent to reason"""
+        start = self.sim.now
+        value = yield event
+        self.stalls[reason] += self.sim.now - start
+        return value
+
+
+class Memory:
+    """Shared memory with one read and one write port, each moving words_per_cycle words per cycle"""
+
+    def __init__(self, sim: Simulator, read_words_per_cycle: int, write_words_per_cycle: int, read_latency: int = 0):
+        self.sim = sim
+        self.read_words_per_cycle = read_words_per_cycle
+        self.write_words_per_cycle = write_words_per_cycle
+        self.read_latency = read_latency
+        self.read_busy = 0
+        self.write_busy = 0
+        self._read_free_at = 0
+        self._write_free_at = 0
+
+    def read(self, words: int, earliest: Optional[int] = None) -> int:
+        """
+        Reserve the read port for words (first come first served) from earliest (now if None), returns the cycle the
+        last word arrives
+        """
+        start = max(self.sim.now if earliest is None else earliest, self._read_free_at)
+        cycles = math.ceil(words / self.read_words_per_cycle)
+        self._read_free_at = start + cycles
+        self.read_busy += cycles
+        return self._read_free_at + self.read_latency
+
+    def first_read_cycles(self, words: int) -> int:
+        """Cycles for words to arrive with the read port all to themselves"""
+        return math.ceil(words / self.read_words_per_cycle) + self.read_latency
+
+    def write(self, words: int) -> int:
+        """Reserve the write port for words (first come first served), returns the cycle the last word is written"""
+        start = max(self.sim.now, self._write_free_at)
+        cycles = math.ceil(words / self.write_words_per_cycle)
+        self._write_free_at = start + cycles
+        self.write_busy += cycles
+        return self._write_free_at
+
+
+class Pass:
+    """One repeat of a memory_buffer: length beats to a processor, done fires with the last beat"""
+
+    def __init__(self, sim: Simulator, length: int, final: bool = True):
+        self.length = length
+        self.final = final  # K_SPLIT: last chunk of the tile, the processor only drains after this one
+        self.done = Event(sim)
+        self.taken = Event(sim)  # the processor took the last beat (later than done if it held it back)
+
+    def take(self) -> None:
+        """The last beat was taken. A broadcast pass goes to several processors, the first one fires taken"""
+        if not self.taken.triggered:
+            self.taken.succeed()
+
+
+class Tile:
+    """An N x N result, rows_taken fires when the last row left output_streaming_registers"""
+
+    def __init__(self, sim: Simulator):
+        self.rows_taken = Event(sim)
+
+
+class MemoryBufferModel(Component):
+    """
+    memory_buffer: fetch a row / col block once, broadcast it repeats times to its processors
+
+    broadcast models BROADCAST=1: a beat goes to every processor in the same cycle instead of one ID at a time.
+    prefetch models PREFETCH=1: two banks, the next instruction is taken and read while the current one repeats.
+    """
+
+    def __init__(self, sim: Simulator, name: str, n: int, memory: Memory, instructions: Channel, outputs: List[Channel],
+                 broadcast: bool = False, prefetch: bool = False):
+        super().__init__(sim, name)
+        self.n = n
+        self.memory = memory
+        self.instructions = instructions
+        self.outputs = outputs
+        self.broadcast = broadcast
+        self.prefetch = prefetch
+
+    def run(self):
+        if self.prefetch:
+            yield from self._run_prefetching()
+        while True:
+            address, length, repeats, final = yield from self._wait(self.instructions.get(), "no_instruction")
+            first, fetched = self._read(length)
+            yield from self._stream(length, repeats, final, first, fetched)
+
+    def _run_prefetching(self):
+        """Streams the two banks in turn while a _fetch process fills whichever is free"""
+        free_banks = Channel(self.sim, depth=2)
+        loaded_banks = Channel(self.sim, depth=2)
+        for _ in range(2):
+            free_banks.put(None)
+        self.sim.process(self._fetch(free_banks, loaded_banks))
+        while True:
+            length, repeats, final, first, fetched = yield from self._wait(loaded_banks.get(), "no_instruction")
+            yield from self._stream(length, repeats, final, first, fetched)
+            free_banks.put(None)
+
+    def _fetch(self, free_banks: Channel, loaded_banks: Channel):
+        """Takes an instruction whenever a bank is free, its reads queue up behind the ones of the other bank"""
+        while True:
+            yield free_banks.get()
+            address, length, repeats, final = yield self.instructions.get()
+            first, fetched = self._read(length)
+            yield loaded_banks.put((length, repeats, final, first, fetched))
+
+    def _read(self, length: int) -> Tuple[int, int]:
+        """
+        Reads of an instruction: cycles the words of the first beat and the last word arrive. They start the cycle
+        after the instruction handshake (memory_read_ready comes from the registered instruction). The memory serves
+        the ports in turns, so the first beat does not wait for the blocks other buffers reserved before it
+        """
+        fetched = self.memory.read(length * self.n, self.sim.now + 1)
+        first = self.sim.now + 1 + self.memory.first_read_cycles(self.n)
+        return min(first, fetched), fetched
+
+    def _stream(self, length: int, repeats: int, final: bool, first: int, fetched: int):
+        """
+        repeats passes of length beats, the first beat of the first one not before first (its words read) and its
+        last beat not before fetched (the last word read)
+        """
+        for _ in range(repeats):
+            data_pass = Pass(self.sim, length, final)
+            for output in self.outputs:
+                yield from self._wait(output.put(data_pass), "processor_not_ready")
+            # One beat per cycle, one processor ID at a time unless broadcast
+            stream_cycles = length if self.broadcast else length * len(self.outputs)
+            last_beat = self.sim.now + stream_cycles - 1
+            ready = max(first + stream_cycles, fetched + 1)
+            if last_beat < ready:
+                # Cannot send a beat before it was read from memory
+                self.stalls["memory"] += ready - last_beat
+                last_beat = ready
+            self.busy += stream_cycles
+            yield self.sim.timeout(last_beat - self.sim.now)
+            data_pass.done.succeed()
+            # The processor takes the last beat together with the other side's, the next pass starts after that
+            yield from self._wait(data_pass.taken, "processor_not_ready")
+            yield self.sim.timeout(1)
+
+
+class ProcessorModel(Component):
+    """
+    processor: systolic array plus output_streaming_registers (two processes)
+
+    double_buffer models DOUBLE_BUFFER=1: the next pass streams in right after the last beat, only its own last
+    beat waits until the previous tile left the shadow bank for the output registers.
+    """
+
+    def __init__(self, sim: Simulator, name: str, n: int, a_input: Channel, b_input: Channel, output: Channel,
+                 double_buffer: bool = False):
+        super().__init__(sim, name)
+        self.n = n
+        self.a_input = a_input
+        self.b_input = b_input
+        self.output = output
+        self.double_buffer = double_buffer
+        self.tiles = 0
+        self._result = Channel(sim)  # systolic array -> output_streaming_registers
+        self._bank: Optional[Process] = None  # tile in the shadow bank, done once the output registers took it
+
+    def run(self):
+        """Systolic array"""
+        if self.double_buffer:
+            yield from self._run_double_buffered()
+        while True:
+            a_pass = yield from self._wait(self.a_input.get(), "waiting_a")
+            b_pass = yield from self._wait(self.b_input.get(), "waiting_b")
+            start = self.sim.now
+            # Both sides must be valid together, so the slower stream sets the pace
+            yield a_pass.done
+            yield b_pass.done
+            length = max(a_pass.length, b_pass.length)
+            self.busy += length
+            self.stalls["input_gaps"] += self.sim.now + 1 - start - length
+            a_pass.take()
+            b_pass.take()
+            if not a_pass.final:
+                # A chunk before the final one: the accumulators carry on with the next chunk
+                yield self.sim.timeout(1)
+                continue
+            # Counter counts down 2N cycles after the last beat before result_valid loads the output registers
+            yield self.sim.timeout(2 * self.n)
+            self.stalls["drain"] += 2 * self.n
+            yield from self._wait(self._result.put(Tile(self.sim)), "output_registers_full")
+            yield self.sim.timeout(1)
+            self.tiles += 1
+
+    def _run_double_buffered(self):
+        while True:
+            a_pass = yield from self._wait(self.a_input.get(), "waiting_a")
+            b_pass = yield from self._wait(self.b_input.get(), "waiting_b")
+            start = self.sim.now
+            yield a_pass.done
+            yield b_pass.done
+            length = max(a_pass.length, b_pass.length)
+            self.busy += length
+            self.stalls["input_gaps"] += self.sim.now + 1 - start - length
+            if not a_pass.final:
+                a_pass.take()
+                b_pass.take()
+                yield self.sim.timeout(1)
+                continue
+            if self._bank is not None:
+                # input_ready stays low on the last beat while the shadow bank still holds the previous tile
+                yield from self._wait(self._bank, "bank_full")
+            a_pass.take()
+            b_pass.take()
+            self._bank = self.sim.process(self._drain_bank())
+            yield self.sim.timeout(1)
+
+    def _drain_bank(self):
+        """The last unit snapshots 2N cycles after the last beat, bank_valid follows, then the output registers take it"""
+        yield self.sim.timeout(2 * self.n + 1)
+        yield from self._wait(self._result.put(Tile(self.sim)), "output_registers_full")
+        self.tiles += 1
+        # The next last beat can go in from the cycle after
+        yield self.sim.timeout(1)
+
+    def run_output(self):
+        """output_streaming_registers"""
+        while True:
+            tile = yield self._result.get()
+            yield from self._wait(self.output.put(tile), "writer_not_ready")
+            yield tile.rows_taken
+            yield self.sim.timeout(1)
+
+
+class OutputMemoryWriterModel(Component):
+    """output_memory_writer: one address per tile, one row at a time into memory"""
+
+    def __init__(self, sim: Simulator, name: str, n: int, parallel_data_streaming_size: int, memory: Memory,
+                 instructions: Channel, tiles: Channel, completions: Channel):
+        super().__init__(sim, name)
+        self.n = n
+        self.write_cycles = math.ceil(n / parallel_data_streaming_size)  # memory beats per row
+        self.memory = memory
+        self.instructions = instructions
+        self.tiles = tiles
+        self.completions = completions
+
+    def run(self):
+        while True:
+            address = yield from self._wait(self.instructions.get(), "no_instruction")
+            tile = yield from self._wait(self.tiles.get(), "waiting_processor")
+            # Row k is read at start + 1 + k * (1 + write_cycles), then written over write_cycles cycles
+            row_cycles = 1 + self.write_cycles
+            last_write = self.sim.now + self.n * row_cycles
+            written = self.memory.write(self.n * self.n)
+            if written > last_write:
+                self.stalls["memory"] += written - last_write
+                last_write = written
+            self.busy += self.n * row_cycles
+            yield self.sim.timeout(last_write - self.write_cycles - self.sim.now)
+            tile.rows_taken.succeed()
+            yield self.sim.timeout(self.write_cycles)
+            yield from self._wait(self.completions.put(address), "controller_not_ready")
+            yield self.sim.timeout(1)
+
+
+@dataclass
+class GridConfig:
+    """top.sv parameters (matrix_length is the runtime matrix_length_input)"""
+    n: int = 4
+    rows_processors: int = 4
+    cols_processors: int = 4
+    parallel_data_streaming_size: int = 4
+    matrix_length: int = 64
+    memory_read_words_per_cycle: Optional[int] = None  # defaults to PARALLEL_DATA_STREAMING_SIZE
+    memory_write_words_per_cycle: Optional[int] = None  # defaults to PARALLEL_DATA_STREAMING_SIZE
+    memory_read_latency: int = 0
+    chunk_length: Optional[int] = None  # K_SPLIT: vectors per memory_buffer instruction (M), whole blocks if None
+    broadcast: bool = False  # BROADCAST: memory buffers send every beat to all their processors at once
+    prefetch: bool = False  # PREFETCH: memory buffers fetch the next instruction into a second bank during the repeats
+    a_memory_addr: int = 0
+    b_memory_addr: int = 0
+    c_memory_addr: int = 0
+
+    def validate(self) -> None:
+        for name in ("n", "rows_processors", "cols_processors", "parallel_data_streaming_size"):
+            value = getattr(self, name)
+            if value <= 0 or value & (value - 1):
+                raise ValueError(f"{name}={value} should be a power of 2")
+        if self.matrix_length % (self.n * self.rows_processors) or self.matrix_length % (self.n * self.cols_processors):
+            raise ValueError(f"matrix_length={self.matrix_length} should be a multiple of N * ROWS_PROCESSORS and N * COLS_PROCESSORS")
+        if self.n % self.parallel_data_streaming_size:
+            raise ValueError("N should be an integer multiple of PARALLEL_DATA_STREAMING_SIZE")
+        if self.chunk_length is not None and (self.chunk_length <= 0 or self.matrix_length % self.chunk_length):
+            raise ValueError(f"matrix_length={self.matrix_length} should be a multiple of chunk_length={self.chunk_length}")
+
+    @property
+    def buffer_words(self) -> int:
+        """Words each memory_buffer has to store"""
+        return self.n * (self.chunk_length or self.matrix_length)
+
+
+@dataclass
+class PerformanceReport:
+    """Predicted cycle count and the stall breakdown of every component"""
+    config: GridConfig
+    cycles: int
+    macs: int
+    busy: Dict[str, int] = field(default_factory=dict)
+    stalls: Dict[str, Dict[str, int]] = field(default_factory=dict)  # component name -> reason -> cycles
+    memory_read_busy: int = 0  # cycles the shared read port moved data
+
+    @property
+    def macs_per_cycle(self) -> float:
+        return self.macs / self.cycles if self.cycles else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the peak ROWS_PROCESSORS * COLS_PROCESSORS * N * N MACs per cycle"""
+        config = self.config
+        return self.macs_per_cycle / (config.rows_processors * config.cols_processors * config.n * config.n)
+
+    def stall_summary(self) -> Dict[str, Dict[str, float]]:
+        """Stall cycles per reason, averaged over every instance of a module (grouped by name prefix)"""
+        totals: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        counts: Dict[str, int] = defaultdict(int)
+        for name, reasons in self.stalls.items():
+            kind = name.split("[")[0]
+            counts[kind] += 1
+            for reason, cycles in reasons.items():
+                totals[kind][reason] += cycles
+        return {kind: {reason: cycles / counts[kind] for reason, cycles in reasons.items()} for kind, reasons in totals.items()}
+
+    def summary(self) -> str:
+        config = self.config
+        lines = [
+            f"{config.matrix_length}x{config.matrix_length} with N={config.n} ROWS_PROCESSORS={config.rows_processors} "
+            f"COLS_PROCESSORS={config.cols_processors} PARALLEL_DATA_STREAMING_SIZE={config.parallel_data_streaming_size}",
+            f"\tmemory_buffer storage: {config.buffer_words} words"
+            + (f" (chunks of {config.chunk_length})" if config.chunk_length else "")
+            + (", broadcast" if config.broadcast else ", one processor ID at a time")
+            + (", prefetching the next instruction" if config.prefetch else ""),
+            f"\tcycles: {self.cycles}",
+            f"\tMACs/cycle: {self.macs_per_cycle:.2f} (utilization {self.utilization:.1%})",
+            f"\tmemory read port: busy {self.memory_read_busy} cycles, idle {self.cycles - self.memory_read_busy}",
+        ]
+        for kind, reasons in self.stall_summary().items():
+            breakdown = ", ".join(f"{reason}={cycles:.0f}" for reason, cycles in sorted(reasons.items()))
+            lines.append(f"\t{kind} stalls (average cycles): {breakdown}")
+        return "\n".join(lines)
+
+
+def simulate_top(config: GridConfig) -> PerformanceReport:
+    """
+    Model one matrix_length x matrix_length multiply on the top.sv grid
+
+    test_top checks it against top.sv with an ideal memory: within 5% plus 16 cycles of pipeline latency, 15% with
+    chunk_length and no prefetch (the RTL memory idles while the buffers take their next chunk, this one does not).
+    No model of double_buffer / input_fifo_depth here.
+    """
+    config.validate()
+    sim = Simulator()
+    n, rows, cols, length = config.n, config.rows_processors, config.cols_processors, config.matrix_length
+    memory = Memory(
+        sim,
+        read_words_per_cycle=config.memory_read_words_per_cycle or config.parallel_data_streaming_size,
+        write_words_per_cycle=config.memory_write_words_per_cycle or config.parallel_data_streaming_size,
+        read_latency=config.memory_read_latency,
+    )
+
+    # Channels, a_links[i][j] goes from A buffer i to processor (i, j), b_links[i][j] from B buffer j
+    a_links = [[Channel(sim) for _ in range(cols)] for _ in range(rows)]
+    b_links = [[Channel(sim) for _ in range(cols)] for _ in range(rows)]
+    tile_links = [[Channel(sim) for _ in range(cols)] for _ in range(rows)]
+    a_instructions = [Channel(sim) for _ in range(rows)]
+    b_instructions = [Channel(sim) for _ in range(cols)]
+    writer_instructions = [[Channel(sim) for _ in range(cols)] for _ in range(rows)]
+    writer_completions = [[Channel(sim) for _ in range(cols)] for _ in range(rows)]
+
+    components: List[Component] = []
+    for i in range(rows):
+        buffer = MemoryBufferModel(sim, f"a_memory_buffer[{i}]", n, memory, a_instructions[i], a_links[i], config.broadcast,
+                                   config.prefetch)
+        components.append(buffer)
+        sim.process(buffer.run())
+    for j in range(cols):
+        buffer = MemoryBufferModel(sim, f"b_memory_buffer[{j}]", n, memory, b_instructions[j], [b_links[i][j] for i in range(rows)],
+                                   config.broadcast, config.prefetch)
+        components.append(buffer)
+        sim.process(buffer.run())
+    for i in range(rows):
+        for j in range(cols):
+            processor = ProcessorModel(sim, f"processor[{i}][{j}]", n, a_links[i][j], b_links[i][j], tile_links[i][j])
+            writer = OutputMemoryWriterModel(sim, f"output_memory_writer[{i}][{j}]", n, config.parallel_data_streaming_size,
+                                             memory, writer_instructions[i][j], tile_links[i][j], writer_completions[i][j])
+            components += [processor, writer]
+            sim.process(processor.run())
+            sim.process(processor.run_output())
+            sim.process(writer.run())
+
+    # Controller: every unit gets its own instruction stream
+    row_groups = length // (n * rows)  # row blocks per A buffer
+    col_groups = length // (n * cols)  # col blocks per B buffer
+    block_size = n * length
+
+    def issue(channel: Channel, instructions):
+        # in_operation_register, then the instruction counters / registers, before the first valid
+        yield sim.timeout(2)
+        for instruction in instructions:
+            yield channel.put(instruction)
+            yield sim.timeout(1)
+
+    def collect(channel: Channel, count: int):
+        for _ in range(count):
+            yield channel.get()
+
+    def chunks(address: int):
+        """K_SPLIT instructions of one block, chunk c starts c * chunk_length vectors in"""
+        chunk_length = config.chunk_length
+        count = length // chunk_length
+        return [(address + chunk * chunk_length * n, chunk_length, 1, chunk == count - 1) for chunk in range(count)]
+
+    finished = []
+    if config.chunk_length is None:
+        for i in range(rows):
+            sim.process(issue(a_instructions[i], (
+                (config.a_memory_addr + (row_group * rows + i) * block_size, length, col_groups, True)
+                for row_group in range(row_groups)
+            )))
+        for j in range(cols):
+            sim.process(issue(b_instructions[j], (
+                (config.b_memory_addr + (col_group * cols + j) * block_size, length, 1, True)
+                for _ in range(row_groups) for col_group in range(col_groups)
+            )))
+    else:
+        # A chunk cannot be repeated for the next col group, the processors would mix two tiles, so the A row
+        # block is fetched again for every col group
+        for i in range(rows):
+            sim.process(issue(a_instructions[i], (
+                instruction
+                for row_group in range(row_groups) for _ in range(col_groups)
+                for instruction in chunks(config.a_memory_addr + (row_group * rows + i) * block_size)
+            )))
+        for j in range(cols):
+            sim.process(issue(b_instructions[j], (
+                instruction
+                for _ in range(row_groups) for col_group in range(col_groups)
+                for instruction in chunks(config.b_memory_addr + (col_group * cols + j) * block_size)
+            )))
+    for i in range(rows):
+        for j in range(cols):
+            sim.process(issue(writer_instructions[i][j], (
+                config.c_memory_addr + (group * rows * cols + i * cols + j) * n * n
+                for group in range(row_groups * col_groups)
+            )))
+            finished.append(sim.process(collect(writer_completions[i][j], row_groups * col_groups)))
+
+    done = []
+
+    def wait_done():
+        for process in finished:
+            yield process
+        # Completion counters, then done_register
+        done.append(sim.now + 2)
+
+    sim.process(wait_done())
+    sim.run()
+    if not done:
+        raise RuntimeError("Model deadlocked before every tile was written")
+
+    return PerformanceReport(
+        config=config,
+        cycles=done[0],
+        macs=length ** 3,
+        busy={component.name: component.busy for component in components},
+        stalls={component.name: dict(component.stalls) for component in components},
+        memory_read_busy=memory.read_busy,
+    )
+
+
+def simulate_processor(n: int, inner_dimension: int, num_tiles: int, double_buffer: bool = False,
+                       chunk_length: Optional[int] = None, input_fifo_depth: int = 0) -> int:
+    """
+    Model processor_tb with steady input and output: cycles from the first input handshake to the last output row
+
+    chunk_length sends every tile in chunks (K_SPLIT). input_fifo_depth models INPUT_FIFO_DEPTH: a beat reaches the
+    array from the FIFO head the cycle after its handshake, and a 1 beat FIFO is not written while it is read (a
+    beat every other cycle). Used by the processor bench to check this model against the RTL.
+    """
+    chunk_length = chunk_length or inner_dimension
+    beat_cycles = 2 if input_fifo_depth == 1 else 1
+    sim = Simulator()
+    a_input, b_input, output = Channel(sim), Channel(sim), Channel(sim)
+    processor = ProcessorModel(sim, "processor", n, a_input, b_input, output, double_buffer=double_buffer)
+    sim.process(processor.run())
+    sim.process(processor.run_output())
+    first_input = []
+    last_output = []
+
+    def source(channel: Channel):
+        for _ in range(num_tiles):
+            for start in range(0, inner_dimension, chunk_length):
+                length = min(chunk_length, inner_dimension - start)
+                data_pass = Pass(sim, length, final=start + length == inner_dimension)
+                yield channel.put(data_pass)
+                if not first_input:
+                    first_input.append(sim.now)
+                yield sim.timeout((length - 1) * beat_cycles)
+                data_pass.done.succeed()
+                # The next pass starts the cycle after the last beat was taken
+                yield data_pass.taken
+                yield sim.timeout(1)
+
+    def sink():
+        # Output always ready: one row per cycle
+        for _ in range(num_tiles):
+            tile = yield output.get()
+            yield sim.timeout(n)
+            last_output.append(sim.now)
+            tile.rows_taken.succeed()
+
+    sim.process(source(a_input))
+    sim.process(source(b_input))
+    sim.process(sink())
+    sim.run()
+    return last_output[-1] - first_input[0] + (1 if input_fifo_depth else 0)
+
+
+def simulate_memory_buffer(n: int, length: int, repeats: int, num_processors: int, parallel_data_streaming_size: int,
+                           broadcast: bool = False, prefetch: bool = False, num_instructions: int = 1) -> int:
+    """
+    Model memory_buffer_tb with an ideal memory and always ready processors: cycles from the first instruction
+    handshake to the last beat of the last repeat, num_instructions of the same size given back to back. Used by
+    the memory buffer bench to check this model against the RTL.
+    """
+    sim = Simulator()
+    memory = Memory(sim, read_words_per_cycle=parallel_data_streaming_size, write_words_per_cycle=parallel_data_streaming_size)
+    instructions = Channel(sim)
+    outputs = [Channel(sim) for _ in range(num_processors)]
+    buffer = MemoryBufferModel(sim, "memory_buffer", n, memory, instructions, outputs, broadcast, prefetch)
+    sim.process(buffer.run())
+    last_beat = []
+
+    def sink(channel: Channel):
+        for _ in range(repeats * num_instructions):
+            data_pass = yield channel.get()
+            yield data_pass.done
+            data_pass.take()
+            last_beat.append(sim.now)
+
+    def controller():
+        for instruction in range(num_instructions):
+            yield instructions.put((instruction * length * n, length, repeats, True))
+            yield sim.timeout(1)
+
+    for output in outputs:
+        sim.process(sink(output))
+    sim.process(controller())
+    sim.run()
+    return max(last_beat) + 1
+
+
+def processor_initiation_interval(n: int, inner_dimension: int, double_buffer: bool = False, num_tiles: int = 16,
+                                  input_fifo_depth: int = 0) -> float:
+    """Steady state cycles between two tiles of simulate_processor()"""
+    return (simulate_processor(n, inner_dimension, num_tiles, double_buffer, input_fifo_depth=input_fifo_depth)
+            - simulate_processor(n, inner_dimension, 1, double_buffer, input_fifo_depth=input_fifo_depth)) / (num_tiles - 1)
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Predict cycle counts of top.sv with the transaction-level model")
+    parser.add_argument("--n", type=int, default=4)
+    parser.add_argument("--rows-processors", type=int, default=4)
+    parser.add_argument("--cols-processors", type=int, default=4)
+    parser.add_argument("--parallel-data-streaming-size", type=int, default=4)
+    parser.add_argument("--matrix-length", type=int, default=64)
+    parser.add_argument("--memory-read-latency", type=int, default=0)
+    parser.add_argument("--chunk-length", type=int, default=None, help="K_SPLIT chunks of M vectors per memory_buffer instruction")
+    parser.add_argument("--broadcast", action="store_true", help="BROADCAST memory buffers, every beat to all processors at once")
+    parser.add_argument("--prefetch", action="store_true", help="PREFETCH memory buffers, next instruction read during the repeats")
+    args = parser.parse_args()
+    report = simulate_top(GridConfig(
+        n=args.n,
+        rows_processors=args.rows_processors,
+        cols_processors=args.cols_processors,
+        parallel_data_streaming_size=args.parallel_data_streaming_size,
+        matrix_length=args.matrix_length,
+        memory_read_latency=args.memory_read_latency,
+        chunk_length=args.chunk_length,
+        broadcast=args.broadcast,
+        prefetch=args.prefetch,
+    ))
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Golden model of the sum stationary processor.
+
+All functions here work on whole batches of tiles at once using NumPy, so the
+testbenches never build a python object (or a BinaryValue) per output element.
+
+Shapes:
+    a_matrices: (..., outer_dimension, inner_dimension)  (A row blocks)
+    b_matrices: (..., inner_dimension, outer_dimension)  (B col blocks)
+    result:     (..., outer_dimension, outer_dimension)
+"""
+
+from enum import Enum
+from typing import Sequence, Union
+
+import numpy as np
+
+# int64 holds any unsigned value of up to this many bits without overflowing
+INT64_SAFE_BITS = 62
+
+
+def output_dtype(data_width: int, multiply_data_width: int, accum_data_width: int, inner_dimension: int) -> np.dtype:
+    """
+    Pick the cheapest dtype that can hold every intermediate value of the model.
+
+    The largest intermediates are a full precision product (2 * data_width bits) and the full sum of
+    inner_dimension products (each of at most multiply_data_width bits) before it is wrapped to
+    multiply_data_width + accum_data_width bits.
+    Falls back to object (python int) arrays when int64 is not wide enough.
+    """
+    sum_bits = multiply_data_width + max(int(inner_dimension) - 1, 0).bit_length()
+    if max(2 * data_width, sum_bits, multiply_data_width + accum_data_width) <= INT64_SAFE_BITS:
+        return np.dtype(np.int64)
+    return np.dtype(object)
+
+
+class TruncationPolicy(Enum):
+    """
+    How the processor fits full precision values into its MULTIPLY_DATA_WIDTH product register
+    and MULTIPLY_DATA_WIDTH + ACCUM_DATA_WIDTH result register.
+    """
+    LOW_BITS = "low"        # Keep the lower bits, drop the upper ones (what processor.sv does today)
+    HIGH_BITS = "high"      # Keep the upper bits, drop the lower ones (hdl TODO "Output Bits Truncation")
+    SATURATE = "saturate"   # Clamp to the largest value the register can hold
+
+
+class FixedPointEngine:
+    """
+    Bit-accurate, batched model of the processor multiply-accumulate for one truncation policy
+
+    Args
+        data_width: DATA_WIDTH, bits of each (unsigned) A / B input
+        multiply_data_width: MULTIPLY_DATA_WIDTH, bits kept of each product
+        accum_data_width: ACCUM_DATA_WIDTH, additional bits of the accumulator
+        policy: TruncationPolicy (or its string value) applied to both the products and the sum
+
+    Policies, with P = 2 * DATA_WIDTH (full product), M = MULTIPLY_DATA_WIDTH,
+    O = MULTIPLY_DATA_WIDTH + ACCUM_DATA_WIDTH and S = M + clog2(inner_dimension) (full sum):
+        LOW_BITS:  product = (a * b) mod 2^M,        result = sum(product) mod 2^O
+        HIGH_BITS: product = (a * b) >> max(P-M, 0), result = sum(product) >> max(S-O, 0)
+        SATURATE:  product = min(a * b, 2^M - 1),    result = min(sum(product), 2^O - 1)
+    """
+
+    def __init__(self, data_width: int, multiply_data_width: int, accum_data_width: int,
+                 policy: Union[TruncationPolicy, str] = TruncationPolicy.LOW_BITS):
+        self.data_width = data_width
+        self.multiply_data_width = multiply_data_width
+        self.accum_data_width = accum_data_width
+        self.policy = TruncationPolicy(policy)
+
+    @property
+    def output_data_width(self) -> int:
+        """Width of c_data_streaming"""
+        return self.multiply_data_width + self.accum_data_width
+
+    def multiply(self, a_matrices, b_matrices) -> np.ndarray:
+        """Compute every tile of the batch, (..., outer, inner) x (..., inner, outer) -> (..., outer, outer)"""
+        a_matrices = np.asarray(a_matrices)
+        b_matrices = np.asarray(b_matrices)
+        inner_dimension = a_matrices.shape[-1]
+        dtype = output_dtype(self.data_width, self.multiply_data_width, self.accum_data_width, inner_dimension)
+        a_matrices = a_matrices.astype(dtype)
+        b_matrices = b_matrices.astype(dtype)
+
+        if self.multiply_data_width >= 2 * self.data_width:
+            # Product register is wide enough for any product (no policy changes it), a plain matmul is exact
+            full_sum = np.matmul(a_matrices, b_matrices)
+        else:
+            # Products are cut down before accumulating, so build every product explicitly
+            # (..., outer, inner, 1) * (..., 1, inner, outer) -> (..., outer, inner, outer)
+            products = a_matrices[..., :, :, np.newaxis] * b_matrices[..., np.newaxis, :, :]
+            full_sum = self._fit(products, 2 * self.data_width, self.multiply_data_width).sum(axis=-2)
+
+        sum_data_width = self.multiply_data_width + max(inner_dimension - 1, 0).bit_length()
+        return self._fit(full_sum, sum_data_width, self.output_data_width)
+
+    def _fit(self, values: np.ndarray, full_data_width: int, data_width: int) -> np.ndarray:
+        """Apply the policy to fit values of (at most) full_data_width bits into data_width bits, in place"""
+        if self.policy is TruncationPolicy.LOW_BITS:
+            values &= (1 << data_width) - 1
+        elif self.policy is TruncationPolicy.HIGH_BITS:
+            if full_data_width > data_width:
+                values >>= full_data_width - data_width
+        else:
+            np.minimum(values, (1 << data_width) - 1, out=values)
+        return values
+
+
+def matrix_multiplication(a_matrices, b_matrices, data_width: int, multiply_data_width: int, accum_data_width: int) -> np.ndarray:
+    """
+    Transaction-level model of the processor as instantiated (lower bits are kept).
+
+    processing_unit computes north_i * west_i into a MULTIPLY_DATA_WIDTH wide product register,
+    then accumulates the products into a MULTIPLY_DATA_WIDTH + ACCUM_DATA_WIDTH wide result register.
+    Both registers silently drop the upper bits, see FixedPointEngine / TruncationPolicy.LOW_BITS.
+    """
+    return FixedPointEngine(data_width, multiply_data_width, accum_data_width).multiply(a_matrices, b_matrices)
+
+
+def rows_to_integers(rows: Sequence) -> np.ndarray:
+    """
+    Convert rows sampled from c_data_streaming (lists of BinaryValue / LogicArray / int) into an int array
+
+    Python ints are used so output widths above 63 bits still compare exactly.
+    """
+    return np.array([[int(value) for value in row] for row in rows], dtype=object)
+
+
+def matrices_equal(expected: np.ndarray, actual: np.ndarray) -> bool:
+    """Plain integer comparison between a model result and collected output rows"""
+    return np.array_equal(np.asarray(expected, dtype=object), np.asarray(actual, dtype=object))
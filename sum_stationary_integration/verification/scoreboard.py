@@ -0,0 +1,169 @@
+"""
+Scoreboard for the processor output stream.
+
+LIReader pushes every output transaction straight into the scoreboard (LIReader.add_callback), which checks
+the row right away against the head of a streaming queue of expected tiles and drops it once matched. Nothing
+polls the output queue every clock and only the tiles still in flight are kept in memory.
+
+    scoreboard = Scoreboard("c_data_streaming", clock_period_ns=10, log=dut._log)
+    tester.output_reader.add_callback(scoreboard.observe_output)
+    tester.a_input_writer.add_callback(scoreboard.observe_input)  # starts the latency clock of each tile
+    stimulus = StreamingStimulus(..., scoreboard=scoreboard)      # feeds scoreboard.expect()
+    await scoreboard.wait_for(num_samples)
+
+Latency of a tile is counted in clock cycles from its first accepted A beat to its last output row.
+"""
+
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Sequence
+
+import numpy as np
+from cocotb.triggers import Event, NextTimeStep
+from cocotb.utils import get_sim_time
+
+from verification.reference_model import matrices_equal, rows_to_integers
+
+# How many per-tile latencies are kept for percentiles, older ones only count in min / mean / max
+RECENT_LATENCIES = 1024
+
+
+class ScoreboardError(AssertionError):
+    """An output row did not match the expected row (or came out with nothing expected)"""
+
+
+class LatencyStats:
+    """Running min / mean / max of per tile latencies, plus the last RECENT_LATENCIES values"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+        self.recent: Deque[int] = deque(maxlen=RECENT_LATENCIES)
+
+    def add(self, latency: int) -> None:
+        self.count += 1
+        self.total += latency
+        self.min = latency if self.min is None else min(self.min, latency)
+        self.max = latency if self.max is None else max(self.max, latency)
+        self.recent.append(latency)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Percentile over the recent latencies"""
+        return float(np.percentile(list(self.recent), q)) if self.recent else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(tiles=self.count, latency_min=self.min, latency_mean=self.mean, latency_max=self.max,
+                    latency_p95=self.percentile(95))
+
+
+class Scoreboard:
+    """
+    Row by row checker of the processor output against a streaming queue of expected tiles
+
+    Args
+        signal: name of the output signal in the LIReader transactions (c_data_streaming)
+        clock_period_ns: period of the clock, timestamps are converted to cycles
+        log: where mismatches and the summary go
+    """
+
+    def __init__(self, signal: str, clock_period_ns: int, log: Optional[logging.Logger] = None):
+        self._signal = signal
+        self._clock_period_ns = clock_period_ns
+        self._log = log or logging.getLogger("cocotb.scoreboard")
+        self._expected: Deque[np.ndarray] = deque()
+        self._tile_starts: Deque[int] = deque()
+        self._input_open = False
+        self._done = Event()
+        self._target = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the statistics (not the tiles in flight), e.g. between scenarios"""
+        self.tiles_matched = 0
+        self.rows_matched = 0
+        self.latency = LatencyStats()
+        self.first_input_cycle: Optional[int] = None
+        self.last_output_cycle: Optional[int] = None
+        self._row_index = 0
+
+    def now(self) -> int:
+        return int(get_sim_time("ns")) // self._clock_period_ns
+
+    def expect(self, tile: np.ndarray) -> None:
+        """Queue the rows the processor should output for the next tile"""
+        self._expected.append(np.asarray(tile))
+
+    def observe_input(self, beat: Sequence) -> None:
+        """
+        LIWriter callback, (data, valid, last) of every accepted beat. The first beat of a tile starts its clock
+
+        Chunked beats (data, valid, last, final_chunk) only end the tile with final_chunk.
+        """
+        now = self.now()
+        if self.first_input_cycle is None:
+            self.first_input_cycle = now
+        if not self._input_open:
+            self._tile_starts.append(now)
+            self._input_open = True
+        if beat[2] and (len(beat) < 4 or beat[3]):
+            self._input_open = False
+
+    def observe_output(self, transaction: Dict[str, Any]) -> None:
+        """LIReader callback, checks one output row"""
+        if not self._expected:
+            raise ScoreboardError(f"Unexpected output row {transaction[self._signal]}, no tile expected")
+        expected_tile = self._expected[0]
+        expected_row = expected_tile[self._row_index]
+        actual_row = rows_to_integers([transaction[self._signal]])[0]
+        if not matrices_equal(expected_row, actual_row):
+            self._log.info(f"Tile {self.tiles_matched + 1}, row {self._row_index}")
+            self._log.info("Expected")
+            self._log.info(expected_row.tolist())
+            self._log.info("Actual")
+            self._log.info(actual_row.tolist())
+            raise ScoreboardError(f"Mismatch in row {self._row_index} of tile {self.tiles_matched + 1}")
+
+        self.rows_matched += 1
+        self._row_index += 1
+        if self._row_index < len(expected_tile):
+            return
+
+        # Whole tile matched, drop it
+        now = self.now()
+        self._expected.popleft()
+        self._row_index = 0
+        self.tiles_matched += 1
+        self.last_output_cycle = now
+        if self._tile_starts:
+            self.latency.add(now - self._tile_starts.popleft())
+        self._log.info(f"Successful Number: {self.tiles_matched}")
+        if self.tiles_matched >= self._target:
+            self._done.set()
+
+    async def wait_for(self, tiles: int) -> None:
+        """Wait until tiles tiles were matched since the last reset()"""
+        if self.tiles_matched >= tiles:
+            return
+        self._target = tiles
+        self._done.clear()
+        await self._done.wait()
+        # The last row is checked in the reader's ReadOnly phase, leave it so the caller can drive signals again
+        # (the next rising edge is the one taking that row)
+        await NextTimeStep()
+
+    @property
+    def pending_tiles(self) -> int:
+        return len(self._expected)
+
+    def summary(self) -> str:
+        stats = self.latency
+        if not stats.count:
+            return "No tile completed"
+        return (f"{self.tiles_matched} tiles ({self.rows_matched} rows) matched, latency in cycles: "
+                f"min {stats.min}, mean {stats.mean:.1f}, p95 {stats.percentile(95):.0f}, max {stats.max}")
@@ -0,0 +1,61 @@
+"""
+Simulator independent signal access for the benches.
+
+ModelSim and Verilator disagree on a few things the benches used to rely on:
+    - Assigning a python list to an unpacked array port (a_data, b_data) goes through the range the
+      simulator reports for the array, which is not the same on every simulator. Writing each element by
+      index works everywhere.
+    - .binstr of a 4-state value can be "x"/"z", Verilator only has 2 states. is_high() treats anything
+      unresolved as low.
+    - Values read right after RisingEdge are pre-edge on event driven simulators but post-edge on Verilator,
+      so handshakes are sampled in ReadOnly (settled values of the cycle, i.e. what the next edge sees).
+
+wait_cycles() is here too, it skips the per edge wake ups of ClockCycles when the clock period is known.
+"""
+
+from typing import Any, List, Optional, Sequence
+
+from cocotb.handle import NonHierarchyIndexableObject, SimHandleBase
+from cocotb.triggers import ClockCycles, RisingEdge, Timer
+from cocotb.utils import get_sim_time
+
+
+def is_high(handle: SimHandleBase) -> bool:
+    """True if a 1 bit signal is a resolved 1"""
+    value = handle.value
+    return value.is_resolvable and value.integer == 1
+
+
+def write_array(handle: SimHandleBase, values: Sequence[int]) -> None:
+    """Drive an unpacked array element by element, values[i] goes to handle[i] whatever the declared range order"""
+    if len(values) != len(handle):
+        raise ValueError(f"{handle._name} has {len(handle)} elements, got {len(values)} values")
+    for index, value in enumerate(values):
+        handle[index].value = value
+
+
+def read_array(handle: SimHandleBase) -> List[Any]:
+    """Read an unpacked array element by element, element i of the result is handle[i]"""
+    return [handle[index].value for index in range(len(handle))]
+
+
+def sample(handle: SimHandleBase) -> Any:
+    """Current value of a signal, unpacked arrays come back as a list in index order"""
+    if isinstance(handle, NonHierarchyIndexableObject):
+        return read_array(handle)
+    return handle.value
+
+
+async def wait_cycles(clk: SimHandleBase, cycles: int, clock_period_ns: Optional[int] = None) -> None:
+    """
+    Wait for the next cycles rising edges of clk, call it right after a rising edge
+
+    With the period of a clock started at time 0 (what the benches do), a single Timer sleeps up to half a
+    period before the last edge instead of waking up on every edge like ClockCycles. Falls back to ClockCycles
+    when the period is not given or we are not on an edge.
+    """
+    if clock_period_ns is None or cycles < 2 or get_sim_time("ns") % clock_period_ns:
+        await ClockCycles(clk, cycles)
+        return
+    await Timer(cycles * clock_period_ns - clock_period_ns // 2, units="ns")
+    await RisingEdge(clk)
@@ -0,0 +1,187 @@
+"""
+Streaming stimulus for the processor input writers.
+
+Instead of pushing every column of A / row of B of every sample into the writer queues up front (and keeping
+every expected result around), tiles are generated lazily in small batches and fed to the writers as they
+drain. Every queue on the way is bounded, so memory does not grow with the number of samples:
+
+    generate_tiles()  --tiles-->  StreamingStimulus  --beats-->  LIWriter.values (bounded, see queue_depth)
+                                         |
+                                         +--expected results--> StreamingStimulus.expected (or Scoreboard.expect())
+
+    stimulus = StreamingStimulus(tester.a_input_writer, tester.b_input_writer,
+                                 generate_tiles(REFERENCE_ENGINE, num_samples, N, K), gaps=lambda: 0,
+                                 data_width=DATA_WIDTH)
+    stimulus.start()
+    ...
+    expected = stimulus.expected.get_nowait()  # once a whole tile came out of the processor
+
+A and B are fed by two independent coroutines, so a full A queue never stops B beats from going out (the
+processor only takes a beat when both sides are valid, or when both heads of its input FIFOs are there). b_gaps
+gives B its own gap pattern.
+"""
+
+from dataclasses import dataclass
+from random import getrandbits
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import cocotb
+import numpy as np
+from cocotb.queue import Queue
+
+from verification.layouts import pack_a, pack_b
+from verification.reference_model import FixedPointEngine
+
+# (data by index, valid, last), what LIWriter.values holds. Chunked A beats add final_chunk:
+# (data by index, valid, last, final_chunk)
+Beat = Union[Tuple[List[int], bool, bool], Tuple[List[int], bool, bool, bool]]
+
+
+@dataclass
+class Tile:
+    """One sample: A (outer x inner), B (inner x outer) and the result the processor should stream out"""
+    a: List[List[int]]
+    b: List[List[int]]
+    expected: np.ndarray
+
+
+def generate_tiles(engine: FixedPointEngine, num_samples: int, outer_dimension: int, inner_dimension: int,
+                   func: Callable[[int], int] = getrandbits, transpose: bool = False, batch_size: int = 64) -> Iterator[Tile]:
+    """
+    Lazily yield num_samples tiles, values from func(DATA_WIDTH)
+
+    Expected results are computed batch_size tiles at a time with the batched reference engine, so only one
+    batch is alive at any time. transpose gives the expected result column by column (output_by_row = 0).
+    """
+    data_width = engine.data_width
+    remaining = num_samples
+    while remaining > 0:
+        count = min(batch_size, remaining)
+        remaining -= count
+        a_matrices = list(gen_matrices(outer_dimension, inner_dimension, count, data_width, func))
+        b_matrices = list(gen_matrices(inner_dimension, outer_dimension, count, data_width, func))
+        expected = engine.multiply(a_matrices, b_matrices)
+        if transpose:
+            expected = expected.swapaxes(-1, -2)
+        for a, b, result in zip(a_matrices, b_matrices, expected):
+            yield Tile(a, b, result)
+
+
+def create_row(length: int, data_width: int, func: Callable[[int], int] = getrandbits) -> List[int]:
+    return [func(data_width) for _ in range(length)]
+
+
+def create_matrix(rows: int, cols: int, data_width: int, func: Callable[[int], int] = getrandbits) -> List[List[int]]:
+    return [create_row(cols, data_width, func) for _ in range(rows)]
+
+
+def gen_matrices(rows: int, cols: int, num_samples: int, data_width: int,
+                 func: Callable[[int], int] = getrandbits) -> Iterator[List[List[int]]]:
+    """Generate random matrix data for matrices of set dimensions"""
+    for _ in range(num_samples):
+        yield create_matrix(rows, cols, data_width, func)
+
+
+def a_beats(tile: Tile, gaps: Callable[[], int], data_width: int, chunk_length: Optional[int] = None) -> Iterator[Beat]:
+    """
+    Columns of A, last column first, element i of a beat goes to a_data[i]. last is set on column 0
+
+    chunk_length: send the tile in chunks of that many columns like the K_SPLIT memory buffers, last is set at the
+    end of every chunk and final_chunk (4th element) on the last one
+    """
+    # A tile is a single row block, its memory image is the columns in the order they go out
+    columns = pack_a(tile.a, len(tile.a)).reshape(-1, len(tile.a)).tolist()
+    for index, column in enumerate(columns):
+        is_final = index == len(columns) - 1
+        if chunk_length is None:
+            yield column, True, is_final
+        else:
+            yield column, True, is_final or (index + 1) % chunk_length == 0, is_final
+        yield from idle_beats(gaps(), len(tile.a), data_width)
+
+
+def b_beats(tile: Tile, gaps: Callable[[], int], data_width: int) -> Iterator[Beat]:
+    """Rows of B, last row first, element i of a beat goes to b_data[i]. last is set on row 0"""
+    # Same with a single col block of B
+    rows = pack_b(tile.b, len(tile.b[0])).reshape(-1, len(tile.b[0])).tolist()
+    for index, row in enumerate(rows):
+        yield row, True, index == len(rows) - 1
+        yield from idle_beats(gaps(), len(tile.b[0]), data_width)
+
+
+def idle_beats(count: int, length: int, data_width: int) -> Iterator[Beat]:
+    """Not valid beats (random data) making a gap in the input, each one lasts 1-3 cycles in LIWriter"""
+    for _ in range(count):
+        yield [getrandbits(data_width) for _ in range(length)], False, False
+
+
+class StreamingStimulus:
+    """
+    Feeds tiles into the A and B input writers as they drain
+
+    Args
+        a_writer / b_writer: LIWriter-like objects with a values queue of Beats, bound it (queue_depth) to get backpressure
+        tiles: iterable of Tile, usually generate_tiles()
+        gaps: returns how many not valid beats to insert after each valid beat (0 for steady input)
+        b_gaps: same for the B beats, gaps if None (each side still draws its own values)
+        chunk_length: A goes in chunks of this many columns (K_SPLIT processors), see a_beats()
+        data_width: DATA_WIDTH, for the random data of not valid beats
+        depth: tiles generated ahead of the slower writer
+        scoreboard: if given, expected results go to scoreboard.expect() instead of self.expected
+    """
+
+    def __init__(self, a_writer, b_writer, tiles: Iterable[Tile], gaps: Callable[[], int], data_width: int, depth: int = 2,
+                 scoreboard=None, b_gaps: Optional[Callable[[], int]] = None, chunk_length: Optional[int] = None):
+        self.expected = Queue[np.ndarray]()  # holds at most the tiles in flight
+        self._scoreboard = scoreboard
+        self.tiles_sent = 0
+        self._a_writer = a_writer
+        self._b_writer = b_writer
+        self._tiles = tiles
+        self._gaps = gaps
+        self._b_gaps = b_gaps if b_gaps is not None else gaps
+        self._chunk_length = chunk_length
+        self._data_width = data_width
+        self._a_tiles = Queue[Optional[Tile]](maxsize=depth)
+        self._b_tiles = Queue[Optional[Tile]](maxsize=depth)
+        self._coros = []
+
+    def start(self) -> None:
+        if self._coros:
+            raise RuntimeError("Stimulus already started")
+        self._coros = [
+            cocotb.start_soon(self._produce()),
+            cocotb.start_soon(self._feed(self._a_writer, self._a_tiles, self._a_beats, self._gaps)),
+            cocotb.start_soon(self._feed(self._b_writer, self._b_tiles, b_beats, self._b_gaps)),
+        ]
+
+    def stop(self) -> None:
+        for coro in self._coros:
+            if not coro.done():
+                coro.kill()
+        self._coros = []
+
+    async def _produce(self) -> None:
+        for tile in self._tiles:
+            if self._scoreboard is None:
+                self.expected.put_nowait(tile.expected)
+            else:
+                self._scoreboard.expect(tile.expected)
+            await self._a_tiles.put(tile)
+            await self._b_tiles.put(tile)
+            self.tiles_sent += 1
+        # No more tiles
+        await self._a_tiles.put(None)
+        await self._b_tiles.put(None)
+
+    def _a_beats(self, tile: Tile, gaps: Callable[[], int], data_width: int) -> Iterator[Beat]:
+        return a_beats(tile, gaps, data_width, self._chunk_length)
+
+    async def _feed(self, writer, tiles: Queue, beats: Callable[..., Iterator[Beat]], gaps: Callable[[], int]) -> None:
+        while True:
+            tile = await tiles.get()
+            if tile is None:
+                return
+            for beat in beats(tile, gaps, self._data_width):
+                # Blocks while the writer queue is full
+                await writer.values.put(beat)
@@ -0,0 +1,357 @@
+"""
+Parameter sweep over the cocotb benches.
+
+Builds and runs one bench for every combination of HDL parameters, each in its own build
+directory, in parallel processes through cocotb.runner (no Makefile involved), then prints
+a results table. Builds go through the content-addressed BuildCache, so points (or later sweeps)
+with the same sources and HDL parameters only elaborate once:
+
+    python -m verification.sweep --param N=2,4,8 --param DATA_WIDTH=8,16 --csv sweep.csv
+
+The bench writes its measured cycles / MACs to METRICS_FILE (see processor_tb.py), grid parameters
+(ROWS_PROCESSORS, COLS_PROCESSORS, PARALLEL_DATA_STREAMING_SIZE) are not HDL parameters of the swept
+benches, they only feed the transaction-level model in performance_model.py for the model_* columns
+(checked against top.sv by test_top).
+
+The memory_buffer bench writes beats per cycle instead (beats taken by all its processors), e.g. how
+broadcasting scales with the processors a buffer feeds:
+
+    python -m verification.sweep --bench memory_buffer --param NUM_PROCESSORS_TO_BROADCAST=1,2,4,8 --param BROADCAST=0,1
+
+and memory_idle, the cycles its memory read port sat idle in prefetch_test, e.g. what the second bank buys behind
+a slow memory (--memory-timing, --memory-arbiter and --memory-burst set up its MemoryReadController):
+
+    python -m verification.sweep --bench memory_buffer --param PREFETCH=0,1 --memory-timing latency=8
+
+and read_wait, the mean cycles a read of the buffer waited for the arbiter while --memory-contenders other ports
+read from the same memory, e.g. how the arbitration policy shares the memory with the rest of the grid:
+
+    python -m verification.sweep --bench memory_buffer --param PREFETCH=0,1 --memory-contenders 3 --memory-arbiter priority
+
+and beats_per_request, the read handshakes saved by the --memory-burst bursts of burst_test.
+"""
+
+import csv
+import itertools
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from verification.build_cache import BuildCache
+from verification.performance_model import GridConfig, simulate_top
+
+# sum_stationary_integration/
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+HDL_DIR = PROJECT_DIR / "hdl"
+
+# Extra build arguments per simulator, same as the bench Makefiles
+SIM_BUILD_ARGS: Dict[str, Tuple[str, ...]] = {
+    "verilator": ("-Wno-fatal",),  # lint warnings should not stop the build
+}
+
+# RANDOM_SEED of the bench Makefiles
+DEFAULT_SEED = 123456789
+
+# Parameters of the top.sv grid, only used by the performance model
+GRID_PARAMETERS = ("ROWS_PROCESSORS", "COLS_PROCESSORS", "PARALLEL_DATA_STREAMING_SIZE")
+
+
+@dataclass(frozen=True)
+class Bench:
+    """One cocotb bench: where it lives, what it simulates and which HDL parameters it takes (with defaults)"""
+    test_dir: str
+    hdl_toplevel: str
+    test_module: str
+    sources: Tuple[str, ...]
+    parameters: Tuple[Tuple[str, int], ...]
+
+    @property
+    def path(self) -> Path:
+        return PROJECT_DIR / self.test_dir
+
+
+# Same defaults as the bench Makefiles
+BENCHES: Dict[str, Bench] = {
+    "processor": Bench(
+        test_dir="test_processor",
+        hdl_toplevel="processor",
+        test_module="processor_tb",
+        sources=("processor.sv",),
+        parameters=(("DATA_WIDTH", 8), ("N", 4), ("MULTIPLY_DATA_WIDTH", 16), ("ACCUM_DATA_WIDTH", 3), ("DOUBLE_BUFFER", 0),
+                    ("INPUT_FIFO_DEPTH", 0), ("K_SPLIT", 0)),
+    ),
+    "memory_buffer": Bench(
+        test_dir="test_memory_buffer",
+        hdl_toplevel="memory_buffer",
+        test_module="memory_buffer_tb",
+        sources=("memory_buffer.sv",),
+        parameters=(("DATA_WIDTH", 8), ("N", 4), ("M", 4), ("NUM_PROCESSORS_TO_BROADCAST", 4), ("PARALLEL_DATA_STREAMING_SIZE", 4),
+                    ("MAX_MATRIX_LENGTH", 64), ("MEMORY_ADDRESS_BITS", 16), ("K_SPLIT", 0), ("BROADCAST", 0),
+                    ("PREFETCH", 0)),
+    ),
+}
+
+
+@dataclass
+class SweepPoint:
+    """One combination of parameters to build and run"""
+    bench: str
+    simulator: str
+    parameters: Dict[str, int]
+    run_dir: str
+    num_samples: int
+    matrix_length: int
+    # Build cache directory (see build_cache.py), None builds straight into run_dir every time
+    cache_dir: Optional[str] = None
+    cache_size: int = 16
+    # MEMORY_TIMING of the fake memories (see memory_timing.py), "" for the ideal memory
+    memory_timing: str = ""
+    # MEMORY_ARBITER of the fake memories (see arbiters.py), "" for round robin
+    memory_arbiter: str = ""
+    # MEMORY_BURST, beats per memory read request
+    memory_burst: int = 1
+    # MEMORY_CONTENDERS, other read ports of the memory_buffer bench's memory
+    memory_contenders: int = 0
+    # STIMULUS_CACHE directory of generated datasets (see dataset_cache.py), None generates them every run
+    stimulus_cache: Optional[str] = None
+    # cocotb random seed, the RANDOM_SEED of the Makefiles (the stimulus, and so its cache entries, depend on it)
+    seed: int = DEFAULT_SEED
+
+    @property
+    def hdl_parameters(self) -> Dict[str, int]:
+        return {name: value for name, value in self.parameters.items() if name not in GRID_PARAMETERS}
+
+
+def parse_parameter(text: str) -> Tuple[str, List[int]]:
+    """'N=2,4,8' -> ('N', [2, 4, 8])"""
+    name, _, values = text.partition("=")
+    if not name or not values:
+        raise ValueError(f"Expected NAME=v1,v2,..., got {text!r}")
+    return name.strip(), [int(value, 0) for value in values.split(",")]
+
+
+def sweep_points(bench: str, simulator: str, sweep: Dict[str, Sequence[int]], build_root: Path,
+                 num_samples: int, matrix_length: int, cache_size: Optional[int] = 16,
+                 memory_timing: str = "", memory_arbiter: str = "", memory_burst: int = 1,
+                 memory_contenders: int = 0, seed: int = DEFAULT_SEED) -> List[SweepPoint]:
+    """
+    Cartesian product of the swept values, unswept HDL parameters keep the bench default
+
+    Builds are shared through a BuildCache in build_root/cache unless cache_size is None, generated stimulus
+    through a DatasetCache in build_root/stimulus.
+    """
+    defaults = dict(BENCHES[bench].parameters)
+    unknown = set(sweep) - set(defaults) - set(GRID_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown parameters for the {bench} bench: {', '.join(sorted(unknown))}")
+
+    names = list(sweep)
+    points = []
+    for values in itertools.product(*(sweep[name] for name in names)):
+        parameters = dict(defaults)
+        parameters.update(zip(names, values))
+        build_name = "_".join(f"{name}{value}" for name, value in sorted(parameters.items()))
+        points.append(SweepPoint(
+            bench=bench,
+            simulator=simulator,
+            parameters=parameters,
+            run_dir=str(build_root / f"{bench}_{simulator}_{build_name}"),
+            num_samples=num_samples,
+            matrix_length=matrix_length,
+            cache_dir=None if cache_size is None else str(build_root / "cache"),
+            cache_size=cache_size or 1,
+            memory_timing=memory_timing,
+            memory_arbiter=memory_arbiter,
+            memory_burst=memory_burst,
+            memory_contenders=memory_contenders,
+            stimulus_cache=None if cache_size is None else str(build_root / "stimulus"),
+            seed=seed,
+        ))
+    return points
+
+
+def model_columns(point: SweepPoint) -> Dict[str, Any]:
+    """
+    Cycles / MACs per cycle of the full grid predicted by the transaction-level model
+
+    A memory buffer's NUM_PROCESSORS_TO_BROADCAST stands for COLS_PROCESSORS (the processors an A buffer feeds).
+    """
+    config = GridConfig(
+        n=point.parameters["N"],
+        rows_processors=point.parameters.get("ROWS_PROCESSORS", 4),
+        cols_processors=point.parameters.get("COLS_PROCESSORS", point.parameters.get("NUM_PROCESSORS_TO_BROADCAST", 4)),
+        parallel_data_streaming_size=point.parameters.get("PARALLEL_DATA_STREAMING_SIZE", 4),
+        matrix_length=point.matrix_length,
+        broadcast=bool(point.parameters.get("BROADCAST", 0)),
+        prefetch=bool(point.parameters.get("PREFETCH", 0)),
+    )
+    try:
+        report = simulate_top(config)
+    except ValueError:
+        # matrix_length does not tile onto this grid
+        return dict(model_cycles=None, model_macs_per_cycle=None)
+    return dict(model_cycles=report.cycles, model_macs_per_cycle=round(report.macs_per_cycle, 3))
+
+
+def run_point(point: SweepPoint) -> Dict[str, Any]:
+    """Build (or reuse a cached build) and run one point, runs in a worker process"""
+    from cocotb.runner import get_results, get_runner
+
+    bench = BENCHES[point.bench]
+    run_dir = Path(point.run_dir)
+    run_dir.mkdir(parents=True, exist_ok=True)
+    metrics_file = run_dir / "metrics.json"
+    results_xml = run_dir / "results.xml"
+    for stale in (metrics_file, results_xml):
+        if stale.exists():
+            stale.unlink()
+
+    # The runner hands sys.path to the simulator as PYTHONPATH: the bench module and the verification package
+    for path in (str(PROJECT_DIR), str(bench.path)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    sources = [HDL_DIR / source for source in bench.sources]
+    build_args = list(SIM_BUILD_ARGS.get(point.simulator, ()))
+    runner = None
+
+    def build(build_dir: Path) -> None:
+        runner.build(
+            verilog_sources=sources,
+            hdl_toplevel=bench.hdl_toplevel,
+            parameters=point.hdl_parameters,
+            build_args=build_args,
+            build_dir=build_dir,
+        )
+
+    def test(build_dir: Path) -> None:
+        # Run inside the build directory (questa looks the work library up relative to it), results go to run_dir
+        runner.test(
+            test_module=bench.test_module,
+            hdl_toplevel=bench.hdl_toplevel,
+            hdl_toplevel_lang="verilog",
+            build_dir=build_dir,
+            test_dir=build_dir,
+            results_xml=str(results_xml),
+            seed=point.seed,
+            parameters=point.hdl_parameters,
+            extra_env=dict(NUM_SAMPLES=str(point.num_samples), METRICS_FILE=str(metrics_file),
+                           MEMORY_TIMING=point.memory_timing, MEMORY_ARBITER=point.memory_arbiter,
+                           MEMORY_BURST=str(point.memory_burst), MEMORY_CONTENDERS=str(point.memory_contenders),
+                           STIMULUS_CACHE=point.stimulus_cache or ""),
+        )
+
+    row: Dict[str, Any] = dict(point.parameters)
+    row.update(model_columns(point))
+    row.update(status="error", build="", cycles=None, macs_per_cycle=None, initiation_interval=None,
+               input_backpressure=None, beats_per_cycle=None, memory_idle=None, read_wait=None, beats_per_request=None,
+               error="")
+    try:
+        runner = get_runner(point.simulator)
+        if point.cache_dir is None:
+            build(run_dir)
+            test(run_dir)
+        else:
+            cache = BuildCache(point.cache_dir, point.cache_size)
+            with cache.entry(cache.describe(point.simulator, bench.hdl_toplevel, sources, point.hdl_parameters, build_args)) as entry:
+                row["build"] = "cached" if entry.hit else "built"
+                if not entry.hit:
+                    build(entry.path)
+                    entry.commit()
+                test(entry.path)
+        _, num_failed = get_results(results_xml)
+        row["status"] = "pass" if num_failed == 0 else "fail"
+    except (subprocess.CalledProcessError, SystemExit, RuntimeError, ValueError, OSError) as e:
+        row["error"] = str(e) or type(e).__name__
+
+    if metrics_file.exists():
+        metrics = json.loads(metrics_file.read_text())
+        row["cycles"] = metrics["cycles"]
+        if metrics["cycles"] and "macs" in metrics:
+            row["macs_per_cycle"] = round(metrics["macs"] / metrics["cycles"], 3)
+        row["initiation_interval"] = metrics.get("initiation_interval")
+        row["input_backpressure"] = metrics.get("input_backpressure")
+        if metrics.get("beats_per_cycle") is not None:
+            row["beats_per_cycle"] = round(metrics["beats_per_cycle"], 3)
+        row["memory_idle"] = metrics.get("memory_idle")
+        if metrics.get("read_wait") is not None:
+            row["read_wait"] = round(metrics["read_wait"], 2)
+        if metrics.get("beats_per_request") is not None:
+            row["beats_per_request"] = round(metrics["beats_per_request"], 2)
+    return row
+
+
+def run_sweep(points: Sequence[SweepPoint], jobs: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Run every point, jobs processes at a time (all cpus by default), rows come back in point order"""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        return [run_point(point) for point in points]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(run_point, points))
+
+
+def format_table(rows: Sequence[Dict[str, Any]]) -> str:
+    """Aligned plain text table"""
+    if not rows:
+        return ""
+    columns = list(rows[0])
+    cells = [[("-" if row[column] is None else str(row[column])) for column in columns] for row in rows]
+    widths = [max(len(column), *(len(line[i]) for line in cells)) for i, column in enumerate(columns)]
+    lines = ["  ".join(column.ljust(width) for column, width in zip(columns, widths))]
+    lines.append("  ".join("-" * width for width in widths))
+    lines += ["  ".join(cell.ljust(width) for cell, width in zip(line, widths)) for line in cells]
+    return "\n".join(lines)
+
+
+def write_csv(rows: Sequence[Dict[str, Any]], path: Path) -> None:
+    with open(path, "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build and run a cocotb bench over a grid of parameters")
+    parser.add_argument("--bench", choices=sorted(BENCHES), default="processor")
+    parser.add_argument("--sim", default="verilator", help="cocotb.runner simulator (verilator, questa, icarus, ...)")
+    parser.add_argument("--param", action="append", default=[], metavar="NAME=v1,v2",
+                        help="values to sweep, may be repeated, e.g. --param N=2,4,8")
+    parser.add_argument("--num-samples", type=int, default=5)
+    parser.add_argument("--matrix-length", type=int, default=64, help="matrix size used for the model_* columns")
+    parser.add_argument("--build-root", type=Path, default=PROJECT_DIR / "sweep_build")
+    parser.add_argument("--cache-size", type=int, default=16, help="compiled builds kept in BUILD_ROOT/cache")
+    parser.add_argument("--no-cache", action="store_true", help="always rebuild, straight into each point's directory, and regenerate the stimulus")
+    parser.add_argument("--memory-timing", default="", metavar="SPEC",
+                        help="memory_buffer bench: timing of its fake memory, e.g. latency=40,outstanding=8 (see verification/memory_timing.py)")
+    parser.add_argument("--memory-arbiter", default="", metavar="SPEC",
+                        help="memory_buffer bench: port arbiter of its fake memory: round_robin, priority[:order] or wfq[:weights]")
+    parser.add_argument("--memory-contenders", type=int, default=0, metavar="PORTS",
+                        help="memory_buffer bench: other read ports competing for its memory")
+    parser.add_argument("--memory-burst", type=int, default=1, metavar="BEATS", help="memory_buffer bench: beats per read request of its fake memory")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="cocotb random seed of every point")
+    parser.add_argument("--jobs", type=int, default=None, help="parallel builds/runs, defaults to the cpu count")
+    parser.add_argument("--csv", type=Path, default=None, help="also write the results table to this file")
+    args = parser.parse_args()
+
+    sweep = dict(parse_parameter(text) for text in args.param)
+    points = sweep_points(args.bench, args.sim, sweep, args.build_root.resolve(), args.num_samples, args.matrix_length,
+                          cache_size=None if args.no_cache else args.cache_size, memory_timing=args.memory_timing,
+                          memory_arbiter=args.memory_arbiter, memory_burst=args.memory_burst,
+                          memory_contenders=args.memory_contenders, seed=args.seed)
+    rows = run_sweep(points, args.jobs)
+    print(format_table(rows))
+    if args.csv:
+        write_csv(rows, args.csv)
+    if any(row["status"] != "pass" for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Reusable checker of a processor (matrix_multiplier) instance, shared by the benches.
+
+    tester = MatrixMultiplierTester(dut, n=N, queue_depth=STIMULUS_QUEUE_DEPTH, clock_period_ns=CLOCK_PERIOD_NS)
+    tester.start()
+    cycles = await tester.run_scenario(REFERENCE_ENGINE, num_samples=5, outer_dimension=N, inner_dimension=N,
+                                       input_steady=True, output_steady=True,
+                                       input_not_steady_long_time=True, output_not_steady_long_time=True)
+"""
+
+import os
+from random import getrandbits, randint
+from typing import Callable, Optional
+
+import cocotb
+from cocotb.handle import SimHandleBase
+from cocotb.triggers import ClockCycles, RisingEdge
+
+from verification.dataset_cache import DatasetCache
+from verification.instrumentation import ProcessorMonitor
+from verification.latency_insensitive_io import LIReader, LIWriter
+from verification.reference_model import FixedPointEngine
+from verification.scoreboard import Scoreboard
+from verification.stimulus import StreamingStimulus, generate_tiles
+
+
+# Tester:
+#   init = define itself, add the writer/reader.
+#   start() starts
+#   end() ends
+class MatrixMultiplierTester:
+    """
+    Reusable checker of a matrix_multiplier instance
+
+    Args
+        matrix_multiplier_entity: handle to an instance of matrix_multiplier
+        n: N of the instance, length of a_data / b_data
+        queue_depth: beats buffered in each input writer, the stimulus waits for the writer to drain past this
+        clock_period_ns: period of dut.clk, for the scoreboard cycle counts and the writer gaps
+        dataset_cache: random tiles come from this cache (see dataset_cache.py), from the STIMULUS_CACHE
+            environment variable (a directory) if None, not cached if that is not set either
+        instrument: also watch the processor with a ProcessorMonitor (self.monitor, reset by every scenario)
+    """
+
+    def __init__(self, matrix_multiplier_entity: SimHandleBase, n: int, queue_depth: int = 16, clock_period_ns: int = 10,
+                 dataset_cache: Optional[DatasetCache] = None, instrument: bool = False):
+        self.dut = matrix_multiplier_entity
+        if dataset_cache is None and os.environ.get("STIMULUS_CACHE"):
+            dataset_cache = DatasetCache(os.environ["STIMULUS_CACHE"])
+        self.dataset_cache = dataset_cache
+
+        self.a_input_writer = LIWriter(
+            dut=self.dut,
+            clk=self.dut.clk,
+            signals=self.dut.a_data,
+            valid=self.dut.a_input_valid,
+            ready=self.dut.a_input_ready,  # input_ready unless the processor has input FIFOs
+            last=self.dut.last,
+            sends_last=True,
+            final_chunk=self.dut.final_chunk,
+            input_length=n,
+            queue_depth=queue_depth,
+            clock_period_ns=clock_period_ns
+        )
+
+        self.b_input_writer = LIWriter(
+            dut=self.dut,
+            clk=self.dut.clk,
+            signals=self.dut.b_data,
+            valid=self.dut.b_input_valid,
+            ready=self.dut.b_input_ready,
+            last=None,
+            sends_last=False,
+            input_length=n,
+            queue_depth=queue_depth,
+            clock_period_ns=clock_period_ns
+        )
+
+        self.output_reader = LIReader(
+            dut=self.dut,
+            clk=self.dut.clk,
+            signals=dict(c_data_streaming=self.dut.c_data_streaming),  # the c_data_streaming= tells name of the dict value
+            valid=self.dut.output_valid,
+            ready=self.dut.output_ready
+        )
+
+        # Output rows are checked as the reader takes them, see verification/scoreboard.py
+        self.scoreboard = Scoreboard("c_data_streaming", clock_period_ns=clock_period_ns, log=self.dut._log)
+        self.output_reader.add_callback(self.scoreboard.observe_output)
+        self.a_input_writer.add_callback(self.scoreboard.observe_input)
+
+        # Per tile latency / interval / stall counters, see verification/instrumentation.py
+        self.monitor = ProcessorMonitor(self.dut, self.dut.clk) if instrument else None
+
+    def start(self) -> None:
+        """Starts the writers and the reader"""
+        self.a_input_writer.start()
+        self.b_input_writer.start()
+        self.output_reader.start()
+        if self.monitor is not None:
+            self.monitor.start()
+
+    def stop(self) -> None:
+        """Stops everything"""
+        self.a_input_writer.stop()
+        self.b_input_writer.stop()
+        self.output_reader.stop()
+        if self.monitor is not None:
+            self.monitor.stop()
+
+    async def run_scenario(self, engine: FixedPointEngine, num_samples: int, outer_dimension: int, inner_dimension: int,
+                           input_steady: bool, output_steady: bool,
+                           input_not_steady_long_time: bool, output_not_steady_long_time: bool,
+                           output_by_row: bool = True, matrix_gen_func: Callable[[int], int] = getrandbits,
+                           a_gaps: Optional[Callable[[], int]] = None, b_gaps: Optional[Callable[[], int]] = None,
+                           chunk_length: Optional[int] = None) -> Optional[int]:
+        """
+        repeat num_samples time, do outer_dimension x inner_dimension * inner_dimension * outer_dimension matrix
+        N = outer_dimension here
+
+        Test: output always ready to listen, input all streamlined
+        Test: Sprinkle random not_valid for input
+        Test: Output ready have random pauses
+        Test: input will be not valid for a long period of time
+        Test: output will be not_ready for a long period of time
+
+        a_gaps / b_gaps: not valid beats after each A / B beat, instead of the input_steady pattern (see StreamingStimulus)
+        chunk_length: send every tile in chunks of that many beats, last on each and final_chunk on the last one (K_SPLIT)
+
+        Returns the cycles from the first input handshake to the last output row
+        """
+        dut = self.dut
+        dut.output_by_row.value = output_by_row  # Output based on row or col
+        # Tiles (and their golden results) are generated lazily and fed to the writers as they drain, so memory
+        # stays constant whatever num_samples is
+        if input_steady:
+            gaps = lambda: 0
+        elif not input_not_steady_long_time:
+            # add random pauses here and there lasting 1-3 cycles
+            gaps = lambda: randint(0, 1)
+        else:
+            # adding random pauses that are at least as long as an entire input cycle
+            gaps = lambda: randint(0, inner_dimension)
+        if a_gaps is not None:
+            gaps = a_gaps
+        if self.dataset_cache is not None and matrix_gen_func is getrandbits:
+            # One draw keeps scenarios different from each other and the run deterministic under RANDOM_SEED
+            dataset = self.dataset_cache.get(engine, getrandbits(32), num_samples, outer_dimension, inner_dimension)
+            tiles = dataset.tiles(transpose=not output_by_row)
+        else:
+            tiles = generate_tiles(engine, num_samples, outer_dimension, inner_dimension,
+                                   func=matrix_gen_func, transpose=not output_by_row)
+        scoreboard = self.scoreboard
+        scoreboard.reset()
+        if self.monitor is not None:
+            self.monitor.reset()
+        stimulus = StreamingStimulus(self.a_input_writer, self.b_input_writer, tiles, gaps, data_width=engine.data_width,
+                                     scoreboard=scoreboard, b_gaps=b_gaps, chunk_length=chunk_length)
+        stimulus.start()
+
+        # Output ready pattern runs on its own, output rows are checked by the scoreboard as the reader takes them
+        output_ready_driver = cocotb.start_soon(drive_output_ready(self.output_reader, dut.clk, output_steady,
+                                                                  output_not_steady_long_time, inner_dimension))
+        await scoreboard.wait_for(num_samples)
+        # The last row was checked before the edge taking it, output_ready must hold until that edge
+        await RisingEdge(dut.clk)
+        output_ready_driver.kill()
+        stimulus.stop()
+        dut._log.info(scoreboard.summary())
+
+        if scoreboard.first_input_cycle is None or scoreboard.last_output_cycle is None:
+            return None
+        return scoreboard.last_output_cycle - scoreboard.first_input_cycle
+
+
+async def drive_output_ready(output_reader: LIReader, clk: SimHandleBase, output_steady: bool, output_not_steady_long_time: bool,
+                             inner_dimension: int):
+    """Output ready pattern of a scenario: always ready, random per cycle, or toggling every inner_dimension cycles"""
+    if output_steady:
+        output_reader.set_status(True)
+        return
+    if not output_not_steady_long_time:
+        while True:
+            output_reader.set_status(randint(0, 1) > 0)
+            await RisingEdge(clk)
+    output_reader_status = True
+    while True:
+        await ClockCycles(clk, inner_dimension)
+        output_reader.set_status(output_reader_status)
+        output_reader_status = not output_reader_status